@@ -3,8 +3,12 @@ import os
 import time
 import tkinter.filedialog
 
+from oasa import substructure_index
+
 from bkchem import logger
 from bkchem import dialogs
+from bkchem import oasa_bridge
+from bkchem import os_support
 
 from bkchem.singleton_store import Store
 
@@ -16,56 +20,42 @@ if not _:
 
 
 def process_directory(app, fragment, directory):
-	files = 0
-	matching = 0
+	"""Open the files in directory that contain fragment; return files searched.
+
+	The search itself runs headless through oasa.substructure_index, which
+	keeps an index in the personal BKChem directory so repeated searches
+	only read files that changed.  Worker processes are spawned rather
+	than forked from the Tk process.
+	"""
+	index_path = os_support.get_substructure_index_path(directory) or False
+	index = substructure_index.SubstructureIndex(
+		directory, index_path=index_path, mp_context="spawn")
+	query = oasa_bridge.bkchem_mol_to_oasa_mol(fragment)
 
 	dialog = dialogs.progress_dialog(app, title=_("Search progress"))
+	stage_texts = {"index": _("Indexing drawings"), "match": _("Searching")}
 
-	files_to_go = []
-	for filename in os.listdir(directory):
-		path = os.path.join(directory, filename)
-		if os.path.isfile(path) and os.path.splitext(path)[1] in (".svg", ".cdml"):
-			files_to_go.append(path)
-
-	for f in files_to_go:
-		#print f
+	def progress(stage, done, total):
 		dialog.update(
-			files / len(files_to_go),
-			top_text=os.path.split(f)[1],
-			bottom_text=_("Found: %d matching") % matching,
+			done / total if total else 1.0,
+			top_text=stage_texts[stage],
+			bottom_text=_("%d of %d") % (done, total),
 		)
-		files += 1
-		app.in_batch_mode = True
-		if app.add_new_paper(name=f):
-			if app._load_CDML_file(f, draw=False):
-				found = False
-				for mol in app.paper.molecules:
-					gen = mol.select_matching_substructures(
-						fragment,
-						implicit_freesites=True,
-					)
-					try:
-						next(gen)
-					except StopIteration:
-						pass
-					else:
-						found = True
-						matching += 1
-						mol.clean_after_search(fragment)
-						break
-				if not found:
-					app.close_current_paper()
-				else:
-					app.in_batch_mode = False
-					[o.draw() for o in app.paper.stack]
-					app.paper.set_bindings()
-					app.paper.add_bindings()
-			else:
-				app.close_current_paper()
 
-	app.in_batch_mode = False
-	dialog.close()
-	return files
+	try:
+		found = index.matching_files(query, implicit_freesites=True, progress=progress)
+		for opened, f in enumerate(found):
+			dialog.update(
+				opened / len(found),
+				top_text=os.path.split(f)[1],
+				bottom_text=_("Found: %d matching") % len(found),
+			)
+			if app.add_new_paper(name=f):
+				if not app._load_CDML_file(f):
+					app.close_current_paper()
+	finally:
+		dialog.close()
+	return index.last_search.files
 
 
 def main(app):
@@ -24,8 +24,10 @@
 import importlib
 import oasa
 import oasa.bond_lib
+import oasa.graph.edge_lib
 
 from bkchem import bkchem_utils
+from bkchem import undo
 
 from bkchem.singleton_store import Screen
 from bkchem.parents import meta_enabled, line_colored, drawable, with_line, interactive, child_with_paper
@@ -235,12 +237,14 @@ class BkBond(
 
   @atom1.setter
   def atom1(self, mol):
+    old = list(getattr(self, '_bond_vertices', ()))
     try:
       self._bond_vertices[0] = mol
     except (IndexError, AttributeError):
       self._bond_vertices = [mol, None]
     self._vertices = self._bond_vertices
     self.__dirty = 1
+    oasa.graph.edge_lib.vertices_changed(self, old)
 
 
   @property
@@ -253,12 +257,14 @@ class BkBond(
 
   @atom2.setter
   def atom2(self, mol):
+    old = list(getattr(self, '_bond_vertices', ()))
     try:
       self._bond_vertices[1] = mol
     except (IndexError, AttributeError):
       self._bond_vertices = [None, mol]
     self._vertices = self._bond_vertices
     self.__dirty = 1
+    oasa.graph.edge_lib.vertices_changed(self, old)
 
 
   @property
@@ -269,9 +275,11 @@ class BkBond(
   @atoms.setter
   def atoms(self, mol):
     # replace and re-link references
+    old = self._bond_vertices
     self._bond_vertices = list(mol)
     self._vertices = self._bond_vertices
     self.__dirty = 1
+    oasa.graph.edge_lib.vertices_changed(self, old)
 
 
   @property
@@ -283,8 +291,11 @@ class BkBond(
   @vertices.setter
   def vertices(self, vs):
     """Set the bond vertex list."""
+    old = self._bond_vertices
     self._bond_vertices = list(vs)
     self._vertices = self._bond_vertices
+    oasa.graph.edge_lib.vertices_changed(self, old)
+    undo.mark_dirty( self)
 
 
   def get_vertices(self):
@@ -295,8 +306,10 @@ class BkBond(
   def set_vertices(self, vs=None):
     """Set the bond vertex list (compatibility with oasa.edge API)."""
     if vs and len(vs) == 2:
+      old = self._bond_vertices
       self._bond_vertices = list(vs)
       self._vertices = self._bond_vertices
+      oasa.graph.edge_lib.vertices_changed(self, old)
 
 
   @property
@@ -40,6 +40,7 @@ def export_CD_SVG(paper, filename, gzipped=0):
   except IOError:
     return 0
 
+  paper.redraw_stale()
   try:
     oasa_bridge.write_codec_file_from_paper("cdsvg", paper, f)
   except Exception:
@@ -192,6 +192,8 @@ def import_format(codec_name, paper, filename):
 #============================================
 def export_format(codec_name, paper, filename, scope, gui_options):
 	"""Export one file via oasa_bridge using scope and resolved GUI options."""
+	# export exactly what a full redraw after the last zoom would show
+	paper.redraw_stale()
 	kwargs = resolve_gui_kwargs(paper, gui_options)
 	with open(filename, "wb") as handle:
 		if scope == "selected_molecule":
@@ -8,6 +8,9 @@ the exact API of oasa.graph.vertex so that graph algorithms continue to work.
 # Standard Library
 import copy
 
+# local repo modules
+from bkchem import undo
+
 
 #============================================
 class GraphVertexMixin:
@@ -63,6 +66,7 @@ class GraphVertexMixin:
 		"""
 		self._clean_cache()
 		self._neighbors[e] = v
+		undo.mark_dirty(self)
 
 	#============================================
 	def remove_neighbor(self, v) -> None:
@@ -82,6 +86,7 @@ class GraphVertexMixin:
 				break
 		if to_del:
 			del self._neighbors[to_del]
+			undo.mark_dirty(self)
 		else:
 			raise Exception("Cannot remove non-existing neighbor")
 
@@ -98,6 +103,7 @@ class GraphVertexMixin:
 		self._clean_cache()
 		if e in list(self._neighbors.keys()):
 			del self._neighbors[e]
+			undo.mark_dirty(self)
 		else:
 			raise Exception("Cannot remove non-existing edge", e)
 
@@ -83,8 +83,16 @@ class MainTabsMixin:
     page.grid_columnconfigure( 0, weight=1, minsize = 0)
     scroll_x.grid( row=1, column=0, sticky='we')
     scroll_y.grid( row=0, column=1, sticky='ns')
-    paper['yscrollcommand'] = scroll_y.set
-    paper['xscrollcommand'] = scroll_x.set
+    # the scroll commands fire on every view change; the paper uses them
+    # to redraw content left stale by a zoom once it comes into view
+    def _yscroll( *args):
+      scroll_y.set( *args)
+      paper.viewport_changed()
+    def _xscroll( *args):
+      scroll_x.set( *args)
+      paper.viewport_changed()
+    paper['yscrollcommand'] = _yscroll
+    paper['xscrollcommand'] = _xscroll
 
     # Zoom controls at bottom of each tab page -- use ttk widgets
     zoom_frame = ttk.Frame(page)
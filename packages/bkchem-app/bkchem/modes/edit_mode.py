@@ -351,8 +351,7 @@ class edit_mode(basic_mode):
 
 
 	def _end_of_empty_drag( self, x1, y1, x2, y2):
-		Store.app.paper.select( [o for o in map( Store.app.paper.id_to_object,\
-													Store.app.paper.find_enclosed( x1, y1, x2, y2)) if o])
+		Store.app.paper.select( Store.app.paper.find_registered_enclosed( x1, y1, x2, y2))
 
 
 	## METHODS FOR KEY EVENTS RESPONSES
@@ -69,6 +69,7 @@ class rotate_mode( edit_mode):
 			if self._fixed:
 				# 3D rotation around a bond
 				self._rotated_atoms = self._get_objs_to_rotate()
+			Store.app.paper.redraw_stale()
 			x1, y1, x2, y2 = Store.app.paper.list_bbox( [o.item for o in self._rotated_mol.atoms])
 			self._centerx = x1+(x2-x1)/2.0
 			self._centery = y1+(y2-y1)/2.0
@@ -34,6 +34,7 @@ from math import atan2, sin, cos, pi, sqrt
 from bkchem import bkchem_utils
 from bkchem import dom_extensions
 from bkchem import safe_xml
+from bkchem import spatial_grid
 
 from bkchem.bond_lib import BkBond
 from bkchem.atom_lib import BkAtom
@@ -490,7 +491,8 @@ class BkMolecule( container, top_level, id_enabled, with_paper):
 
   def delete_atom( self, item):
     "remove links to atom from molecule records"
-    self.vertices.remove( item)
+    # go through the graph so the rustworkx mirror drops the node as well
+    self.delete_vertex( item)
     item.delete()
     if item == self.t_atom:
       self.t_atom = None
@@ -698,20 +700,24 @@ class BkMolecule( container, top_level, id_enabled, with_paper):
   def handle_overlap( self):
     "deletes one of overlaping atoms and updates the bonds"
     to_delete = []
+    to_delete_set = set()
     bonds_to_check = set() # this can speedup the following for b in bonds_to_check by factor of 10 for big mols
-    for i in range( len( self.atoms)):
-      for j in range( i+1, len( self.atoms)):
-        a = self.atoms[i]
-        b = self.atoms[j]
-        if (abs( a.x-b.x) < 4) and (abs( a.y-b.y) <4):
-          if a not in to_delete:
-            for e,v in b.get_neighbor_edge_pairs():
-              e.change_atoms( b, a)
-              a.add_neighbor( v, e)
-              v.add_neighbor( a, e)
-              bonds_to_check.add( e)
-            to_delete.append( b)
-    deleted = bkchem_utils.filter_unique( to_delete)
+    atoms = self.atoms
+    # the spatial grid yields close pairs in the same (i, j) order as the
+    # former all-pairs loop, so the same atoms survive
+    for i, j in spatial_grid.close_point_pairs( [(a.x, a.y) for a in atoms], 4):
+      a = atoms[i]
+      b = atoms[j]
+      # b may be close to several atoms; merge it into the first one only
+      if a not in to_delete_set and b not in to_delete_set:
+        for e,v in b.get_neighbor_edge_pairs():
+          e.change_atoms( b, a)
+          a.add_neighbor( v, e)
+          v.add_neighbor( a, e)
+          bonds_to_check.add( e)
+        to_delete.append( b)
+        to_delete_set.add( b)
+    deleted = list( to_delete)
     [self.delete_atom( o) for o in deleted]
     # after all is done, find and delete orphan bonds and update the others
     to_redraw = []
@@ -20,6 +20,7 @@
 # Standard Library
 import os
 import sys
+import hashlib
 import importlib.util
 
 
@@ -191,6 +192,22 @@ def get_local_templates_path():
   return os.path.join( get_personal_config_directory(), 'templates')
 
 
+def get_template_cache_path():
+  """returns the path of the template layout cache shared with BKChem-Qt"""
+  return os.path.join( get_personal_config_directory(), 'template_cache.json')
+
+
+def get_substructure_index_path( directory):
+  """returns the fragment search index file for directory, kept in the personal
+  directory so that searching never writes into the searched folder;
+  None when the personal directory is not writable"""
+  dir = create_personal_config_directory( 'substructure_index')
+  if not dir:
+    return None
+  key = hashlib.sha1( os.path.abspath( directory).encode( 'utf-8')).hexdigest()
+  return os.path.join( dir, key + '.json')
+
+
 def get_module_path():
   dir = (site_config and site_config.BKCHEM_MODULE_PATH) or os.getenv( 'BKCHEM_MODULE_PATH') or './'
   return dir
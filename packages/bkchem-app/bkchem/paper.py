@@ -58,6 +58,7 @@ try:
 	from bkchem.paper_lib.paper_cdml import PaperCDMLMixin
 	from bkchem.paper_lib.paper_properties import PaperPropertiesMixin
 	from bkchem.paper_lib.paper_layout import PaperLayoutMixin
+	from bkchem.paper_lib.paper_spatial import PaperSpatialMixin
 except ImportError:
 	PaperZoomMixin = importlib.import_module("paper_lib.paper_zoom").PaperZoomMixin
 	PaperTransformsMixin = importlib.import_module("paper_lib.paper_transforms").PaperTransformsMixin
@@ -68,6 +69,7 @@ except ImportError:
 	PaperCDMLMixin = importlib.import_module("paper_lib.paper_cdml").PaperCDMLMixin
 	PaperPropertiesMixin = importlib.import_module("paper_lib.paper_properties").PaperPropertiesMixin
 	PaperLayoutMixin = importlib.import_module("paper_lib.paper_layout").PaperLayoutMixin
+	PaperSpatialMixin = importlib.import_module("paper_lib.paper_spatial").PaperSpatialMixin
 
 # gettext i18n translation fallbacks
 _ = builtins.__dict__.get('_', lambda m: m)
@@ -76,6 +78,7 @@ ngettext = builtins.__dict__.get('ngettext', lambda s, p, n: s if n == 1 else p)
 
 class chem_paper(
 	PaperLayoutMixin,
+	PaperSpatialMixin,
 	PaperPropertiesMixin,
 	PaperCDMLMixin,
 	PaperFactoriesMixin,
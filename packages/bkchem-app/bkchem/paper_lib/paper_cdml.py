@@ -154,6 +154,8 @@ class PaperCDMLMixin:
 
 
 	def get_package( self):
+		# atoms off screen at the last zoom are still drawn at the old scale
+		self.redraw_stale()
 		doc = dom.Document()
 		root = dom_extensions.elementUnder( doc, 'cdml', attributes = (('version', bkchem_config.current_CDML_version),
 																																		( 'xmlns', data.cdml_namespace)))
@@ -193,6 +195,8 @@ class PaperCDMLMixin:
 			return self._cropping_bbox
 
 		margin = self.get_paper_property('crop_margin')
+		# the crop box is read from the canvas, so it has to be exact
+		self.redraw_stale()
 		items = list( self.find_all())
 		items.remove( self.background)
 		# exclude hex grid dots from crop bbox
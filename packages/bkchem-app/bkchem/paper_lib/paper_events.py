@@ -104,10 +104,7 @@ class PaperEventsMixin:
 		event.y = self.canvasy( event.y)
 		Store.app.update_cursor_position( event.x, event.y)
 		Store.app.mode.mouse_drag( event)
-		b = self.find_overlapping( event.x-2, event.y-2, event.x+2, event.y+2)
-		b = list(filter( self.is_registered_id, b))
-		a = list(map( self.id_to_object, b))
-		a = [i for i in a if i not in self._do_not_focus]
+		a = [o for i, o in self.find_registered_near( event.x, event.y, 2) if o not in self._do_not_focus]
 		if a:
 			a = a[-1]
 		else:
@@ -145,9 +142,8 @@ class PaperEventsMixin:
 		Store.app.update_cursor_position( event.x, event.y)
 		Store.app.mode.mouse_move( event)
 
-		b = self.find_overlapping( event.x-3, event.y-3, event.x+3, event.y+3)
-		b = list(filter( self.is_registered_id, b))
-		id_objs = [(x, self.id_to_object( x)) for x in b]
+		# answered from the model-space spatial grid (PaperSpatialMixin)
+		id_objs = self.find_registered_near( event.x, event.y, 3)
 		a = [i for i in id_objs if i[1] not in self._do_not_focus]
 
 		if a:
@@ -8,13 +8,19 @@ class PaperIdManagerMixin:
 
 	def register_id( self, id, object):
 		self._id_2_object[ id] = object
+		# keep the spatial index (PaperSpatialMixin) current once built
+		if getattr( self, '_spatial_grid', None) is not None:
+			self._spatial_register( id, object)
 
 
 	def unregister_id( self, id):
 		try:
-			del self._id_2_object[ id]
+			object = self._id_2_object.pop( id)
 		except KeyError:
 			warn( 'trying to unregister not registered id', UserWarning, 3)
+			return
+		if getattr( self, '_spatial_grid', None) is not None:
+			self._spatial_unregister( id, object)
 
 
 	def id_to_object( self, id):
@@ -33,8 +39,8 @@ class PaperIdManagerMixin:
 
 	def is_registered_object( self, o):
 		"""has this object a registered id?"""
-		return o in list(self._id_2_object.values())
+		return o in self._id_2_object.values()
 
 
 	def is_registered_id( self, id):
-		return id in list(self._id_2_object.keys())
+		return id in self._id_2_object
@@ -238,6 +238,8 @@ class PaperLayoutMixin:
 		objects, not tkinter canvas objects"""
 		if not objects:
 			return None
+		# the bboxes are read from the canvas, so it has to be exact
+		self.redraw_stale()
 		xmin, ymin, xmax, ymax = objects[0].bbox()
 		for o in objects[:]:
 			x0, y0, x1, y1 = o.bbox()
@@ -328,16 +330,7 @@ class PaperLayoutMixin:
 
 	def handle_overlap( self):
 		"puts overlaping molecules together to one and then calls handle_overlap(a1, a2) for that molecule"
-		overlap = []
-		for a in self.find_withtag('atom'):
-			x, y = self.id_to_object( a).get_xy_on_paper()
-			for b in self.find_overlapping( x-2, y-2, x+2, y+2):
-				if (a != b) and ( 'atom' in self.gettags( b)):
-					a1 = self.id_to_object( a)
-					a2 = self.id_to_object( b)
-					if ( abs( a1.x - a2.x) < 2) and ( abs( a1.y - a2.y) < 2):
-						if (not [a2,a1] in overlap) and a1.z == a2.z:
-							overlap.append( [a1,a2])
+		overlap = self.overlapping_atom_pairs( 2)
 
 		deleted = []
 		if overlap:
@@ -358,7 +351,8 @@ class PaperLayoutMixin:
 					deleted.extend( mol.handle_overlap())
 			deleted.extend(j for i in [mol.handle_overlap() for mol in bkchem_utils.difference(a_eatenby_b2, a_eatenby_b1)]
 														for j in i)
-			self.selected = bkchem_utils.difference( self.selected, deleted)
+			deleted_set = set( deleted)
+			self.selected = [o for o in self.selected if o not in deleted_set]
 			self.add_bindings()
 			Store.log( _('concatenated overlaping atoms'))
 
@@ -484,6 +478,7 @@ class PaperLayoutMixin:
 		self.background = None
 		del self._id_2_object
 		self._id_2_object = {}
+		self.invalidate_spatial_index()
 
 		for obj in self.stack:
 			obj.paper = None
@@ -505,6 +500,8 @@ class PaperLayoutMixin:
 		"""Redraws all the content of the paper."""
 		for o in self.stack:
 			o.redraw()
+		# nothing is left stale from culled zoom redraws
+		self._zoom_stale = {}
 		# redraw hex grid if visible
 		if hasattr(self, '_hex_grid_overlay') and self._hex_grid_overlay:
 			if self._hex_grid_overlay.visible:
@@ -0,0 +1,224 @@
+"""Model-space spatial index mixin methods for BKChem paper."""
+
+import math
+
+from bkchem import spatial_grid
+
+
+class PaperSpatialMixin:
+	"""Spatial grid of drawn atoms and bonds in model (real) coordinates.
+
+	The grid answers hover, rubber-band and overlap queries without asking
+	the Tk canvas. It is built on the first query from the registered
+	objects and then kept current: register_id()/unregister_id() add and
+	drop atoms and bonds as they are drawn, redrawn and deleted, and the
+	vertex x/y setters report moved atoms together with their bonds, so
+	moves, undo, transforms and template placement all keep it current.
+	"""
+
+	def invalidate_spatial_index( self):
+		"""Drop the grid; the next query rebuilds it from registered objects."""
+		self._spatial_grid = None
+
+
+	def rebuild_spatial_index( self):
+		grid = spatial_grid.SpatialGrid()
+		self._spatial_grid = grid
+		self._spatial_extents = {}
+		self._spatial_foreign = {}
+		for id, obj in self._id_2_object.items():
+			self._spatial_register( id, obj)
+		return grid
+
+
+	def _spatial_index( self):
+		grid = getattr( self, '_spatial_grid', None)
+		if grid is None:
+			grid = self.rebuild_spatial_index()
+		return grid
+
+
+	def _spatial_register( self, id, obj):
+		object_type = getattr( obj, 'object_type', None)
+		if object_type == 'atom':
+			self._spatial_extents[ obj] = self._spatial_atom_extents( obj)
+			self._spatial_insert_atom( obj)
+		elif object_type == 'bond':
+			self._spatial_insert_bond( obj)
+		else:
+			self._spatial_foreign[ id] = obj
+
+
+	def _spatial_unregister( self, id, obj):
+		object_type = getattr( obj, 'object_type', None)
+		if object_type == 'atom':
+			self._spatial_grid.remove( obj)
+			self._spatial_extents.pop( obj, None)
+		elif object_type == 'bond':
+			self._spatial_grid.remove( obj)
+		else:
+			self._spatial_foreign.pop( id, None)
+
+
+	def _spatial_atom_extents( self, atom):
+		"""Label box of a drawn atom as model-space offsets from its position."""
+		if not getattr( atom, 'show', 0) or not getattr( atom, 'item', None):
+			return (0.0, 0.0, 0.0, 0.0)
+		box = self.bbox( atom.item)
+		if not box:
+			return (0.0, 0.0, 0.0, 0.0)
+		x1, y1, x2, y2 = self.canvas_to_real( box)
+		return (x1 - atom.x, y1 - atom.y, x2 - atom.x, y2 - atom.y)
+
+
+	def _spatial_insert_atom( self, atom):
+		dx1, dy1, dx2, dy2 = self._spatial_extents.get( atom, (0.0, 0.0, 0.0, 0.0))
+		self._spatial_grid.insert( atom, atom.x+dx1, atom.y+dy1, atom.x+dx2, atom.y+dy2)
+
+
+	def _spatial_insert_bond( self, bond):
+		a1 = bond.atom1
+		a2 = bond.atom2
+		if a1 is None or a2 is None:
+			return
+		self._spatial_grid.insert( bond, a1.x, a1.y, a2.x, a2.y)
+
+
+	def spatial_index_moved( self, atom):
+		"""Update the grid after atom (and therefore its bonds) moved."""
+		if getattr( self, '_spatial_grid', None) is None or atom not in self._spatial_grid:
+			return
+		self._spatial_insert_atom( atom)
+		for bond in atom.neighbor_edges:
+			if bond in self._spatial_grid:
+				self._spatial_insert_bond( bond)
+
+
+	def _spatial_is_live( self, obj):
+		"""Whether obj is still drawn and registered on this paper."""
+		item = getattr( obj, 'item', None)
+		return item is not None and self._id_2_object.get( item) is obj
+
+
+	def _atom_distance( self, atom, x, y):
+		"""Distance from (x, y) to the atom label box (0 inside it)."""
+		dx1, dy1, dx2, dy2 = self._spatial_extents.get( atom, (0.0, 0.0, 0.0, 0.0))
+		dx = max( atom.x+dx1 - x, 0.0, x - (atom.x+dx2))
+		dy = max( atom.y+dy1 - y, 0.0, y - (atom.y+dy2))
+		return math.hypot( dx, dy)
+
+
+	def atoms_near( self, x, y, radius):
+		"""Return drawn atoms within radius of model point (x, y), nearest first."""
+		grid = self._spatial_index()
+		found = []
+		for obj in grid.query_radius( x, y, radius):
+			if obj.object_type != 'atom' or not self._spatial_is_live( obj):
+				continue
+			d = self._atom_distance( obj, x, y)
+			if d <= radius:
+				found.append( (d, obj))
+		found.sort( key=lambda pair: pair[0])
+		return [obj for d, obj in found]
+
+
+	def bonds_near( self, x, y, radius):
+		"""Return drawn bonds within radius of model point (x, y), nearest first.
+
+		The bond half width is added to radius, so the tolerance matches
+		a hit on the drawn line.
+		"""
+		grid = self._spatial_index()
+		found = []
+		for obj in grid.query_radius( x, y, radius):
+			if obj.object_type != 'bond' or not self._spatial_is_live( obj):
+				continue
+			d = _point_segment_distance( x, y, obj.atom1.x, obj.atom1.y, obj.atom2.x, obj.atom2.y)
+			if d <= radius + _bond_half_width( obj):
+				found.append( (d, obj))
+		found.sort( key=lambda pair: pair[0])
+		return [obj for d, obj in found]
+
+
+	def objects_in_rect( self, x1, y1, x2, y2):
+		"""Return drawn atoms and bonds lying completely inside a model box."""
+		xmin, xmax = min( x1, x2), max( x1, x2)
+		ymin, ymax = min( y1, y2), max( y1, y2)
+
+		def inside( x, y):
+			return xmin <= x <= xmax and ymin <= y <= ymax
+
+		grid = self._spatial_index()
+		found = []
+		for obj in grid.query_rect( xmin, ymin, xmax, ymax):
+			if not self._spatial_is_live( obj):
+				continue
+			if obj.object_type == 'atom':
+				dx1, dy1, dx2, dy2 = self._spatial_extents.get( obj, (0.0, 0.0, 0.0, 0.0))
+				if inside( obj.x+dx1, obj.y+dy1) and inside( obj.x+dx2, obj.y+dy2):
+					found.append( obj)
+			elif inside( obj.atom1.x, obj.atom1.y) and inside( obj.atom2.x, obj.atom2.y):
+				found.append( obj)
+		return found
+
+
+	def overlapping_atom_pairs( self, tolerance=2):
+		"""Return [a1, a2] pairs of drawn atoms on top of each other.
+
+		Atoms overlap when both coordinate differences are below tolerance
+		and they share z. Pairs come in registration order, a1 first.
+		"""
+		atoms = [o for o in self._id_2_object.values() if getattr( o, 'object_type', None) == 'atom']
+		pairs = spatial_grid.close_point_pairs( [(a.x, a.y) for a in atoms], tolerance)
+		return [[atoms[i], atoms[j]] for i, j in pairs if atoms[i].z == atoms[j].z]
+
+
+	def find_registered_near( self, x, y, radius):
+		"""Return [(id, object)] registered near canvas point (x, y), topmost last.
+
+		Papers holding only atoms and bonds are answered from the spatial
+		grid. When other registered objects (arrows, texts, selection
+		handles) exist, the Tk canvas is asked so stacking order among
+		them is kept.
+		"""
+		self._spatial_index()
+		if self._spatial_foreign:
+			# the canvas answers from the drawn label boxes, refresh them first
+			self.redraw_stale( self.canvas_to_real( (x-radius, y-radius, x+radius, y+radius)))
+			ids = self.find_overlapping( x-radius, y-radius, x+radius, y+radius)
+			return [(i, self._id_2_object[i]) for i in ids if i in self._id_2_object]
+		mx, my, mr = self.canvas_to_real( (x, y, radius))
+		# atoms are drawn above bonds, so they come last
+		hits = list( reversed( self.bonds_near( mx, my, mr)))
+		hits.extend( reversed( self.atoms_near( mx, my, mr)))
+		return [(o.item, o) for o in hits]
+
+
+	def find_registered_enclosed( self, x1, y1, x2, y2):
+		"""Return registered objects lying completely inside a canvas box."""
+		self._spatial_index()
+		if self._spatial_foreign:
+			mx1, my1, mx2, my2 = self.canvas_to_real( (x1, y1, x2, y2))
+			self.redraw_stale( (min( mx1, mx2), min( my1, my2), max( mx1, mx2), max( my1, my2)))
+			ids = self.find_enclosed( x1, y1, x2, y2)
+			return [self._id_2_object[i] for i in ids if i in self._id_2_object]
+		return self.objects_in_rect( *self.canvas_to_real( (x1, y1, x2, y2)))
+
+
+def _bond_half_width( bond):
+	"""Half the drawn width of a bond, including the gap of multiple bonds."""
+	width = getattr( bond, 'line_width', 1) or 1
+	if getattr( bond, 'order', 1) > 1:
+		width += abs( getattr( bond, 'bond_width', 0) or 0)
+	return width / 2.0
+
+
+def _point_segment_distance( px, py, x1, y1, x2, y2):
+	"""Distance from point (px, py) to the segment (x1, y1)-(x2, y2)."""
+	dx = x2 - x1
+	dy = y2 - y1
+	length2 = dx*dx + dy*dy
+	if length2 == 0:
+		return math.hypot( px-x1, py-y1)
+	t = max( 0.0, min( 1.0, ((px-x1)*dx + (py-y1)*dy) / length2))
+	return math.hypot( px - (x1 + t*dx), py - (y1 + t*dy))
@@ -4,15 +4,26 @@ import math
 
 from oasa.transform_lib import Transform
 
+from bkchem import undo
+
 
 ZOOM_FACTOR = 1.2
 ZOOM_MIN = 0.1
 ZOOM_MAX = 10.0
+# share of the larger viewport side redrawn beyond each edge on zoom
+ZOOM_REDRAW_MARGIN = 0.5
 
 
 class PaperZoomMixin:
 	"""Zoom and scale helpers extracted from paper.py."""
 
+	# redraw only atoms and bonds near the viewport on zoom; the rest is
+	# marked stale and redrawn by redraw_stale() once it scrolls into view
+	zoom_culling = True
+	# keep off-screen normal bonds exact by scaling their line items in
+	# place instead of marking them stale
+	zoom_line_fast_path = True
+
 	def scale_selected( self, ratio_x, ratio_y, scale_font=1, fix_centers=0, scale_bond_width=False):
 		top_levels, unique = self.selected_to_unique_top_levels()
 		ratio = math.sqrt( ratio_x*ratio_y) # ratio for operations where x and y can't be distinguished (font size etc.)
@@ -52,6 +63,7 @@ class PaperZoomMixin:
 			for frag in o.fragments:
 				if frag.type == "linear_form":
 					frag.properties['bond_length'] = round( frag.properties['bond_length'] * ratio)
+					undo.mark_dirty( frag)
 					o.check_linear_form_fragment( frag)
 		if o.object_type in ('arrow','polygon','polyline'):
 			for i in o.points:
@@ -94,9 +106,16 @@ class PaperZoomMixin:
 			my = oy / self._scale
 			target_cx = mx * new_scale
 			target_cy = my * new_scale
+			view = self._model_view_rect( new_scale, center=(mx, my))
+		else:
+			view = self._model_view_rect( new_scale)
 		self._scale = new_scale
-		# Redraw all content from model coordinates at the new scale.
-		self.redraw_all()
+		if self.zoom_culling:
+			# Redraw content near the viewport from model coordinates.
+			self.redraw_for_zoom( actual_factor, view)
+		else:
+			# Redraw all content from model coordinates at the new scale.
+			self.redraw_all()
 		# Reset the page background to its nominal size, then scale
 		# from the origin so it stays aligned with the redrawn content.
 		self.create_background()
@@ -128,6 +147,161 @@ class PaperZoomMixin:
 			self._center_viewport_on_canvas(target_cx, target_cy)
 		self.event_generate('<<zoom-changed>>')
 
+	def _model_view_rect( self, scale, center=None):
+		"""Model-space box of the viewport at scale, widened by ZOOM_REDRAW_MARGIN.
+
+		Without center the canvas view origin is assumed to stay where it
+		is, which is what Tk does when the scale changes.
+		"""
+		width = self.winfo_width()
+		height = self.winfo_height()
+		margin = ZOOM_REDRAW_MARGIN * max( width, height) / scale
+		if center:
+			cx, cy = center
+			x1 = cx - width / 2 / scale
+			y1 = cy - height / 2 / scale
+		else:
+			x1 = self.canvasx( 0) / scale
+			y1 = self.canvasy( 0) / scale
+		x2 = x1 + width / scale
+		y2 = y1 + height / scale
+		return (x1 - margin, y1 - margin, x2 + margin, y2 + margin)
+
+
+	def redraw_for_zoom( self, factor, view):
+		"""Rescale the drawing by factor, redrawing atoms and bonds only in view.
+
+		All canvas items are first moved to their new place with a single
+		canvas scale call. Atoms and bonds inside the model-space box view
+		are then redrawn. Off-screen normal bonds get their line widths
+		scaled (zoom_line_fast_path). Other off-screen atoms and bonds are
+		left with scaled coordinates but old fonts and widths and marked
+		stale until redraw_stale() reaches them. Non-chemistry objects are
+		few and always redrawn.
+		"""
+		self.scale( 'all', 0, 0, factor, factor)
+		stale = self._stale_objects()
+		for o in self.stack:
+			if o.object_type == 'molecule':
+				self._redraw_molecule_in_view( o, view, factor, stale)
+			else:
+				o.redraw()
+
+
+	def _stale_objects( self):
+		stale = getattr( self, '_zoom_stale', None)
+		if stale is None:
+			stale = self._zoom_stale = {}
+		return stale
+
+
+	def _redraw_molecule_in_view( self, mol, view, factor, stale):
+		x1, y1, x2, y2 = view
+		to_lift = set()
+		for a in mol.atoms:
+			if x1 <= a.x <= x2 and y1 <= a.y <= y2:
+				a.redraw()
+				stale.pop( a, None)
+				to_lift.add( a)
+			else:
+				stale[ a] = None
+		for b in mol.bonds:
+			a1 = b.atom1
+			a2 = b.atom2
+			if (min( a1.x, a2.x) <= x2 and max( a1.x, a2.x) >= x1 and
+					min( a1.y, a2.y) <= y2 and max( a1.y, a2.y) >= y1):
+				b.redraw()
+				stale.pop( b, None)
+				to_lift.add( a1)
+				to_lift.add( a2)
+			elif b not in stale and self.zoom_line_fast_path and self._scale_line_bond( b, factor):
+				continue
+			else:
+				stale[ b] = None
+		# atoms are drawn above bonds
+		for a in to_lift:
+			a.lift()
+
+
+	def _scale_line_bond( self, bond, factor):
+		"""Finish canvas scaling of a bond drawn only with line items.
+
+		Normal bonds between hidden atoms are plain lines whose geometry
+		is linear in the scale, so after the canvas scale call only the
+		line widths are left to update. Returns False for other bonds.
+		"""
+		items = getattr( bond, '_render_item_ids', None)
+		if (not items or bond.type != 'n' or bond.order not in (1, 2, 3) or
+				bond.atom1.show or bond.atom2.show):
+			return False
+		for item in items:
+			width = float( self.itemcget( item, 'width'))
+			self.itemconfigure( item, width=width * factor)
+		if bond._selected:
+			bond.select()
+		return True
+
+
+	def redraw_stale( self, view=None):
+		"""Redraw atoms and bonds marked stale by a zoom.
+
+		Only objects inside the model-space box view are redrawn; without
+		view everything stale is. Objects deleted since the zoom are
+		dropped.
+		"""
+		stale = getattr( self, '_zoom_stale', None)
+		if not stale:
+			return
+		if view:
+			x1, y1, x2, y2 = view
+		molecules = set( o for o in self.stack if o.object_type == 'molecule')
+		atoms = []
+		bonds = []
+		for o in list( stale):
+			if o.object_type == 'bond':
+				a1 = o.atom1
+				a2 = o.atom2
+				if view and not (min( a1.x, a2.x) <= x2 and max( a1.x, a2.x) >= x1 and
+						min( a1.y, a2.y) <= y2 and max( a1.y, a2.y) >= y1):
+					continue
+				del stale[ o]
+				if o.molecule in molecules and o in o.molecule.edges:
+					bonds.append( o)
+			else:
+				if view and not (x1 <= o.x <= x2 and y1 <= o.y <= y2):
+					continue
+				del stale[ o]
+				if o.molecule in molecules and self._spatial_is_live( o):
+					atoms.append( o)
+		for a in atoms:
+			a.redraw()
+			if a.show:
+				# bond ends are clipped by the label, which has just changed size
+				bonds.extend( a.neighbor_edges)
+		to_lift = set( atoms)
+		for b in set( bonds):
+			b.redraw()
+			stale.pop( b, None)
+			to_lift.add( b.atom1)
+			to_lift.add( b.atom2)
+		for a in to_lift:
+			a.lift()
+
+
+	def redraw_stale_in_view( self):
+		"""Redraw stale atoms and bonds that are now in (or near) the viewport."""
+		self._stale_redraw_pending = False
+		if getattr( self, '_zoom_stale', None):
+			self.redraw_stale( self._model_view_rect( self._scale))
+
+
+	def viewport_changed( self, *args):
+		"""Schedule an idle redraw of stale objects after a scroll or resize."""
+		if getattr( self, '_zoom_stale', None) and not getattr( self, '_stale_redraw_pending', False):
+			self._stale_redraw_pending = True
+			self.after_idle( self.redraw_stale_in_view)
+
+
 	def zoom_in(self):
 		if self._scale < ZOOM_MAX:
 			self.scale_all(ZOOM_FACTOR, center_on_viewport=True)
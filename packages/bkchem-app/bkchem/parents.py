@@ -26,6 +26,7 @@ Used to provide mostly the desired meta_behaviour.
 from bkchem.ftext_lib import BkFtext
 from bkchem import dom_extensions
 from bkchem import safe_xml
+from bkchem import undo
 
 from bkchem.singleton_store import Store
 
@@ -47,12 +48,27 @@ class simple_parent(object):
 	meta__undo_properties = ()
 	meta__undo_copy = ()
 	meta__undo_children_to_record = ()
+	# names of all the attributes above, set for every subclass
+	_undo_names = frozenset()
+
+
+	def __init_subclass__( cls, **kwargs):
+		super().__init_subclass__( **kwargs)
+		names = cls.meta__undo_fake + cls.meta__undo_simple + cls.meta__undo_properties
+		cls._undo_names = frozenset( names + cls.meta__undo_copy)
 
 
 	def __init__( self):
 		pass
 
 
+	def __setattr__( self, name, value):
+		object.__setattr__( self, name, value)
+		if name in self._undo_names:
+			# let the next undo record know about the change
+			undo.mark_dirty( self)
+
+
 	def copy_settings( self, other):
 		pass
 
@@ -130,6 +146,7 @@ class meta_enabled(id_enabled):
 						break
 				if not is_prop:
 					self.__dict__[i] = standard.__dict__[i]
+					undo.mark_dirty( self)
 
 
 
@@ -0,0 +1,178 @@
+"""Uniform spatial hash for model-space hit testing in BKChem.
+
+Objects are stored under every grid cell their bounding box touches, so
+point, radius and rectangle queries only look at the few cells around
+the query instead of every object on the paper. The grid knows nothing
+about atoms or bonds; callers pass boxes and do exact geometry tests on
+the returned candidates.
+"""
+
+# Standard Library
+import math
+
+
+# default cell edge in model units; about one standard bond length
+DEFAULT_CELL_SIZE = 25.0
+
+
+#============================================
+class SpatialGrid:
+	"""Hash grid mapping square cells to the objects overlapping them.
+
+	Args:
+		cell_size: Edge length of one grid cell in model units.
+	"""
+
+	#============================================
+	def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+		"""Create an empty grid.
+
+		Args:
+			cell_size: Edge length of one grid cell in model units.
+		"""
+		if cell_size <= 0:
+			raise ValueError("cell_size must be positive")
+		self.cell_size = float(cell_size)
+		# (ix, iy) -> {obj: None}, dicts keep insertion order
+		self._cells = {}
+		# obj -> tuple of (ix, iy) keys it is stored under
+		self._keys = {}
+
+	#============================================
+	def __len__(self) -> int:
+		return len(self._keys)
+
+	#============================================
+	def __contains__(self, obj) -> bool:
+		return obj in self._keys
+
+	#============================================
+	def _cell_range(self, x1: float, y1: float, x2: float, y2: float) -> list:
+		"""Return the cell keys covering a box (corners in any order)."""
+		size = self.cell_size
+		ix1 = math.floor(min(x1, x2) / size)
+		ix2 = math.floor(max(x1, x2) / size)
+		iy1 = math.floor(min(y1, y2) / size)
+		iy2 = math.floor(max(y1, y2) / size)
+		return [(ix, iy) for ix in range(ix1, ix2 + 1) for iy in range(iy1, iy2 + 1)]
+
+	#============================================
+	def insert(self, obj, x1: float, y1: float, x2: float = None, y2: float = None) -> None:
+		"""Store obj under its box, replacing any previous entry.
+
+		Args:
+			obj: Hashable object to store.
+			x1: Left (or point) x coordinate.
+			y1: Top (or point) y coordinate.
+			x2: Right x coordinate; defaults to x1 for a point.
+			y2: Bottom y coordinate; defaults to y1 for a point.
+		"""
+		if x2 is None:
+			x2 = x1
+		if y2 is None:
+			y2 = y1
+		keys = tuple(self._cell_range(x1, y1, x2, y2))
+		old_keys = self._keys.get(obj)
+		if old_keys == keys:
+			return
+		if old_keys is not None:
+			self._drop(obj, old_keys)
+		for key in keys:
+			cell = self._cells.get(key)
+			if cell is None:
+				cell = self._cells[key] = {}
+			cell[obj] = None
+		self._keys[obj] = keys
+
+	#============================================
+	def remove(self, obj) -> None:
+		"""Forget obj; unknown objects are ignored."""
+		keys = self._keys.pop(obj, None)
+		if keys is not None:
+			self._drop(obj, keys)
+
+	#============================================
+	def _drop(self, obj, keys: tuple) -> None:
+		for key in keys:
+			cell = self._cells.get(key)
+			if cell is None:
+				continue
+			cell.pop(obj, None)
+			if not cell:
+				del self._cells[key]
+
+	#============================================
+	def clear(self) -> None:
+		"""Remove every object."""
+		self._cells = {}
+		self._keys = {}
+
+	#============================================
+	def query_rect(self, x1: float, y1: float, x2: float, y2: float) -> list:
+		"""Return candidates whose cells overlap a box, without duplicates.
+
+		Candidates only share a cell with the box; callers test the exact
+		geometry themselves.
+
+		Args:
+			x1: One corner x.
+			y1: One corner y.
+			x2: Opposite corner x.
+			y2: Opposite corner y.
+
+		Returns:
+			List of stored objects in first-seen order.
+		"""
+		found = {}
+		cells = self._cells
+		for key in self._cell_range(x1, y1, x2, y2):
+			cell = cells.get(key)
+			if cell:
+				found.update(cell)
+		return list(found)
+
+	#============================================
+	def query_radius(self, x: float, y: float, radius: float) -> list:
+		"""Return candidates whose cells overlap the box around a circle.
+
+		Args:
+			x: Center x.
+			y: Center y.
+			radius: Search radius.
+
+		Returns:
+			List of stored objects in first-seen order.
+		"""
+		return self.query_rect(x - radius, y - radius, x + radius, y + radius)
+
+
+#============================================
+def close_point_pairs(items: list, tolerance: float) -> list:
+	"""Return index pairs (i, j), i < j, of points closer than tolerance.
+
+	Two points are close when both ``abs(dx)`` and ``abs(dy)`` are below
+	tolerance, the test BKChem uses to decide that atoms overlap. Pairs
+	are returned in the order a nested ``for i: for j > i`` loop would
+	visit them, so callers that merge in that order keep their old
+	results, in roughly linear instead of quadratic time.
+
+	Args:
+		items: Sequence of (x, y) tuples.
+		tolerance: Exclusive per-axis distance limit.
+
+	Returns:
+		Sorted list of (i, j) index tuples.
+	"""
+	grid = SpatialGrid(cell_size=max(tolerance, 1e-9))
+	for index, (x, y) in enumerate(items):
+		grid.insert(index, x, y)
+	pairs = []
+	for i, (x, y) in enumerate(items):
+		for j in grid.query_radius(x, y, tolerance):
+			if j <= i:
+				continue
+			xj, yj = items[j]
+			if abs(x - xj) < tolerance and abs(y - yj) < tolerance:
+				pairs.append((i, j))
+	pairs.sort()
+	return pairs
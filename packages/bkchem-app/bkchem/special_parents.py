@@ -27,6 +27,7 @@ from warnings import warn
 from bkchem import bkchem_utils
 from bkchem import marks
 from bkchem import theme_manager
+from bkchem import undo
 
 from bkchem.ftext_lib import BkFtext
 from bkchem.singleton_store import Store, Screen
@@ -147,6 +148,7 @@ class vertex_common(object):
 
     m.delete()
     self.marks.remove( m)
+    undo.mark_dirty( self)
     self._set_mark_helper( m.__class__, sign=-1)
     return m
 
@@ -182,6 +184,7 @@ class vertex_common(object):
     if draw:
       m.draw()
     self.marks.add( m)
+    undo.mark_dirty( self)
     return m
 
 
@@ -502,6 +505,7 @@ class drawable_chem_vertex(GraphVertexMixin,
   @x.setter
   def x( self, x):
     self._x = Screen.any_to_px( x)
+    self._coords_changed()
 
 
   @property
@@ -512,6 +516,16 @@ class drawable_chem_vertex(GraphVertexMixin,
   @y.setter
   def y(self, y):
     self._y = Screen.any_to_px( y)
+    self._coords_changed()
+
+
+  def _coords_changed( self):
+    # keep the paper spatial grid in step with the model coordinates, however
+    # they were changed (move, undo, transform, template placement)
+    if getattr( self, 'item', None):
+      paper = self.paper
+      if paper is not None:
+        paper.spatial_index_moved( self)
 
 
   @property
@@ -32,7 +32,7 @@ from oasa.transform_lib import Transform
 import oasa
 import oasa.atom_lib
 import oasa.oasa_config
-import oasa.smiles_lib
+import oasa.template_cache
 from oasa.molecule_lib import Molecule as oasa_molecule_class
 
 from bkchem import bkchem_config
@@ -284,8 +284,10 @@ class template_manager(object):
 		# chemistry-only methods like remove_unimportant_hydrogens)
 		saved_class = oasa.oasa_config.Config.molecule_class
 		oasa.oasa_config.Config.molecule_class = oasa_molecule_class
-		# parse SMILES and generate 2D coordinates
-		mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=1)
+		# parse SMILES and generate 2D coordinates, or reuse the layout
+		# stored on disk by an earlier session of BKChem or BKChem-Qt
+		cache = oasa.template_cache.get_cache(os_support.get_template_cache_path())
+		mol = cache.layout(smiles)
 		# restore the BKChem molecule class
 		oasa.oasa_config.Config.molecule_class = saved_class
 		if not mol:
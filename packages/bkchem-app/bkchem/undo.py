@@ -27,14 +27,31 @@ exported in __all__.
 ## NOTE that undo uses a low-level access to objects in order to
 ## speed up the task.
 
+## Records are deltas: a new record re-records only the top level objects
+## and the objects marked dirty (see mark_dirty) since the previous record,
+## and shares the previous per-object dicts of everything else. A top level
+## object whose children changed is walked again as a whole. Each record
+## remembers the dicts it created (owned) to keep the memory budget
+## accounting exact when records are dropped.
+
+import sys
 import copy
 import inspect
+import weakref
 
-from bkchem import bkchem_utils
 
 
+__all__= ['undo_manager', 'mark_dirty']
 
-__all__= ['undo_manager']
+
+# objects changed since they were last recorded; weak, so deleted objects
+# do not linger here
+_dirty = weakref.WeakSet()
+
+
+def mark_dirty( o):
+  """marks o as changed, the next undo record will record it again"""
+  _dirty.add( o)
 
 ##-------------------- UNDO MANAGER --------------------
 
@@ -43,6 +60,9 @@ class undo_manager(object):
 
   """
   MAX_RECORDS = 50
+  # approximate bytes of recorded state kept for undo; oldest records are
+  # dropped beyond it (the two newest records are always kept)
+  MEMORY_BUDGET = 64 * 1024 * 1024
 
   def __init__( self, paper):
     """well, init"""
@@ -57,16 +77,32 @@ class undo_manager(object):
     if len( self._records)-1 > self._pos:
       del self._records[ (self._pos+1):]
     if len( self._records) >= self.MAX_RECORDS:
-      del self._records[0]
-      self._pos -= 1
-    self._records.append( state_record( self.paper, name=name))
+      self._drop_first_record()
+    previous = self._records[ self._pos] if self._pos >= 0 else None
+    dirty = set( _dirty)
+    record = state_record( self.paper, name=name, previous=previous, dirty=dirty)
+    _dirty.difference_update( [o for o in dirty if o in record.records])
+    self._records.append( record)
     self._pos += 1
+    while len( self._records) > 2 and self.get_memory_usage() > self.MEMORY_BUDGET:
+      self._drop_first_record()
+
+  def _drop_first_record( self):
+    dropped = self._records.pop( 0)
+    if self._records:
+      self._records[0].adopt( dropped)
+    self._pos -= 1
+
+  def get_memory_usage( self):
+    """returns approximate number of bytes held by all undo records"""
+    return sum( record.nbytes for record in self._records)
 
   def undo( self):
     """undoes the last step and returns the number of undo records available"""
     self._pos -= 1
     if self._pos >= 0:
       self._records[ self._pos].undo( self._records[ self._pos+1])
+      self._forget_restored( self._records[ self._pos])
     else:
       self._pos = 0
     return self._pos
@@ -76,10 +112,16 @@ class undo_manager(object):
     self._pos += 1
     if self._pos < len( self._records):
       self._records[ self._pos].undo( self._records[ self._pos-1])
+      self._forget_restored( self._records[ self._pos])
     else:
       self._pos = len( self._records)-1
     return len( self._records) - self._pos -1
 
+  def _forget_restored( self, record):
+    """the paper matches record after undo or redo, so the objects it holds
+    are not dirty anymore"""
+    _dirty.difference_update( [o for o in _dirty if o in record.records])
+
   def clean( self):
     """removes all undo informations, does not start new undo record"""
     self._pos = -1
@@ -107,7 +149,8 @@ class undo_manager(object):
     especially powerfull in combination with named records;
     use with care - it could cause problems"""
     if self._pos > 0:
-      del self._records[ self._pos-1]
+      dropped = self._records.pop( self._pos-1)
+      self._records[ self._pos-1].adopt( dropped)
       self._pos -= 1
 
   def get_number_of_records( self):
@@ -123,22 +166,22 @@ class undo_manager(object):
 
   def compare_records( self, o, state_rec1, state_rec2):
     """returns True if the object o changed between ref1 and ref2"""
-    x1 = o in state_rec1.objects
-    x2 = o in state_rec2.objects
-    if (x1 and not x2) or (x2 and not x1):
+    rec1 = state_rec1.records.get( o)
+    rec2 = state_rec2.records.get( o)
+    if (rec1 is None) != (rec2 is None):
       # one record does not have o
       return False
-    if not x1 and not x2:
+    if rec1 is None:
       # no record has o - they are the same then
       return True
-    rec1 = state_rec1.records[ state_rec1.objects.index( o)]
-    rec2 = state_rec2.records[ state_rec2.objects.index( o)]
-    for a in o.meta__undo_fake + o.meta__undo_simple + o.meta__undo_properties:
-      if rec1[a] != rec2[a]:
-        return False
-    for a in o.meta__undo_copy:
-      if rec1[a] != rec2[a]:
-        return False
+    if rec1 is not rec2:
+      # shared records are equal, only the children need a look
+      for a in o.meta__undo_fake + o.meta__undo_simple + o.meta__undo_properties:
+        if rec1[a] != rec2[a]:
+          return False
+      for a in o.meta__undo_copy:
+        if rec1[a] != rec2[a]:
+          return False
     # process the chidren
     for a in o.meta__undo_children_to_record:
       obj = getattr( o, a)
@@ -177,34 +220,86 @@ class state_record(object):
   """Class for storing and setting state of the whole system.
 
   """
-  def __init__( self, paper, name=''):
-    """hmmm, what is supposed to be in comment for __init__?"""
+  def __init__( self, paper, name='', previous=None, dirty=None):
+    """records the state of paper; objects that are not in dirty share the
+    per-object dicts of the previous record"""
     self.paper = paper
-    self.objects = []
-    self.records = []
+    # object -> recorded attribute dict, in recording order
+    self.records = {}
+    # top level object -> the part of records for it and its children
+    self.subtrees = {}
+    # object -> approximate size of the dicts this record created
+    self.owned = {}
+    self.nbytes = 0
     self.name = name
     self.stack = []
-    self.record_state()
+    self.record_state( previous=previous, dirty=dirty)
 
 
   def clean( self):
     del self.stack
     del self.paper
-    del self.objects
     del self.records
+    del self.subtrees
+    del self.owned
     del self.name
 
 
-  def record_state( self):
+  def record_state( self, previous=None, dirty=None):
     """stores all necessary information about the system, so that its than able to
-    fully recover that state."""
+    fully recover that state.
+    Without dirty (the set of objects changed since previous) everything is
+    recorded again."""
     self.stack = copy.copy( self.paper.stack)
-
+    previous_records = previous.records if previous is not None else {}
+    previous_subtrees = previous.subtrees if previous is not None else {}
     for o in self.paper.top_levels:
-      self.record_object( o)
+      old = previous_subtrees.get( o)
+      if old is None or dirty is None:
+        subtree = {}
+        self.record_object( o, previous_records, subtree)
+      else:
+        subtree = self.update_subtree( o, old, dirty, previous_records)
+      self.subtrees[ o] = subtree
+      self.records.update( subtree)
+
+
+  def update_subtree( self, top, old, dirty, previous_records):
+    """returns the records of top and its children, reusing old (the
+    previous records of them) for everything that is not dirty"""
+    subtree = None
+    for o in [top] + list( dirty.intersection( old)):
+      rec = self.record_own( o, old.get( o))
+      if rec is old[ o]:
+        continue
+      for a in o.meta__undo_children_to_record:
+        if a not in rec or rec[ a] != old[ o][ a]:
+          # children were added or removed, walk the whole tree again
+          subtree = {}
+          self.record_object( top, previous_records, subtree)
+          return subtree
+      if subtree is None:
+        subtree = dict( old)
+      subtree[ o] = rec
+    return old if subtree is None else subtree
+
+
+  def record_object( self, o, previous_records, subtree):
+    """records o and its children into subtree"""
+    subtree[ o] = self.record_own( o, previous_records.get( o) if previous_records else None)
+    # process the chidren
+    for a in o.meta__undo_children_to_record:
+      obj = getattr( o, a)
+      if isinstance(obj, (list, set)):
+        [self.record_object( i, previous_records, subtree) for i in obj]
+      elif isinstance(obj, dict):
+        [self.record_object( i, previous_records, subtree) for i in obj.values() if i]
+      else:
+        self.record_object( obj, previous_records, subtree)
 
 
-  def record_object( self, o):
+  def record_own( self, o, old):
+    """returns the record of the attributes of o, old when they did not change"""
     rec = {}
     for a in o.meta__undo_fake:
       rec[a] = getattr( o, a)
@@ -213,18 +308,27 @@ class state_record(object):
     for a in o.meta__undo_properties:
       rec[a] = getattr( o, a)
     for a in o.meta__undo_copy:
-      rec[a] = copy.copy( o.__dict__[a])
-    self.objects.append( o)
-    self.records.append( rec)
-    # process the chidren
-    for a in o.meta__undo_children_to_record:
-      obj = getattr( o, a)
-      if isinstance(obj, (list, set)):
-        [self.record_object( i) for i in obj]
-      elif isinstance(obj, dict):
-        [self.record_object( i) for i in obj.values() if i]
+      value = o.__dict__[a]
+      if old is not None and a in old and old[a] == value:
+        # recorded copies are never mutated, so they can be shared
+        rec[a] = old[a]
       else:
-        self.record_object( obj)
+        rec[a] = copy.copy( value)
+    if old is not None and old == rec:
+      return old
+    if o not in self.owned:
+      size = _record_nbytes( rec)
+      self.owned[ o] = size
+      self.nbytes += size
+    return rec
+
+
+  def adopt( self, dropped):
+    """takes over ownership of dicts shared with a dropped earlier record"""
+    for o, size in dropped.owned.items():
+      if o not in self.owned and self.records.get( o) is dropped.records[ o]:
+        self.owned[ o] = size
+        self.nbytes += size
 
 
   def undo( self, previous):
@@ -236,25 +340,26 @@ class state_record(object):
     """sets the system to the recorded state (update is done only where necessary,
     not changed values are not touched)."""
     # we need to know about deleted bonds before we try to redraw them (when updating atom)
-    deleted = bkchem_utils.difference( self.objects, previous.objects)
-    added = bkchem_utils.difference( previous.objects, self.objects)
+    deleted = [o for o in self.records if o not in previous.records]
+    added = [o for o in previous.records if o not in self.records]
+    deleted_set = set( deleted)
+    added_set = set( added)
     to_redraw = set()
     ## CHANGED OBJECTS
-    i = 0
-    for o in self.objects:
+    for o, rec in self.records.items():
       changed = 0
       for a in o.meta__undo_fake:
         # fakes serve only to force redraw in some cases however do not perform any undo
-        if self.records[i][a] != getattr( o, a):
+        if rec[a] != getattr( o, a):
           changed = 1
       for a in o.meta__undo_simple:
-        if self.records[i][a] != o.__dict__[a]:
-          o.__dict__[a] = self.records[i][a]
+        if rec[a] != o.__dict__[a]:
+          o.__dict__[a] = rec[a]
           if a != 'molecule':  # this jumps a little from the clean, meta-driven design, however saves much time
             changed = 1
       for a in o.meta__undo_copy:
-        if self.records[i][a] != o.__dict__[a]:
-          o.__dict__[a] = copy.copy( self.records[i][a])
+        if rec[a] != o.__dict__[a]:
+          o.__dict__[a] = copy.copy( rec[a])
           changed = 1
           # this part is not meta driven, I have to rewrite it one day
           if a == 'bonds':
@@ -264,15 +369,15 @@ class state_record(object):
           # / end of the shitty patch
       for a in o.meta__undo_properties:
         if hasattr( o, a):
-          if self.records[i][a] != getattr( o, a):
-            setattr( o, a, self.records[i][a])
+          if rec[a] != getattr( o, a):
+            setattr( o, a, rec[a])
             changed = 1
 
       if changed:
         to_redraw.add( o)
         # some hacks needed to ensure complete redraw
         if o.object_type == 'atom':
-          neigh_edges = set( [b for b in o.neighbor_edges if b not in deleted and b not in added])
+          neigh_edges = set( [b for b in o.neighbor_edges if b not in deleted_set and b not in added_set])
           to_redraw |= neigh_edges
           # neighboring edges of the atoms edges - needed because of new bond drawing code
           # that takes neighboring edges into account
@@ -280,16 +385,14 @@ class state_record(object):
           for e in neigh_edges:
             # collect edges adjacent to both atoms of each neighboring bond
             for a_of_e in e.get_atoms():
-              neigh_edges2 |= set([e2 for e2 in a_of_e.neighbor_edges if e2 not in added])
+              neigh_edges2 |= set([e2 for e2 in a_of_e.neighbor_edges if e2 not in added_set])
           to_redraw |= neigh_edges2
         elif o.object_type == 'bond':
-          to_redraw |= set( [a for a in o.get_atoms() if a.show and not a in deleted and not a in added])
+          to_redraw |= set( [a for a in o.get_atoms() if a.show and not a in deleted_set and not a in added_set])
         elif o.object_type == 'point':
           to_redraw.add( o)
           to_redraw.add( o.parent)
 
-      i += 1
-
     ## DELETED OBJECTS
     # deleted are known from the top of this def
     for o in deleted:
@@ -301,9 +404,9 @@ class state_record(object):
           o.draw()
       # hacks to ensure complete redraw
       if o.object_type == 'atom':
-        to_redraw |= set( [b for b in o.neighbor_edges if b not in deleted])
+        to_redraw |= set( [b for b in o.neighbor_edges if b not in deleted_set])
       elif o.object_type == 'bond':
-        to_redraw |= set( [a for a in o.get_atoms() if a.show and not a in deleted])
+        to_redraw |= set( [a for a in o.get_atoms() if a.show and not a in deleted_set])
       elif o.object_type == 'point':
         to_redraw.add( o)
         to_redraw.add( o.parent)
@@ -319,7 +422,7 @@ class state_record(object):
     to_redraw = list( to_redraw)
     to_redraw.sort(key=_redraw_sorting)
     for o in to_redraw:
-      if o not in deleted and o.object_type != 'molecule' and hasattr(o,'redraw'):
+      if o not in deleted_set and o.object_type != 'molecule' and hasattr(o,'redraw'):
         if hasattr( o, "after_undo"):
           o.after_undo()
         if o.object_type == 'atom':
@@ -332,11 +435,7 @@ class state_record(object):
 
 
   def get_record( self, o):
-    if o in self.objects:
-      i = self.objects.index(o)
-      return self.records[i]
-    else:
-      return None
+    return self.records.get( o)
 
   def object_changed( self, o):
     """returns True if the object o differs from the state recorded here"""
@@ -367,6 +466,12 @@ class state_record(object):
 
 
 
+def _record_nbytes( rec):
+  """approximate size of one recorded attribute dict (shallow per value)"""
+  return sys.getsizeof( rec) + sum( sys.getsizeof( v) for v in rec.values())
+
+
+
 REDRAW_PREFERENCES = ("atom", "bond")
 
 def cmp_to_key(mycmp):
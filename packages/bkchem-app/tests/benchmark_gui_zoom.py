@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark Tk zoom latency against document size.
+
+Opens the BKChem GUI (a display is required), tiles copies of cholesterol
+on the paper and times zoom_in()/zoom_out() steps with viewport culling
+on and off. With culling on it also times redraw_stale(), the cost paid
+later when the rest of the drawing is scrolled into view. Runs from the
+repo root.
+"""
+
+# Standard Library
+import sys
+import time
+import builtins
+import argparse
+
+# ensure bkchem and OASA are importable from the repo tree
+sys.path.insert(0, "packages/bkchem-app")
+sys.path.insert(0, "packages/oasa")
+
+
+CHOLESTEROL_SMILES = "CC(C)CCCC(C)C1CCC2C3CC=C4C[C@H](O)CC[C@]4(C)C3CC[C@]12C"
+# tile pitch in model units, larger than one cholesterol drawing
+TILE_DX = 260.0
+TILE_DY = 160.0
+TILES_PER_ROW = 10
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time Tk zoom steps with and without viewport culling"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[10, 50, 200],
+		help="Cholesterol copies on the paper (default: 10 50 200)",
+	)
+	parser.add_argument(
+		'-n', '--steps', dest='steps',
+		type=int, default=4,
+		help="Zoom in/out pairs timed per run (default: 4)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def start_app():
+	"""Create a withdrawn-then-shown BKChem window with preferences set."""
+	if "_" not in builtins.__dict__:
+		builtins.__dict__["_"] = lambda m: m
+	if "ngettext" not in builtins.__dict__:
+		builtins.__dict__["ngettext"] = lambda s, p, n: s if n == 1 else p
+	from bkchem import os_support
+	from bkchem import pref_manager
+	from bkchem import singleton_store
+	if singleton_store.Store.pm is None:
+		singleton_store.Store.pm = pref_manager.pref_manager([
+			os_support.get_config_filename("prefs.xml", level="global", mode="r"),
+			os_support.get_config_filename("prefs.xml", level="personal", mode="r"),
+		])
+	import bkchem.main
+	app = bkchem.main.BKChem()
+	app.withdraw()
+	app.initialize()
+	app.deiconify()
+	app.update()
+	return app
+
+
+#============================================
+def fill_paper(app, copies: int) -> int:
+	"""Tile cholesterol copies on a fresh paper; return the atom count."""
+	paper = app.paper
+	paper.clean_paper()
+	atoms = 0
+	for index in range(copies):
+		mol = app.read_smiles(CHOLESTEROL_SMILES)
+		if isinstance(mol, list):
+			mol = mol[0]
+		col = index % TILES_PER_ROW
+		row = index // TILES_PER_ROW
+		mol.move(col * TILE_DX, row * TILE_DY)
+		atoms += len(mol.atoms)
+	paper.zoom_reset()
+	paper.xview_moveto(0.0)
+	paper.yview_moveto(0.0)
+	app.update()
+	return atoms
+
+
+#============================================
+def time_zoom(app, steps: int, culling: bool) -> tuple:
+	"""Return (mean ms per zoom step, ms to redraw what was left stale)."""
+	paper = app.paper
+	paper.zoom_culling = culling
+	app.update()
+	start = time.perf_counter()
+	for _ in range(steps):
+		paper.zoom_in()
+		paper.zoom_out()
+	zoom_ms = 1000 * (time.perf_counter() - start) / (2 * steps)
+	start = time.perf_counter()
+	paper.redraw_stale()
+	stale_ms = 1000 * (time.perf_counter() - start)
+	app.update()
+	return zoom_ms, stale_ms
+
+
+#============================================
+def main() -> None:
+	args = parse_args()
+	app = start_app()
+	try:
+		print(
+			f"{'copies':>7} {'atoms':>7} {'full ms/step':>13}"
+			f" {'culled ms/step':>15} {'stale flush ms':>15}"
+		)
+		for copies in args.sizes:
+			atoms = fill_paper(app, copies)
+			full_ms, _stale = time_zoom(app, args.steps, culling=False)
+			culled_ms, stale_ms = time_zoom(app, args.steps, culling=True)
+			print(
+				f"{copies:>7} {atoms:>7} {full_ms:>13.1f}"
+				f" {culled_ms:>15.1f} {stale_ms:>15.1f}"
+			)
+	finally:
+		app.destroy()
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark merging two overlapping fragments, as after a big paste.
+
+Builds two BkMolecule chains of the same size, the second shifted by one
+unit so every atom lies on top of an atom of the first, and times the
+two steps of paper.handle_overlap(): finding overlapping atom pairs and
+BkMolecule.handle_overlap() on the merged molecule. Each step is timed
+with the spatial grid and with the former all-pairs loops. Tk drawing is
+replaced by a small stand-in paper, so no display is needed.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure bkchem and OASA are importable from the repo tree
+sys.path.insert(0, "packages/bkchem-app")
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import bkchem.chem_compat
+from bkchem import classes
+from bkchem import spatial_grid
+from bkchem.bond_lib import BkBond
+from bkchem.molecule_lib import BkMolecule
+from bkchem.singleton_store import Store
+
+
+ROW_LENGTH = 40
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time overlap merging of two pasted fragments"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[250, 1000, 2000],
+		help="Atoms per fragment (default: 250 1000 2000)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+class BenchPaper:
+	"""Paper stand-in with the standard and no canvas."""
+	standard = classes.standard()
+
+	def real_to_canvas(self, value):
+		return value
+
+	def canvas_to_real(self, value):
+		return value
+
+	def delete(self, *items):
+		pass
+
+	def unregister_id(self, id):
+		pass
+
+
+#============================================
+class BenchApp:
+	"""Application stand-in exposing the paper."""
+	paper = None
+
+
+#============================================
+def build_fragment(paper, n_atoms: int, offset: float) -> BkMolecule:
+	"""Return a zigzag chain laid out in rows."""
+	mol = BkMolecule(paper=paper)
+	previous = None
+	for index in range(n_atoms):
+		atom = mol.create_vertex()
+		atom.x = 30.0 * (index % ROW_LENGTH) + offset
+		atom.y = 26.0 * (index // ROW_LENGTH) + offset
+		atom.z = 0
+		mol.add_vertex(atom)
+		if previous is not None:
+			mol.add_edge(previous, atom, mol.create_edge())
+		previous = atom
+	return mol
+
+
+#============================================
+def legacy_pairs(atoms: list) -> list:
+	"""Pair search as paper.handle_overlap() did it, minus the Tk queries."""
+	overlap = []
+	for a1 in atoms:
+		for a2 in atoms:
+			if a1 is not a2 and abs(a1.x - a2.x) < 2 and abs(a1.y - a2.y) < 2:
+				if [a2, a1] not in overlap and a1.z == a2.z:
+					overlap.append([a1, a2])
+	return overlap
+
+
+#============================================
+def legacy_close_pairs(atoms: list) -> list:
+	"""The all-pairs loop BkMolecule.handle_overlap() used."""
+	pairs = []
+	for i in range(len(atoms)):
+		for j in range(i + 1, len(atoms)):
+			if abs(atoms[i].x - atoms[j].x) < 4 and abs(atoms[i].y - atoms[j].y) < 4:
+				pairs.append((i, j))
+	return pairs
+
+
+#============================================
+def bench_size(paper, n_atoms: int) -> dict:
+	first = build_fragment(paper, n_atoms, 0.0)
+	second = build_fragment(paper, n_atoms, 1.0)
+	atoms = first.atoms + second.atoms
+	points = [(a.x, a.y) for a in atoms]
+	start = time.perf_counter()
+	spatial_grid.close_point_pairs(points, 2)
+	grid_pairs_ms = 1000 * (time.perf_counter() - start)
+	start = time.perf_counter()
+	legacy_pairs(atoms)
+	legacy_pairs_ms = 1000 * (time.perf_counter() - start)
+	start = time.perf_counter()
+	legacy_close_pairs(atoms)
+	legacy_scan_ms = 1000 * (time.perf_counter() - start)
+	first.eat_molecule(second)
+	start = time.perf_counter()
+	deleted = first.handle_overlap()
+	merge_ms = 1000 * (time.perf_counter() - start)
+	result = {
+		'atoms': n_atoms,
+		'deleted': len(deleted),
+		'grid_pairs_ms': grid_pairs_ms,
+		'legacy_pairs_ms': legacy_pairs_ms,
+		'merge_ms': merge_ms,
+		'legacy_scan_ms': legacy_scan_ms,
+	}
+	return result
+
+
+#============================================
+def main() -> None:
+	args = parse_args()
+	bkchem.chem_compat.register_bkchem_classes()
+	paper = BenchPaper()
+	BenchApp.paper = paper
+	Store.app = BenchApp()
+	# bond redraws go to Tk; the merge itself is what is timed
+	BkBond.redraw = lambda self, **kw: None
+	print(
+		f"{'atoms':>6} {'deleted':>8} {'pairs ms':>9} {'legacy pairs ms':>16}"
+		f" {'merge ms':>9} {'legacy scan ms':>15}"
+	)
+	for size in args.sizes:
+		row = bench_size(paper, size)
+		print(
+			f"{row['atoms']:>6} {row['deleted']:>8} {row['grid_pairs_ms']:>9.2f}"
+			f" {row['legacy_pairs_ms']:>16.1f} {row['merge_ms']:>9.2f}"
+			f" {row['legacy_scan_ms']:>15.1f}"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Benchmark undo record and undo latency against document size.
+
+Builds documents of stand-in molecules that follow the meta__undo_*
+protocol (no Tk needed, but with the bkchem attribute hook that marks
+changed objects dirty), moves a few atoms per step like a drag would, and
+times undo_manager.start_new_record() and undo(). For comparison it also
+times the previous full-copy recording and the list-based difference of
+deleted and added objects, and reports the bytes each record holds.
+"""
+
+# Standard Library
+import sys
+import copy
+import time
+import argparse
+
+# ensure bkchem is importable from the repo tree
+sys.path.insert(0, "packages/bkchem-app")
+
+# local repo modules
+from bkchem import undo
+from bkchem.parents import simple_parent
+
+
+ATOMS_PER_MOLECULE = 20
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time delta undo records against document size"
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes',
+		type=int, nargs='+', default=[200, 1000, 5000, 20000],
+		help="Document sizes in atoms (default: 200 1000 5000 20000)",
+	)
+	parser.add_argument(
+		'-n', '--steps', dest='steps',
+		type=int, default=20,
+		help="Edit steps recorded per size (default: 20)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+class BenchAtom(simple_parent):
+	"""Atom-like object with the attribute mix of bkchem atoms."""
+	object_type = 'atom'
+	meta__undo_simple = ('x', 'y', 'z', 'show', 'charge')
+	meta__undo_properties = ('symbol', 'font_size', 'line_color')
+
+	def __init__(self, x, y):
+		self.x = x
+		self.y = y
+		self.z = 0
+		self.show = 0
+		self.charge = 0
+		self.symbol = 'C'
+		self.font_size = 12
+		self.line_color = '#000'
+		self.neighbor_edges = []
+
+	def redraw(self, suppress_reposition=0):
+		pass
+
+
+#============================================
+class BenchMolecule(simple_parent):
+	"""Molecule-like container recorded by copy."""
+	object_type = 'molecule'
+	meta__undo_properties = ('name',)
+	meta__undo_copy = ('atoms',)
+	meta__undo_children_to_record = ('atoms',)
+
+	def __init__(self, offset):
+		self.name = 'mol'
+		self.atoms = [BenchAtom(offset + i, float(i)) for i in range(ATOMS_PER_MOLECULE)]
+		self.vertices = self.atoms
+
+
+#============================================
+class BenchPaper:
+	"""Paper-like holder of top level objects."""
+
+	def __init__(self, n_atoms):
+		count = max(1, n_atoms // ATOMS_PER_MOLECULE)
+		self.stack = [BenchMolecule(100.0 * i) for i in range(count)]
+
+	@property
+	def top_levels(self):
+		return self.stack
+
+	def add_bindings(self):
+		pass
+
+
+#============================================
+def legacy_record(paper) -> tuple:
+	"""Record the whole document the way undo did before delta records."""
+	objects = []
+	records = []
+
+	def record_object(o):
+		rec = {}
+		for a in o.meta__undo_fake + o.meta__undo_simple + o.meta__undo_properties:
+			rec[a] = getattr(o, a)
+		for a in o.meta__undo_copy:
+			rec[a] = copy.copy(o.__dict__[a])
+		objects.append(o)
+		records.append(rec)
+		for a in o.meta__undo_children_to_record:
+			for child in getattr(o, a):
+				record_object(child)
+
+	for o in paper.top_levels:
+		record_object(o)
+	return objects, records
+
+
+#============================================
+def legacy_difference(a, b) -> list:
+	"""List difference as done by bkchem_utils.difference."""
+	ret = list(a)
+	for i in b:
+		if i in ret:
+			ret.remove(i)
+	return ret
+
+
+#============================================
+def edit(paper, step: int) -> None:
+	"""Move three atoms of one molecule, like a small drag."""
+	mol = paper.stack[step % len(paper.stack)]
+	for atom in mol.atoms[:3]:
+		atom.x += 1.0
+
+
+#============================================
+def bench_size(n_atoms: int, steps: int) -> dict:
+	paper = BenchPaper(n_atoms)
+	manager = undo.undo_manager(paper)
+	record_times = []
+	for step in range(steps):
+		edit(paper, step)
+		start = time.perf_counter()
+		manager.start_new_record()
+		record_times.append(time.perf_counter() - start)
+	first_bytes = manager._records[0].nbytes
+	delta_bytes = sum(record.nbytes for record in manager._records[1:]) / max(1, steps)
+	start = time.perf_counter()
+	for _ in range(steps):
+		manager.undo()
+	undo_time = (time.perf_counter() - start) / steps
+
+	legacy_times = []
+	for _ in range(min(steps, 5)):
+		start = time.perf_counter()
+		objects, _records = legacy_record(paper)
+		legacy_times.append(time.perf_counter() - start)
+	# undo across a deletion: previous record lacks one molecule
+	start = time.perf_counter()
+	legacy_difference(objects, objects[ATOMS_PER_MOLECULE + 1:])
+	legacy_diff_time = time.perf_counter() - start
+	previous = set(objects[ATOMS_PER_MOLECULE + 1:])
+	start = time.perf_counter()
+	[o for o in objects if o not in previous]
+	set_diff_time = time.perf_counter() - start
+	result = {
+		'atoms': len(paper.stack) * ATOMS_PER_MOLECULE,
+		'record_ms': 1000 * min(record_times),
+		'legacy_record_ms': 1000 * min(legacy_times),
+		'undo_ms': 1000 * undo_time,
+		'diff_ms': 1000 * set_diff_time,
+		'legacy_diff_ms': 1000 * legacy_diff_time,
+		'first_kib': first_bytes / 1024.0,
+		'delta_kib': delta_bytes / 1024.0,
+	}
+	return result
+
+
+#============================================
+def main() -> None:
+	args = parse_args()
+	print(
+		f"{'atoms':>7} {'record ms':>10} {'legacy ms':>10} {'undo ms':>9}"
+		f" {'diff ms':>9} {'legacy diff ms':>15} {'full KiB':>9} {'delta KiB':>10}"
+	)
+	for size in args.sizes:
+		row = bench_size(size, args.steps)
+		print(
+			f"{row['atoms']:>7} {row['record_ms']:>10.2f} {row['legacy_record_ms']:>10.2f}"
+			f" {row['undo_ms']:>9.2f} {row['diff_ms']:>9.3f} {row['legacy_diff_ms']:>15.2f}"
+			f" {row['first_kib']:>9.1f} {row['delta_kib']:>10.2f}"
+		)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
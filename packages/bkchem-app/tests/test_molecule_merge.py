@@ -0,0 +1,153 @@
+"""Tests for BkMolecule edits that move bonds onto another atom.
+
+replace_vertices() and handle_overlap() re-attach bonds with
+change_atoms() and then delete the old atom. The graph caches (the
+rustworkx mirror and the ring cache) must agree with a full rebuild
+afterwards. Tk drawing is replaced by a small stand-in paper.
+"""
+
+# Standard Library
+import math
+import warnings
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import bkchem.chem_compat
+from bkchem import classes
+from bkchem.bond_lib import BkBond
+from bkchem.molecule_lib import BkMolecule
+from bkchem.singleton_store import Store
+
+
+#============================================
+class StandInPaper:
+	"""Paper stand-in with the standard and no canvas."""
+	standard = classes.standard()
+
+	def real_to_canvas(self, value):
+		return value
+
+	def canvas_to_real(self, value):
+		return value
+
+	def delete(self, *items):
+		pass
+
+	def unregister_id(self, id):
+		pass
+
+
+#============================================
+class StandInApp:
+	"""Application stand-in exposing the paper."""
+	paper = None
+
+
+#============================================
+@pytest.fixture
+def paper(monkeypatch):
+	bkchem.chem_compat.register_bkchem_classes()
+	paper = StandInPaper()
+	app = StandInApp()
+	app.paper = paper
+	monkeypatch.setattr(Store, "app", app, raising=False)
+	monkeypatch.setattr(BkBond, "redraw", lambda self, **kw: None)
+	return paper
+
+
+#============================================
+def _add_atom(mol, x, y):
+	atom = mol.create_vertex()
+	atom.x = x
+	atom.y = y
+	atom.z = 0
+	mol.add_vertex(atom)
+	return atom
+
+
+#============================================
+def _ring(paper, size=6):
+	"""Return a BkMolecule ring with warm graph caches."""
+	mol = BkMolecule(paper=paper)
+	atoms = [_add_atom(mol, 30.0 * math.cos(2 * math.pi * i / size),
+		30.0 * math.sin(2 * math.pi * i / size)) for i in range(size)]
+	for i in range(size):
+		mol.add_edge(atoms[i], atoms[(i + 1) % size], mol.create_edge())
+	# query once so the incremental caches are live before the edit
+	assert len(mol.get_smallest_independent_cycles()) == 1
+	assert mol.is_connected()
+	return mol, atoms
+
+
+#============================================
+def _graph_state(mol) -> tuple:
+	rings = sorted(len(ring) for ring in mol.get_smallest_independent_cycles())
+	components = len(list(mol.get_connected_components()))
+	return (rings, components, mol.is_connected())
+
+
+#============================================
+def test_replace_vertices_keeps_ring(paper):
+	mol, atoms = _ring(paper)
+	new = mol.create_vertex()
+	new.x, new.y, new.z = atoms[0].x, atoms[0].y, 0
+	mol.replace_vertices(atoms[0], new)
+	state = _graph_state(mol)
+	assert state == ([6], 1, True)
+	mol._chem_mol._flush_cache()
+	assert _graph_state(mol) == state
+
+
+#============================================
+def test_handle_overlap_merges_into_ring(paper):
+	mol, atoms = _ring(paper)
+	# a pendant chain whose end lies on top of a ring atom
+	tail = _add_atom(mol, 100.0, 0.0)
+	end = _add_atom(mol, atoms[0].x + 1.0, atoms[0].y)
+	mol.add_edge(tail, end, mol.create_edge())
+	assert _graph_state(mol) == ([6], 2, False)
+	mol.handle_overlap()
+	state = _graph_state(mol)
+	assert state == ([6], 1, True)
+	assert end not in mol.vertices
+	mol._chem_mol._flush_cache()
+	assert _graph_state(mol) == state
+
+
+#============================================
+def test_handle_overlap_merges_shared_neighbor_once(paper):
+	"""An atom close to two atoms that are apart is merged and deleted once."""
+	mol = BkMolecule(paper=paper)
+	left = _add_atom(mol, 0.0, 0.0)
+	right = _add_atom(mol, 6.0, 0.0)
+	middle = _add_atom(mol, 3.0, 0.0)
+	above = _add_atom(mol, 3.0, 30.0)
+	bond = mol.create_edge()
+	mol.add_edge(middle, above, bond)
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		deleted = mol.handle_overlap()
+	assert deleted == [middle]
+	assert mol.vertices == [left, right, above]
+	assert bond.atom1 is left or bond.atom2 is left
+	assert left.neighbors == [above]
+	assert right.neighbors == []
+	assert _graph_state(mol) == ([], 2, False)
+
+
+#============================================
+def test_change_atoms_resyncs_graph_caches(paper):
+	"""A bond moved with change_atoms() alone updates rings and components."""
+	mol, atoms = _ring(paper)
+	bond = mol.get_edge_between(atoms[0], atoms[1])
+	# 0-1 becomes 0-3: a four-ring 0-3-4-5 with the chain 1-2 on atom 3
+	bond.change_atoms(atoms[1], atoms[3])
+	atoms[1].remove_edge_and_neighbor(bond)
+	atoms[0].add_neighbor(atoms[3], bond)
+	atoms[3].add_neighbor(atoms[0], bond)
+	state = _graph_state(mol)
+	assert state == ([4], 1, True)
+	mol._chem_mol._flush_cache()
+	assert _graph_state(mol) == state
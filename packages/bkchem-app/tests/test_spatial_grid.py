@@ -0,0 +1,220 @@
+"""Tests for the model-space spatial grid used by the Tk paper.
+
+Uses small stand-in atoms, bonds and a canvas-free paper so the grid,
+the overlap search and the paper queries run without Tk.
+"""
+
+# Standard Library
+import random
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+from bkchem import undo
+from bkchem import spatial_grid
+from bkchem.atom_lib import BkAtom
+from bkchem.classes import standard
+from bkchem.parents import simple_parent
+from bkchem.paper_lib.paper_id_manager import PaperIdManagerMixin
+from bkchem.paper_lib.paper_spatial import PaperSpatialMixin
+from bkchem.paper_lib.paper_zoom import PaperZoomMixin
+
+
+#============================================
+class FakeAtom:
+	"""Hidden atom drawn as a single registered item."""
+	object_type = 'atom'
+
+	def __init__(self, item, x, y, z=0):
+		self.item = item
+		self.x = x
+		self.y = y
+		self.z = z
+		self.show = 0
+		self.neighbor_edges = []
+
+
+#============================================
+class FakeBond:
+	"""Single bond between two fake atoms."""
+	object_type = 'bond'
+	order = 1
+	line_width = 1.0
+	bond_width = 6.0
+
+	def __init__(self, item, atom1, atom2):
+		self.item = item
+		self.atom1 = atom1
+		self.atom2 = atom2
+		atom1.neighbor_edges.append(self)
+		atom2.neighbor_edges.append(self)
+
+
+#============================================
+class FakePaper(PaperZoomMixin, PaperSpatialMixin, PaperIdManagerMixin):
+	"""Paper at zoom 1 that fails if hover queries reach the canvas."""
+
+	def __init__(self):
+		self._id_2_object = {}
+
+	def canvas_to_real(self, values):
+		return list(values)
+
+	def find_overlapping(self, *args):
+		raise AssertionError("Tk canvas queried")
+
+	def find_enclosed(self, *args):
+		raise AssertionError("Tk canvas queried")
+
+
+#============================================
+def _chain(paper, count, x0=0.0, y0=0.0, first_item=1):
+	"""Register a horizontal chain of atoms 30 apart; return (atoms, bonds)."""
+	atoms = []
+	bonds = []
+	item = first_item
+	for index in range(count):
+		atom = FakeAtom(item, x0 + 30.0 * index, y0)
+		paper.register_id(item, atom)
+		item += 1
+		if atoms:
+			bond = FakeBond(item, atoms[-1], atom)
+			paper.register_id(item, bond)
+			bonds.append(bond)
+			item += 1
+		atoms.append(atom)
+	return atoms, bonds
+
+
+#============================================
+def test_grid_insert_move_remove():
+	grid = spatial_grid.SpatialGrid(cell_size=10)
+	grid.insert('a', 5, 5)
+	grid.insert('b', 0, 0, 35, 5)
+	assert set(grid.query_radius(31, 1, 2)) == {'b'}
+	grid.insert('a', 31, 2)
+	assert set(grid.query_radius(31, 1, 2)) == {'a', 'b'}
+	assert grid.query_radius(5, 5, 1) == ['b']
+	grid.remove('b')
+	assert grid.query_rect(-100, -100, 100, 100) == ['a']
+	assert len(grid) == 1 and 'b' not in grid
+
+
+#============================================
+def test_close_point_pairs_matches_all_pairs_loop():
+	rng = random.Random(7)
+	points = [(rng.uniform(0, 200), rng.uniform(0, 200)) for _ in range(400)]
+	# add exact and near duplicates like a pasted fragment
+	points += [(x + 0.5, y - 1.0) for x, y in points[:50]]
+	expected = []
+	for i in range(len(points)):
+		for j in range(i + 1, len(points)):
+			if abs(points[i][0] - points[j][0]) < 4 and abs(points[i][1] - points[j][1]) < 4:
+				expected.append((i, j))
+	assert spatial_grid.close_point_pairs(points, 4) == expected
+
+
+#============================================
+def test_paper_queries_follow_registration_and_moves():
+	paper = FakePaper()
+	atoms, bonds = _chain(paper, 4)
+	assert paper.atoms_near(31.0, 1.0, 3) == [atoms[1]]
+	assert paper.bonds_near(45.0, 2.0, 3) == [bonds[1]]
+	hits = paper.find_registered_near(30.0, 0.0, 3)
+	# atoms come after (above) bonds, like the Tk stacking order
+	assert hits[-1] == (atoms[1].item, atoms[1])
+	assert set(o for i, o in hits) == {atoms[1], bonds[0], bonds[1]}
+	assert set(paper.find_registered_enclosed(-5, -5, 65, 5)) == set(atoms[:3] + bonds[:2])
+	# moving an atom updates it and its bonds in the grid
+	atoms[3].y += 200.0
+	paper.spatial_index_moved(atoms[3])
+	assert paper.atoms_near(90.0, 200.0, 1) == [atoms[3]]
+	assert paper.bonds_near(75.0, 0.0, 1) == []
+	# unregistering drops it
+	paper.unregister_id(atoms[0].item)
+	assert paper.atoms_near(0.0, 0.0, 3) == []
+
+
+#============================================
+def test_overlapping_atom_pairs_after_paste():
+	paper = FakePaper()
+	first, _bonds = _chain(paper, 50)
+	second, _bonds = _chain(paper, 50, x0=0.5, y0=1.0, first_item=1000)
+	pairs = paper.overlapping_atom_pairs(2)
+	assert pairs == [[a, b] for a, b in zip(first, second)]
+	second[0].z = 1
+	assert [first[0], second[0]] not in paper.overlapping_atom_pairs(2)
+
+
+#============================================
+def test_foreign_objects_fall_back_to_canvas():
+	paper = FakePaper()
+	_chain(paper, 2)
+
+	class Arrow:
+		object_type = 'arrow'
+
+	paper.register_id(500, Arrow())
+	with pytest.raises(AssertionError, match="Tk canvas queried"):
+		paper.find_registered_near(0.0, 0.0, 3)
+
+
+#============================================
+class UndoMolecule(simple_parent):
+	"""Top level holding real BkAtoms for the undo manager."""
+	object_type = 'molecule'
+	meta__undo_copy = ('atoms',)
+	meta__undo_children_to_record = ('atoms',)
+
+	def __init__(self, paper, atoms):
+		self.paper = paper
+		self.atoms = list(atoms)
+
+	def get_fragments_with_vertex(self, vertex):
+		return []
+
+
+#============================================
+class UndoPaper(FakePaper):
+	"""Fake paper with the stack the undo manager records."""
+
+	def __init__(self):
+		FakePaper.__init__(self)
+		self.stack = []
+
+	@property
+	def top_levels(self):
+		return self.stack
+
+	def add_bindings(self):
+		pass
+
+
+#============================================
+def test_undo_moves_atom_in_grid():
+	paper = UndoPaper()
+	mol = UndoMolecule(paper, [])
+	paper.stack.append(mol)
+	std = standard()
+	for index in range(3):
+		atom = BkAtom(standard=std, xy=(30.0 * index, 0.0), molecule=mol)
+		# registered like a drawn atom; undo redraws go nowhere
+		atom.item = index + 1
+		atom.redraw = lambda suppress_reposition=0: None
+		mol.atoms.append(atom)
+		paper.register_id(atom.item, atom)
+	manager = undo.undo_manager(paper)
+	atom = mol.atoms[1]
+	paper.atoms_near(30.0, 0.0, 1)
+	# a plain coordinate change, no move(), updates the grid
+	atom.y = 200.0
+	assert paper.atoms_near(30.0, 200.0, 1) == [atom]
+	assert paper.atoms_near(30.0, 0.0, 1) == []
+	manager.start_new_record()
+	manager.undo()
+	assert atom.y == 0.0
+	assert paper.atoms_near(30.0, 0.0, 1) == [atom]
+	assert paper.atoms_near(30.0, 200.0, 1) == []
+	manager.redo()
+	assert paper.atoms_near(30.0, 200.0, 1) == [atom]
@@ -0,0 +1,221 @@
+"""Tests for delta undo records in bkchem.undo.
+
+Uses small stand-in objects that follow the meta__undo_* protocol so the
+undo manager can be exercised without Tk.
+"""
+
+# Standard Library
+import sys
+
+# local repo modules
+from bkchem import undo
+from bkchem.parents import simple_parent
+
+
+#============================================
+class FakeAtom(simple_parent):
+	"""Minimal undoable atom."""
+	object_type = 'atom'
+	meta__undo_simple = ('x', 'y')
+	meta__undo_properties = ('symbol',)
+
+	def __init__(self, x, y, symbol='C'):
+		self.x = x
+		self.y = y
+		self.symbol = symbol
+		self.show = 0
+		self.neighbor_edges = []
+		self.redraws = 0
+
+	def draw(self):
+		pass
+
+	def redraw(self, suppress_reposition=0):
+		self.redraws += 1
+
+	def delete(self):
+		pass
+
+
+#============================================
+class FakeMolecule(simple_parent):
+	"""Container whose atom list is recorded by copy."""
+	object_type = 'molecule'
+	meta__undo_properties = ('name',)
+	meta__undo_copy = ('atoms',)
+	meta__undo_children_to_record = ('atoms',)
+
+	def __init__(self, atoms):
+		self.name = 'mol'
+		self.atoms = list(atoms)
+		self.vertices = self.atoms
+
+
+#============================================
+class FakePaper:
+	"""Holds the top level objects like the Tk paper does."""
+
+	def __init__(self, n_atoms=10):
+		self.molecule = FakeMolecule(FakeAtom(float(i), 0.0) for i in range(n_atoms))
+		self.stack = [self.molecule]
+
+	@property
+	def top_levels(self):
+		return self.stack
+
+	def add_bindings(self):
+		pass
+
+
+#============================================
+def test_unchanged_objects_share_records():
+	paper = FakePaper()
+	manager = undo.undo_manager(paper)
+	moved = paper.molecule.atoms[3]
+	moved.x = 100.0
+	manager.start_new_record()
+	first, second = manager._records
+	for atom in paper.molecule.atoms:
+		if atom is moved:
+			assert second.records[atom] is not first.records[atom]
+		else:
+			assert second.records[atom] is first.records[atom]
+	# only the moved atom's dict is new
+	assert list(second.owned) == [moved]
+	assert second.nbytes < first.nbytes
+
+
+#============================================
+def test_undo_redo_restores_values_and_atoms():
+	paper = FakePaper(4)
+	manager = undo.undo_manager(paper)
+	mol = paper.molecule
+	removed = mol.atoms.pop()
+	paper.molecule.atoms[0].x = 42.0
+	mol.name = 'renamed'
+	manager.start_new_record()
+	manager.undo()
+	assert mol.atoms[0].x == 0.0
+	assert removed in mol.atoms
+	assert mol.vertices is mol.atoms
+	assert mol.name == 'mol'
+	manager.redo()
+	assert mol.atoms[0].x == 42.0
+	assert removed not in mol.atoms
+	assert mol.name == 'renamed'
+
+
+#============================================
+def test_dropping_records_keeps_shared_state():
+	paper = FakePaper(5)
+	manager = undo.undo_manager(paper)
+	manager.MAX_RECORDS = 3
+	for step in range(6):
+		paper.molecule.atoms[step % 5].y = float(step + 1)
+		manager.start_new_record()
+	assert manager.get_number_of_records() == 3
+	# the oldest record inherited ownership of every dict it still uses
+	oldest = manager._records[0]
+	assert set(oldest.owned) == set(oldest.records)
+	assert manager.get_memory_usage() == sum(
+		sum(sys.getsizeof(v) for v in rec.values()) + sys.getsizeof(rec)
+		for record in manager._records
+		for o, rec in record.records.items() if o in record.owned
+	)
+	manager.undo()
+	manager.undo()
+	# back at the record taken after the fourth step
+	assert paper.molecule.atoms[0].y == 1.0
+	assert paper.molecule.atoms[3].y == 4.0
+	assert paper.molecule.atoms[4].y == 0.0
+
+
+#============================================
+def test_memory_budget_drops_oldest_records():
+	paper = FakePaper(50)
+	manager = undo.undo_manager(paper)
+	manager.MEMORY_BUDGET = manager.get_memory_usage() + 1
+	for step in range(5):
+		for atom in paper.molecule.atoms:
+			atom.x += 1.0
+		manager.start_new_record()
+	# every record changes every atom, so only the two newest fit
+	assert manager.get_number_of_records() == 2
+	assert manager.undo() == 0
+	assert paper.molecule.atoms[0].x == 4.0
+
+
+#============================================
+def test_compare_records_and_object_changed():
+	paper = FakePaper(3)
+	manager = undo.undo_manager(paper)
+	paper.molecule.atoms[1].symbol = 'N'
+	manager.start_new_record()
+	first, second = manager._records
+	assert manager.compare_records(paper.molecule.atoms[0], first, second)
+	assert not manager.compare_records(paper.molecule.atoms[1], first, second)
+	# the molecule record is shared, but a child changed
+	assert not manager.compare_records(paper.molecule, first, second)
+	assert not second.object_changed(paper.molecule)
+	paper.molecule.atoms[2].x = 9.0
+	assert second.object_changed(paper.molecule)
+
+
+#============================================
+def test_record_visits_only_dirty_objects(monkeypatch):
+	paper = FakePaper(20)
+	manager = undo.undo_manager(paper)
+	visited = []
+	record_own = undo.state_record.record_own
+
+	def counting_record_own(self, o, old):
+		visited.append(o)
+		return record_own(self, o, old)
+
+	monkeypatch.setattr(undo.state_record, 'record_own', counting_record_own)
+	moved = paper.molecule.atoms[7]
+	moved.x = 55.0
+	manager.start_new_record()
+	# the top level is always looked at, the clean atoms are not
+	assert sorted(visited, key=id) == sorted([paper.molecule, moved], key=id)
+	assert manager._records[1].records[moved]['x'] == 55.0
+	# nothing changed since, so the next record reuses the whole subtree
+	visited.clear()
+	manager.start_new_record()
+	assert visited == [paper.molecule]
+	assert manager._records[2].subtrees[paper.molecule] is manager._records[1].subtrees[paper.molecule]
+
+
+#============================================
+def test_edits_after_undo_are_recorded():
+	paper = FakePaper(4)
+	manager = undo.undo_manager(paper)
+	atoms = paper.molecule.atoms
+	atoms[0].x = 10.0
+	manager.start_new_record()
+	manager.undo()
+	assert atoms[0].x == 0.0
+	# a new edit after undo starts from the restored state
+	atoms[1].y = 5.0
+	manager.start_new_record()
+	assert manager.get_number_of_records() == 2
+	manager.undo()
+	assert atoms[1].y == 0.0
+	assert atoms[0].x == 0.0
+	manager.redo()
+	assert atoms[1].y == 5.0
+	assert atoms[0].x == 0.0
+
+
+#============================================
+def test_added_atom_is_recorded_with_its_molecule():
+	paper = FakePaper(3)
+	manager = undo.undo_manager(paper)
+	added = FakeAtom(7.0, 7.0)
+	paper.molecule.atoms.append(added)
+	manager.start_new_record()
+	assert added in manager._records[1].records
+	manager.undo()
+	assert added not in paper.molecule.atoms
+	manager.redo()
+	assert added in paper.molecule.atoms
@@ -0,0 +1,240 @@
+"""Tests for viewport-culled zoom redraws of the Tk paper.
+
+Uses stand-in atoms, bonds, molecules and a canvas-free paper that
+records canvas calls, so the culling and stale bookkeeping run without Tk.
+"""
+
+# local repo modules
+from bkchem import oasa_bridge
+from bkchem import format_loader
+from bkchem.paper_lib.paper_layout import PaperLayoutMixin
+from bkchem.paper_lib.paper_id_manager import PaperIdManagerMixin
+from bkchem.paper_lib.paper_spatial import PaperSpatialMixin
+from bkchem.paper_lib.paper_zoom import PaperZoomMixin
+
+
+#============================================
+class FakeAtom:
+	"""Atom that counts redraws."""
+	object_type = 'atom'
+
+	def __init__(self, item, x, y, show=0):
+		self.item = item
+		self.x = x
+		self.y = y
+		self.z = 0
+		self.show = show
+		self.molecule = None
+		self.neighbor_edges = []
+		self.redraws = 0
+
+	def redraw(self):
+		self.redraws += 1
+
+	def lift(self):
+		pass
+
+
+#============================================
+class FakeBond:
+	"""Normal single bond drawn as one line item."""
+	object_type = 'bond'
+	type = 'n'
+	order = 1
+	line_width = 1.0
+
+	def __init__(self, item, atom1, atom2):
+		self.item = item
+		self._render_item_ids = [item]
+		self._selected = 0
+		self.atom1 = atom1
+		self.atom2 = atom2
+		self.molecule = None
+		self.redraws = 0
+		atom1.neighbor_edges.append(self)
+		atom2.neighbor_edges.append(self)
+
+	def redraw(self):
+		self.redraws += 1
+
+
+#============================================
+class FakeMolecule:
+	object_type = 'molecule'
+
+	def __init__(self, atoms, bonds):
+		self.atoms = atoms
+		self.bonds = bonds
+		self.edges = set(bonds)
+		for child in atoms + bonds:
+			child.molecule = self
+
+
+#============================================
+class FakePaper(PaperZoomMixin, PaperSpatialMixin, PaperIdManagerMixin):
+	"""400x300 viewport at the canvas origin, zoom 1."""
+
+	def __init__(self):
+		self._id_2_object = {}
+		self._scale = 1.0
+		self.stack = []
+		self.scale_calls = []
+		self.widths = {}
+		self.idle = []
+
+	def scale(self, tag, x0, y0, sx, sy):
+		self.scale_calls.append((tag, sx, sy))
+
+	def itemcget(self, item, option):
+		return self.widths.get(item, 1.0)
+
+	def itemconfigure(self, item, width):
+		self.widths[item] = width
+
+	def winfo_width(self):
+		return 400
+
+	def winfo_height(self):
+		return 300
+
+	def canvasx(self, x):
+		return x
+
+	def canvasy(self, y):
+		return y
+
+	def after_idle(self, func):
+		self.idle.append(func)
+
+
+#============================================
+def _chain(paper, count, show=(), atom_class=FakeAtom):
+	"""Register a horizontal chain, atoms 100 apart; return the molecule."""
+	atoms = []
+	bonds = []
+	item = 1
+	for index in range(count):
+		atom = atom_class(item, 100.0 * index, 50.0, show=int(index in show))
+		atom.paper = paper
+		paper.register_id(item, atom)
+		item += 1
+		if atoms:
+			bond = FakeBond(item, atoms[-1], atom)
+			paper.register_id(item, bond)
+			bonds.append(bond)
+			item += 1
+		atoms.append(atom)
+	mol = FakeMolecule(atoms, bonds)
+	paper.stack.append(mol)
+	return mol
+
+
+#============================================
+def test_zoom_redraws_only_objects_in_view():
+	paper = FakePaper()
+	mol = _chain(paper, 20, show=(15,))
+	paper._scale = 2.0
+	paper.redraw_for_zoom(2.0, (0.0, 0.0, 250.0, 100.0))
+	assert paper.scale_calls == [('all', 2.0, 2.0)]
+	assert [a.redraws for a in mol.atoms[:4]] == [1, 1, 1, 0]
+	assert sum(a.redraws for a in mol.atoms) == 3
+	# a bond half in view is redrawn, hidden-atom bonds off view are rescaled
+	assert [b.redraws for b in mol.bonds[:3]] == [1, 1, 1]
+	assert paper.widths[mol.bonds[5].item] == 2.0
+	assert mol.bonds[5] not in paper._zoom_stale
+	# bonds to a shown label wait for a real redraw
+	assert mol.bonds[14] in paper._zoom_stale
+	assert mol.bonds[14].item not in paper.widths
+	assert mol.atoms[15] in paper._zoom_stale
+
+
+#============================================
+def test_stale_objects_redrawn_when_scrolled_into_view():
+	paper = FakePaper()
+	mol = _chain(paper, 20, show=(15,))
+	paper.redraw_for_zoom(0.5, (0.0, 0.0, 250.0, 100.0))
+	deleted = mol.atoms[16]
+	paper.unregister_id(deleted.item)
+	paper.redraw_stale((1350.0, 0.0, 1650.0, 100.0))
+	assert [a.redraws for a in mol.atoms[13:18]] == [0, 1, 1, 0, 0]
+	assert deleted.redraws == 0
+	# the shown atom's bonds follow its new label size
+	assert mol.bonds[14].redraws == 1 and mol.bonds[15].redraws == 1
+	assert mol.atoms[15] not in paper._zoom_stale
+	assert mol.atoms[19] in paper._zoom_stale
+	paper.redraw_stale()
+	assert mol.atoms[19].redraws == 1
+	assert not paper._zoom_stale
+
+
+#============================================
+def test_viewport_change_schedules_one_idle_redraw():
+	paper = FakePaper()
+	mol = _chain(paper, 10)
+	paper._scale = 1.2
+	paper.viewport_changed()
+	assert paper.idle == []
+	paper.redraw_for_zoom(1.2, (0.0, 0.0, 150.0, 100.0))
+	paper.viewport_changed()
+	paper.viewport_changed()
+	assert len(paper.idle) == 1
+	paper.idle.pop()()
+	# the fake viewport plus margin reaches x = 500 at zoom 1.2
+	assert [a.redraws for a in mol.atoms] == [1, 1, 1, 1, 1, 1, 0, 0, 0, 0]
+	paper.viewport_changed()
+	assert len(paper.idle) == 1
+
+
+#============================================
+class LabelAtom(FakeAtom):
+	"""Atom whose canvas label keeps the size of the zoom it was drawn at."""
+
+	def redraw(self):
+		FakeAtom.redraw(self)
+		self.drawn_scale = self.paper._scale
+
+	def bbox(self):
+		# the canvas scale call moves the label, only a redraw resizes it
+		scale = self.paper._scale
+		half = 5.0 * self.drawn_scale
+		return (self.x*scale - half, self.y*scale - half, self.x*scale + half, self.y*scale + half)
+
+
+#============================================
+class LayoutPaper(PaperLayoutMixin, FakePaper):
+	pass
+
+
+#============================================
+def _zoomed_label_paper(view):
+	"""Paper with a drawn 20-atom chain, zoomed 2x redrawing only view."""
+	paper = LayoutPaper()
+	mol = _chain(paper, 20, atom_class=LabelAtom)
+	for atom in mol.atoms:
+		atom.redraw()
+	paper._scale = 2.0
+	paper.redraw_for_zoom(2.0, view)
+	return paper
+
+
+#============================================
+def test_export_and_bbox_after_zoom_match_full_redraw(monkeypatch, tmp_path):
+	exported = []
+
+	def capture(codec_name, paper, handle, **kwargs):
+		exported.append([a.bbox() for a in paper.stack[0].atoms])
+
+	monkeypatch.setattr(oasa_bridge, 'write_codec_file_from_paper', capture)
+	everything = (-1e9, -1e9, 1e9, 1e9)
+	culled = _zoomed_label_paper((0.0, 0.0, 250.0, 100.0))
+	full = _zoomed_label_paper(everything)
+	assert culled._zoom_stale and not full._zoom_stale
+	for paper in (culled, full):
+		format_loader.export_format('molfile', paper, str(tmp_path / 'out.mol'), 'paper', [])
+	assert exported[0] == exported[1]
+	assert not culled._zoom_stale
+	# selection bboxes are read after the same flush
+	culled = _zoomed_label_paper((0.0, 0.0, 250.0, 100.0))
+	full = _zoomed_label_paper(everything)
+	atoms = culled.stack[0].atoms
+	assert culled.common_bbox(atoms[-1:]) == full.common_bbox(full.stack[0].atoms[-1:])
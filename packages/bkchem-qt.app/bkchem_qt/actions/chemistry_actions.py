@@ -8,10 +8,6 @@ import PySide6.QtWidgets
 
 # local repo modules
 import oasa.periodic_table
-import oasa.peptide_utils
-import bkchem_qt.io.format_bridge
-import bkchem_qt.bridge.oasa_bridge
-import bkchem_qt.actions.file_actions
 import bkchem_qt.undo.commands
 from bkchem_qt.actions.action_registry import MenuAction
 
@@ -254,6 +250,8 @@ def _read_smiles(app) -> None:
 	Args:
 		app: MainWindow instance.
 	"""
+	import bkchem_qt.bridge.oasa_bridge
+	import bkchem_qt.actions.file_actions
 	text, ok = PySide6.QtWidgets.QInputDialog.getText(
 		app, "Import SMILES", "Enter SMILES string:"
 	)
@@ -296,6 +294,8 @@ def _read_inchi(app) -> None:
 	Args:
 		app: MainWindow instance.
 	"""
+	import bkchem_qt.bridge.oasa_bridge
+	import bkchem_qt.actions.file_actions
 	text, ok = PySide6.QtWidgets.QInputDialog.getText(
 		app, "Import InChI", "Enter InChI string:"
 	)
@@ -339,6 +339,9 @@ def _read_peptide(app) -> None:
 	Args:
 		app: MainWindow instance.
 	"""
+	import oasa.peptide_utils
+	import bkchem_qt.bridge.oasa_bridge
+	import bkchem_qt.actions.file_actions
 	# build prompt listing supported amino acid codes
 	supported = sorted(oasa.peptide_utils.AMINO_ACID_SMILES.keys())
 	supported_str = ", ".join(supported)
@@ -412,6 +415,7 @@ def _gen_smiles(app) -> None:
 	Args:
 		app: MainWindow instance.
 	"""
+	import bkchem_qt.io.format_bridge
 	mols = app.document.selected_mols
 	if len(mols) != 1:
 		PySide6.QtWidgets.QMessageBox.warning(
@@ -448,6 +452,7 @@ def _gen_inchi(app) -> None:
 	Args:
 		app: MainWindow instance.
 	"""
+	import bkchem_qt.io.format_bridge
 	mols = app.document.selected_mols
 	if len(mols) != 1:
 		PySide6.QtWidgets.QMessageBox.warning(
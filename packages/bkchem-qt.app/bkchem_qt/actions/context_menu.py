@@ -8,9 +8,6 @@ import PySide6.QtWidgets
 import bkchem_qt.canvas.items.atom_item
 import bkchem_qt.canvas.items.bond_item
 import bkchem_qt.canvas.scene_queries
-import bkchem_qt.dialogs.atom_dialog
-import bkchem_qt.dialogs.bond_dialog
-import bkchem_qt.io.clipboard_manager
 import bkchem_qt.undo.commands
 
 
@@ -88,6 +85,7 @@ def _atom_context_menu(atom_item, view) -> PySide6.QtWidgets.QMenu:
 	Returns:
 		QMenu populated with atom-specific actions.
 	"""
+	import bkchem_qt.dialogs.atom_dialog
 	menu = PySide6.QtWidgets.QMenu(view)
 	atom_model = atom_item.atom_model
 
@@ -138,7 +136,9 @@ def _delete_atom(view, atom_item) -> None:
 	mol_model = bkchem_qt.canvas.scene_queries.find_molecule_for_atom(view, atom_model)
 	if mol_model is None or undo_stack is None:
 		return
-	connected_bonds = bkchem_qt.canvas.scene_queries.find_connected_bond_items(scene, atom_model)
+	connected_bonds = bkchem_qt.canvas.scene_queries.find_connected_bond_items(
+		scene, atom_model, getattr(view, "document", None),
+	)
 	cmd = bkchem_qt.undo.commands.RemoveAtomCommand(
 		scene, mol_model, atom_model, atom_item, connected_bonds,
 	)
@@ -179,6 +179,7 @@ def _bond_context_menu(bond_item, view) -> PySide6.QtWidgets.QMenu:
 	Returns:
 		QMenu populated with bond-specific actions.
 	"""
+	import bkchem_qt.dialogs.bond_dialog
 	menu = PySide6.QtWidgets.QMenu(view)
 	bond_model = bond_item.bond_model
 
@@ -298,6 +299,7 @@ def _empty_context_menu(view) -> PySide6.QtWidgets.QMenu:
 	Returns:
 		QMenu populated with general canvas actions.
 	"""
+	import bkchem_qt.io.clipboard_manager
 	menu = PySide6.QtWidgets.QMenu(view)
 
 	# paste action -- enabled only when clipboard has CDML content
@@ -7,9 +7,6 @@ import os
 import PySide6.QtWidgets
 
 # local repo modules
-import bkchem_qt.io.cdml_io
-import bkchem_qt.bridge.oasa_bridge
-import bkchem_qt.bridge.worker
 import bkchem_qt.canvas.items.atom_item
 import bkchem_qt.canvas.items.bond_item
 import bkchem_qt.config.geometry_units
@@ -122,6 +119,7 @@ def open_file_path(main_window, file_path: str) -> None:
 		main_window: MainWindow instance providing scene and document.
 		file_path: Absolute or relative path to the file to load.
 	"""
+	import bkchem_qt.io.cdml_io
 	ext = os.path.splitext(file_path)[1].lower()
 	molecules = []
 	bond_length_pt = _resolve_scene_bond_length_pt(main_window)
@@ -165,6 +163,8 @@ def _load_with_worker(
 		codec_name: OASA codec name (e.g. 'molfile', 'smiles').
 		file_path: Path to the chemistry file.
 	"""
+	import bkchem_qt.bridge.oasa_bridge
+	import bkchem_qt.bridge.worker
 	worker = bkchem_qt.bridge.worker.FileReaderWorker(codec_name, file_path)
 
 	def on_finished(oasa_mol):
@@ -267,6 +267,7 @@ def _save_as_template(app) -> None:
 	Args:
 		app: MainWindow instance.
 	"""
+	import bkchem_qt.io.cdml_io
 	if not app.document.molecules:
 		app.statusBar().showMessage("No molecules to save as template", 3000)
 		return
@@ -4,9 +4,7 @@
 import math
 
 # local repo modules
-from oasa import coords_generator
 import bkchem_qt.canvas.items.atom_item
-import bkchem_qt.bridge.oasa_bridge
 import bkchem_qt.config.geometry_units
 import bkchem_qt.undo.commands
 from bkchem_qt.actions.action_registry import MenuAction
@@ -115,6 +113,8 @@ def _handle_clean_geometry(app) -> None:
 	Args:
 		app: The main BKChem-Qt application object.
 	"""
+	from oasa import coords_generator
+	import bkchem_qt.bridge.oasa_bridge
 	targets = _get_target_mols_and_items(app)
 	if not targets:
 		app.statusBar().showMessage("No molecules to clean", 3000)
@@ -19,15 +19,19 @@ APP_VERSION = "26.02a1"
 
 
 #============================================
-def main(files: list = None) -> int:
+def main(files: list = None, profiler=None) -> int:
 	"""Create and run the BKChem-Qt application.
 
 	Args:
 		files: Optional list of file paths to open on launch.
+		profiler: Optional StartupProfiler that records the startup phases
+			and writes its report at the first paint.
 
 	Returns:
 		Application exit code from the Qt event loop.
 	"""
+	if profiler:
+		profiler.mark("application imports")
 	app = PySide6.QtWidgets.QApplication(sys.argv)
 	style = app.style()
 	app_icon = style.standardIcon(
@@ -57,15 +61,22 @@ def main(files: list = None) -> int:
 	# create the theme manager, restore saved or system theme
 	theme_mgr = bkchem_qt.themes.theme_manager.ThemeManager(app)
 	theme_mgr.restore_theme()
+	if profiler:
+		profiler.mark("QApplication and theme")
 
 	# create the main window
 	window = bkchem_qt.main_window.MainWindow(theme_mgr)
+	if profiler:
+		profiler.mark("main window built")
 	if not app_icon.isNull():
 		window.setWindowIcon(app_icon)
 	window.show()
 
 	# restore saved geometry
 	window.restore_geometry()
+	if profiler:
+		profiler.mark("window shown")
+		profiler.watch_first_paint(app)
 
 	# open command-line files (stub for Milestone 2)
 	if files:
@@ -27,7 +27,7 @@ class AtomItem(PySide6.QtWidgets.QGraphicsItem):
 	"""Visual representation of a single atom on the chemistry canvas.
 
 	Delegates rendering to OASA's ``build_vertex_ops()`` and paints the
-	resulting render ops through ``render_ops_painter.paint_ops()``.
+	resulting render ops through a cached ``render_ops_painter.OpsPicture``.
 	Listens to the wrapped ``AtomModel.property_changed`` signal to
 	regenerate ops when chemistry or display properties change.
 
@@ -48,6 +48,8 @@ class AtomItem(PySide6.QtWidgets.QGraphicsItem):
 		self._atom_model = atom_model
 		# cached render ops from OASA
 		self._ops: list = []
+		# recorded QPicture of the ops, replayed on every repaint
+		self._ops_picture = render_ops_painter.OpsPicture()
 		# cached bounding rectangle
 		self._bounding_rect = PySide6.QtCore.QRectF()
 		# hover state tracked locally
@@ -81,7 +83,7 @@ class AtomItem(PySide6.QtWidgets.QGraphicsItem):
 	def paint(self, painter: PySide6.QtGui.QPainter,
 			option: PySide6.QtWidgets.QStyleOptionGraphicsItem,
 			widget: PySide6.QtWidgets.QWidget = None) -> None:
-		"""Paint the atom using cached render ops.
+		"""Paint the atom by replaying its recorded render ops.
 
 		Draws selection and hover highlights as colored rectangles
 		behind the atom label when the item is selected or hovered.
@@ -113,8 +115,8 @@ class AtomItem(PySide6.QtWidgets.QGraphicsItem):
 			painter.setPen(pen)
 			painter.setBrush(PySide6.QtCore.Qt.BrushStyle.NoBrush)
 			painter.drawRect(self._bounding_rect)
-		# paint OASA render ops
-		render_ops_painter.paint_ops(self._ops, painter)
+		# replay the recorded OASA render ops
+		self._ops_picture.paint(painter, low_detail=render_ops_painter.scene_low_detail(self))
 
 	#============================================
 	def shape(self) -> PySide6.QtGui.QPainterPath:
@@ -192,6 +194,7 @@ class AtomItem(PySide6.QtWidgets.QGraphicsItem):
 		# restore chem_atom coords
 		chem_atom.x = saved_x
 		chem_atom.y = saved_y
+		self._ops_picture.set_ops(self._ops)
 		# recompute bounding rect from ops
 		self._bounding_rect = _bounding_rect_from_ops(self._ops)
 		self.update()
@@ -206,7 +209,10 @@ class AtomItem(PySide6.QtWidgets.QGraphicsItem):
 		"""
 		if name in ("x", "y"):
 			self.setPos(self._atom_model.x, self._atom_model.y)
-		# regenerate ops for any visual change
+		# regenerate ops for any visual change, once per scene transaction
+		scene = self.scene()
+		if scene is not None and hasattr(scene, "mark_dirty") and scene.mark_dirty(self):
+			return
 		self.update_from_model()
 
 	# ------------------------------------------------------------------
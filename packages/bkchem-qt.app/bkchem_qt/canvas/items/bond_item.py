@@ -31,7 +31,7 @@ class BondItem(PySide6.QtWidgets.QGraphicsItem):
 
 	Renders the bond by calling ``oasa.render_lib.bond_ops.build_bond_ops()``
 	on the underlying OASA edge and painting the resulting render ops via
-	``render_ops_painter.paint_ops()``.
+	a cached ``render_ops_painter.OpsPicture``.
 
 	The bond item uses scene coordinates directly (it is not parented to
 	an atom item) so that it can span between two atom positions.
@@ -59,6 +59,8 @@ class BondItem(PySide6.QtWidgets.QGraphicsItem):
 		self._bond_model = bond_model
 		# cached render ops from OASA
 		self._ops: list = []
+		# recorded QPicture of the ops, replayed on every repaint
+		self._ops_picture = render_ops_painter.OpsPicture()
 		# cached bounding rectangle
 		self._bounding_rect = PySide6.QtCore.QRectF()
 		# hover state
@@ -90,7 +92,7 @@ class BondItem(PySide6.QtWidgets.QGraphicsItem):
 	def paint(self, painter: PySide6.QtGui.QPainter,
 			option: PySide6.QtWidgets.QStyleOptionGraphicsItem,
 			widget: PySide6.QtWidgets.QWidget = None) -> None:
-		"""Paint the bond using cached render ops.
+		"""Paint the bond by replaying its recorded render ops.
 
 		Draws selection or hover highlights as a colored thick line
 		along the bond axis before rendering the actual bond ops.
@@ -118,8 +120,8 @@ class BondItem(PySide6.QtWidgets.QGraphicsItem):
 				PySide6.QtCore.QPointF(start[0], start[1]),
 				PySide6.QtCore.QPointF(end[0], end[1]),
 			)
-		# paint OASA render ops
-		render_ops_painter.paint_ops(self._ops, painter)
+		# replay the recorded OASA render ops
+		self._ops_picture.paint(painter, low_detail=render_ops_painter.scene_low_detail(self))
 
 	#============================================
 	def shape(self) -> PySide6.QtGui.QPainterPath:
@@ -215,6 +217,7 @@ class BondItem(PySide6.QtWidgets.QGraphicsItem):
 		self._ops = oasa.render_lib.bond_ops.build_bond_ops(
 			chem_bond, start, end, context,
 		)
+		self._ops_picture.set_ops(self._ops)
 		# recompute bounding rect from ops
 		self._bounding_rect = _bounding_rect_from_ops(self._ops, start, end)
 		self.update()
@@ -239,13 +242,18 @@ class BondItem(PySide6.QtWidgets.QGraphicsItem):
 		"""Handle property changes on endpoint atoms.
 
 		Filters on label-affecting properties and triggers a full
-		update_from_model() to recompute bond clipping.
+		update_from_model() to recompute bond clipping. Inside a scene
+		update transaction the rebuild is deferred so the bond rebuilds
+		once however many endpoint setters fire.
 
 		Args:
 			name: Name of the changed property.
 			value: New value of the property (unused).
 		"""
 		if name in self._LABEL_AFFECTING_PROPS:
+			scene = self.scene()
+			if scene is not None and hasattr(scene, "mark_dirty") and scene.mark_dirty(self):
+				return
 			self.update_from_model()
 
 	#============================================
@@ -6,6 +6,7 @@ import math
 # PIP3 modules
 import PySide6.QtCore
 import PySide6.QtGui
+import PySide6.QtWidgets
 
 # local repo modules
 import oasa.render_ops
@@ -25,6 +26,10 @@ _charge_colors = {"plus": "#3366ff", "minus": "#ff3333"}
 # -- light theme default line color used as sentinel for theme remapping --
 _light_default_line = "#000000"
 
+# -- bumped whenever a theme color that ops resolve against changes, so
+# recorded OpsPicture caches know to re-record --
+_palette_generation = 0
+
 # -- font scale and vertical offsets for sub/sup text --
 _SCRIPT_FONT_SCALE = oasa.render_ops.SCRIPT_FONT_SCALE
 _SUBSCRIPT_OFFSET_EM = oasa.render_ops.SUBSCRIPT_OFFSET_EM
@@ -41,8 +46,9 @@ def set_default_color(hex_color: str) -> None:
 	Args:
 		hex_color: CSS hex color string (e.g. '#e0e0e0').
 	"""
-	global _default_color
+	global _default_color, _palette_generation
 	_default_color = PySide6.QtGui.QColor(hex_color)
+	_palette_generation += 1
 
 
 #============================================
@@ -126,10 +132,11 @@ def set_light_default_line(hex_color: str) -> None:
 	Args:
 		hex_color: Hex color string from the light theme's chemistry.default_line.
 	"""
-	global _light_default_line
+	global _light_default_line, _palette_generation
 	# normalize through color_to_hex so 3-char shorthand (#000) expands to
 	# 6-char (#000000), matching _color_to_qcolor's normalized comparison
 	_light_default_line = oasa.render_ops.color_to_hex(hex_color) or hex_color.lower()
+	_palette_generation += 1
 
 
 #============================================
@@ -157,6 +164,152 @@ def paint_ops(ops: list, painter: PySide6.QtGui.QPainter) -> None:
 			_paint_text(op, painter)
 
 
+#============================================
+def record_ops(ops: list) -> PySide6.QtGui.QPicture:
+	"""Record a list of render operations into a QPicture.
+
+	The picture stores the resolved pens, brushes, fonts and geometry,
+	so replaying it with ``QPainter.drawPicture()`` skips the per-op
+	dispatch and QPen/QColor/QFont construction of ``paint_ops()``.
+
+	Args:
+		ops: List of OASA render op dataclass instances.
+
+	Returns:
+		QPicture holding the recorded draw calls.
+	"""
+	picture = PySide6.QtGui.QPicture()
+	painter = PySide6.QtGui.QPainter(picture)
+	paint_ops(ops, painter)
+	painter.end()
+	return picture
+
+
+#============================================
+class OpsPicture:
+	"""Cached QPicture of an item's render ops.
+
+	Items hand their op list to ``set_ops()`` whenever they rebuild it
+	(in ``update_from_model()``), and call ``paint()`` from their
+	``paint()`` method. The ops are recorded lazily on the first paint
+	after a change and replayed on every later repaint, such as scroll,
+	pan and zoom steps. A theme color change invalidates every cache
+	through the module palette generation.
+	"""
+
+	#============================================
+	def __init__(self):
+		"""Create an empty cache."""
+		self._ops: list = []
+		# recorded pictures keyed by low_detail flag
+		self._pictures: dict = {}
+		self._generation: int = -1
+
+	#============================================
+	def set_ops(self, ops: list) -> None:
+		"""Replace the cached ops and drop the recorded pictures.
+
+		Args:
+			ops: List of OASA render op dataclass instances.
+		"""
+		self._ops = ops
+		self._pictures = {}
+
+	#============================================
+	def invalidate(self) -> None:
+		"""Drop the recorded pictures so the next paint re-records them."""
+		self._pictures = {}
+
+	#============================================
+	def is_recorded(self, low_detail: bool = False) -> bool:
+		"""Whether a picture for the current ops and palette is cached.
+
+		Args:
+			low_detail: Check the simplified low-zoom picture instead.
+
+		Returns:
+			True when ``paint()`` would replay without recording.
+		"""
+		if self._generation != _palette_generation:
+			return False
+		return low_detail in self._pictures
+
+	#============================================
+	def paint(self, painter: PySide6.QtGui.QPainter, low_detail: bool = False) -> None:
+		"""Replay the cached picture, recording it first if stale.
+
+		Args:
+			painter: Active QPainter to draw into.
+			low_detail: Paint text as solid blocks (see
+				``simplify_text_ops()``), used at low zoom levels.
+		"""
+		if not self._ops:
+			return
+		if self._generation != _palette_generation:
+			self._pictures = {}
+			self._generation = _palette_generation
+		picture = self._pictures.get(low_detail)
+		if picture is None:
+			ops = simplify_text_ops(self._ops) if low_detail else self._ops
+			picture = record_ops(ops)
+			self._pictures[low_detail] = picture
+		painter.drawPicture(0, 0, picture)
+
+
+#============================================
+def scene_low_detail(item: PySide6.QtWidgets.QGraphicsItem) -> bool:
+	"""Whether the item's scene asks for low level-of-detail painting.
+
+	ChemView sets ``ChemScene.low_detail`` when the zoom drops below its
+	level-of-detail threshold.
+
+	Args:
+		item: Scene item about to paint.
+
+	Returns:
+		True when the item should paint its simplified picture.
+	"""
+	scene = item.scene()
+	return bool(scene is not None and getattr(scene, "low_detail", False))
+
+
+#============================================
+def simplify_text_ops(ops: list) -> list:
+	"""Replace TextOps with filled boxes covering the same glyph run.
+
+	At low zoom a label is a few device pixels tall, so shaping its
+	text is wasted work; a box in the label color reads the same.
+	Other ops are passed through unchanged.
+
+	Args:
+		ops: List of OASA render op dataclass instances.
+
+	Returns:
+		New list with each TextOp swapped for a PolygonOp.
+	"""
+	simplified = []
+	for op in ops:
+		if not isinstance(op, oasa.render_ops.TextOp):
+			simplified.append(op)
+			continue
+		qt_weight = PySide6.QtGui.QFont.Weight.Bold if op.weight == "bold" else PySide6.QtGui.QFont.Weight.Normal
+		segments = oasa.render_ops._text_segments(op.text)
+		width = _measure_segments_width(segments, op.font_name, op.font_size, qt_weight, None)
+		x = op.x
+		if op.anchor == "middle":
+			x -= width / 2.0
+		elif op.anchor == "end":
+			x -= width
+		# cap height of typical label glyphs sits near 0.7 em
+		top = op.y - 0.7 * op.font_size
+		points = ((x, top), (x + width, top), (x + width, op.y), (x, op.y))
+		# uncolored text falls back to the light theme line color, which
+		# _color_to_qcolor remaps to the active theme default
+		fill = op.color if op.color is not None else _light_default_line
+		simplified.append(oasa.render_ops.PolygonOp(points=points, fill=fill, z=op.z))
+	return simplified
+
+
 #============================================
 def _paint_line(op: oasa.render_ops.LineOp, painter: PySide6.QtGui.QPainter) -> None:
 	"""Draw a LineOp as a single line segment.
@@ -1,5 +1,8 @@
 """Chemistry scene for the BKChem Qt canvas."""
 
+# Standard Library
+import contextlib
+
 # PIP3 modules
 import PySide6.QtCore
 import PySide6.QtGui
@@ -65,6 +68,18 @@ class ChemScene(PySide6.QtWidgets.QGraphicsScene):
 		self._grid_snap_enabled: bool = bool(grid_snap_enabled)
 		self._grid_group: PySide6.QtWidgets.QGraphicsItemGroup = None
 
+		# update transaction state: nesting depth and items awaiting
+		# update_from_model(), kept in insertion order
+		self._update_depth: int = 0
+		self._dirty_items: dict = {}
+		# AtomModel/BondModel -> the item that draws it
+		self._items_by_model: dict = {}
+
+		# render state pushed by ChemView: simplified painting at low zoom
+		# and the QGraphicsItem cache mode for atom and bond items
+		self._low_detail: bool = False
+		self._item_cache_mode = PySide6.QtWidgets.QGraphicsItem.CacheMode.NoCache
+
 		# build the paper rectangle centered in the scene
 		self._build_paper()
 		# build the grid constrained to the paper area
@@ -301,6 +316,188 @@ class ChemScene(PySide6.QtWidgets.QGraphicsScene):
 				self._grid_group = None
 		self._build_grid()
 
+	# ------------------------------------------------------------------
+	# Render detail and item caching
+	# ------------------------------------------------------------------
+
+	#============================================
+	@property
+	def low_detail(self) -> bool:
+		"""Whether atom and bond items paint their simplified picture."""
+		return self._low_detail
+
+	#============================================
+	def set_low_detail(self, enabled: bool) -> None:
+		"""Switch atom and bond items between full and low detail.
+
+		Args:
+			enabled: True to paint labels as solid blocks.
+		"""
+		enabled = bool(enabled)
+		if enabled == self._low_detail:
+			return
+		self._low_detail = enabled
+		for item in self._items_by_model.values():
+			item.update()
+
+	#============================================
+	@property
+	def item_cache_mode(self) -> PySide6.QtWidgets.QGraphicsItem.CacheMode:
+		"""Cache mode applied to atom and bond items."""
+		return self._item_cache_mode
+
+	#============================================
+	def set_item_cache_mode(self, mode: PySide6.QtWidgets.QGraphicsItem.CacheMode) -> None:
+		"""Set the cache mode of current and future atom and bond items.
+
+		``DeviceCoordinateCache`` keeps each item as a device pixmap, so
+		panning blits instead of repainting; zooming re-renders it.
+
+		Args:
+			mode: QGraphicsItem.CacheMode value.
+		"""
+		self._item_cache_mode = mode
+		for item in self._items_by_model.values():
+			item.setCacheMode(mode)
+
+	# ------------------------------------------------------------------
+	# Model item registry
+	# ------------------------------------------------------------------
+
+	#============================================
+	def addItem(self, item: PySide6.QtWidgets.QGraphicsItem) -> None:
+		"""Add an item, registering atom and bond items by their model.
+
+		Args:
+			item: QGraphicsItem to add.
+		"""
+		super().addItem(item)
+		model = _item_model(item)
+		if model is not None:
+			self._items_by_model[model] = item
+			if item.cacheMode() != self._item_cache_mode:
+				item.setCacheMode(self._item_cache_mode)
+
+	#============================================
+	def removeItem(self, item: PySide6.QtWidgets.QGraphicsItem) -> None:
+		"""Remove an item and drop its model registration.
+
+		Args:
+			item: QGraphicsItem to remove.
+		"""
+		model = _item_model(item)
+		if model is not None and self._items_by_model.get(model) is item:
+			del self._items_by_model[model]
+		super().removeItem(item)
+
+	#============================================
+	def clear(self) -> None:
+		"""Remove and delete all items, forgetting registrations."""
+		self._items_by_model.clear()
+		self._dirty_items = {}
+		super().clear()
+
+	#============================================
+	def item_for_model(self, model):
+		"""Return the AtomItem or BondItem drawing a model, or None.
+
+		Args:
+			model: AtomModel or BondModel.
+
+		Returns:
+			The registered QGraphicsItem, or None.
+		"""
+		return self._items_by_model.get(model)
+
+	# ------------------------------------------------------------------
+	# Update transactions
+	# ------------------------------------------------------------------
+
+	#============================================
+	def begin_update(self) -> None:
+		"""Open an update transaction; transactions may nest.
+
+		While a transaction is open, items that call ``mark_dirty()``
+		are queued instead of rebuilding their render ops, so an item
+		touched by many model setters rebuilds once when the outermost
+		transaction ends.
+		"""
+		self._update_depth += 1
+
+	#============================================
+	def end_update(self) -> int:
+		"""Close an update transaction and flush at the outermost level.
+
+		Returns:
+			Number of items rebuilt by this call.
+		"""
+		if self._update_depth > 0:
+			self._update_depth -= 1
+		if self._update_depth > 0:
+			return 0
+		return self.flush_updates()
+
+	#============================================
+	@contextlib.contextmanager
+	def update_transaction(self):
+		"""Context manager around begin_update() and end_update().
+
+		Example:
+			with scene.update_transaction():
+				for model in moved_atoms:
+					model.x += dx
+					model.y += dy
+		"""
+		self.begin_update()
+		try:
+			yield self
+		finally:
+			self.end_update()
+
+	#============================================
+	@property
+	def in_update_transaction(self) -> bool:
+		"""Whether an update transaction is currently open."""
+		return self._update_depth > 0
+
+	#============================================
+	def mark_dirty(self, item) -> bool:
+		"""Queue an item for update_from_model() if a transaction is open.
+
+		Args:
+			item: Scene item with an ``update_from_model()`` method.
+
+		Returns:
+			True when the update was deferred, False when the caller
+			should update immediately.
+		"""
+		if self._update_depth == 0:
+			return False
+		self._dirty_items[item] = None
+		return True
+
+	#============================================
+	def flush_updates(self) -> int:
+		"""Rebuild every queued item once.
+
+		Items are rebuilt in descending z order so atom labels are laid
+		out before the bonds that clip against them. Items removed from
+		the scene while queued are skipped.
+
+		Returns:
+			Number of items rebuilt.
+		"""
+		dirty = list(self._dirty_items)
+		self._dirty_items = {}
+		dirty.sort(key=lambda item: -item.zValue())
+		count = 0
+		for item in dirty:
+			if item.scene() is not self:
+				continue
+			item.update_from_model()
+			count += 1
+		return count
+
 	#============================================
 	def snap_to_grid(self, x: float, y: float) -> tuple:
 		"""Snap coordinates to the nearest hex grid point.
@@ -316,3 +513,12 @@ class ChemScene(PySide6.QtWidgets.QGraphicsScene):
 			x, y, self._grid_spacing_pt,
 		)
 		return snapped
+
+
+#============================================
+def _item_model(item):
+	"""Return the AtomModel or BondModel an item draws, or None."""
+	model = getattr(item, "bond_model", None)
+	if model is None:
+		model = getattr(item, "atom_model", None)
+	return model
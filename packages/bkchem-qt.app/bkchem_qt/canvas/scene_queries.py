@@ -38,10 +38,7 @@ def find_molecule_for_atom(view, atom_model):
 	"""
 	if not hasattr(view, "document") or view.document is None:
 		return None
-	for mol_model in view.document.molecules:
-		if atom_model in mol_model.atoms:
-			return mol_model
-	return None
+	return view.document.molecule_for_atom(atom_model)
 
 
 #============================================
@@ -57,19 +54,21 @@ def find_molecule_for_bond(view, bond_model):
 	"""
 	if not hasattr(view, "document") or view.document is None:
 		return None
-	for mol_model in view.document.molecules:
-		if bond_model in mol_model.bonds:
-			return mol_model
-	return None
+	return view.document.molecule_for_bond(bond_model)
 
 
 #============================================
-def find_connected_bond_items(scene, atom_model):
+def find_connected_bond_items(scene, atom_model, document=None):
 	"""Find all BondItems connected to an atom.
 
+	With a document and a ChemScene the bonds come from the document's
+	adjacency index and the items from the scene's model registry, so the
+	cost follows the atom's degree. Otherwise every scene item is checked.
+
 	Args:
 		scene: The QGraphicsScene.
 		atom_model: The AtomModel whose bonds to find.
+		document: Optional Document holding the atom.
 
 	Returns:
 		List of (BondModel, BondItem) tuples.
@@ -77,6 +76,12 @@ def find_connected_bond_items(scene, atom_model):
 	if scene is None:
 		return []
 	connected = []
+	if document is not None and hasattr(scene, "item_for_model"):
+		for bm in document.bonds_for_atom(atom_model):
+			item = scene.item_for_model(bm)
+			if item is not None:
+				connected.append((bm, item))
+		return connected
 	for item in scene.items():
 		if isinstance(item, bkchem_qt.canvas.items.bond_item.BondItem):
 			bm = item.bond_model
@@ -15,6 +15,8 @@ from bkchem_qt.canvas.scene import ChemScene  # noqa: F401 (used in type hints)
 ZOOM_MIN_PERCENT = 10.0
 ZOOM_MAX_PERCENT = 1000.0
 ZOOM_FACTOR_PER_NOTCH = 1.15
+# below this zoom percentage atom labels paint as solid blocks
+LOW_DETAIL_ZOOM_PERCENT = 30.0
 ZOOM_SNAP_LEVELS = (
 	10.0,
 	15.0,
@@ -109,6 +111,9 @@ class ChemView(PySide6.QtWidgets.QGraphicsView):
 		)
 		shortcut.activated.connect(self.reset_zoom)
 
+		# level-of-detail follows every zoom change
+		self.zoom_changed.connect(self._apply_level_of_detail)
+
 	#============================================
 	def set_document(self, doc) -> None:
 		"""Set the active document for this view.
@@ -124,6 +129,38 @@ class ChemView(PySide6.QtWidgets.QGraphicsView):
 		"""The active Document, or None if not set."""
 		return self._document
 
+	#============================================
+	def set_device_cache_enabled(self, enabled: bool) -> None:
+		"""Enable or disable per-item device coordinate caching.
+
+		With the cache on, atom and bond items are kept as device
+		pixmaps so panning a large drawing only blits. The pixmaps are
+		re-rendered after each zoom step, which costs more than a plain
+		repaint, so the cache is off by default.
+
+		Args:
+			enabled: True for DeviceCoordinateCache, False for NoCache.
+		"""
+		scene = self.scene()
+		if not hasattr(scene, "set_item_cache_mode"):
+			return
+		if enabled:
+			mode = PySide6.QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+		else:
+			mode = PySide6.QtWidgets.QGraphicsItem.CacheMode.NoCache
+		scene.set_item_cache_mode(mode)
+
+	#============================================
+	def _apply_level_of_detail(self, zoom_percent: float) -> None:
+		"""Switch the scene to low detail below LOW_DETAIL_ZOOM_PERCENT.
+
+		Args:
+			zoom_percent: Current zoom level as a percentage.
+		"""
+		scene = self.scene()
+		if hasattr(scene, "set_low_detail"):
+			scene.set_low_detail(zoom_percent < LOW_DETAIL_ZOOM_PERCENT)
+
 	#============================================
 	def set_mode_manager(self, manager) -> None:
 		"""Set the mode manager for event dispatch.
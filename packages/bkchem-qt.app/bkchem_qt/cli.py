@@ -4,19 +4,20 @@
 import argparse
 import sys
 
-# local repo modules
-import bkchem_qt.app
-
 # application version
 VERSION = "26.02a1"
 
+# report file used when --profile-startup is given without a path
+DEFAULT_PROFILE_PATH = "bkchem_qt_startup_profile.txt"
+
 
 #============================================
 def parse_args() -> argparse.Namespace:
 	"""Parse command-line arguments.
 
 	Returns:
-		Parsed argument namespace with version flag and file list.
+		Parsed argument namespace with version flag, startup profile
+		options and file list.
 	"""
 	parser = argparse.ArgumentParser(
 		description="BKChem-Qt - 2D molecular structure editor",
@@ -26,6 +27,16 @@ def parse_args() -> argparse.Namespace:
 		action='version',
 		version=f"BKChem-Qt {VERSION}",
 	)
+	parser.add_argument(
+		'--profile-startup', dest='profile_startup',
+		action='store_true',
+		help="Write an import-time and first-paint timing report",
+	)
+	parser.add_argument(
+		'--profile-startup-report', dest='profile_report',
+		default=DEFAULT_PROFILE_PATH, metavar='PATH',
+		help=f"Report file for --profile-startup (default: {DEFAULT_PROFILE_PATH})",
+	)
 	parser.add_argument(
 		'files',
 		nargs='*',
@@ -39,5 +50,12 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
 	"""Entry point for the BKChem-Qt CLI."""
 	args = parse_args()
-	exit_code = bkchem_qt.app.main(args.files)
+	profiler = None
+	if args.profile_startup:
+		import bkchem_qt.startup_profile
+		profiler = bkchem_qt.startup_profile.StartupProfiler(args.profile_report)
+		profiler.install()
+	# imported after the profiler is installed so the app imports are timed
+	import bkchem_qt.app
+	exit_code = bkchem_qt.app.main(args.files, profiler=profiler)
 	sys.exit(exit_code)
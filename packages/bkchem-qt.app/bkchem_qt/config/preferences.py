@@ -30,6 +30,7 @@ class Preferences:
 	KEY_GRID_SNAP_ENABLED: str = "appearance/grid_snap_enabled"
 	KEY_RECENT_FILES: str = "files/recent"
 	KEY_ZOOM_LEVEL: str = "view/zoom_level"
+	KEY_DEVICE_CACHE: str = "view/device_coordinate_cache"
 	# legacy key retained only for hard-cut cleanup
 	KEY_BOND_LENGTH: str = "drawing/bond_length"
 	KEY_BOND_LENGTH_PT: str = "drawing/bond_length_pt"
@@ -49,6 +50,7 @@ class Preferences:
 		KEY_GRID_SNAP_ENABLED: True,
 		KEY_RECENT_FILES: [],
 		KEY_ZOOM_LEVEL: 100.0,
+		KEY_DEVICE_CACHE: False,
 		KEY_BOND_LENGTH_PT: 40.0,
 		KEY_LINE_WIDTH: 2.0,
 		KEY_FONT_SIZE: 12,
@@ -1,9 +1,12 @@
 """CDML file loading and saving for BKChem-Qt."""
 
+# Standard Library
+import io
+
 # local repo modules
+import oasa.cdml
 import oasa.cdml_writer
 from oasa import dom_extensions as dom_ext
-from oasa import safe_xml
 from oasa.cdml_writer import POINTS_PER_CM
 
 import bkchem_qt.bridge.oasa_bridge
@@ -14,8 +17,8 @@ import bkchem_qt.models.molecule_model
 def load_cdml_file(file_path: str, bond_length_pt: float = None) -> list:
 	"""Load a CDML file and return a list of MoleculeModel objects.
 
-	Parses the CDML XML document, extracts each ``<molecule>`` element,
-	converts it to an OASA molecule via ``read_cdml_molecule_element()``,
+	Streams the CDML XML document one ``<molecule>`` element at a time,
+	converts each to an OASA molecule via ``read_cdml_molecule_element()``,
 	and wraps each in a MoleculeModel through the bridge layer. Handles
 	disconnected molecules by splitting into separate models.
 
@@ -30,9 +33,8 @@ def load_cdml_file(file_path: str, bond_length_pt: float = None) -> list:
 	Returns:
 		List of MoleculeModel instances parsed from the file.
 	"""
-	with open(file_path, "r") as f:
-		text = f.read()
-	return load_cdml_string(text, bond_length_pt=bond_length_pt)
+	with open(file_path, "rb") as f:
+		return _load_cdml_source(f, bond_length_pt=bond_length_pt)
 
 
 #============================================
@@ -49,11 +51,17 @@ def load_cdml_string(cdml_text: str, bond_length_pt: float = None) -> list:
 	Returns:
 		List of MoleculeModel instances parsed from the text.
 	"""
-	doc = safe_xml.parse_dom_from_string(cdml_text)
-	# search for all <molecule> elements anywhere in the document
-	molecule_elements = dom_ext.simpleXPathSearch(doc, "//molecule")
+	if not isinstance(cdml_text, bytes):
+		cdml_text = str(cdml_text).encode("utf-8")
+	return _load_cdml_source(io.BytesIO(cdml_text), bond_length_pt=bond_length_pt)
+
+
+#============================================
+def _load_cdml_source(source, bond_length_pt: float = None) -> list:
+	"""Convert every ``<molecule>`` of a binary CDML stream to MoleculeModels."""
 	results = []
-	for mol_el in molecule_elements:
+	# all <molecule> elements anywhere in the document, one at a time
+	for mol_el in oasa.cdml.iter_molecule_elements(source):
 		oasa_mol = oasa.cdml_writer.read_cdml_molecule_element(mol_el)
 		if oasa_mol is None:
 			continue
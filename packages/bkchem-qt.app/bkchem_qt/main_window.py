@@ -19,14 +19,7 @@ import bkchem_qt.widgets.icon_loader
 import bkchem_qt.setup.canvas_setup
 import bkchem_qt.setup.mode_setup
 import bkchem_qt.setup.toolbar_setup
-import bkchem_qt.actions.file_actions
-import bkchem_qt.io.cdml_io
-import bkchem_qt.io.clipboard_manager
-import bkchem_qt.dialogs.about_dialog
-import bkchem_qt.dialogs.preferences_dialog
-import bkchem_qt.dialogs.theme_chooser_dialog
 import bkchem_qt.models.document
-import bkchem_qt.io.export
 import bkchem_qt.themes.theme_loader
 
 
@@ -50,7 +43,8 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 		self._theme_manager = theme_manager
 		self._prefs = bkchem_qt.config.preferences.Preferences.instance()
 		self._document = bkchem_qt.models.document.Document(self)
-		self._clipboard_manager = bkchem_qt.io.clipboard_manager.ClipboardManager()
+		# created by the first copy or paste, see clipboard_manager
+		self._clipboard_manager = None
 
 		self.setWindowTitle(self.tr("BKChem-Qt"))
 		style = PySide6.QtWidgets.QApplication.style()
@@ -92,6 +86,15 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 		"""The active graphics view."""
 		return self._view
 
+	#============================================
+	@property
+	def clipboard_manager(self):
+		"""The CDML clipboard manager, imported and created on first use."""
+		if self._clipboard_manager is None:
+			import bkchem_qt.io.clipboard_manager
+			self._clipboard_manager = bkchem_qt.io.clipboard_manager.ClipboardManager()
+		return self._clipboard_manager
+
 	#============================================
 	def _setup_canvas(self) -> None:
 		"""Create the scene, view, and tab widget for the central area."""
@@ -439,7 +442,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def on_copy(self) -> None:
 		"""Copy selected molecules to clipboard as CDML."""
-		count = self._clipboard_manager.copy_selection(self._document)
+		count = self.clipboard_manager.copy_selection(self._document)
 		if count == 0:
 			self.statusBar().showMessage(
 				self.tr("Nothing selected to copy"), 3000,
@@ -452,7 +455,8 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def on_paste(self) -> None:
 		"""Paste molecules from clipboard CDML data."""
-		status, molecules = self._clipboard_manager.paste()
+		import bkchem_qt.actions.file_actions
+		status, molecules = self.clipboard_manager.paste()
 		if status == "no_data":
 			self.statusBar().showMessage(
 				self.tr("No CDML data on clipboard"), 3000,
@@ -484,8 +488,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _delete_selected(self) -> None:
 		"""Delete all selected atoms and bonds with undo support."""
-		import bkchem_qt.canvas.items.atom_item
-		import bkchem_qt.canvas.items.bond_item
+		import bkchem_qt.canvas.scene_queries
 		import bkchem_qt.undo.commands
 		scene = self._scene
 		undo_stack = self._document.undo_stack
@@ -507,14 +510,9 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 			if mol is None:
 				continue
 			# find connected bond items still in scene
-			connected = []
-			for item in scene.items():
-				if isinstance(
-					item, bkchem_qt.canvas.items.bond_item.BondItem
-				):
-					bm = item.bond_model
-					if bm.atom1 is atom_model or bm.atom2 is atom_model:
-						connected.append((bm, item))
+			connected = bkchem_qt.canvas.scene_queries.find_connected_bond_items(
+				scene, atom_model, self._document,
+			)
 			cmd = bkchem_qt.undo.commands.RemoveAtomCommand(
 				scene, mol, atom_model, atom_item, connected,
 			)
@@ -654,6 +652,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_open(self) -> None:
 		"""Open a file via file dialog."""
+		import bkchem_qt.actions.file_actions
 		bkchem_qt.actions.file_actions.open_file(self)
 
 	#============================================
@@ -663,6 +662,8 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 		If the document has a file path, saves directly. Otherwise
 		prompts for a save location via file dialog.
 		"""
+		import bkchem_qt.actions.file_actions
+		import bkchem_qt.io.cdml_io
 		file_path = self._document.file_path
 		if not file_path:
 			file_path = PySide6.QtWidgets.QFileDialog.getSaveFileName(
@@ -688,6 +689,8 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 		Always prompts for a save location, even if the document
 		already has a file path.
 		"""
+		import bkchem_qt.actions.file_actions
+		import bkchem_qt.io.cdml_io
 		file_path = PySide6.QtWidgets.QFileDialog.getSaveFileName(
 			self, self.tr("Save CDML File As"), "",
 			self.tr("CDML Files (*.cdml);;All Files (*)"),
@@ -707,6 +710,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_export_svg(self) -> None:
 		"""Export scene to SVG."""
+		import bkchem_qt.io.export
 		path = PySide6.QtWidgets.QFileDialog.getSaveFileName(
 			self, self.tr("Export SVG"), "", self.tr("SVG Files (*.svg)")
 		)[0]
@@ -716,6 +720,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_export_png(self) -> None:
 		"""Export scene to PNG."""
+		import bkchem_qt.io.export
 		path = PySide6.QtWidgets.QFileDialog.getSaveFileName(
 			self, self.tr("Export PNG"), "", self.tr("PNG Files (*.png)")
 		)[0]
@@ -725,6 +730,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_export_pdf(self) -> None:
 		"""Export scene to PDF."""
+		import bkchem_qt.io.export
 		path = PySide6.QtWidgets.QFileDialog.getSaveFileName(
 			self, self.tr("Export PDF"), "", self.tr("PDF Files (*.pdf)")
 		)[0]
@@ -768,6 +774,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_choose_theme(self) -> None:
 		"""Open the theme chooser dialog and apply the selected theme."""
+		import bkchem_qt.dialogs.theme_chooser_dialog
 		current = self._theme_manager.current_theme
 		chosen = bkchem_qt.dialogs.theme_chooser_dialog.ThemeChooserDialog \
 			.choose_theme(self, current)
@@ -895,6 +902,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 		Args:
 			file_path: Absolute path to the file to open.
 		"""
+		import bkchem_qt.actions.file_actions
 		if not os.path.isfile(file_path):
 			PySide6.QtWidgets.QMessageBox.warning(
 				self, self.tr("File Not Found"),
@@ -906,6 +914,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_preferences(self) -> None:
 		"""Show the preferences dialog."""
+		import bkchem_qt.dialogs.preferences_dialog
 		accepted = bkchem_qt.dialogs.preferences_dialog.PreferencesDialog \
 			.show_preferences(self)
 		if accepted:
@@ -915,6 +924,7 @@ class MainWindow(PySide6.QtWidgets.QMainWindow):
 	#============================================
 	def _on_about(self) -> None:
 		"""Show the About dialog."""
+		import bkchem_qt.dialogs.about_dialog
 		bkchem_qt.dialogs.about_dialog.AboutDialog.show_about(self)
 
 	#============================================
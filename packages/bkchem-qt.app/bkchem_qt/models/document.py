@@ -2,6 +2,7 @@
 
 # Standard Library
 import os
+import functools
 
 # PIP3 modules
 import PySide6.QtCore
@@ -24,6 +25,11 @@ class Document(PySide6.QtCore.QObject):
 	window title can show an unsaved-changes indicator. Emits
 	``selection_changed`` after selection queries detect a change.
 
+	Keeps atom->bonds, atom->molecule and bond->molecule indexes for the
+	molecules it holds. They follow the MoleculeModel structure signals
+	and BondModel endpoint changes, so undo commands keep them current
+	and selection queries cost O(degree) instead of O(scene).
+
 	Args:
 		parent: Optional parent QObject.
 	"""
@@ -47,6 +53,14 @@ class Document(PySide6.QtCore.QObject):
 		self._undo_stack = PySide6.QtGui.QUndoStack(self)
 		# scene reference for selection queries (set by MainWindow)
 		self._scene = None
+		# adjacency indexes: model -> owning MoleculeModel, atom -> bonds
+		# (insertion-ordered dict used as a set), bond -> (atom1, atom2)
+		self._atom_molecule = {}
+		self._bond_molecule = {}
+		self._atom_bonds = {}
+		self._bond_atoms = {}
+		# per-molecule signal slots, kept for disconnecting
+		self._molecule_slots = {}
 
 	# ------------------------------------------------------------------
 	# Properties
@@ -238,28 +252,20 @@ class Document(PySide6.QtCore.QObject):
 		Returns:
 			List of BondModel instances needing update.
 		"""
-		import bkchem_qt.canvas.items.bond_item
 		if self._scene is None:
 			return []
-		# collect selected atom models
-		selected_atom_models = set()
-		for atom_item in self.selected_atoms:
-			selected_atom_models.add(id(atom_item.atom_model))
 		# collect selected bond models to exclude
 		selected_bond_models = set()
 		for bond_item in self.selected_bonds:
 			selected_bond_models.add(id(bond_item.bond_model))
-		# find bonds connected to selected atoms but not themselves selected
+		# walk the bonds of each selected atom but skip selected bonds
+		seen = set()
 		result = []
-		for item in self._scene.items():
-			if not isinstance(item, bkchem_qt.canvas.items.bond_item.BondItem):
-				continue
-			bm = item.bond_model
-			if id(bm) in selected_bond_models:
-				continue
-			if bm.atom1 is not None and id(bm.atom1) in selected_atom_models:
-				result.append(bm)
-			elif bm.atom2 is not None and id(bm.atom2) in selected_atom_models:
+		for atom_item in self.selected_atoms:
+			for bm in self.bonds_for_atom(atom_item.atom_model):
+				if id(bm) in selected_bond_models or id(bm) in seen:
+					continue
+				seen.add(id(bm))
 				result.append(bm)
 		return result
 
@@ -293,6 +299,46 @@ class Document(PySide6.QtCore.QObject):
 					result.append(atom_model)
 		return result
 
+	# ------------------------------------------------------------------
+	# Adjacency queries
+	# ------------------------------------------------------------------
+
+	#============================================
+	def molecule_for_atom(self, atom_model):
+		"""Return the MoleculeModel containing an AtomModel.
+
+		Args:
+			atom_model: AtomModel to look up.
+
+		Returns:
+			MoleculeModel or None.
+		"""
+		return self._atom_molecule.get(atom_model)
+
+	#============================================
+	def molecule_for_bond(self, bond_model):
+		"""Return the MoleculeModel containing a BondModel.
+
+		Args:
+			bond_model: BondModel to look up.
+
+		Returns:
+			MoleculeModel or None.
+		"""
+		return self._bond_molecule.get(bond_model)
+
+	#============================================
+	def bonds_for_atom(self, atom_model) -> list:
+		"""Return the BondModels that have atom_model as an endpoint.
+
+		Args:
+			atom_model: AtomModel to look up.
+
+		Returns:
+			List of BondModel instances in the order they were added.
+		"""
+		return list(self._atom_bonds.get(atom_model, ()))
+
 	#============================================
 	def _find_molecule_for_atom(self, atom_model):
 		"""Find the MoleculeModel containing a given AtomModel.
@@ -303,10 +349,7 @@ class Document(PySide6.QtCore.QObject):
 		Returns:
 			MoleculeModel or None.
 		"""
-		for mol_model in self._molecules:
-			if atom_model in mol_model.atoms:
-				return mol_model
-		return None
+		return self.molecule_for_atom(atom_model)
 
 	#============================================
 	def _find_molecule_for_bond(self, bond_model):
@@ -318,10 +361,92 @@ class Document(PySide6.QtCore.QObject):
 		Returns:
 			MoleculeModel or None.
 		"""
-		for mol_model in self._molecules:
-			if bond_model in mol_model.bonds:
-				return mol_model
-		return None
+		return self.molecule_for_bond(bond_model)
+
+	# ------------------------------------------------------------------
+	# Index maintenance
+	# ------------------------------------------------------------------
+
+	#============================================
+	def _index_molecule(self, mol_model) -> None:
+		"""Index a molecule's atoms and bonds and follow its signals."""
+		if mol_model in self._molecule_slots:
+			return
+		slots = (
+			functools.partial(self._index_atom, mol_model),
+			self._unindex_atom,
+			functools.partial(self._index_bond, mol_model),
+			self._unindex_bond,
+		)
+		mol_model.atom_added.connect(slots[0])
+		mol_model.atom_removed.connect(slots[1])
+		mol_model.bond_added.connect(slots[2])
+		mol_model.bond_removed.connect(slots[3])
+		self._molecule_slots[mol_model] = slots
+		for atom_model in mol_model.atoms:
+			self._index_atom(mol_model, atom_model)
+		for bond_model in mol_model.bonds:
+			self._index_bond(mol_model, bond_model)
+
+	#============================================
+	def _unindex_molecule(self, mol_model) -> None:
+		"""Drop a molecule's entries and stop following its signals."""
+		slots = self._molecule_slots.pop(mol_model, None)
+		if slots is not None:
+			mol_model.atom_added.disconnect(slots[0])
+			mol_model.atom_removed.disconnect(slots[1])
+			mol_model.bond_added.disconnect(slots[2])
+			mol_model.bond_removed.disconnect(slots[3])
+		for bond_model in mol_model.bonds:
+			self._unindex_bond(bond_model)
+		for atom_model in mol_model.atoms:
+			self._unindex_atom(atom_model)
+
+	#============================================
+	def _index_atom(self, mol_model, atom_model) -> None:
+		self._atom_molecule[atom_model] = mol_model
+		self._atom_bonds.setdefault(atom_model, {})
+
+	#============================================
+	def _unindex_atom(self, atom_model) -> None:
+		self._atom_molecule.pop(atom_model, None)
+		self._atom_bonds.pop(atom_model, None)
+
+	#============================================
+	def _index_bond(self, mol_model, bond_model) -> None:
+		if bond_model not in self._bond_molecule:
+			bond_model.property_changed.connect(self._on_bond_property_changed)
+		self._bond_molecule[bond_model] = mol_model
+		self._set_bond_atoms(bond_model, (bond_model.atom1, bond_model.atom2))
+
+	#============================================
+	def _unindex_bond(self, bond_model) -> None:
+		if self._bond_molecule.pop(bond_model, None) is not None:
+			bond_model.property_changed.disconnect(self._on_bond_property_changed)
+		self._set_bond_atoms(bond_model, ())
+
+	#============================================
+	def _set_bond_atoms(self, bond_model, atoms: tuple) -> None:
+		"""Move a bond's atom->bonds entries to a new endpoint pair."""
+		for atom_model in self._bond_atoms.pop(bond_model, ()):
+			bonds = self._atom_bonds.get(atom_model)
+			if bonds is not None:
+				bonds.pop(bond_model, None)
+		atoms = tuple(atom_model for atom_model in atoms if atom_model is not None)
+		if not atoms:
+			return
+		self._bond_atoms[bond_model] = atoms
+		for atom_model in atoms:
+			self._atom_bonds.setdefault(atom_model, {})[bond_model] = None
+
+	#============================================
+	def _on_bond_property_changed(self, name: str, value: object) -> None:
+		"""Re-index a bond whose endpoint was reassigned (e.g. atom merge)."""
+		if name not in ("atom1", "atom2"):
+			return
+		bond_model = self.sender()
+		if bond_model in self._bond_molecule:
+			self._set_bond_atoms(bond_model, (bond_model.atom1, bond_model.atom2))
 
 	# ------------------------------------------------------------------
 	# Mutation
@@ -335,6 +460,7 @@ class Document(PySide6.QtCore.QObject):
 			mol_model: MoleculeModel to add.
 		"""
 		self._molecules.append(mol_model)
+		self._index_molecule(mol_model)
 		self.dirty = True
 
 	#============================================
@@ -348,11 +474,14 @@ class Document(PySide6.QtCore.QObject):
 			ValueError: If the molecule is not in the document.
 		"""
 		self._molecules.remove(mol_model)
+		self._unindex_molecule(mol_model)
 		self.dirty = True
 
 	#============================================
 	def clear(self):
 		"""Remove all molecules and reset the document to empty state."""
+		for mol_model in list(self._molecules):
+			self._unindex_molecule(mol_model)
 		self._molecules.clear()
 		self._undo_stack.clear()
 		self.dirty = False
@@ -286,19 +286,22 @@ class BioTemplateMode(bkchem_qt.modes.base_mode.BaseMode):
 		"""Load and place a biomolecule template at the given position.
 
 		Parses the current SMILES to an OASA molecule, generates
-		coordinates, converts to a Qt MoleculeModel, repositions
+		coordinates (cached across sessions), converts to a Qt MoleculeModel, repositions
 		to (x, y), and adds to the scene with undo.
 
 		Args:
 			x: Target X coordinate in scene units.
 			y: Target Y coordinate in scene units.
 		"""
-		import oasa.smiles_lib
+		import bkchem.os_support
+		import oasa.template_cache
 		import bkchem_qt.bridge.oasa_bridge
 		import bkchem_qt.models.molecule_model
 
-		# parse SMILES to OASA molecule with coordinate generation
-		oasa_mol = oasa.smiles_lib.text_to_mol(self._current_smiles)
+		# parse SMILES to OASA molecule with coordinate generation, or
+		# reuse the layout cached on disk (shared with the Tk app)
+		cache = oasa.template_cache.get_cache(bkchem.os_support.get_template_cache_path())
+		oasa_mol = cache.layout(self._current_smiles)
 		if oasa_mol is None:
 			self.status_message.emit(
 				f"Failed to parse: {self._current_template_name}"
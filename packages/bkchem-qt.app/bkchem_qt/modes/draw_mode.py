@@ -881,13 +881,9 @@ class DrawMode(bkchem_qt.modes.base_mode.BaseMode):
 		survivor_model = survivor_item.atom_model
 		duplicate_model = duplicate_item.atom_model
 		# find bonds connected to the duplicate
-		bond_items_in_scene = [
-			item for item in scene.items()
-			if isinstance(item, bkchem_qt.canvas.items.bond_item.BondItem)
-		]
+		connected_bonds = self._env.find_connected_bond_items(duplicate_model)
 		undo_stack.beginMacro("Merge Overlapping Atoms")
-		for bond_item in bond_items_in_scene:
-			bm = bond_item.bond_model
+		for bm, _bond_item in connected_bonds:
 			if bm.atom1 is duplicate_model:
 				# skip if this would create a self-bond
 				if bm.atom2 is survivor_model:
@@ -906,16 +902,13 @@ class DrawMode(bkchem_qt.modes.base_mode.BaseMode):
 				)
 				undo_stack.push(cmd)
 		# remove the duplicate atom from its molecule
-		doc = self._env.document
-		if doc is not None:
-			for mol_model in doc.molecules:
-				if duplicate_model in mol_model.atoms:
-					cmd = bkchem_qt.undo.commands.RemoveAtomCommand(
-						scene, mol_model, duplicate_model,
-						duplicate_item, [],
-					)
-					undo_stack.push(cmd)
-					break
+		mol_model = self._env.find_molecule_for_atom(duplicate_model)
+		if mol_model is not None:
+			cmd = bkchem_qt.undo.commands.RemoveAtomCommand(
+				scene, mol_model, duplicate_model,
+				duplicate_item, [],
+			)
+			undo_stack.push(cmd)
 		undo_stack.endMacro()
 
 	# ------------------------------------------------------------------
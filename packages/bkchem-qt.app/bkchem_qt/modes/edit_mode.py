@@ -11,8 +11,6 @@ import bkchem_qt.canvas.items.atom_item
 import bkchem_qt.canvas.items.bond_item
 from bkchem_qt.canvas.items import render_ops_painter
 import bkchem_qt.undo.commands
-import bkchem_qt.dialogs.atom_dialog
-import bkchem_qt.dialogs.bond_dialog
 import bkchem_qt.actions.context_menu
 
 # minimum drag distance in pixels before a move begins
@@ -203,12 +201,13 @@ class EditMode(bkchem_qt.modes.base_mode.BaseMode):
 				anchor_model = self._drag_anchor_item.atom_model
 				move_dx = snap_x - anchor_model.x
 				move_dy = snap_y - anchor_model.y
-			# move each selected item
-			for item in self._moved_items:
-				if isinstance(item, bkchem_qt.canvas.items.atom_item.AtomItem):
-					model = item.atom_model
-					model.x = model.x + move_dx
-					model.y = model.y + move_dy
+			# move each selected item, rebuilding each touched item once
+			with scene.update_transaction():
+				for item in self._moved_items:
+					if isinstance(item, bkchem_qt.canvas.items.atom_item.AtomItem):
+						model = item.atom_model
+						model.x = model.x + move_dx
+						model.y = model.y + move_dy
 			self._drag_last = scene_pos
 		elif self._rubber_band_origin is not None:
 			# update or create the rubber band rectangle
@@ -463,6 +462,16 @@ class EditMode(bkchem_qt.modes.base_mode.BaseMode):
 				candidates[id(atom_model)] = atom_model
 		if not candidates:
 			return []
+		# with the document index each candidate costs O(degree)
+		if self._env.document is not None and hasattr(scene, "item_for_model"):
+			orphans = []
+			for atom_model in candidates.values():
+				item = scene.item_for_model(atom_model)
+				if item is None:
+					continue
+				if not self._env.find_connected_bond_items(atom_model):
+					orphans.append(item)
+			return orphans
 		# find AtomItems for candidates and check if they have remaining bonds
 		orphans = []
 		for item in scene.items():
@@ -509,12 +518,13 @@ class EditMode(bkchem_qt.modes.base_mode.BaseMode):
 			return
 		selected = scene.selectedItems()
 		items_and_offsets = []
-		for item in selected:
-			if isinstance(item, bkchem_qt.canvas.items.atom_item.AtomItem):
-				model = item.atom_model
-				model.x = model.x + dx
-				model.y = model.y + dy
-				items_and_offsets.append((item, dx, dy))
+		with scene.update_transaction():
+			for item in selected:
+				if isinstance(item, bkchem_qt.canvas.items.atom_item.AtomItem):
+					model = item.atom_model
+					model.x = model.x + dx
+					model.y = model.y + dy
+					items_and_offsets.append((item, dx, dy))
 		if items_and_offsets:
 			undo_stack = self._env.undo_stack
 			if undo_stack is not None:
@@ -532,6 +542,7 @@ class EditMode(bkchem_qt.modes.base_mode.BaseMode):
 		Args:
 			atom_item: The AtomItem to edit.
 		"""
+		import bkchem_qt.dialogs.atom_dialog
 		model = atom_item.atom_model
 		# snapshot old values before dialog opens
 		old_values = {
@@ -575,6 +586,7 @@ class EditMode(bkchem_qt.modes.base_mode.BaseMode):
 		Args:
 			bond_item: The BondItem to edit.
 		"""
+		import bkchem_qt.dialogs.bond_dialog
 		model = bond_item.bond_model
 		# snapshot old values before dialog opens
 		old_values = {
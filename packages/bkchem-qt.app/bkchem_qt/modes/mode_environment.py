@@ -109,5 +109,5 @@ class ModeEnvironment:
 			List of (BondModel, BondItem) tuples.
 		"""
 		return bkchem_qt.canvas.scene_queries.find_connected_bond_items(
-			self.scene, atom_model
+			self.scene, atom_model, self.document
 		)
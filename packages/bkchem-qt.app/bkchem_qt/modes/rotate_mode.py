@@ -10,7 +10,6 @@ import PySide6.QtGui
 # local repo modules
 import bkchem_qt.modes.base_mode
 import bkchem_qt.canvas.items.atom_item
-import bkchem_qt.canvas.items.bond_item
 
 
 #============================================
@@ -114,20 +113,19 @@ class RotateMode(bkchem_qt.modes.base_mode.BaseMode):
 		cy = self._center.y()
 		cos_r = math.cos(rotation)
 		sin_r = math.sin(rotation)
-		for item_id, (orig_x, orig_y, item) in self._original_positions.items():
-			# translate to origin, rotate, translate back
-			rel_x = orig_x - cx
-			rel_y = orig_y - cy
-			new_x = cx + rel_x * cos_r - rel_y * sin_r
-			new_y = cy + rel_x * sin_r + rel_y * cos_r
-			item.atom_model.set_xyz(new_x, new_y, item.atom_model.z)
-		self._accumulated_angle = rotation
-		# update bond items after moving atoms
 		scene = self._env.scene
-		if scene is not None:
-			for item in scene.items():
-				if isinstance(item, bkchem_qt.canvas.items.bond_item.BondItem):
-					item.update_from_model()
+		if scene is None:
+			return
+		# moved atoms and their bonds rebuild once when the transaction ends
+		with scene.update_transaction():
+			for item_id, (orig_x, orig_y, item) in self._original_positions.items():
+				# translate to origin, rotate, translate back
+				rel_x = orig_x - cx
+				rel_y = orig_y - cy
+				new_x = cx + rel_x * cos_r - rel_y * sin_r
+				new_y = cy + rel_x * sin_r + rel_y * cos_r
+				item.atom_model.set_xyz(new_x, new_y, item.atom_model.z)
+		self._accumulated_angle = rotation
 
 	#============================================
 	def mouse_release(self, scene_pos: PySide6.QtCore.QPointF, event) -> None:
@@ -173,8 +173,9 @@ class TemplateMode(bkchem_qt.modes.base_mode.BaseMode):
 			x: Target X coordinate in scene units.
 			y: Target Y coordinate in scene units.
 		"""
+		import bkchem.os_support
 		import oasa.known_groups
-		import oasa.smiles_lib
+		import oasa.template_cache
 		import bkchem_qt.bridge.oasa_bridge
 		import bkchem_qt.models.molecule_model
 
@@ -183,8 +184,10 @@ class TemplateMode(bkchem_qt.modes.base_mode.BaseMode):
 			self.status_message.emit(f"No SMILES for template: {self._current_template}")
 			return
 
-		# parse SMILES to OASA molecule with coordinate generation
-		oasa_mol = oasa.smiles_lib.text_to_mol(smiles)
+		# parse SMILES to OASA molecule with coordinate generation, or
+		# reuse the layout cached on disk (shared with the Tk app)
+		cache = oasa.template_cache.get_cache(bkchem.os_support.get_template_cache_path())
+		oasa_mol = cache.layout(smiles)
 		if oasa_mol is None:
 			self.status_message.emit(f"Failed to parse template: {self._current_template}")
 			return
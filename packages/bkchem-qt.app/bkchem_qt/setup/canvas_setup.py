@@ -45,6 +45,14 @@ def setup_canvas(window, theme_manager, prefs, document):
 	# wire scene into document for selection query forwarding
 	document.set_scene(scene)
 
+	# optional per-item pixmap caching for fast panning; QSettings may
+	# hand back the stored flag as a string
+	device_cache = prefs.value(
+		bkchem_qt.config.preferences.Preferences.KEY_DEVICE_CACHE,
+		False,
+	)
+	view.set_device_cache_enabled(str(device_cache).lower() in ("true", "1"))
+
 	# set initial viewport background from YAML theme
 	surround = bkchem_qt.themes.theme_loader.get_canvas_surround(theme)
 	view.set_background_color(surround)
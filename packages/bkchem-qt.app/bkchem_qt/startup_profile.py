@@ -0,0 +1,193 @@
+"""Import-time and first-paint timing report for BKChem-Qt startup.
+
+StartupProfiler puts a finder at the front of sys.meta_path that wraps
+each module loader and times the module body, so the report shows self
+and cumulative import time per module, like python -X importtime. The
+application marks its startup phases, and an application event filter
+marks the first paint event and writes the report. This module uses the
+standard library only so it can be installed before PySide6 is imported.
+"""
+
+# Standard Library
+import sys
+import time
+import platform
+
+
+# modules whose presence before the first paint is worth reporting
+WATCHED_MODULES = (
+	"rdkit",
+	"cairo",
+	"oasa.smiles_lib",
+	"oasa.inchi_lib",
+	"oasa.codecs.rdkit_formats",
+	"bkchem_qt.io.cdml_io",
+	"bkchem_qt.io.export",
+	"bkchem_qt.io.format_bridge",
+	"bkchem_qt.bridge.oasa_bridge",
+	"bkchem_qt.dialogs.about_dialog",
+	"bkchem_qt.dialogs.preferences_dialog",
+	"bkchem_qt.dialogs.atom_dialog",
+)
+
+# slowest modules listed in the report
+TOP_MODULES = 30
+
+
+#============================================
+class _TimedLoader:
+	"""Loader wrapper that times exec_module() for the profiler.
+
+	Every other attribute is forwarded to the wrapped loader, so resource
+	readers and get_data() keep working on wrapped modules.
+	"""
+
+	#============================================
+	def __init__(self, loader, profiler):
+		self._loader = loader
+		self._profiler = profiler
+
+	#============================================
+	def __getattr__(self, name):
+		return getattr(self._loader, name)
+
+	#============================================
+	def create_module(self, spec):
+		return self._loader.create_module(spec)
+
+	#============================================
+	def exec_module(self, module):
+		self._profiler._enter()
+		try:
+			self._loader.exec_module(module)
+		finally:
+			self._profiler._leave(module.__name__)
+
+
+#============================================
+class StartupProfiler:
+	"""Collect import times and startup phase marks, then write a report.
+
+	Args:
+		report_path: Path of the text report written at the first paint.
+	"""
+
+	#============================================
+	def __init__(self, report_path: str):
+		self.report_path = report_path
+		self.start = time.perf_counter()
+		# (phase name, seconds since start) in mark order
+		self.phases = []
+		# module name -> [self seconds, cumulative seconds], as imports finish
+		self.imports = {}
+		self._stack = []
+		self._installed = False
+		self._written = False
+
+	#============================================
+	def install(self) -> None:
+		"""Start timing imports; modules already loaded are not timed."""
+		if not self._installed:
+			sys.meta_path.insert(0, self)
+			self._installed = True
+
+	#============================================
+	def uninstall(self) -> None:
+		"""Stop timing imports."""
+		if self._installed:
+			sys.meta_path.remove(self)
+			self._installed = False
+
+	#============================================
+	def find_spec(self, fullname, path, target=None):
+		"""Meta path hook: wrap the loader the other finders resolve."""
+		for finder in sys.meta_path:
+			if finder is self or not hasattr(finder, "find_spec"):
+				continue
+			spec = finder.find_spec(fullname, path, target)
+			if spec is None:
+				continue
+			if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+				spec.loader = _TimedLoader(spec.loader, self)
+			return spec
+		return None
+
+	#============================================
+	def _enter(self) -> None:
+		# [start time, seconds spent in nested imports]
+		self._stack.append([time.perf_counter(), 0.0])
+
+	#============================================
+	def _leave(self, name: str) -> None:
+		started, nested = self._stack.pop()
+		cumulative = time.perf_counter() - started
+		self.imports[name] = [cumulative - nested, cumulative]
+		if self._stack:
+			self._stack[-1][1] += cumulative
+
+	#============================================
+	def mark(self, phase: str) -> None:
+		"""Record that a startup phase finished now."""
+		self.phases.append((phase, time.perf_counter() - self.start))
+
+	#============================================
+	def watch_first_paint(self, app) -> None:
+		"""Mark the first paint event seen by app and write the report.
+
+		Args:
+			app: The QApplication; an event filter is installed on it and
+				removed again after the first paint.
+		"""
+		import PySide6.QtCore
+
+		profiler = self
+
+		class FirstPaintFilter(PySide6.QtCore.QObject):
+			def eventFilter(self, watched, event):
+				if event.type() == PySide6.QtCore.QEvent.Type.Paint:
+					app.removeEventFilter(self)
+					profiler.mark("first paint")
+					profiler.uninstall()
+					profiler.write_report()
+				return False
+
+		self._paint_filter = FirstPaintFilter(app)
+		app.installEventFilter(self._paint_filter)
+
+	#============================================
+	def report_lines(self) -> list:
+		"""Return the report as a list of text lines."""
+		lines = [
+			"BKChem-Qt startup profile",
+			f"Python {platform.python_version()} on {platform.system()}",
+			"",
+			"Phases (ms since the profiler started):",
+		]
+		for phase, seconds in self.phases:
+			lines.append(f"  {seconds * 1000:9.1f}  {phase}")
+		# self times add up to the total without double counting
+		total = sum(times[0] for times in self.imports.values())
+		lines.append("")
+		lines.append(f"Modules imported: {len(self.imports)}, {total * 1000:.1f} ms")
+		lines.append("")
+		lines.append("Watched modules:")
+		for name in WATCHED_MODULES:
+			state = "loaded" if name in sys.modules else "not loaded"
+			lines.append(f"  {name:<40} {state}")
+		lines.append("")
+		lines.append(f"Slowest imports (top {TOP_MODULES} by cumulative time):")
+		lines.append(f"  {'self ms':>9}  {'cumul ms':>9}  module")
+		ranked = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+		for name, (self_time, cumulative) in ranked[:TOP_MODULES]:
+			lines.append(f"  {self_time * 1000:9.1f}  {cumulative * 1000:9.1f}  {name}")
+		return lines
+
+	#============================================
+	def write_report(self) -> None:
+		"""Write the report to report_path once."""
+		if self._written:
+			return
+		self._written = True
+		with open(self.report_path, "w", encoding="utf-8") as handle:
+			handle.write("\n".join(self.report_lines()) + "\n")
+		print(f"Startup profile written to {self.report_path}")
@@ -1,5 +1,8 @@
 """QUndoCommand subclasses for undo/redo support."""
 
+# Standard Library
+import contextlib
+
 # PIP3 modules
 import PySide6.QtGui
 
@@ -85,6 +88,11 @@ class RemoveAtomCommand(PySide6.QtGui.QUndoCommand):
 		self._atom_model = atom_model
 		self._atom_item = atom_item
 		self._connected_bonds = list(connected_bonds)
+		# save endpoint references for undo restore (remove_bond clears them)
+		self._bond_endpoints = [
+			(bond_model.atom1, bond_model.atom2)
+			for bond_model, _bond_item in self._connected_bonds
+		]
 
 	#============================================
 	def redo(self) -> None:
@@ -104,9 +112,8 @@ class RemoveAtomCommand(PySide6.QtGui.QUndoCommand):
 		self._molecule_model.add_atom(self._atom_model)
 		self._scene.addItem(self._atom_item)
 		# restore connected bonds
-		for bond_model, bond_item in self._connected_bonds:
-			atom1 = bond_model.atom1
-			atom2 = bond_model.atom2
+		for (bond_model, bond_item), (atom1, atom2) in zip(
+				self._connected_bonds, self._bond_endpoints):
 			if atom1 is not None and atom2 is not None:
 				self._molecule_model.add_bond(atom1, atom2, bond_model)
 			self._scene.addItem(bond_item)
@@ -301,18 +308,34 @@ class MoveAtomsCommand(PySide6.QtGui.QUndoCommand):
 		if self._first_redo:
 			self._first_redo = False
 			return
-		for atom_item, dx, dy in self._items_and_offsets:
-			model = atom_item.atom_model
-			model.x = model.x + dx
-			model.y = model.y + dy
+		with self._update_transaction():
+			for atom_item, dx, dy in self._items_and_offsets:
+				model = atom_item.atom_model
+				model.x = model.x + dx
+				model.y = model.y + dy
 
 	#============================================
 	def undo(self) -> None:
 		"""Move atoms back by the negative of their offsets."""
-		for atom_item, dx, dy in self._items_and_offsets:
-			model = atom_item.atom_model
-			model.x = model.x - dx
-			model.y = model.y - dy
+		with self._update_transaction():
+			for atom_item, dx, dy in self._items_and_offsets:
+				model = atom_item.atom_model
+				model.x = model.x - dx
+				model.y = model.y - dy
+
+	#============================================
+	def _update_transaction(self):
+		"""Return the scene update transaction for the moved atoms.
+
+		Atom and bond items then rebuild once per command instead of once
+		per coordinate setter. Falls back to a null context when the
+		items are not in a ChemScene.
+		"""
+		for atom_item, _dx, _dy in self._items_and_offsets:
+			scene = atom_item.scene()
+			if scene is not None and hasattr(scene, "update_transaction"):
+				return scene.update_transaction()
+		return contextlib.nullcontext()
 
 
 #============================================
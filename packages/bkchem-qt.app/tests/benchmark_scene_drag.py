@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark frame time while dragging an atom selection on the Qt canvas.
+
+Builds a ChemScene with chains of carbon atoms (about 500 atoms by
+default), selects every atom, and replays drag frames the way EditMode
+does: each frame moves every selected atom by a small delta. Frames are
+timed with per-setter item rebuilds (the old behavior) and inside one
+scene update transaction per frame, and the rebuild counts are reported.
+"""
+
+# Standard Library
+import os
+import sys
+import time
+import argparse
+
+# force offscreen rendering so the benchmark runs without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# ensure bkchem_qt, bkchem and OASA are importable from the repo tree
+sys.path.insert(0, "packages/bkchem-qt.app")
+sys.path.insert(0, "packages/bkchem-app")
+sys.path.insert(0, "packages/oasa")
+
+# PIP3 modules
+import PySide6.QtWidgets
+
+# local repo modules
+import bkchem_qt.canvas.scene
+import bkchem_qt.canvas.items.atom_item
+import bkchem_qt.canvas.items.bond_item
+import bkchem_qt.models.molecule_model
+
+
+CHAIN_LENGTH = 20
+BOND_SPACING = 30.0
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time drag frames for a large atom selection"
+	)
+	parser.add_argument(
+		'-a', '--atoms', dest='atoms',
+		type=int, default=500,
+		help="Number of selected atoms (default: 500)",
+	)
+	parser.add_argument(
+		'-f', '--frames', dest='frames',
+		type=int, default=10,
+		help="Drag frames timed per variant (default: 10)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_scene(n_atoms: int) -> tuple:
+	"""Return (scene, atom_items, bond_items) with carbon chains."""
+	scene = bkchem_qt.canvas.scene.ChemScene()
+	atom_items = []
+	bond_items = []
+	n_chains = max(1, n_atoms // CHAIN_LENGTH)
+	for chain in range(n_chains):
+		mol_model = bkchem_qt.models.molecule_model.MoleculeModel()
+		previous = None
+		for index in range(CHAIN_LENGTH):
+			atom = mol_model.create_atom(symbol="O" if index % 5 == 0 else "C")
+			# zigzag chain
+			y_offset = 15.0 if index % 2 else 0.0
+			atom.set_xyz(1100.0 + index * BOND_SPACING, 800.0 + chain * 45.0 + y_offset, 0.0)
+			mol_model.add_atom(atom)
+			atom_item = bkchem_qt.canvas.items.atom_item.AtomItem(atom)
+			scene.addItem(atom_item)
+			atom_items.append(atom_item)
+			if previous is not None:
+				bond = mol_model.create_bond(order=1, bond_type="n")
+				mol_model.add_bond(previous, atom, bond)
+				bond_item = bkchem_qt.canvas.items.bond_item.BondItem(bond)
+				scene.addItem(bond_item)
+				bond_items.append(bond_item)
+			previous = atom
+	return scene, atom_items, bond_items
+
+
+#============================================
+def move_selection(atom_items: list, dx: float, dy: float) -> None:
+	for atom_item in atom_items:
+		model = atom_item.atom_model
+		model.x = model.x + dx
+		model.y = model.y + dy
+
+
+#============================================
+def time_frames(scene, atom_items: list, frames: int, batched: bool) -> tuple:
+	"""Return (mean ms per frame, rebuilds per frame)."""
+	counter = {'count': 0}
+	originals = {}
+	for cls in (bkchem_qt.canvas.items.atom_item.AtomItem, bkchem_qt.canvas.items.bond_item.BondItem):
+		originals[cls] = cls.update_from_model
+
+		def counting(self, _original=originals[cls]):
+			counter['count'] += 1
+			_original(self)
+
+		cls.update_from_model = counting
+	try:
+		start = time.perf_counter()
+		for frame in range(frames):
+			delta = 1.0 if frame % 2 == 0 else -1.0
+			if batched:
+				with scene.update_transaction():
+					move_selection(atom_items, delta, delta)
+			else:
+				move_selection(atom_items, delta, delta)
+		elapsed = time.perf_counter() - start
+	finally:
+		for cls, original in originals.items():
+			cls.update_from_model = original
+	return (1000.0 * elapsed / frames, counter['count'] / frames)
+
+
+#============================================
+def main() -> None:
+	args = parse_args()
+	app = PySide6.QtWidgets.QApplication.instance() or PySide6.QtWidgets.QApplication([])
+	scene, atom_items, bond_items = build_scene(args.atoms)
+	for atom_item in atom_items:
+		atom_item.setSelected(True)
+	print(f"{len(atom_items)} selected atoms, {len(bond_items)} bonds, {args.frames} frames")
+	print(f"{'variant':<22} {'ms/frame':>10} {'rebuilds/frame':>15}")
+	for label, batched in (("per-setter rebuilds", False), ("update transaction", True)):
+		ms, rebuilds = time_frames(scene, atom_items, args.frames, batched)
+		print(f"{label:<22} {ms:>10.1f} {rebuilds:>15.0f}")
+	app.processEvents()
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark viewport repaint time while panning a large Qt drawing.
+
+Builds a ChemScene with chains of carbon and oxygen atoms (about 1000
+atoms by default), shows it in a ChemView, and times full viewport
+repaints while scrolling across the drawing. Three variants are timed:
+interpreting the render ops on every paint (the old behavior), replaying
+the per-item recorded QPicture, and the QPicture plus per-item
+DeviceCoordinateCache.
+"""
+
+# Standard Library
+import os
+import sys
+import time
+import argparse
+
+# force offscreen rendering so the benchmark runs without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# ensure bkchem_qt, bkchem and OASA are importable from the repo tree
+sys.path.insert(0, "packages/bkchem-qt.app")
+sys.path.insert(0, "packages/bkchem-app")
+sys.path.insert(0, "packages/oasa")
+
+# PIP3 modules
+import PySide6.QtWidgets
+
+# local repo modules
+import bkchem_qt.canvas.scene
+import bkchem_qt.canvas.view
+import bkchem_qt.canvas.items.atom_item
+import bkchem_qt.canvas.items.bond_item
+import bkchem_qt.models.molecule_model
+from bkchem_qt.canvas.items import render_ops_painter
+
+
+CHAIN_LENGTH = 20
+BOND_SPACING = 30.0
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time viewport repaints while panning a large drawing"
+	)
+	parser.add_argument(
+		'-a', '--atoms', dest='atoms',
+		type=int, default=1000,
+		help="Number of atoms in the drawing (default: 1000)",
+	)
+	parser.add_argument(
+		'-f', '--frames', dest='frames',
+		type=int, default=30,
+		help="Pan frames timed per variant (default: 30)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_scene(n_atoms: int) -> bkchem_qt.canvas.scene.ChemScene:
+	"""Return a scene filled with zigzag chains."""
+	scene = bkchem_qt.canvas.scene.ChemScene()
+	n_chains = max(1, n_atoms // CHAIN_LENGTH)
+	for chain in range(n_chains):
+		mol_model = bkchem_qt.models.molecule_model.MoleculeModel()
+		previous = None
+		for index in range(CHAIN_LENGTH):
+			atom = mol_model.create_atom(symbol="O" if index % 5 == 0 else "C")
+			y_offset = 15.0 if index % 2 else 0.0
+			# lay chains out in two columns so the drawing fills the paper
+			x0 = 1050.0 + (chain % 2) * 650.0
+			y0 = 780.0 + (chain // 2) * 55.0
+			atom.set_xyz(x0 + index * BOND_SPACING, y0 + y_offset, 0.0)
+			mol_model.add_atom(atom)
+			scene.addItem(bkchem_qt.canvas.items.atom_item.AtomItem(atom))
+			if previous is not None:
+				bond = mol_model.create_bond(order=1 + index % 2, bond_type="n")
+				mol_model.add_bond(previous, atom, bond)
+				scene.addItem(bkchem_qt.canvas.items.bond_item.BondItem(bond))
+			previous = atom
+	return scene
+
+
+#============================================
+def time_pan(view, frames: int) -> float:
+	"""Return mean milliseconds per repaint while scrolling back and forth."""
+	bar = view.horizontalScrollBar()
+	start_value = bar.value()
+	step = max(1, (bar.maximum() - bar.minimum()) // (4 * frames))
+	# warm up so every item has painted (and recorded) once
+	view.viewport().repaint()
+	start = time.perf_counter()
+	for frame in range(frames):
+		direction = 1 if frame < frames // 2 else -1
+		bar.setValue(bar.value() + direction * step)
+		view.viewport().repaint()
+	elapsed = time.perf_counter() - start
+	bar.setValue(start_value)
+	return 1000.0 * elapsed / frames
+
+
+#============================================
+def legacy_paint(self, painter, low_detail=False):
+	"""Interpret the ops on every paint, as before the picture cache."""
+	render_ops_painter.paint_ops(self._ops, painter)
+
+
+#============================================
+def main() -> None:
+	args = parse_args()
+	app = PySide6.QtWidgets.QApplication.instance() or PySide6.QtWidgets.QApplication([])
+	scene = build_scene(args.atoms)
+	view = bkchem_qt.canvas.view.ChemView(scene)
+	view.resize(1400, 900)
+	view.show()
+	view.set_zoom_percent(75.0)
+	view.centerOn(scene.itemsBoundingRect().center())
+	app.processEvents()
+	print(f"{len(scene.items())} scene items, {args.frames} pan frames, viewport 1400x900")
+	print(f"{'variant':<28} {'ms/frame':>10} {'fps':>8}")
+	cached_paint = render_ops_painter.OpsPicture.paint
+	variants = (
+		("interpret ops per paint", legacy_paint, False),
+		("recorded QPicture", cached_paint, False),
+		("QPicture + device cache", cached_paint, True),
+	)
+	for label, paint, device_cache in variants:
+		render_ops_painter.OpsPicture.paint = paint
+		view.set_device_cache_enabled(device_cache)
+		ms = time_pan(view, args.frames)
+		print(f"{label:<28} {ms:>10.2f} {1000.0 / ms:>8.0f}")
+	render_ops_painter.OpsPicture.paint = cached_paint
+	view.set_device_cache_enabled(False)
+
+
+#============================================
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,117 @@
+"""Tests for the Document adjacency indexes (atom->bonds, ->molecule)."""
+
+# local repo modules
+import bkchem_qt.canvas.scene_queries
+import bkchem_qt.models.document
+import bkchem_qt.models.molecule_model
+import bkchem_qt.undo.commands
+
+
+#============================================
+def _chain(count=3):
+	"""Build a carbon chain MoleculeModel; returns (mol, atoms, bonds)."""
+	mol = bkchem_qt.models.molecule_model.MoleculeModel()
+	atoms = []
+	bonds = []
+	for index in range(count):
+		atom = mol.create_atom(symbol="C")
+		atom.set_xyz(100.0 + 40.0 * index, 100.0, 0.0)
+		mol.add_atom(atom)
+		if atoms:
+			bond = mol.create_bond()
+			mol.add_bond(atoms[-1], atom, bond)
+			bonds.append(bond)
+		atoms.append(atom)
+	return mol, atoms, bonds
+
+
+#============================================
+def test_index_follows_molecule_mutations(qapp):
+	"""Indexes cover existing content and follow add/remove signals."""
+	doc = bkchem_qt.models.document.Document()
+	mol, atoms, bonds = _chain()
+	doc.add_molecule(mol)
+	assert doc.molecule_for_atom(atoms[1]) is mol
+	assert doc.molecule_for_bond(bonds[0]) is mol
+	assert doc.bonds_for_atom(atoms[1]) == bonds
+	# new content is indexed through the MoleculeModel signals
+	extra = mol.create_atom(symbol="O")
+	mol.add_atom(extra)
+	bond = mol.create_bond()
+	mol.add_bond(atoms[2], extra, bond)
+	assert doc.bonds_for_atom(extra) == [bond]
+	assert doc.molecule_for_bond(bond) is mol
+	# removing an atom drops it and its bonds
+	mol.remove_atom(atoms[2])
+	assert doc.molecule_for_atom(atoms[2]) is None
+	assert doc.molecule_for_bond(bond) is None
+	assert doc.bonds_for_atom(extra) == []
+	assert doc.bonds_for_atom(atoms[1]) == [bonds[0]]
+	# removing the molecule empties the index
+	doc.remove_molecule(mol)
+	assert doc.molecule_for_atom(atoms[0]) is None
+	assert doc.bonds_for_atom(atoms[0]) == []
+
+
+#============================================
+def test_endpoint_change_reindexes_bond(qapp):
+	"""Reassigning a bond endpoint (atom merge) moves its index entry."""
+	doc = bkchem_qt.models.document.Document()
+	mol, atoms, bonds = _chain()
+	doc.add_molecule(mol)
+	cmd = bkchem_qt.undo.commands.ChangePropertyCommand(
+		bonds[1], "atom2", atoms[2], atoms[0],
+	)
+	doc.undo_stack.push(cmd)
+	assert bonds[1] in doc.bonds_for_atom(atoms[0])
+	assert doc.bonds_for_atom(atoms[2]) == []
+	doc.undo_stack.undo()
+	assert doc.bonds_for_atom(atoms[2]) == [bonds[1]]
+	assert bonds[1] not in doc.bonds_for_atom(atoms[0])
+
+
+#============================================
+def test_undo_commands_keep_index_and_items(main_window):
+	"""RemoveAtomCommand redo/undo updates indexes and scene lookups."""
+	main_window._mode_manager.set_mode("draw")
+	draw_mode = main_window._mode_manager.current_mode
+	doc = main_window.document
+	scene = main_window.scene
+	a1 = draw_mode._create_atom_at(100.0, 200.0, "C")
+	a2 = draw_mode._create_atom_at(160.0, 200.0, "C")
+	draw_mode._create_bond_between(a1, a2)
+	bond_model = doc.bonds_for_atom(a1.atom_model)[0]
+	connected = bkchem_qt.canvas.scene_queries.find_connected_bond_items(
+		scene, a2.atom_model, doc,
+	)
+	assert [bm for bm, _item in connected] == [bond_model]
+	assert connected[0][1] is scene.item_for_model(bond_model)
+	mol = doc.molecule_for_atom(a2.atom_model)
+	doc.undo_stack.push(bkchem_qt.undo.commands.RemoveAtomCommand(
+		scene, mol, a2.atom_model, a2, connected,
+	))
+	assert doc.bonds_for_atom(a1.atom_model) == []
+	assert doc.molecule_for_atom(a2.atom_model) is None
+	assert scene.item_for_model(bond_model) is None
+	doc.undo_stack.undo()
+	assert doc.bonds_for_atom(a1.atom_model) == [bond_model]
+	assert doc.molecule_for_atom(a2.atom_model) is mol
+	assert scene.item_for_model(a2.atom_model) is a2
+
+
+#============================================
+def test_bonds_to_update_uses_selected_atoms(main_window):
+	"""bonds_to_update() returns unselected bonds of selected atoms."""
+	main_window._mode_manager.set_mode("draw")
+	draw_mode = main_window._mode_manager.current_mode
+	doc = main_window.document
+	a1 = draw_mode._create_atom_at(100.0, 200.0, "C")
+	a2 = draw_mode._create_atom_at(160.0, 200.0, "C")
+	a3 = draw_mode._create_atom_at(220.0, 200.0, "C")
+	draw_mode._create_bond_between(a1, a2)
+	draw_mode._create_bond_between(a2, a3)
+	a2.setSelected(True)
+	first_bond = doc.bonds_for_atom(a1.atom_model)[0]
+	main_window.scene.item_for_model(first_bond).setSelected(True)
+	result = doc.bonds_to_update()
+	assert result == doc.bonds_for_atom(a3.atom_model)
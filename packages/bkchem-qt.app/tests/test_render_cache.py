@@ -0,0 +1,126 @@
+"""Tests for cached QPicture rendering of atom and bond items."""
+
+# PIP3 modules
+import PySide6.QtGui
+import PySide6.QtWidgets
+
+# local repo modules
+import oasa.render_ops
+import bkchem_qt.models.molecule_model
+import bkchem_qt.canvas.items.atom_item
+import bkchem_qt.canvas.items.bond_item
+from bkchem_qt.canvas.items import render_ops_painter
+
+
+#============================================
+def _pair():
+	"""Return (atom_item, bond_item) for a charged N double-bonded to C."""
+	mol = bkchem_qt.models.molecule_model.MoleculeModel()
+	n_atom = mol.create_atom(symbol="N")
+	n_atom.set_xyz(0.0, 0.0, 0.0)
+	mol.add_atom(n_atom)
+	n_atom.charge = 1
+	c_atom = mol.create_atom(symbol="C")
+	c_atom.set_xyz(40.0, 0.0, 0.0)
+	mol.add_atom(c_atom)
+	bond = mol.create_bond(order=2)
+	mol.add_bond(n_atom, c_atom, bond)
+	atom_item = bkchem_qt.canvas.items.atom_item.AtomItem(n_atom)
+	bond_item = bkchem_qt.canvas.items.bond_item.BondItem(bond)
+	return atom_item, bond_item
+
+
+#============================================
+def _render(ops: list, cached: bool, scale: float) -> PySide6.QtGui.QImage:
+	"""Paint ops into an image directly or through an OpsPicture."""
+	image = PySide6.QtGui.QImage(160, 100, PySide6.QtGui.QImage.Format.Format_ARGB32)
+	image.fill(0xffffffff)
+	painter = PySide6.QtGui.QPainter(image)
+	painter.setRenderHint(PySide6.QtGui.QPainter.RenderHint.Antialiasing, True)
+	painter.translate(40.0, 50.0)
+	painter.scale(scale, scale)
+	if cached:
+		cache = render_ops_painter.OpsPicture()
+		cache.set_ops(ops)
+		cache.paint(painter)
+	else:
+		render_ops_painter.paint_ops(ops, painter)
+	painter.end()
+	return image
+
+
+#============================================
+def _render_item(item) -> None:
+	"""Call item.paint() into a scratch image."""
+	image = PySide6.QtGui.QImage(80, 80, PySide6.QtGui.QImage.Format.Format_ARGB32)
+	painter = PySide6.QtGui.QPainter(image)
+	item.paint(painter, PySide6.QtWidgets.QStyleOptionGraphicsItem(), None)
+	painter.end()
+
+
+#============================================
+def test_picture_matches_direct_painting(qapp):
+	"""Replaying the recorded picture is pixel-identical to paint_ops()."""
+	atom_item, bond_item = _pair()
+	for ops in (atom_item._ops, bond_item._ops):
+		assert ops
+		for scale in (0.5, 1.0, 3.0):
+			assert _render(ops, True, scale) == _render(ops, False, scale)
+
+
+#============================================
+def test_picture_recorded_once_until_model_change(qapp, monkeypatch):
+	"""Repaints replay the picture; update_from_model() drops it."""
+	atom_item, _bond_item = _pair()
+	calls = []
+	original = render_ops_painter.record_ops
+
+	def counting(ops):
+		calls.append(ops)
+		return original(ops)
+
+	monkeypatch.setattr(render_ops_painter, "record_ops", counting)
+	cache = atom_item._ops_picture
+	for _ in range(3):
+		_render_item(atom_item)
+	assert len(calls) == 1
+	assert cache.is_recorded()
+	atom_item.atom_model.symbol = "O"
+	assert not cache.is_recorded()
+	_render_item(atom_item)
+	assert len(calls) == 2
+	# a theme color change invalidates every recorded picture
+	render_ops_painter.set_default_color(render_ops_painter._default_color.name())
+	assert not cache.is_recorded()
+
+
+#============================================
+def test_simplify_text_ops_keeps_geometry_ops(qapp):
+	"""Low-detail ops swap text for boxes and keep other ops."""
+	atom_item, bond_item = _pair()
+	simplified = render_ops_painter.simplify_text_ops(atom_item._ops)
+	assert len(simplified) == len(atom_item._ops)
+	assert not any(isinstance(op, oasa.render_ops.TextOp) for op in simplified)
+	assert render_ops_painter.simplify_text_ops(bond_item._ops) == bond_item._ops
+
+
+#============================================
+def test_view_level_of_detail_and_item_cache(main_window):
+	"""Zooming out switches low detail; the cache mode reaches new items."""
+	view = main_window.view
+	scene = main_window.scene
+	cache_mode = PySide6.QtWidgets.QGraphicsItem.CacheMode
+	view.set_zoom_percent(20.0)
+	assert scene.low_detail
+	view.set_zoom_percent(100.0)
+	assert not scene.low_detail
+	view.set_device_cache_enabled(True)
+	try:
+		atom_item, bond_item = _pair()
+		scene.addItem(atom_item)
+		scene.addItem(bond_item)
+		assert atom_item.cacheMode() == cache_mode.DeviceCoordinateCache
+		view.set_device_cache_enabled(False)
+		assert bond_item.cacheMode() == cache_mode.NoCache
+	finally:
+		view.set_device_cache_enabled(False)
@@ -0,0 +1,117 @@
+"""Tests for ChemScene update transactions and deferred item rebuilds."""
+
+# PIP3 modules
+import PySide6.QtGui
+
+# local repo modules
+import bkchem_qt.models.molecule_model
+import bkchem_qt.canvas.items.atom_item
+import bkchem_qt.canvas.items.bond_item
+import bkchem_qt.undo.commands
+
+
+#============================================
+def _add_chain(scene, count=3, spacing=40.0):
+	"""Add a carbon chain to the scene and return (atom_items, bond_items)."""
+	mol_model = bkchem_qt.models.molecule_model.MoleculeModel()
+	atom_items = []
+	bond_items = []
+	previous = None
+	for index in range(count):
+		atom = mol_model.create_atom(symbol="C")
+		atom.set_xyz(100.0 + index * spacing, 100.0, 0.0)
+		mol_model.add_atom(atom)
+		atom_item = bkchem_qt.canvas.items.atom_item.AtomItem(atom)
+		scene.addItem(atom_item)
+		atom_items.append(atom_item)
+		if previous is not None:
+			bond = mol_model.create_bond(order=1, bond_type="n")
+			mol_model.add_bond(previous, atom, bond)
+			bond_item = bkchem_qt.canvas.items.bond_item.BondItem(bond)
+			scene.addItem(bond_item)
+			bond_items.append(bond_item)
+		previous = atom
+	return atom_items, bond_items
+
+
+#============================================
+def _count_rebuilds(monkeypatch) -> dict:
+	"""Count update_from_model() calls per item."""
+	counts = {}
+	for cls in (bkchem_qt.canvas.items.atom_item.AtomItem, bkchem_qt.canvas.items.bond_item.BondItem):
+		original = cls.update_from_model
+
+		def counting(self, _original=original):
+			counts[self] = counts.get(self, 0) + 1
+			_original(self)
+
+		monkeypatch.setattr(cls, "update_from_model", counting)
+	return counts
+
+
+#============================================
+def test_transaction_rebuilds_each_item_once(main_window, monkeypatch):
+	"""Moving atoms inside a transaction rebuilds every touched item once."""
+	scene = main_window.scene
+	atom_items, bond_items = _add_chain(scene)
+	counts = _count_rebuilds(monkeypatch)
+	with scene.update_transaction():
+		for atom_item in atom_items:
+			atom_item.atom_model.x += 5.0
+			atom_item.atom_model.y += 5.0
+		# nothing rebuilds until the transaction closes
+		assert counts == {}
+		assert scene.in_update_transaction
+	assert not scene.in_update_transaction
+	for item in atom_items + bond_items:
+		assert counts[item] == 1
+	# positions were applied immediately and ops follow the model
+	assert atom_items[0].pos().x() == atom_items[0].atom_model.x
+	start, _end = bond_items[0]._endpoint_positions()
+	assert start == (105.0, 105.0)
+
+
+#============================================
+def test_nested_transactions_flush_at_outermost(main_window, monkeypatch):
+	"""Inner transactions do not flush; the outermost one does."""
+	scene = main_window.scene
+	atom_items, bond_items = _add_chain(scene, count=2)
+	counts = _count_rebuilds(monkeypatch)
+	scene.begin_update()
+	with scene.update_transaction():
+		atom_items[1].atom_model.x += 10.0
+	assert counts == {}
+	assert scene.end_update() == 2
+	assert counts[bond_items[0]] == 1
+
+
+#============================================
+def test_removed_item_is_skipped_on_flush(main_window, monkeypatch):
+	"""Items removed from the scene while queued are not rebuilt."""
+	scene = main_window.scene
+	atom_items, bond_items = _add_chain(scene, count=2)
+	counts = _count_rebuilds(monkeypatch)
+	with scene.update_transaction():
+		atom_items[0].atom_model.x += 10.0
+		scene.removeItem(bond_items[0])
+	assert bond_items[0] not in counts
+	assert counts[atom_items[0]] == 1
+
+
+#============================================
+def test_move_command_undo_uses_one_rebuild(main_window, monkeypatch):
+	"""MoveAtomsCommand undo/redo rebuild each affected item once."""
+	scene = main_window.scene
+	atom_items, bond_items = _add_chain(scene)
+	stack = PySide6.QtGui.QUndoStack()
+	for atom_item in atom_items:
+		atom_item.atom_model.x += 20.0
+	cmd = bkchem_qt.undo.commands.MoveAtomsCommand(
+		[(atom_item, 20.0, 0.0) for atom_item in atom_items],
+	)
+	stack.push(cmd)
+	counts = _count_rebuilds(monkeypatch)
+	stack.undo()
+	assert atom_items[0].atom_model.x == 100.0
+	for item in atom_items + bond_items:
+		assert counts[item] == 1
@@ -0,0 +1,83 @@
+"""Tests for lazy startup imports and the --profile-startup report."""
+
+# Standard Library
+import os
+import sys
+import importlib
+import subprocess
+
+# local repo modules
+import bkchem_qt.cli
+import bkchem_qt.startup_profile
+
+
+#============================================
+def test_main_window_import_defers_heavy_modules():
+	"""Dialogs, exporters, codecs, RDKit and cairo wait for first use."""
+	code = (
+		"import sys, bkchem_qt.startup_profile, bkchem_qt.app\n"
+		"watched = bkchem_qt.startup_profile.WATCHED_MODULES\n"
+		"print(' '.join(name for name in watched if name in sys.modules))\n"
+	)
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+	output = subprocess.check_output([sys.executable, "-c", code], env=env, text=True)
+	assert output.split() == []
+
+
+#============================================
+def test_profiler_times_nested_imports(tmp_path, monkeypatch):
+	package = tmp_path / "profiled_pkg"
+	package.mkdir()
+	(package / "__init__.py").write_text("from profiled_pkg import inner\n")
+	(package / "inner.py").write_text("import time\ntime.sleep(0.02)\n")
+	monkeypatch.syspath_prepend(str(tmp_path))
+	profiler = bkchem_qt.startup_profile.StartupProfiler(str(tmp_path / "report.txt"))
+	profiler.install()
+	try:
+		profiled_pkg = importlib.import_module("profiled_pkg")
+	finally:
+		profiler.uninstall()
+		sys.modules.pop("profiled_pkg", None)
+		sys.modules.pop("profiled_pkg.inner", None)
+	assert profiled_pkg.inner is not None
+	outer_self, outer_total = profiler.imports["profiled_pkg"]
+	inner_self, inner_total = profiler.imports["profiled_pkg.inner"]
+	assert inner_self >= 0.02
+	assert outer_total >= inner_total
+	assert outer_self < inner_self
+	assert profiler not in sys.meta_path
+
+
+#============================================
+def test_report_lists_phases_and_imports(tmp_path):
+	report_path = tmp_path / "report.txt"
+	profiler = bkchem_qt.startup_profile.StartupProfiler(str(report_path))
+	profiler.imports["example.module"] = [0.004, 0.010]
+	profiler.mark("window shown")
+	profiler.mark("first paint")
+	profiler.write_report()
+	text = report_path.read_text()
+	assert "window shown" in text
+	assert "first paint" in text
+	assert "example.module" in text
+	assert "rdkit" in text
+
+
+#============================================
+def test_profile_startup_flag(monkeypatch):
+	monkeypatch.setattr(sys, "argv", ["bkchem-qt", "--profile-startup"])
+	args = bkchem_qt.cli.parse_args()
+	assert args.profile_startup
+	assert args.profile_report == bkchem_qt.cli.DEFAULT_PROFILE_PATH
+	# a drawing after the flag is a file to open, never the report path
+	monkeypatch.setattr(sys, "argv", ["bkchem-qt", "--profile-startup", "drawing.cdml"])
+	args = bkchem_qt.cli.parse_args()
+	assert args.files == ["drawing.cdml"]
+	assert args.profile_report == bkchem_qt.cli.DEFAULT_PROFILE_PATH
+	monkeypatch.setattr(sys, "argv", ["bkchem-qt", "--profile-startup",
+		"--profile-startup-report", "out.txt", "a.cdml"])
+	args = bkchem_qt.cli.parse_args()
+	assert args.profile_report == "out.txt"
+	assert args.files == ["a.cdml"]
+	monkeypatch.setattr(sys, "argv", ["bkchem-qt"])
+	assert not bkchem_qt.cli.parse_args().profile_startup
@@ -30,6 +30,7 @@ sys.path.append( '../')
 import math
 
 from oasa.graph.edge_lib import Edge as edge
+from oasa.graph.edge_lib import vertices_changed
 
 
 
@@ -93,7 +94,9 @@ class Bond(edge, object):
     assert len( vs) == 2 or len( vs) == 0
     #if len( vs) == 2 and vs[0] == vs[1]:
     #  warn( "creating bond with both ends equal", UserWarning, 2)
+    old = self._vertices
     self._vertices = list( vs)
+    vertices_changed( self, old)
 
 
   @property
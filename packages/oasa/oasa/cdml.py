@@ -20,22 +20,85 @@
 
 
 
+import io
+
 from oasa import cdml_writer
-from oasa import dom_extensions as dom_ext
 from oasa import safe_xml
 from oasa.coords_generator import calculate_coords
 
 
-
-def read_cdml( text):
-  """returns the last molecule for now"""
-  doc = safe_xml.parse_dom_from_string( text)
-  #if doc.childNodes()[0].nodeName == 'svg':
-  #  path = "/svg/cdml/molecule"
-  #else:
-  #  path = "/cdml/molecule"
-  path = "//molecule"
-  for mol_el in dom_ext.simpleXPathSearch( doc, path):
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+def _qualified_name( name, prefixes):
+  """turn ElementTree '{uri}local' names into the 'prefix:local' names of minidom"""
+  if name[:1] != '{':
+    return name
+  uri, local = name[1:].split( '}', 1)
+  prefix = prefixes.get( uri)
+  if prefix:
+    return prefix + ':' + local
+  return local
+
+
+def iter_molecule_elements( source):
+  """yields the <molecule> elements of a CDML or CD-SVG document, one at a time
+
+  source is a path or a binary file object; it is parsed incrementally
+  with the defused ElementTree parser. Element and attribute names are
+  rewritten to the qualified names minidom uses, so molecules are found
+  exactly as getElementsByTagName( 'molecule') finds them, in the same
+  order. Everything outside the molecule being read is discarded as
+  soon as it is parsed, and each yielded element is cleared when the
+  next one is requested."""
+  prefixes = {XML_NAMESPACE: 'xml'}
+  scopes = []
+  pending = []
+  open_elements = []
+  molecule_depth = 0
+  for event, item in safe_xml.iterparse_xml( source, events=('start-ns', 'start', 'end')):
+    if event == 'start-ns':
+      pending.append( item)
+      continue
+    el = item
+    if event == 'start':
+      scopes.append( prefixes)
+      if pending:
+        prefixes = dict( prefixes)
+        for prefix, uri in pending:
+          for bound_uri in [u for u, p in prefixes.items() if p == prefix]:
+            del prefixes[ bound_uri]
+          prefixes[ uri] = prefix
+        pending = []
+      el.tag = _qualified_name( el.tag, prefixes)
+      if any( key[:1] == '{' for key in el.attrib):
+        attrib = {_qualified_name( key, prefixes): value for key, value in el.attrib.items()}
+        el.attrib.clear()
+        el.attrib.update( attrib)
+      if el.tag == 'molecule':
+        molecule_depth += 1
+      open_elements.append( el)
+      continue
+    open_elements.pop()
+    prefixes = scopes.pop()
+    if el.tag == 'molecule':
+      molecule_depth -= 1
+    if molecule_depth:
+      # part of an enclosing molecule, kept until that one is complete
+      continue
+    if el.tag == 'molecule':
+      # nested molecules come after their parent, as in document order
+      for mol_el in el.iter( 'molecule'):
+        yield mol_el
+    el.clear()
+    if open_elements and len( open_elements[-1]) and open_elements[-1][-1] is el:
+      del open_elements[-1][-1]
+
+
+def read_cdml_file( source):
+  """yields the molecules of a CDML document read from a path or binary file object;
+  disconnected molecules are split into their parts"""
+  for mol_el in iter_molecule_elements( source):
     mol = cdml_writer.read_cdml_molecule_element( mol_el)
     if mol is None:
       continue
@@ -47,6 +110,13 @@ def read_cdml( text):
         yield comp
 
 
+def read_cdml( text):
+  """yields the molecules of a CDML document given as text or bytes"""
+  if not isinstance( text, bytes):
+    text = str( text).encode( 'utf-8')
+  yield from read_cdml_file( io.BytesIO( text))
+
+
 def cm_to_float_coord( x):
   if not x:
     return 0
@@ -65,10 +135,14 @@ writes_text = 0
 writes_files = 0
 
 def file_to_mol( f):
-  return text_to_mol( f.read())
+  if isinstance( f, io.TextIOBase):
+    return text_to_mol( f.read())
+  return _first_mol( read_cdml_file( f))
 
 def text_to_mol( text):
-  gen = read_cdml( text)
+  return _first_mol( read_cdml( text))
+
+def _first_mol( gen):
   try:
     mol = next(gen)
   except StopIteration:
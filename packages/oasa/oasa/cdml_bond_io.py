@@ -61,7 +61,7 @@ def read_cdml_bond_attributes(bond_el, bond, preserve_attrs=None, known_attrs=No
 	"""Read CDML bond attributes into the bond object.
 
 	Args:
-		bond_el: CDML bond element.
+		bond_el: CDML bond element, minidom or ElementTree.
 		bond: Bond object to update.
 		preserve_attrs (set[str] | None): Attrs to preserve in properties_.
 		known_attrs (set[str] | None): Attrs to exclude from unknown capture.
@@ -74,11 +74,13 @@ def read_cdml_bond_attributes(bond_el, bond, preserve_attrs=None, known_attrs=No
 	if known_attrs is None:
 		known_attrs = CDML_ALL_ATTRS
 	present = set()
-	if not hasattr(bond_el, "attributes") or bond_el.attributes is None:
+	if hasattr(bond_el, "attrib"):
+		items = bond_el.attrib.items()
+	elif getattr(bond_el, "attributes", None) is not None:
+		items = ((attr.name, attr.value) for attr in bond_el.attributes.values())
+	else:
 		return present
-	for attr in bond_el.attributes.values():
-		name = attr.name
-		value = attr.value
+	for name, value in items:
 		present.add(name)
 		if name == "color":
 			bond.line_color = value
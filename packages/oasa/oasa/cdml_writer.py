@@ -24,10 +24,10 @@ import xml.dom.minidom as dom
 from oasa import bond_semantics
 from oasa import cdml_bond_io
 from oasa import dom_extensions as dom_ext
-from oasa import smiles_lib as smiles
 from oasa.atom_lib import Atom as atom
 from oasa.bond_lib import Bond as bond
 from oasa.known_groups import cdml_to_smiles
+from oasa.known_groups import group_fragment
 from oasa.molecule_lib import Molecule as molecule
 from oasa.periodic_table import periodic_table as PT
 
@@ -62,23 +62,50 @@ reads_files = False
 writes_files = True
 
 
+#============================================
+def _descendants(element, tag: str):
+	"""Return descendant elements named tag in document order.
+
+	Works on minidom and ElementTree elements; the element itself is
+	never included, as with getElementsByTagName().
+	"""
+	if hasattr(element, "getElementsByTagName"):
+		return element.getElementsByTagName(tag)
+	found = list(element.iter(tag))
+	if found and found[0] is element:
+		del found[0]
+	return found
+
+
+#============================================
+def _attribute(element, name: str) -> str:
+	"""Return an attribute value, '' when missing, as minidom does."""
+	if hasattr(element, "getAttribute"):
+		return element.getAttribute(name)
+	return element.get(name, "")
+
+
 #============================================
 def read_cdml_molecule_element(mol_el):
-	"""Decode a CDML molecule element into an OASA molecule."""
+	"""Decode a CDML molecule element into an OASA molecule.
+
+	mol_el may be a minidom element or an ElementTree element whose tags
+	are qualified names, as produced by cdml.iter_molecule_elements().
+	"""
 	atom_id_remap = {}
 	mol = molecule()
-	for atom_el in dom_ext.simpleXPathSearch(mol_el, "atom"):
-		name = atom_el.getAttribute("name")
+	for atom_el in _descendants(mol_el, "atom"):
+		name = _attribute(atom_el, "name")
 		if not name:
 			return None
-		pos_nodes = dom_ext.simpleXPathSearch(atom_el, "point")
+		pos_nodes = _descendants(atom_el, "point")
 		if not pos_nodes:
 			return None
 		pos = pos_nodes[0]
-		x = _cm_to_float_coord(pos.getAttribute("x"))
-		y = _cm_to_float_coord(pos.getAttribute("y"))
-		z = _cm_to_float_coord(pos.getAttribute("z"))
-		charge = atom_el.getAttribute("charge")
+		x = _cm_to_float_coord(_attribute(pos, "x"))
+		y = _cm_to_float_coord(_attribute(pos, "y"))
+		z = _cm_to_float_coord(_attribute(pos, "z"))
+		charge = _attribute(atom_el, "charge")
 		if name in PT:
 			a = atom(
 				symbol=name,
@@ -87,7 +114,7 @@ def read_cdml_molecule_element(mol_el):
 			)
 			mol.add_vertex(v=a)
 		elif name in cdml_to_smiles:
-			group = smiles.text_to_mol(cdml_to_smiles[name], calc_coords=0)
+			group = group_fragment(cdml_to_smiles[name])
 			a = group.vertices[0]
 			a.x = x
 			a.y = y
@@ -95,17 +122,17 @@ def read_cdml_molecule_element(mol_el):
 			mol.insert_a_graph(group)
 		else:
 			return None
-		atom_id_remap[atom_el.getAttribute("id")] = a
+		atom_id_remap[_attribute(atom_el, "id")] = a
 
-	for bond_el in dom_ext.simpleXPathSearch(mol_el, "bond"):
-		type_value = bond_el.getAttribute("type")
+	for bond_el in _descendants(mol_el, "bond"):
+		type_value = _attribute(bond_el, "type")
 		bond_type, order, legacy = bond_semantics.parse_cdml_bond_type(type_value)
 		if order == 0:
 			continue
 		if not bond_type:
 			bond_type = "n"
-		v1 = atom_id_remap.get(bond_el.getAttribute("start"))
-		v2 = atom_id_remap.get(bond_el.getAttribute("end"))
+		v1 = atom_id_remap.get(_attribute(bond_el, "start"))
+		v2 = atom_id_remap.get(_attribute(bond_el, "end"))
 		if v1 is None or v2 is None:
 			continue
 		e = bond(order=order, type=bond_type)
@@ -40,6 +40,8 @@ class Codec(object):
 		mol_to_text=None,
 		file_to_mol=None,
 		mol_to_file=None,
+		stream_to_mols=None,
+		mols_to_stream=None,
 	):
 		self.name = _normalize_name(name)
 		if not self.name:
@@ -56,14 +58,23 @@ class Codec(object):
 				file_to_mol = getattr(module, "file_to_mol", None)
 			if mol_to_file is None:
 				mol_to_file = getattr(module, "mol_to_file", None)
+			if stream_to_mols is None:
+				stream_to_mols = getattr(module, "stream_to_mols", None)
+			if mols_to_stream is None:
+				mols_to_stream = getattr(module, "mols_to_stream", None)
 		self.text_to_mol = text_to_mol
 		self.mol_to_text = mol_to_text
 		self.file_to_mol = file_to_mol
 		self.mol_to_file = mol_to_file
+		# generator reader and incremental writer for multi-record formats
+		self.stream_to_mols = stream_to_mols
+		self.mols_to_stream = mols_to_stream
 		self.reads_text = bool(self.text_to_mol)
 		self.writes_text = bool(self.mol_to_text)
 		self.reads_files = bool(self.file_to_mol or self.text_to_mol)
-		self.writes_files = bool(self.mol_to_file or self.mol_to_text)
+		self.writes_files = bool(self.mol_to_file or self.mol_to_text or self.mols_to_stream)
+		self.reads_stream = bool(self.stream_to_mols)
+		self.writes_stream = bool(self.mols_to_stream)
 
 
 	#============================================
@@ -82,6 +93,14 @@ class Codec(object):
 		return self.text_to_mol(file_obj.read(), **kwargs)
 
 
+	#============================================
+	def read_stream(self, file_obj, **kwargs):
+		"""Yield one molecule per record without reading the whole file."""
+		if not self.stream_to_mols:
+			raise ValueError(f"Codec '{self.name}' does not support stream input.")
+		return self.stream_to_mols(file_obj, **kwargs)
+
+
 	#============================================
 	def write_text(self, mol, **kwargs):
 		if not self.mol_to_text:
@@ -102,6 +121,14 @@ class Codec(object):
 			file_obj.write(text.encode("utf-8"))
 
 
+	#============================================
+	def write_stream(self, mols, file_obj, **kwargs):
+		"""Append one record per molecule to an open file object."""
+		if not self.mols_to_stream:
+			raise ValueError(f"Codec '{self.name}' does not support stream output.")
+		return self.mols_to_stream(mols, file_obj, **kwargs)
+
+
 #============================================
 def register_codec(codec, aliases=None, replace=False):
 	name = _normalize_name(codec.name)
@@ -314,6 +341,8 @@ def _ensure_defaults_registered():
 			mol_to_text=rdkit_formats.sdf_mol_to_text,
 			file_to_mol=rdkit_formats.sdf_file_to_mol,
 			mol_to_file=rdkit_formats.sdf_mol_to_file,
+			stream_to_mols=rdkit_formats.sdf_iter_file_to_mols,
+			mols_to_stream=rdkit_formats.sdf_mols_to_stream,
 			extensions=[".sdf"],
 			description="SDF (Structure Data File)",
 		),
@@ -325,6 +354,8 @@ def _ensure_defaults_registered():
 			mol_to_text=rdkit_formats.sdf_v3000_mol_to_text,
 			file_to_mol=rdkit_formats.sdf_v3000_file_to_mol,
 			mol_to_file=rdkit_formats.sdf_v3000_mol_to_file,
+			stream_to_mols=rdkit_formats.sdf_iter_file_to_mols,
+			mols_to_stream=rdkit_formats.sdf_v3000_mols_to_stream,
 			description="SDF V3000",
 		),
 		aliases=["sdf-v3000"],
@@ -383,5 +414,7 @@ def get_registry_snapshot():
 			"writes_text": codec.writes_text,
 			"reads_files": codec.reads_files,
 			"writes_files": codec.writes_files,
+			"reads_stream": codec.reads_stream,
+			"writes_stream": codec.writes_stream,
 		}
 	return snapshot
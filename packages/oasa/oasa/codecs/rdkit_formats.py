@@ -28,6 +28,7 @@ import rdkit.Chem.inchi
 # local repo modules
 from oasa import coords_generator
 from oasa import rdkit_bridge
+from oasa.molecule_lib import as_molecule
 
 
 #============================================
@@ -35,12 +36,12 @@ def _oasa_to_rdkit(mol):
 	"""Convert an OASA molecule to an RDKit Mol for export.
 
 	Args:
-		mol: OASA molecule object.
+		mol: OASA molecule object or FrozenMolecule.
 
 	Returns:
 		RDKit Mol object with 2D coordinates.
 	"""
-	rmol, _atom_map = rdkit_bridge.oasa_to_rdkit_mol(mol)
+	rmol, _atom_map = rdkit_bridge.oasa_to_rdkit_mol(as_molecule(mol))
 	# generate 2D coords if none exist on the RDKit mol
 	if rmol.GetNumConformers() == 0:
 		rdkit.Chem.AllChem.Compute2DCoords(rmol)
@@ -230,30 +231,18 @@ def molfile_v3000_mol_to_file(mol, file_obj):
 # ===================================================================
 
 #============================================
-def sdf_text_to_mol(text):
-	"""Read an SDF string and return merged OASA molecules.
-
-	Multiple records are merged into one disconnected OASA molecule.
-	The bridge layer splits disconnected subgraphs into separate
-	BKChem molecules.
+def _merge_sdf_mols(omols):
+	"""Merge OASA molecules from SDF records into one disconnected molecule.
 
 	Args:
-		text: SDF file content as a string.
+		omols: Iterable of OASA molecules.
 
 	Returns:
 		OASA molecule (may contain disconnected components).
 	"""
-	# ForwardSDMolSupplier needs binary input
-	data = text.encode("utf-8") if isinstance(text, str) else text
-	supplier = rdkit.Chem.ForwardSDMolSupplier(
-		io.BytesIO(data), sanitize=True, removeHs=False,
-	)
 	merged = None
 	count = 0
-	for rmol in supplier:
-		if rmol is None:
-			continue
-		omol = _rdkit_to_oasa(rmol)
+	for omol in omols:
 		if merged is None:
 			merged = omol
 		else:
@@ -279,34 +268,149 @@ def sdf_text_to_mol(text):
 
 
 #============================================
-def sdf_mol_to_text(mol):
-	"""Write an OASA molecule as an SDF record.
+def _iter_sdf_blocks(file_obj):
+	"""Yield the raw bytes of each SDF record, one record at a time.
+
+	Lines are pulled from the handle's buffered iterator, so only one
+	record is held in memory regardless of file size.
 
 	Args:
-		mol: OASA molecule.
+		file_obj: Readable file object (text or binary mode).
+
+	Yields:
+		bytes for one record, including its '$$$$' terminator line.
+	"""
+	lines = []
+	for line in file_obj:
+		if isinstance(line, str):
+			line = line.encode("utf-8")
+		lines.append(line)
+		if line.startswith(b"$$$$"):
+			yield b"".join(lines)
+			lines = []
+	# a final record without a '$$$$' terminator is still a record
+	if any(line.strip() for line in lines):
+		yield b"".join(lines)
+
+
+#============================================
+def _iter_sdf_rdkit_mols(file_obj):
+	"""Yield RDKit molecules for each parseable record of an SDF handle."""
+	for block in _iter_sdf_blocks(file_obj):
+		supplier = rdkit.Chem.ForwardSDMolSupplier(
+			io.BytesIO(block), sanitize=True, removeHs=False,
+		)
+		for rmol in supplier:
+			# unparseable records are skipped, as in sdf_text_to_mol()
+			if rmol is not None:
+				yield rmol
+
+
+#============================================
+def _sdf_record_to_oasa(rmol):
+	"""Convert one RDKit SDF record to OASA, keeping title and data fields.
+
+	Args:
+		rmol: RDKit Mol read from an SDF record.
+
+	Returns:
+		OASA molecule with name (title line) and data_fields (dict of
+		field name to string value) attributes.
+	"""
+	name = rmol.GetProp("_Name") if rmol.HasProp("_Name") else ""
+	data_fields = {key: rmol.GetProp(key) for key in rmol.GetPropNames()}
+	omol = _rdkit_to_oasa(rmol)
+	omol.name = name
+	omol.data_fields = data_fields
+	return omol
+
+
+#============================================
+def _sdf_record_text(mol, force_v3000=False):
+	"""Return one SDF record for mol, with its name and data fields if set.
+
+	Args:
+		mol: OASA molecule, optionally with name and data_fields attributes.
+		force_v3000: Write a V3000 connection table.
 
 	Returns:
 		SDF string with trailing $$$$ delimiter.
 	"""
 	rmol = _oasa_to_rdkit(mol)
+	name = getattr(mol, "name", "")
+	if name:
+		rmol.SetProp("_Name", name)
+	for key, value in getattr(mol, "data_fields", {}).items():
+		rmol.SetProp(key, str(value))
 	out = io.StringIO()
 	writer = rdkit.Chem.SDWriter(out)
+	if force_v3000:
+		writer.SetForceV3000(True)
 	writer.write(rmol)
 	writer.close()
 	return out.getvalue()
 
 
+#============================================
+def _write_text(text, file_obj):
+	"""Write text to a text or binary file object."""
+	if isinstance(file_obj, io.TextIOBase):
+		file_obj.write(text)
+	else:
+		file_obj.write(text.encode("utf-8"))
+
+
+#============================================
+def sdf_text_to_mol(text):
+	"""Read an SDF string and return merged OASA molecules.
+
+	Multiple records are merged into one disconnected OASA molecule.
+	The bridge layer splits disconnected subgraphs into separate
+	BKChem molecules.
+
+	Args:
+		text: SDF file content as a string.
+
+	Returns:
+		OASA molecule (may contain disconnected components).
+	"""
+	# ForwardSDMolSupplier needs binary input
+	data = text.encode("utf-8") if isinstance(text, str) else text
+	supplier = rdkit.Chem.ForwardSDMolSupplier(
+		io.BytesIO(data), sanitize=True, removeHs=False,
+	)
+	omols = (_rdkit_to_oasa(rmol) for rmol in supplier if rmol is not None)
+	return _merge_sdf_mols(omols)
+
+
+#============================================
+def sdf_mol_to_text(mol):
+	"""Write an OASA molecule as an SDF record.
+
+	Args:
+		mol: OASA molecule.
+
+	Returns:
+		SDF string with trailing $$$$ delimiter.
+	"""
+	return _sdf_record_text(mol)
+
+
 #============================================
 def sdf_file_to_mol(file_obj):
 	"""Read an SDF file and return merged OASA molecules.
 
+	Records are streamed from the handle instead of reading the whole
+	file into one string first.
+
 	Args:
-		file_obj: Readable file object (text mode).
+		file_obj: Readable file object (text or binary mode).
 
 	Returns:
 		OASA molecule.
 	"""
-	return sdf_text_to_mol(file_obj.read())
+	omols = (_rdkit_to_oasa(rmol) for rmol in _iter_sdf_rdkit_mols(file_obj))
+	return _merge_sdf_mols(omols)
 
 
 #============================================
@@ -317,11 +421,48 @@ def sdf_mol_to_file(mol, file_obj):
 		mol: OASA molecule.
 		file_obj: Writable file object.
 	"""
-	text = sdf_mol_to_text(mol)
-	if isinstance(file_obj, io.TextIOBase):
-		file_obj.write(text)
-	else:
-		file_obj.write(text.encode("utf-8"))
+	_write_text(sdf_mol_to_text(mol), file_obj)
+
+
+#============================================
+def sdf_iter_file_to_mols(file_obj):
+	"""Stream an SDF file, yielding one OASA molecule per record.
+
+	Only the current record is held in memory, so multi-gigabyte files
+	can be processed. Records RDKit cannot parse are skipped. Each
+	molecule carries the record title as mol.name and the SD data
+	fields as the mol.data_fields dict (string values).
+
+	Args:
+		file_obj: Readable file object (text or binary mode).
+
+	Yields:
+		OASA molecules in file order.
+	"""
+	for rmol in _iter_sdf_rdkit_mols(file_obj):
+		yield _sdf_record_to_oasa(rmol)
+
+
+#============================================
+def sdf_mols_to_stream(mols, file_obj):
+	"""Append one SDF record per molecule to an open file object.
+
+	Records are written as they are produced, so mols may be a
+	generator (e.g. from sdf_iter_file_to_mols()). Name and data_fields
+	attributes, when present, are written back as title and SD fields.
+
+	Args:
+		mols: Iterable of OASA molecules.
+		file_obj: Writable file object (text or binary mode).
+
+	Returns:
+		int: Number of records written.
+	"""
+	count = 0
+	for mol in mols:
+		_write_text(_sdf_record_text(mol), file_obj)
+		count += 1
+	return count
 
 
 # ===================================================================
@@ -352,13 +493,7 @@ def sdf_v3000_mol_to_text(mol):
 	Returns:
 		SDF V3000 string.
 	"""
-	rmol = _oasa_to_rdkit(mol)
-	out = io.StringIO()
-	writer = rdkit.Chem.SDWriter(out)
-	writer.SetForceV3000(True)
-	writer.write(rmol)
-	writer.close()
-	return out.getvalue()
+	return _sdf_record_text(mol, force_v3000=True)
 
 
 #============================================
@@ -366,12 +501,13 @@ def sdf_v3000_file_to_mol(file_obj):
 	"""Read an SDF V3000 file and return merged OASA molecules.
 
 	Args:
-		file_obj: Readable file object (text mode).
+		file_obj: Readable file object (text or binary mode).
 
 	Returns:
 		OASA molecule.
 	"""
-	return sdf_v3000_text_to_mol(file_obj.read())
+	# reuse the streaming reader; RDKit auto-detects V2000 vs V3000
+	return sdf_file_to_mol(file_obj)
 
 
 #============================================
@@ -382,11 +518,25 @@ def sdf_v3000_mol_to_file(mol, file_obj):
 		mol: OASA molecule.
 		file_obj: Writable file object.
 	"""
-	text = sdf_v3000_mol_to_text(mol)
-	if isinstance(file_obj, io.TextIOBase):
-		file_obj.write(text)
-	else:
-		file_obj.write(text.encode("utf-8"))
+	_write_text(sdf_v3000_mol_to_text(mol), file_obj)
+
+
+#============================================
+def sdf_v3000_mols_to_stream(mols, file_obj):
+	"""Append one SDF V3000 record per molecule to an open file object.
+
+	Args:
+		mols: Iterable of OASA molecules.
+		file_obj: Writable file object (text or binary mode).
+
+	Returns:
+		int: Number of records written.
+	"""
+	count = 0
+	for mol in mols:
+		_write_text(_sdf_record_text(mol, force_v3000=True), file_obj)
+		count += 1
+	return count
 
 
 # ===================================================================
@@ -465,6 +615,31 @@ def smiles_text_to_mol(text, calc_coords=1, localize_aromatic_bonds=True,
 	return omol
 
 
+#============================================
+def smiles_text_as_read(text) -> tuple:
+	"""Return SMILES for the atoms smiles_text_to_mol() keeps from text.
+
+	smiles_text_to_mol() removes explicit hydrogens after sanitization,
+	so its vertices no longer match the atoms of a SMILES with [H] atoms.
+	The returned SMILES is written from that sanitized molecule without
+	canonical reordering.
+
+	Args:
+		text: SMILES string.
+
+	Returns:
+		Tuple (smiles, order): order[i] is the index in the molecule's
+		vertices of the i-th atom written in smiles.
+	"""
+	rmol = rdkit.Chem.MolFromSmiles(text.strip(), sanitize=True)
+	if rmol is None:
+		raise ValueError("RDKit could not parse the SMILES string.")
+	rmol = rdkit.Chem.RemoveHs(rmol)
+	smiles = rdkit.Chem.MolToSmiles(rmol, canonical=False)
+	order = list(rmol.GetPropsAsDict(includePrivate=True, includeComputed=True)["_smilesAtomOutputOrder"])
+	return (smiles, order)
+
+
 #============================================
 def smiles_mol_to_text(mol):
 	"""Write an OASA molecule as a SMILES string using RDKit.
@@ -482,6 +657,25 @@ def smiles_mol_to_text(mol):
 	return text
 
 
+#============================================
+def smiles_canonical_text(text):
+	"""Return RDKit's canonical isomeric SMILES for a SMILES string.
+
+	Every spelling of the same structure, stereochemistry included, gives
+	the same string for a given RDKit version. No OASA molecule is built.
+
+	Args:
+		text: SMILES string.
+
+	Returns:
+		Canonical SMILES string.
+	"""
+	rmol = rdkit.Chem.MolFromSmiles(text.strip())
+	if rmol is None:
+		raise ValueError("RDKit could not parse the SMILES string.")
+	return rdkit.Chem.MolToSmiles(rmol, isomericSmiles=True)
+
+
 #============================================
 def smiles_file_to_mol(file_obj):
 	"""Read a SMILES file and return an OASA molecule.
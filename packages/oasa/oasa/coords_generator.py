@@ -7,9 +7,6 @@ generation is handled by RDKit's Compute2DCoords via rdkit_bridge.
 # Standard Library
 import math
 
-# local repo modules
-from oasa import rdkit_bridge
-
 
 #============================================
 def _all_coords_set(mol) -> bool:
@@ -71,7 +68,8 @@ def calculate_coords(mol, bond_length: float = 0, force: int = 0) -> None:
 	else:
 		bl = bond_length
 
-	# delegate to RDKit
+	# delegate to RDKit; imported here so loading this module stays cheap
+	from oasa import rdkit_bridge
 	rdkit_bridge.calculate_coords_rdkit(mol, bond_length=bl)
 
 	# ensure z is set on all atoms
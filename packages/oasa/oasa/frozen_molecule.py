@@ -0,0 +1,322 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Compact array-backed molecules for bulk cheminformatics.
+
+A FrozenMolecule keeps one molecule in a handful of NumPy arrays (element
+numbers, charges, isotopes, coordinates, bond lists and a CSR adjacency)
+instead of one Python object per atom and bond. A MoleculeTable stores
+many molecules as one set of concatenated columns with offsets.
+
+Conversion to and from Molecule is lossless for the chemical and drawing
+attributes of atoms and bonds. Scratch data (properties_ dicts, caches)
+and molecule-level stereochemistry objects are not stored.
+
+NumPy is an optional dependency and is imported on first use, so importing
+this module does not load it.
+"""
+
+# local repo modules
+from oasa import periodic_table as PT
+from oasa.atom_lib import Atom
+from oasa.bond_lib import Bond
+from oasa.molecule_lib import Molecule
+
+
+# element number -> symbol, index 0 unused
+_SYMBOLS = [""] * (max(v["ord"] for v in PT.periodic_table.values()) + 1)
+for _symbol, _record in PT.periodic_table.items():
+	_SYMBOLS[_record["ord"]] = _symbol
+
+# per-atom and per-bond column names with their dtypes
+ATOM_COLUMNS = (
+	("atomic_numbers", "int16"),
+	("charges", "int16"),
+	("isotopes", "int16"),
+	("multiplicities", "int8"),
+	("valencies", "int8"),
+	("explicit_hydrogens", "int8"),
+	("free_sites", "int8"),
+)
+BOND_COLUMNS = (
+	("bond_orders", "int8"),
+	("bond_aromatic", "int8"),
+	("bond_types", "U1"),
+)
+# bond drawing attributes kept sparsely, only when set
+_BOND_EXTRA_ATTRS = ("line_color", "wavy_style", "center")
+
+
+#============================================
+def _frozen(array):
+	"""Return array marked read-only."""
+	array.flags.writeable = False
+	return array
+
+
+#============================================
+def _none_to_nan(value) -> float:
+	"""Map a None coordinate to NaN."""
+	return float("nan") if value is None else value
+
+
+#============================================
+def _nan_to_none(value):
+	"""Map a NaN coordinate back to None."""
+	value = float(value)
+	return None if value != value else value
+
+
+#============================================
+class FrozenMolecule:
+	"""Immutable array-backed snapshot of one OASA molecule.
+
+	Atoms are numbered 0..n-1 in Molecule.vertices order and bonds 0..m-1.
+
+	Attributes:
+		atomic_numbers, charges, isotopes, multiplicities, valencies,
+		explicit_hydrogens, free_sites: Per-atom integer arrays; an isotope
+			of 0 means unset.
+		coords: (n, 3) float64 array; NaN marks an unset coordinate.
+		bond_atoms: (m, 2) int32 array of atom indices.
+		bond_orders: Per-bond stored order; 0 marks an unlocalized
+			aromatic bond (Bond.order 4).
+		bond_aromatic: Per-bond aromatic flag; -1 means unset (None).
+		bond_types: Per-bond type character ('n', 'w', 'h', ...).
+		bond_extras: Dict of bond index -> dict of drawing attributes
+			(line_color, wavy_style, center) for bonds that set them.
+		indptr, indices, adjacent_bonds: CSR adjacency; the neighbors of
+			atom i are indices[indptr[i]:indptr[i+1]], reached through the
+			bonds adjacent_bonds[indptr[i]:indptr[i+1]].
+	"""
+
+	#============================================
+	def __init__(self, columns: dict, coords, bond_atoms, bond_extras=None):
+		"""Build a frozen molecule from column arrays.
+
+		Args:
+			columns: Dict with one array per name in ATOM_COLUMNS and
+				BOND_COLUMNS.
+			coords: (n, 3) array of coordinates.
+			bond_atoms: (m, 2) array of atom indices.
+			bond_extras: Optional dict of bond index -> attribute dict.
+		"""
+		import numpy
+		for name, dtype in ATOM_COLUMNS + BOND_COLUMNS:
+			setattr(self, name, _frozen(numpy.asarray(columns[name], dtype=dtype)))
+		self.coords = _frozen(numpy.asarray(coords, dtype=numpy.float64).reshape(-1, 3))
+		self.bond_atoms = _frozen(numpy.asarray(bond_atoms, dtype=numpy.int32).reshape(-1, 2))
+		self.bond_extras = dict(bond_extras or {})
+		self._build_csr()
+
+	#============================================
+	def _build_csr(self):
+		"""Derive the CSR adjacency from bond_atoms."""
+		import numpy
+		atom_count = len(self.atomic_numbers)
+		bond_count = len(self.bond_atoms)
+		sources = numpy.concatenate((self.bond_atoms[:, 0], self.bond_atoms[:, 1]))
+		targets = numpy.concatenate((self.bond_atoms[:, 1], self.bond_atoms[:, 0]))
+		bond_ids = numpy.tile(numpy.arange(bond_count, dtype=numpy.int32), 2)
+		order = numpy.argsort(sources, kind="stable")
+		indptr = numpy.zeros(atom_count + 1, dtype=numpy.int32)
+		numpy.cumsum(numpy.bincount(sources, minlength=atom_count), out=indptr[1:])
+		self.indptr = _frozen(indptr)
+		self.indices = _frozen(targets[order].astype(numpy.int32))
+		self.adjacent_bonds = _frozen(bond_ids[order])
+
+	#============================================
+	@classmethod
+	def from_molecule(cls, mol):
+		"""Snapshot an OASA Molecule.
+
+		Args:
+			mol: OASA Molecule whose vertices are all Atom instances.
+
+		Returns:
+			New FrozenMolecule.
+
+		Raises:
+			ValueError: If a vertex is not a plain Atom (e.g. a group or
+				query atom), which this representation cannot hold.
+		"""
+		import numpy
+		atom_rows, coords, index = [], [], {}
+		for i, v in enumerate(mol.vertices):
+			if type(v) is not Atom:
+				raise ValueError(f"FrozenMolecule holds plain atoms only, got {type(v).__name__}")
+			index[v] = i
+			atom_rows.append((v.symbol_number, v.charge, v.isotope or 0, v.multiplicity,
+				v.valency, v.explicit_hydrogens, v._free_sites))
+			coords.append((_none_to_nan(v.x), _none_to_nan(v.y), _none_to_nan(v.z)))
+		bond_rows, bond_atoms, bond_extras = [], [], {}
+		for j, b in enumerate(mol.edges):
+			v1, v2 = b.vertices
+			bond_atoms.append((index[v1], index[v2]))
+			stored_order = 0 if b._order is None else b._order
+			aromatic = -1 if b.aromatic is None else int(b.aromatic)
+			bond_rows.append((stored_order, aromatic, b.type))
+			extras = {a: getattr(b, a) for a in _BOND_EXTRA_ATTRS if getattr(b, a) is not None}
+			if extras:
+				bond_extras[j] = extras
+		columns = _rows_to_columns(atom_rows, ATOM_COLUMNS)
+		columns.update(_rows_to_columns(bond_rows, BOND_COLUMNS))
+		frozen = cls(columns, numpy.array(coords).reshape(-1, 3),
+			numpy.array(bond_atoms).reshape(-1, 2), bond_extras)
+		return frozen
+
+	#============================================
+	def to_molecule(self):
+		"""Rebuild a full OASA Molecule from the arrays.
+
+		Returns:
+			New OASA Molecule with atoms in the original vertex order.
+		"""
+		mol = Molecule()
+		atoms = []
+		for i in range(len(self.atomic_numbers)):
+			a = Atom(symbol=_SYMBOLS[self.atomic_numbers[i]], charge=int(self.charges[i]))
+			a.isotope = int(self.isotopes[i]) or None
+			a.multiplicity = int(self.multiplicities[i])
+			a.valency = int(self.valencies[i])
+			a.explicit_hydrogens = int(self.explicit_hydrogens[i])
+			a.free_sites = int(self.free_sites[i])
+			x, y, z = self.coords[i]
+			a.x = _nan_to_none(x)
+			a.y = _nan_to_none(y)
+			a.z = _nan_to_none(z)
+			mol.add_vertex(a)
+			atoms.append(a)
+		for j in range(len(self.bond_atoms)):
+			stored_order = int(self.bond_orders[j])
+			b = Bond(order=stored_order or 4, type=str(self.bond_types[j]))
+			aromatic = int(self.bond_aromatic[j])
+			b.aromatic = None if aromatic == -1 else aromatic
+			for attr, value in self.bond_extras.get(j, {}).items():
+				setattr(b, attr, value)
+			i1, i2 = self.bond_atoms[j]
+			mol.add_edge(atoms[i1], atoms[i2], b)
+		return mol
+
+	#============================================
+	@property
+	def atom_count(self) -> int:
+		return len(self.atomic_numbers)
+
+	#============================================
+	@property
+	def bond_count(self) -> int:
+		return len(self.bond_atoms)
+
+	#============================================
+	@property
+	def symbols(self) -> list:
+		"""Element symbols in atom order."""
+		return [_SYMBOLS[z] for z in self.atomic_numbers]
+
+	#============================================
+	def neighbors(self, atom_index: int):
+		"""Return the neighbor atom indices of one atom as an array view."""
+		return self.indices[self.indptr[atom_index]:self.indptr[atom_index + 1]]
+
+	#============================================
+	@property
+	def nbytes(self) -> int:
+		"""Total bytes held by the NumPy arrays."""
+		names = [name for name, _dtype in ATOM_COLUMNS + BOND_COLUMNS]
+		names += ["coords", "bond_atoms", "indptr", "indices", "adjacent_bonds"]
+		return sum(getattr(self, name).nbytes for name in names)
+
+
+#============================================
+class MoleculeTable:
+	"""Many molecules stored as concatenated column arrays.
+
+	Molecule k owns atoms atom_offsets[k]:atom_offsets[k+1] and bonds
+	bond_offsets[k]:bond_offsets[k+1]; bond_atoms hold per-molecule atom
+	indices. Indexing returns a FrozenMolecule built on array slices.
+	"""
+
+	#============================================
+	def __init__(self, columns: dict, coords, bond_atoms, atom_offsets, bond_offsets,
+		bond_extras=None):
+		import numpy
+		for name, dtype in ATOM_COLUMNS + BOND_COLUMNS:
+			setattr(self, name, _frozen(numpy.asarray(columns[name], dtype=dtype)))
+		self.coords = _frozen(numpy.asarray(coords, dtype=numpy.float64).reshape(-1, 3))
+		self.bond_atoms = _frozen(numpy.asarray(bond_atoms, dtype=numpy.int32).reshape(-1, 2))
+		self.atom_offsets = _frozen(numpy.asarray(atom_offsets, dtype=numpy.int64))
+		self.bond_offsets = _frozen(numpy.asarray(bond_offsets, dtype=numpy.int64))
+		# global bond index -> drawing attribute dict
+		self.bond_extras = dict(bond_extras or {})
+
+	#============================================
+	@classmethod
+	def from_molecules(cls, mols):
+		"""Pack an iterable of Molecule or FrozenMolecule objects.
+
+		Args:
+			mols: Iterable of OASA Molecules and/or FrozenMolecules.
+
+		Returns:
+			New MoleculeTable.
+		"""
+		import numpy
+		parts = [m if isinstance(m, FrozenMolecule) else FrozenMolecule.from_molecule(m) for m in mols]
+		atom_offsets = numpy.zeros(len(parts) + 1, dtype=numpy.int64)
+		bond_offsets = numpy.zeros(len(parts) + 1, dtype=numpy.int64)
+		atom_offsets[1:] = numpy.cumsum([p.atom_count for p in parts])
+		bond_offsets[1:] = numpy.cumsum([p.bond_count for p in parts])
+		columns = {}
+		for name, dtype in ATOM_COLUMNS + BOND_COLUMNS:
+			columns[name] = numpy.concatenate([getattr(p, name) for p in parts] or [numpy.zeros(0, dtype=dtype)])
+		coords = numpy.concatenate([p.coords for p in parts] or [numpy.zeros((0, 3))])
+		bond_atoms = numpy.concatenate([p.bond_atoms for p in parts] or [numpy.zeros((0, 2))])
+		bond_extras = {}
+		for k, p in enumerate(parts):
+			for j, extras in p.bond_extras.items():
+				bond_extras[int(bond_offsets[k]) + j] = extras
+		table = cls(columns, coords, bond_atoms, atom_offsets, bond_offsets, bond_extras)
+		return table
+
+	#============================================
+	def __len__(self) -> int:
+		return len(self.atom_offsets) - 1
+
+	#============================================
+	def __getitem__(self, k: int) -> FrozenMolecule:
+		if k < 0:
+			k += len(self)
+		if not 0 <= k < len(self):
+			raise IndexError("MoleculeTable index out of range")
+		a0, a1 = self.atom_offsets[k], self.atom_offsets[k + 1]
+		b0, b1 = self.bond_offsets[k], self.bond_offsets[k + 1]
+		columns = {name: getattr(self, name)[a0:a1] for name, _dtype in ATOM_COLUMNS}
+		columns.update({name: getattr(self, name)[b0:b1] for name, _dtype in BOND_COLUMNS})
+		extras = {j - int(b0): self.bond_extras[j] for j in range(int(b0), int(b1)) if j in self.bond_extras}
+		frozen = FrozenMolecule(columns, self.coords[a0:a1], self.bond_atoms[b0:b1], extras)
+		return frozen
+
+	#============================================
+	def __iter__(self):
+		for k in range(len(self)):
+			yield self[k]
+
+	#============================================
+	@property
+	def nbytes(self) -> int:
+		"""Total bytes held by the NumPy arrays."""
+		names = [name for name, _dtype in ATOM_COLUMNS + BOND_COLUMNS]
+		names += ["coords", "bond_atoms", "atom_offsets", "bond_offsets"]
+		return sum(getattr(self, name).nbytes for name in names)
+
+
+#============================================
+def _rows_to_columns(rows: list, spec: tuple) -> dict:
+	"""Transpose a list of row tuples into named column arrays."""
+	import numpy
+	columns = {}
+	for position, (name, dtype) in enumerate(spec):
+		columns[name] = numpy.array([row[position] for row in rows], dtype=dtype)
+	return columns
@@ -17,6 +17,8 @@
 
 #--------------------------------------------------------------------------
 
+from oasa.graph.edge_lib import vertices_changed
+
 
 
 class Diedge(object):
@@ -33,7 +35,9 @@ class Diedge(object):
 
   def set_vertices(self, vs=None):
     if vs and len(vs) == 2:
+      old = self.vertices
       self.vertices = vs
+      vertices_changed(self, old)
 
 
   def get_vertices(self):
@@ -18,6 +18,33 @@
 #--------------------------------------------------------------------------
 
 import copy
+import weakref
+
+
+
+def watch_vertices(edge, graph):
+  """Registers graph to be told when the end vertices of edge are reassigned.
+
+  Graph.add_edge() calls this, so edges rewired outside the graph methods
+  (change_atoms(), assigning edge.vertices) still reach the graph caches.
+  """
+  graphs = getattr(edge, '_graphs', None)
+  if graphs is None:
+    graphs = weakref.WeakSet()
+    edge._graphs = graphs
+  graphs.add(graph)
+
+
+def vertices_changed(edge, old_vertices):
+  """Tells the graphs holding edge that its end vertices were reassigned.
+
+  Nothing happens when the same vertices are set again, in either order.
+  """
+  new_vertices = edge.get_vertices()
+  if len(old_vertices) == len(new_vertices) and set(map(id, old_vertices)) == set(map(id, new_vertices)):
+    return
+  for graph in list(getattr(edge, '_graphs', ())):
+    graph._edge_rewired(edge)
 
 
 
@@ -46,7 +73,9 @@ class Edge(object):
   def set_vertices(self, vs=None):
     # Ring perception algorithm relies on allowing both vertices to be the same
     if vs and len(vs) == 2:
+      old = self._vertices
       self._vertices = list(vs)
+      vertices_changed(self, old)
 
 
   def get_vertices(self):
@@ -28,7 +28,9 @@ import copy
 import warnings
 
 from oasa.graph.edge_lib import Edge
+from oasa.graph.edge_lib import watch_vertices
 from oasa.graph.vertex_lib import Vertex
+from oasa.graph.ring_cache import RingCache
 from oasa.graph.rx_backend import RxBackend
 
 
@@ -53,6 +55,8 @@ class Graph(object):
     self._cache = {}
     # rustworkx backend for accelerated graph algorithms
     self._rx_backend = RxBackend()
+    # per ring system cache of perceived rings, survives unrelated edits
+    self._ring_cache = RingCache()
 
 
   def __str__( self):
@@ -101,7 +105,9 @@ class Graph(object):
 
   def delete_vertex( self, v):
     self.vertices.remove( v)
-    self._flush_cache()
+    self._rx_backend.remove_vertex( v, self.edges)
+    self._ring_cache.vertex_removed( v, self.edges)
+    self._flush_cache( incremental=True)
 
 
   def add_vertex( self, v=None):
@@ -114,7 +120,8 @@ class Graph(object):
     else:
       warnings.warn( "Added vertex is already present in graph %s" % str( v), UserWarning, 2)
       return None
-    self._flush_cache()
+    self._rx_backend.add_vertex( v)
+    self._flush_cache( incremental=True)
     return v
 
 
@@ -133,9 +140,12 @@ class Graph(object):
       e = self.create_edge()
     e.set_vertices( (v1,v2))
     self.edges.add( e)
+    watch_vertices( e, self)
     v1.add_neighbor( v2, e)
     v2.add_neighbor( v1, e)
-    self._flush_cache()
+    self._rx_backend.add_edge( e, v1, v2)
+    self._ring_cache.edge_added( e, v1, v2)
+    self._flush_cache( incremental=True)
     return e
 
 
@@ -143,7 +153,15 @@ class Graph(object):
     """inserts all edges and vertices to the graph"""
     self.vertices.extend( gr.vertices)
     self.edges.update( gr.edges)
-    self._flush_cache()
+    for v in gr.vertices:
+      self._rx_backend.add_vertex( v)
+    for e in gr.edges:
+      v1, v2 = e.get_vertices()
+      watch_vertices( e, self)
+      self._rx_backend.add_edge( e, v1, v2)
+    # the inserted graph may bring rings of its own
+    self._ring_cache.invalidate()
+    self._flush_cache( incremental=True)
 
 
   def disconnect( self, v1, v2):
@@ -154,7 +172,9 @@ class Graph(object):
         self.edges.remove( e)
         v1.remove_neighbor( v2)
         v2.remove_neighbor( v1)
-      self._flush_cache()
+        self._rx_backend.remove_edge( e)
+        self._ring_cache.edge_removed( e)
+      self._flush_cache( incremental=True)
       return e
     else:
       return None
@@ -166,7 +186,9 @@ class Graph(object):
     v1.remove_edge_and_neighbor( e)
     if v1 is not v2:
       v2.remove_edge_and_neighbor( e)
-    self._flush_cache()
+    self._rx_backend.remove_edge( e)
+    self._ring_cache.edge_removed( e)
+    self._flush_cache( incremental=True)
 
 
   def remove_vertex( self, v):
@@ -187,7 +209,9 @@ class Graph(object):
     self.edges.remove( e)
     self.disconnected_edges.add( e)
     e.disconnected = True
-    self._flush_cache()
+    self._rx_backend.remove_edge( e)
+    self._ring_cache.edge_removed( e)
+    self._flush_cache( incremental=True)
     return e
 
 
@@ -196,7 +220,10 @@ class Graph(object):
     self.disconnected_edges.remove( e)
     self.edges.add( e)
     e.disconnected = False
-    self._flush_cache()
+    v1, v2 = e.get_vertices()
+    self._rx_backend.add_edge( e, v1, v2)
+    self._ring_cache.edge_added( e, v1, v2)
+    self._flush_cache( incremental=True)
 
 
   def reconnect_temporarily_disconnected_edges( self):
@@ -204,7 +231,10 @@ class Graph(object):
       e = self.disconnected_edges.pop()
       e.disconnected = False
       self.edges.add( e)
-    self._flush_cache()
+      v1, v2 = e.get_vertices()
+      self._rx_backend.add_edge( e, v1, v2)
+      self._ring_cache.edge_added( e, v1, v2)
+    self._flush_cache( incremental=True)
 
 
   ## PROPERTIES METHODS
@@ -317,8 +347,9 @@ class Graph(object):
     """Return list of sets of vertices forming smallest independent cycles.
 
     Uses rustworkx cycle_basis for performance (215x faster than pure Python).
+    Rings are cached per ring system and only stale systems are re-perceived.
     """
-    return self._rx_backend.cycle_basis(self)
+    return [set( ring) for ring in self._ring_cache.get_cycles( self)]
 
 
   def get_smallest_independent_cycles_dangerous_and_cached( self):
@@ -345,6 +376,12 @@ class Graph(object):
 
 
   def get_all_cycles( self):
+    """returns all cycles as a set of frozensets of vertices; the exhaustive
+    perception runs per ring system and is cached with the ring cache"""
+    return self._ring_cache.get_all_cycles( self)
+
+
+  def _get_all_cycles_uncached( self):
     """
     implementation of:
     A New Algorithm for Exhaustive Ring Perception in a Molecular Graph
@@ -612,10 +649,21 @@ class Graph(object):
       return None
 
 
-  def _flush_cache( self):
+  def _flush_cache( self, incremental=False):
+    """drops cached results; incremental=True means the caller already
+    applied the change to the rustworkx mirror and the ring cache"""
     self._cache = {}
-    # invalidate rustworkx backend so it rebuilds before next algorithm call
-    self._rx_backend.mark_dirty()
+    if not incremental:
+      # invalidate rustworkx backend so it rebuilds before next algorithm call
+      self._rx_backend.mark_dirty()
+      self._ring_cache.invalidate()
+
+
+  def _edge_rewired( self, e):
+    """called by edge_lib.vertices_changed() when an edge of this graph was
+    moved to other vertices without the graph methods"""
+    if e in self.edges:
+      self._flush_cache()
 
 
   def _set_cache( self, name, value):
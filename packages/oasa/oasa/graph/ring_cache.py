@@ -0,0 +1,277 @@
+"""Persistent ring perception cache for OASA graphs.
+
+Rings are stored per ring system (biconnected block). The Graph edit
+methods report every structural change to the cache, and each change
+invalidates only the ring systems it can affect. Rings of untouched ring
+systems, and of other fragments, stay valid across edits; only the stale
+region is re-perceived on the next query.
+
+Each block is perceived on its own, rooted at its first vertex in
+graph.vertices order (see RxBackend.block_cycle_bases()), and rings are
+returned in that order too. A block's rings then depend only on the block,
+so the cached result equals a fresh perception after any edit history.
+"""
+
+
+#============================================
+class RingSystem:
+	"""Cached rings of one biconnected block.
+
+	Attributes:
+		first: The block vertex that comes first in graph.vertices; the
+			root of its perception and its place in the ring order.
+		vertices: Frozenset of OASA Vertex objects in the block rings.
+		edges: Frozenset of OASA Edge objects between those vertices.
+		cycles: List of frozensets of vertices (SSSR-style cycle basis).
+		all_cycles: Set of frozensets of vertices for exhaustive ring
+			perception, computed lazily; None until first requested.
+	"""
+
+	__slots__ = ('first', 'vertices', 'edges', 'cycles', 'all_cycles')
+
+	#============================================
+	def __init__(self, first, vertices, edges, cycles):
+		self.first = first
+		self.vertices = vertices
+		self.edges = edges
+		self.cycles = cycles
+		self.all_cycles = None
+
+
+#============================================
+class RingCache:
+	"""Ring systems of one Graph, kept valid across unrelated edits.
+
+	Invalidation rules, applied by the edge and vertex hooks:
+		- a new vertex, or a new edge with a degree-1 end, closes no ring;
+		- a new edge inside one cached ring system stales that system only;
+		- any other new edge stales the connected component it lands in;
+		- removing a ring edge stales its ring system only;
+		- removing a bridge changes no ring.
+	"""
+
+	#============================================
+	def __init__(self):
+		"""Create an empty cache that perceives everything on first use."""
+		self._systems = {}
+		self._vertex_systems = {}
+		self._edge_system = {}
+		self._next_id = 0
+		# vertices of dropped ring systems, re-perceived as a block
+		self._stale_vertices = set()
+		# seed vertices whose whole connected component must be re-perceived
+		self._stale_seeds = set()
+		# system ids in graph.vertices order of their first vertices
+		self._order = []
+		self._valid = False
+
+	#============================================
+	def invalidate(self):
+		"""Forget all rings; the next query perceives the whole graph."""
+		self._systems = {}
+		self._vertex_systems = {}
+		self._edge_system = {}
+		self._stale_vertices = set()
+		self._stale_seeds = set()
+		self._order = []
+		self._valid = False
+
+	# ------------------------------------------------------------------
+	# Edit hooks, called by Graph after the structure changed
+	# ------------------------------------------------------------------
+
+	#============================================
+	def edge_added(self, e, v1, v2):
+		"""Stale whatever rings a newly connected edge may have created.
+
+		Args:
+			e: The OASA Edge just added (or reconnected).
+			v1: First end vertex.
+			v2: Second end vertex.
+		"""
+		if not self._valid:
+			return
+		# a dangling end cannot lie on a cycle (self-loops excepted)
+		if v1 is not v2 and (v1.degree == 1 or v2.degree == 1):
+			return
+		shared = self._vertex_systems.get(v1, set()) & self._vertex_systems.get(v2, set())
+		if shared:
+			# both ends in one block: the new rings stay inside it
+			for sid in list(shared):
+				self._drop_system(sid)
+			return
+		self._stale_seeds.add(v1)
+		self._stale_seeds.add(v2)
+
+	#============================================
+	def edge_removed(self, e):
+		"""Stale the ring system of a removed ring edge.
+
+		Args:
+			e: The OASA Edge just removed (or temporarily disconnected).
+		"""
+		if not self._valid:
+			return
+		sid = self._edge_system.get(e)
+		if sid is not None:
+			self._drop_system(sid)
+
+	#============================================
+	def vertex_removed(self, v, edges):
+		"""Forget a removed vertex and stale any ring system it was in.
+
+		Edges of v that are still in the graph were moved onto another
+		vertex with change_atoms(); the components they now join are
+		re-perceived from their current ends.
+
+		Args:
+			v: The OASA Vertex just removed from graph.vertices.
+			edges: The graph's current edge set.
+		"""
+		if not self._valid:
+			return
+		for sid in list(self._vertex_systems.get(v, ())):
+			self._drop_system(sid)
+		self._stale_vertices.discard(v)
+		self._stale_seeds.discard(v)
+		for e in v.neighbor_edges:
+			if e in edges:
+				self._stale_seeds.update(e.vertices)
+
+	# ------------------------------------------------------------------
+	# Queries
+	# ------------------------------------------------------------------
+
+	#============================================
+	def get_cycles(self, graph) -> list:
+		"""Return the cycle basis of graph, re-perceiving stale parts only.
+
+		Args:
+			graph: The OASA Graph this cache belongs to.
+
+		Returns:
+			New list of frozensets of OASA Vertex objects.
+		"""
+		self._refresh(graph)
+		cycles = []
+		for sid in self._order:
+			cycles.extend(self._systems[sid].cycles)
+		return cycles
+
+	#============================================
+	def get_all_cycles(self, graph) -> set:
+		"""Return all simple cycles of graph, cached per ring system.
+
+		Args:
+			graph: The OASA Graph this cache belongs to.
+
+		Returns:
+			New set of frozensets of OASA Vertex objects.
+		"""
+		self._refresh(graph)
+		rings = set()
+		for system in self._systems.values():
+			if system.all_cycles is None:
+				system.all_cycles = _perceive_all_cycles(graph, system)
+			rings |= system.all_cycles
+		return rings
+
+	# ------------------------------------------------------------------
+	# Internals
+	# ------------------------------------------------------------------
+
+	#============================================
+	def _drop_system(self, sid):
+		"""Remove one ring system and mark its vertices stale."""
+		system = self._systems.pop(sid)
+		for v in system.vertices:
+			sids = self._vertex_systems[v]
+			sids.discard(sid)
+			if not sids:
+				del self._vertex_systems[v]
+		for e in system.edges:
+			self._edge_system.pop(e, None)
+		self._stale_vertices |= system.vertices
+
+	#============================================
+	def _refresh(self, graph):
+		"""Bring the cache up to date with graph."""
+		if not self._valid:
+			self.invalidate()
+			self._register(graph.vertices, graph._rx_backend.block_cycle_bases(graph, graph.vertices))
+			self._valid = True
+			return
+		if not self._stale_vertices and not self._stale_seeds:
+			return
+		if self._stale_seeds:
+			component = _vertices_reachable_from(self._stale_seeds)
+			# every ring system of these components gets re-perceived
+			for v in component:
+				for sid in list(self._vertex_systems.get(v, ())):
+					self._drop_system(sid)
+			self._stale_vertices |= component
+		region = self._stale_vertices
+		self._stale_vertices = set()
+		self._stale_seeds = set()
+		self._register(graph.vertices, graph._rx_backend.block_cycle_bases(graph, region))
+
+	#============================================
+	def _register(self, vertices, blocks):
+		"""Store one ring system per perceived block and reorder them all.
+
+		Args:
+			vertices: The graph.vertices list, for the ring order.
+			blocks: (edges, cycles) pairs from RxBackend.block_cycle_bases().
+		"""
+		position = {v: i for i, v in enumerate(vertices)}
+		for edges, cycles in blocks:
+			# a cached block can lie inside the region when all its ring
+			# atoms also belong to stale blocks; it is still valid
+			if edges[0] in self._edge_system:
+				continue
+			ring_list = [frozenset(c) for c in cycles]
+			block_vertices = frozenset().union(*ring_list)
+			first = min(block_vertices, key=position.__getitem__)
+			sid = self._next_id
+			self._next_id += 1
+			self._systems[sid] = RingSystem(first, block_vertices, frozenset(edges), ring_list)
+			for v in block_vertices:
+				self._vertex_systems.setdefault(v, set()).add(sid)
+			for e in edges:
+				self._edge_system[e] = sid
+		self._order = sorted(self._systems, key=lambda sid: position[self._systems[sid].first])
+
+
+#============================================
+def _vertices_reachable_from(seeds) -> set:
+	"""Return all vertices connected to any of the seed vertices."""
+	seen = set(seeds)
+	todo = list(seeds)
+	while todo:
+		v = todo.pop()
+		for n in v.neighbors:
+			if n not in seen:
+				seen.add(n)
+				todo.append(n)
+	return seen
+
+
+#============================================
+def _perceive_all_cycles(graph, system) -> set:
+	"""Run exhaustive ring perception on the block of one ring system.
+
+	Args:
+		graph: The OASA Graph owning the ring system.
+		system: A RingSystem instance.
+
+	Returns:
+		Set of frozensets of the original OASA Vertex objects.
+	"""
+	block = graph.get_induced_copy_subgraph_from_vertices_and_edges(
+		system.vertices, system.edges, add_back_links=True)
+	# run the Hanser algorithm on the small block instead of the whole graph
+	copied_rings = block._get_all_cycles_uncached()
+	rings = set()
+	for ring in copied_rings:
+		rings.add(frozenset(v.properties_['original'] for v in ring))
+	return rings
@@ -3,6 +3,9 @@
 Provides the RxBackend class that mediates all rustworkx usage for OASA,
 maintaining identity maps between OASA Vertex/Edge objects and rustworkx
 integer indices. Algorithm delegates return OASA objects, never raw indices.
+
+The mirror is patched in place by the Graph edit methods (add/remove of
+single nodes and edges); a full rebuild only happens after mark_dirty().
 """
 
 # PIP3 modules
@@ -37,6 +40,12 @@ class RxBackend:
 		self.e_to_i = {}
 		self.i_to_e = {}
 		self._dirty = True
+		# True while rx node indices follow the order of graph.vertices
+		self._in_vertex_order = True
+		# highest node index handed out since the last rebuild
+		self._top_index = -1
+		# set when two OASA edges share one rx edge (non-simple graph)
+		self._has_multi_edges = False
 
 	#============================================
 	def mark_dirty(self):
@@ -53,6 +62,104 @@ class RxBackend:
 		self.i_to_e.clear()
 		self._dirty = True
 
+	# ------------------------------------------------------------------
+	# Incremental mirror updates
+	# Each is a no-op while dirty, the pending rebuild picks the change up.
+	# ------------------------------------------------------------------
+
+	#============================================
+	def add_vertex(self, v):
+		"""Add one OASA Vertex to the mirror as a new node.
+
+		rustworkx recycles indices of removed nodes, so after a removal
+		the new node may get a lower index than existing nodes.
+
+		Args:
+			v: The OASA Vertex just appended to graph.vertices.
+		"""
+		if self._dirty:
+			return
+		if v in self.v_to_i:
+			self.mark_dirty()
+			return
+		idx = self.rx.add_node(v)
+		self.v_to_i[v] = idx
+		self.i_to_v[idx] = v
+		# a recycled index breaks the index order == vertex order invariant
+		if idx < self._top_index:
+			self._in_vertex_order = False
+		else:
+			self._top_index = idx
+
+	#============================================
+	def remove_vertex(self, v, edges):
+		"""Remove one OASA Vertex and any rx edges still incident to it.
+
+		Callers may move a vertex's edges onto another vertex with
+		change_atoms() before deleting it; such edges are still in the
+		graph but the mirror never saw them move, so it is rebuilt.
+
+		Args:
+			v: The OASA Vertex just removed from graph.vertices.
+			edges: The graph's current edge set.
+		"""
+		if self._dirty:
+			return
+		idx = self.v_to_i.get(v)
+		if idx is None or self._has_multi_edges:
+			self.mark_dirty()
+			return
+		if any(self.i_to_e[ei] in edges for ei in self.rx.incident_edges(idx)):
+			self.mark_dirty()
+			return
+		del self.v_to_i[v]
+		del self.i_to_v[idx]
+		# rustworkx drops incident edges with the node, drop their maps too
+		for ei in self.rx.incident_edges(idx):
+			e = self.i_to_e.pop(ei)
+			self.e_to_i.pop(e, None)
+		self.rx.remove_node(idx)
+
+	#============================================
+	def add_edge(self, e, v1, v2):
+		"""Add one OASA Edge between two mirrored vertices.
+
+		Args:
+			e: The OASA Edge just added to graph.edges.
+			v1: First end vertex.
+			v2: Second end vertex.
+		"""
+		if self._dirty:
+			return
+		i1 = self.v_to_i.get(v1)
+		i2 = self.v_to_i.get(v2)
+		# unknown endpoints or a parallel edge need the full rebuild path
+		if i1 is None or i2 is None or self._has_multi_edges:
+			self.mark_dirty()
+			return
+		if e in self.e_to_i or self.rx.has_edge(i1, i2):
+			self.mark_dirty()
+			return
+		ei = self.rx.add_edge(i1, i2, e)
+		self.e_to_i[e] = ei
+		self.i_to_e[ei] = e
+
+	#============================================
+	def remove_edge(self, e):
+		"""Remove one OASA Edge from the mirror.
+
+		Args:
+			e: The OASA Edge just removed from graph.edges.
+		"""
+		if self._dirty:
+			return
+		ei = self.e_to_i.pop(e, None)
+		if ei is None or self._has_multi_edges:
+			self.mark_dirty()
+			return
+		del self.i_to_e[ei]
+		self.rx.remove_edge_from_index(ei)
+
 	#============================================
 	def rebuild_from_graph(self, graph):
 		"""Rebuild the entire rustworkx graph from an OASA Graph.
@@ -69,6 +176,7 @@ class RxBackend:
 		self.i_to_v = {}
 		self.e_to_i = {}
 		self.i_to_e = {}
+		has_multi_edges = False
 		# add all vertices as nodes with OASA vertex as payload
 		for v in graph.vertices:
 			idx = self.rx.add_node(v)
@@ -81,8 +189,14 @@ class RxBackend:
 			i1 = self.v_to_i[v1]
 			i2 = self.v_to_i[v2]
 			ei = self.rx.add_edge(i1, i2, e)
+			# non-multigraph returns the existing index for parallel edges
+			if ei in self.i_to_e:
+				has_multi_edges = True
 			self.e_to_i[e] = ei
 			self.i_to_e[ei] = e
+		self._has_multi_edges = has_multi_edges
+		self._in_vertex_order = True
+		self._top_index = len(self.rx) - 1
 		self._dirty = False
 
 	#============================================
@@ -123,8 +237,28 @@ class RxBackend:
 			for idx in index_set:
 				vertex_set.add(self.i_to_v[idx])
 			result.append(vertex_set)
+		# recycled indices reorder components, restore graph.vertices order
+		if not self._in_vertex_order:
+			result = self._sort_by_vertex_order(graph, result)
 		return result
 
+	#============================================
+	def _sort_by_vertex_order(self, graph, vertex_sets: list) -> list:
+		"""Sort vertex sets by the position of their first vertex in graph.
+
+		Args:
+			graph: An OASA Graph instance.
+			vertex_sets: List of sets of OASA Vertex objects.
+
+		Returns:
+			New list ordered as a freshly rebuilt mirror would order it.
+		"""
+		position = {v: i for i, v in enumerate(graph.vertices)}
+		keyed = [(min(position[v] for v in vs), vs) for vs in vertex_sets]
+		keyed.sort(key=lambda pair: pair[0])
+		ordered = [vs for _, vs in keyed]
+		return ordered
+
 	#============================================
 	def is_connected(self, graph) -> bool:
 		"""Test whether the graph is connected.
@@ -186,10 +320,10 @@ class RxBackend:
 	def cycle_basis(self, graph) -> list:
 		"""Return a set of independent cycles as sets of OASA Vertex objects.
 
-		Uses root=0 for deterministic results. Without a fixed root,
-		rustworkx.cycle_basis() picks different starting nodes on each
-		call, producing different valid cycle bases for cage molecules
-		(adamantane, cubane). Pinning root=0 ensures consistent output.
+		Every ring block is perceived on its own by block_cycle_bases(),
+		so the basis, including the rings picked on cage molecules
+		(adamantane, cubane), and its order do not depend on mirror indices
+		or on the edit history of the graph.
 
 		Args:
 			graph: An OASA Graph instance.
@@ -198,20 +332,61 @@ class RxBackend:
 			List of sets, each containing the OASA Vertex objects
 			forming one independent cycle.
 		"""
-		self.ensure_synced(graph)
-		# empty graph has no node 0, so return early
-		if len(self.rx) == 0:
-			return []
-		# pin root=0 for deterministic cycle basis on cage molecules
-		rx_cycles = rustworkx.cycle_basis(self.rx, root=0)
 		result = []
-		for index_list in rx_cycles:
-			vertex_set = set()
-			for idx in index_list:
-				vertex_set.add(self.i_to_v[idx])
-			result.append(vertex_set)
+		for edges, cycles in self.block_cycle_bases(graph, graph.vertices):
+			result.extend(cycles)
 		return result
 
+	#============================================
+	def block_cycle_bases(self, graph, vertices) -> list:
+		"""Return the edges and independent cycles of each ring block.
+
+		rustworkx.cycle_basis() follows the neighbor order of its graph,
+		and the root decides which rings a cage gets. Each biconnected
+		block is therefore copied to a small graph with its vertices in
+		graph.vertices order and its edges sorted by the positions of
+		their ends, and searched from its first vertex. Blocks are returned
+		in graph.vertices order of their first vertices. Used for the whole
+		graph and by the ring cache to re-perceive a stale region.
+
+		Args:
+			graph: An OASA Graph instance.
+			vertices: OASA Vertex objects made up of whole blocks, e.g.
+				whole connected components.
+
+		Returns:
+			List of (edges, cycles) per block with at least one ring;
+			edges is a list of OASA Edge objects, cycles a list of sets
+			of OASA Vertex objects.
+		"""
+		self.ensure_synced(graph)
+		position = {v: i for i, v in enumerate(graph.vertices)}
+		if vertices is graph.vertices:
+			sub = self.rx
+		else:
+			# node and edge payloads are the OASA objects, no index map needed
+			sub = self.rx.subgraph(sorted(self.v_to_i[v] for v in vertices))
+		block_pairs = {}
+		for pair, block in rustworkx.biconnected_components(sub).items():
+			block_pairs.setdefault(block, []).append(pair)
+		blocks = []
+		for pairs in block_pairs.values():
+			# a bridge is a block without rings
+			if len(pairs) < 2:
+				continue
+			ends = [(sub[a], sub[b], sub.get_edge_data(a, b)) for a, b in pairs]
+			block_vertices = sorted({v for v1, v2, e in ends for v in (v1, v2)}, key=position.__getitem__)
+			local = {v: i for i, v in enumerate(block_vertices)}
+			ends.sort(key=lambda end: sorted((position[end[0]], position[end[1]])))
+			block_graph = rustworkx.PyGraph(multigraph=False)
+			block_graph.add_nodes_from(block_vertices)
+			block_graph.add_edges_from_no_data([(local[v1], local[v2]) for v1, v2, e in ends])
+			cycles = [set(block_vertices[i] for i in index_list)
+				for index_list in rustworkx.cycle_basis(block_graph, root=0)]
+			blocks.append((position[block_vertices[0]], [e for v1, v2, e in ends], cycles))
+		blocks.sort(key=lambda block: block[0])
+		return [(edges, cycles) for first, edges, cycles in blocks]
+
 	#============================================
 	def bridges(self, graph) -> set:
 		"""Return all bridge edges as a set of OASA Edge objects.
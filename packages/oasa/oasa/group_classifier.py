@@ -0,0 +1,325 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Functional-group and ring classifier compiled from subsearch_data.
+
+compile_patterns() parses every pattern of the subsearch_data tables
+once and precomputes its query search graph, heavy-atom element counts
+and path fingerprint. Patterns are ordered most selective first.
+
+GroupClassifier.label_atoms() then labels a molecule in one pass: the
+molecule's counts, fingerprint and target search graphs are built once
+and shared by all patterns, every pattern the counts and fingerprint
+rule out is skipped, and the candidate screens of query atoms are
+cached on the shared target graph, so patterns that start with the same
+atoms do not repeat that work. classify_many() does the same for a
+stream of molecules, optionally in a process pool.
+
+Pattern SMILES use the legacy OASA spelling: a bare H is a hydrogen atom
+and bracket hydrogen counts are kept, so C-[OH] matches alcohols but not
+ethers. The list in each structures row gives 1-based SMILES positions
+of atoms that stand for the rest of the molecule; they must be present
+for a match but are not labelled with the group.
+"""
+
+# Standard Library
+import os
+import re
+import collections
+import dataclasses
+import concurrent.futures
+
+# PIP3 modules
+import rdkit.Chem
+
+# local repo modules
+from oasa import rdkit_bridge
+from oasa import subsearch_data
+from oasa import substructure_index
+from oasa import substructure_match
+
+
+DEFAULT_CHUNK_SIZE = 100
+RING_CATEGORY = "ring"
+
+# atoms of a pattern SMILES: bracket atoms and the organic subset
+_ATOM_TOKEN = re.compile(r"\[[^\]]*\]|Cl|Br|[BCNOSPFIH]|[bcnosp]")
+
+# compiled default tables and worker-side classifiers, per pattern source
+_CLASSIFIERS = {}
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class GroupPattern:
+	"""One compiled pattern.
+
+	Attributes:
+		name: Group or ring name, used as the atom label.
+		category: Compound type from the table, or RING_CATEGORY.
+		smiles: Pattern SMILES as written in the table.
+		query: Parsed query Molecule; never modified after compiling.
+		graph: SearchGraph.for_query() view of query.
+		labelled: Indices of the query atoms that get the label.
+		hydrogens: needs_hydrogens() of the query.
+		screen: Element counts and path fingerprint of the query, for
+			substructure_index.may_contain().
+	"""
+	name: str
+	category: str
+	smiles: str
+	query: object
+	graph: object
+	labelled: tuple
+	hydrogens: bool
+	screen: object
+
+
+#============================================
+def _legacy_to_smiles(text: str) -> tuple:
+	"""Return (RDKit SMILES, atom tokens) for a legacy pattern SMILES.
+
+	Bare H atoms become [H], which RDKit folds into the explicit hydrogen
+	count of the neighbor.
+	"""
+	tokens = _ATOM_TOKEN.findall(text)
+	parts = []
+	for i, piece in enumerate(re.split(r"(\[[^\]]*\])", text)):
+		# odd pieces are bracket atoms and are kept as they are
+		parts.append(piece if i % 2 else piece.replace("H", "[H]"))
+	return ("".join(parts), tokens)
+
+
+#============================================
+def parse_pattern(text: str, substituents=()) -> tuple:
+	"""Parse a legacy pattern SMILES into a query molecule.
+
+	Args:
+		text: Pattern SMILES; see the module docstring.
+		substituents: 1-based SMILES positions of unlabelled atoms.
+
+	Returns:
+		Tuple (query Molecule, indices of the labelled query atoms).
+
+	Raises:
+		ValueError: The SMILES does not parse, or a substituent position
+			is missing or is a bare hydrogen.
+	"""
+	smiles, tokens = _legacy_to_smiles(text)
+	rmol = rdkit.Chem.MolFromSmiles(smiles)
+	if rmol is None:
+		raise ValueError(f"RDKit could not parse the pattern SMILES {text!r}.")
+	rdkit.Chem.Kekulize(rmol, clearAromaticFlags=False)
+	query, ridx_to_oatom = rdkit_bridge.rdkit_to_oasa_mol(rmol)
+	for ratom in rmol.GetAtoms():
+		ridx_to_oatom[ratom.GetIdx()].explicit_hydrogens = ratom.GetNumExplicitHs()
+	# RDKit drops the bare hydrogens and keeps the order of the other atoms
+	heavy_index = {}
+	for position, token in enumerate(tokens, start=1):
+		if token != "H":
+			heavy_index[position] = len(heavy_index)
+	skipped = set()
+	for position in substituents:
+		if position not in heavy_index:
+			raise ValueError(f"No substituent atom at position {position} of {text!r}.")
+		skipped.add(heavy_index[position])
+	labelled = tuple(i for i in range(len(query.vertices)) if i not in skipped)
+	return (query, labelled)
+
+
+#============================================
+def _screen(mol) -> substructure_index.IndexedMolecule:
+	return substructure_index.IndexedMolecule(packed=None,
+		counts=substructure_index.element_counts(mol), fingerprint=substructure_index.fingerprint(mol))
+
+
+#============================================
+def _compile(name: str, category: str, smiles: str, substituents) -> GroupPattern:
+	query, labelled = parse_pattern(smiles, substituents)
+	pattern = GroupPattern(
+		name=name,
+		category=category,
+		smiles=smiles,
+		query=query,
+		graph=substructure_match.SearchGraph.for_query(query),
+		labelled=labelled,
+		hydrogens=substructure_match.needs_hydrogens(query),
+		screen=_screen(query),
+	)
+	return pattern
+
+
+#============================================
+def _selectivity(pattern: GroupPattern) -> tuple:
+	"""Sort key putting patterns that fewer molecules contain first."""
+	heavy_atoms = sum(pattern.screen.counts.values())
+	return (-bin(pattern.screen.fingerprint).count("1"), -heavy_atoms, pattern.name, pattern.smiles)
+
+
+#============================================
+def _normalize_tables(structures, rings) -> tuple:
+	"""Return hashable copies of the two tables."""
+	structures = tuple((name, category, smiles, tuple(substituents))
+		for name, category, smiles, substituents in structures)
+	rings = tuple((name, smiles) for name, smiles, *_rest in rings)
+	return (structures, rings)
+
+
+#============================================
+def compile_patterns(structures=None, rings=None) -> tuple:
+	"""Parse pattern tables into GroupPattern objects, most selective first.
+
+	Args:
+		structures: Rows (name, category, smiles, substituent positions);
+			None uses subsearch_data.structures.
+		rings: Rows (name, smiles, ...); None uses subsearch_data.rings.
+
+	Returns:
+		Tuple of GroupPattern.
+	"""
+	if structures is None:
+		structures = subsearch_data.structures
+	if rings is None:
+		rings = subsearch_data.rings
+	structures, rings = _normalize_tables(structures, rings)
+	patterns = [_compile(*row) for row in structures]
+	patterns.extend(_compile(name, RING_CATEGORY, smiles, ()) for name, smiles in rings)
+	patterns.sort(key=_selectivity)
+	return tuple(patterns)
+
+
+#============================================
+def get_classifier(structures=None, rings=None) -> "GroupClassifier":
+	"""Return a GroupClassifier for the tables, compiling them only once."""
+	if structures is None:
+		structures = subsearch_data.structures
+	if rings is None:
+		rings = subsearch_data.rings
+	key = _normalize_tables(structures, rings)
+	classifier = _CLASSIFIERS.get(key)
+	if classifier is None:
+		classifier = GroupClassifier(structures=key[0], rings=key[1])
+		_CLASSIFIERS[key] = classifier
+	return classifier
+
+
+#============================================
+def _classify_chunk(tables: tuple, packed_mols: list) -> list:
+	"""Worker entry point: group names of each packed molecule."""
+	classifier = get_classifier(*tables)
+	return [classifier.classify(substructure_index.unpack_mol(packed)) for packed in packed_mols]
+
+
+#============================================
+def _iter_chunks(items, size: int):
+	chunk = []
+	for item in items:
+		chunk.append(item)
+		if len(chunk) >= size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+
+#============================================
+class GroupClassifier:
+	"""Labels molecule atoms with the functional groups and rings they are in.
+
+	Args:
+		structures: Functional-group table; None uses subsearch_data.
+		rings: Ring table; None uses subsearch_data.
+	"""
+
+	#============================================
+	def __init__(self, structures=None, rings=None) -> None:
+		if structures is None:
+			structures = subsearch_data.structures
+		if rings is None:
+			rings = subsearch_data.rings
+		self.tables = _normalize_tables(structures, rings)
+		self.patterns = compile_patterns(*self.tables)
+
+	#============================================
+	def _matchers(self, mol):
+		"""Yield (GroupPattern, SubstructureMatcher) for patterns mol may contain.
+
+		All matchers share the target search graphs of mol, one per
+		needs_hydrogens() value.
+		"""
+		mol_screen = _screen(mol)
+		target_graphs = {}
+		for pattern in self.patterns:
+			if not substructure_index.may_contain(mol_screen, pattern.screen):
+				continue
+			target_graph = target_graphs.get(pattern.hydrogens)
+			if target_graph is None:
+				target_graph = substructure_match.SearchGraph.for_target(mol, pattern.hydrogens)
+				target_graphs[pattern.hydrogens] = target_graph
+			matcher = substructure_match.SubstructureMatcher(mol, pattern.query,
+				implicit_freesites=True, target_graph=target_graph, query_graph=pattern.graph)
+			yield (pattern, matcher)
+
+	#============================================
+	def label_atoms(self, mol) -> dict:
+		"""Return {atom: tuple of group names}, most selective group first.
+
+		Atoms that belong to no group are left out.
+		"""
+		labels = collections.defaultdict(list)
+		for pattern, matcher in self._matchers(mol):
+			target = matcher.target
+			for image in matcher.mappings():
+				for query_node in pattern.labelled:
+					node = image[query_node]
+					if target.is_virtual(node):
+						continue
+					names = labels[target.objects[node]]
+					if pattern.name not in names:
+						names.append(pattern.name)
+		result = {atom: tuple(names) for atom, names in labels.items()}
+		return result
+
+	#============================================
+	def classify(self, mol) -> frozenset:
+		"""Return the names of all groups and rings present in mol."""
+		found = set()
+		for pattern, matcher in self._matchers(mol):
+			if pattern.name in found:
+				continue
+			for _image in matcher.mappings():
+				found.add(pattern.name)
+				break
+		return frozenset(found)
+
+	#============================================
+	def classify_many(self, mols, workers: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE):
+		"""Yield classify() of each molecule, in input order.
+
+		Args:
+			mols: Iterable of OASA molecules, consumed lazily.
+			workers: Worker processes; 0 or 1 classifies in the calling
+				process, None uses os.cpu_count().
+			chunk_size: Molecules sent to a worker per task.
+
+		Yields:
+			Frozensets of group names.
+		"""
+		if workers is None:
+			workers = os.cpu_count() or 1
+		if workers <= 1:
+			for mol in mols:
+				yield self.classify(mol)
+			return
+		packed = (substructure_index.pack_mol(mol) for mol in mols)
+		max_pending = workers * 2
+		with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+			pending = collections.deque()
+			for chunk in _iter_chunks(packed, max(1, chunk_size)):
+				pending.append(pool.submit(_classify_chunk, self.tables, chunk))
+				# keep the window bounded and drain strictly in submission order
+				while len(pending) >= max_pending:
+					yield from pending.popleft().result()
+			while pending:
+				yield from pending.popleft().result()
@@ -0,0 +1,292 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Batch Haworth rendering from a TSV/CSV job table with a process pool.
+
+Each row names one SMILES or sugar code plus optional per-row options.
+Sugar codes are converted with sugar_code.parse and
+sugar_code_smiles.sugar_code_to_smiles, then every row goes through the
+same path as ``oasa_cli.py haworth``: text_to_mol, build_haworth and
+render_out. Workers write the output files themselves and send back one
+small result per row, so one slow or broken row never stops the batch.
+"""
+
+# Standard Library
+import os
+import re
+import csv
+import json
+import time
+import collections
+import dataclasses
+import concurrent.futures
+
+# local repo modules
+from oasa import render_out
+from oasa import smiles_lib
+from oasa import sugar_code
+from oasa import sugar_code_smiles
+from oasa.haworth import layout as haworth_layout
+from oasa.smiles_batch import BatchError
+
+
+DEFAULT_CHUNK_SIZE = 4
+DEFAULT_BOND_LENGTH = 30
+_SERIES_BY_CONFIG = {"DEXTER": "D", "LAEVUS": "L"}
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class HaworthJob:
+	"""One row of the job table with defaults applied.
+
+	Attributes:
+		index: Zero-based row number (header and blank rows excluded).
+		input: SMILES or sugar code text.
+		name: Output file stem.
+		mode: "pyranose" or "furanose".
+		stereo: "alpha", "beta" or None.
+		series: "D", "L" or None.
+		formats: Output formats, e.g. ("svg", "png").
+	"""
+	index: int
+	input: str
+	name: str
+	mode: str
+	stereo: str
+	series: str
+	formats: tuple
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class HaworthJobResult:
+	"""Outcome of one job, as recorded in the manifest.
+
+	Attributes:
+		index: Row number of the job.
+		name: Output file stem.
+		input: Original input text.
+		input_kind: "sugar_code" or "smiles" (None when the row failed early).
+		smiles: SMILES that was rendered, or None.
+		outputs: Paths written for this row.
+		seconds: Worker time spent on the row.
+		error: A BatchError when the row failed, otherwise None.
+	"""
+	index: int
+	name: str
+	input: str
+	input_kind: str
+	smiles: str
+	outputs: tuple
+	seconds: float
+	error: BatchError
+
+
+#============================================
+def _detect_delimiter(header_line: str) -> str:
+	"""Return tab for TSV headers, otherwise comma."""
+	if "\t" in header_line:
+		return "\t"
+	return ","
+
+
+#============================================
+def _safe_name(text: str) -> str:
+	return _UNSAFE_NAME_RE.sub("_", text.strip()).strip("_")
+
+
+#============================================
+def _cell(row: dict, key: str, default):
+	value = (row.get(key) or "").strip()
+	return value or default
+
+
+#============================================
+def read_jobs(file_obj, mode="pyranose", stereo=None, series=None, formats=("svg",)) -> list:
+	"""Read a TSV/CSV job table into HaworthJob rows.
+
+	The first line is a header. Only the ``input`` column is required;
+	``name``, ``mode``, ``stereo``, ``series`` and ``formats`` (comma- or
+	space-separated) override the given defaults per row. Blank rows and
+	rows whose input starts with '#' are skipped.
+
+	Args:
+		file_obj: Text file object.
+		mode: Default ring mode.
+		stereo: Default anomeric stereo.
+		series: Default sugar series.
+		formats: Default output formats.
+
+	Returns:
+		List of HaworthJob.
+	"""
+	header = file_obj.readline()
+	if not header.strip():
+		raise ValueError("Job table is empty; expected a header row with an 'input' column")
+	fieldnames = next(csv.reader([header], delimiter=_detect_delimiter(header)))
+	fieldnames = [field.strip().lower() for field in fieldnames]
+	if "input" not in fieldnames:
+		raise ValueError(f"Job table header needs an 'input' column; got {fieldnames}")
+	reader = csv.DictReader(file_obj, fieldnames=fieldnames, delimiter=_detect_delimiter(header))
+	jobs = []
+	used_names = set()
+	for row in reader:
+		text = _cell(row, "input", "")
+		if not text or text.startswith("#"):
+			continue
+		index = len(jobs)
+		name = _safe_name(_cell(row, "name", "")) or f"row_{index + 1:04d}"
+		if name in used_names:
+			name = f"{name}_{index + 1:04d}"
+		used_names.add(name)
+		row_formats = _cell(row, "formats", None)
+		if row_formats:
+			row_formats = tuple(fmt.lower() for fmt in re.split(r"[,\s]+", row_formats) if fmt)
+		row_stereo = _cell(row, "stereo", stereo)
+		row_series = _cell(row, "series", series)
+		jobs.append(HaworthJob(
+			index=index,
+			input=text,
+			name=name,
+			mode=_cell(row, "mode", mode).lower(),
+			stereo=row_stereo.lower() if row_stereo else None,
+			series=row_series.upper() if row_series else None,
+			formats=row_formats or tuple(formats),
+		))
+	return jobs
+
+
+#============================================
+def resolve_smiles(job: HaworthJob) -> tuple:
+	"""Return (input_kind, smiles, series) for one job.
+
+	Inputs that parse as sugar codes are converted to SMILES for the job's
+	ring mode and stereo, and take their series from the code when the row
+	gives none; anything else is treated as SMILES.
+	"""
+	try:
+		parsed = sugar_code.parse(job.input)
+	except ValueError:
+		return ("smiles", job.input, job.series)
+	if job.stereo is None:
+		raise ValueError(f"Sugar code {job.input!r} needs a stereo (alpha or beta)")
+	smiles = sugar_code_smiles.sugar_code_to_smiles(job.input, job.mode, job.stereo)
+	series = job.series or _SERIES_BY_CONFIG.get(parsed.config)
+	return ("sugar_code", smiles, series)
+
+
+#============================================
+def render_job(job: HaworthJob, output_dir: str, bond_length=DEFAULT_BOND_LENGTH) -> HaworthJobResult:
+	"""Render one job to its output files, capturing any failure."""
+	start = time.perf_counter()
+	input_kind = None
+	smiles = None
+	outputs = ()
+	error = None
+	try:
+		input_kind, smiles, series = resolve_smiles(job)
+		mol = smiles_lib.text_to_mol(smiles, calc_coords=bond_length)
+		haworth_layout.build_haworth(
+			mol,
+			mode=job.mode,
+			bond_length=bond_length,
+			series=series,
+			stereo=job.stereo,
+		)
+		targets = {fmt: os.path.join(output_dir, f"{job.name}.{fmt}") for fmt in job.formats}
+		render_out.mol_to_outputs(mol, targets)
+		outputs = tuple(targets.values())
+	except Exception as exc:
+		error = BatchError(error_type=type(exc).__name__, message=str(exc))
+	seconds = time.perf_counter() - start
+	result = HaworthJobResult(
+		index=job.index,
+		name=job.name,
+		input=job.input,
+		input_kind=input_kind,
+		smiles=smiles,
+		outputs=outputs,
+		seconds=seconds,
+		error=error,
+	)
+	return result
+
+
+#============================================
+def _render_chunk(jobs: list, output_dir: str, bond_length) -> list:
+	"""Worker entry point: render a chunk of jobs."""
+	return [render_job(job, output_dir, bond_length) for job in jobs]
+
+
+#============================================
+def iter_render_jobs(jobs, output_dir: str, workers: int = None,
+	chunk_size: int = DEFAULT_CHUNK_SIZE, bond_length=DEFAULT_BOND_LENGTH):
+	"""Render jobs in a process pool, yielding results in job order.
+
+	Args:
+		jobs: Iterable of HaworthJob.
+		output_dir: Directory that receives the output files.
+		workers: Number of worker processes; None uses os.cpu_count(),
+			0 or 1 renders in the calling process.
+		chunk_size: Jobs sent to a worker per task.
+		bond_length: Bond length in screen units.
+
+	Yields:
+		HaworthJobResult objects in job order.
+	"""
+	os.makedirs(output_dir, exist_ok=True)
+	if workers is None:
+		workers = os.cpu_count() or 1
+	chunk_size = max(1, chunk_size)
+	jobs = list(jobs)
+	chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+	if workers <= 1:
+		for chunk in chunks:
+			yield from _render_chunk(chunk, output_dir, bond_length)
+		return
+	max_pending = workers * 2
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+		pending = collections.deque()
+		for chunk in chunks:
+			pending.append(pool.submit(_render_chunk, chunk, output_dir, bond_length))
+			# keep the window bounded and drain strictly in submission order
+			while len(pending) >= max_pending:
+				yield from pending.popleft().result()
+		while pending:
+			yield from pending.popleft().result()
+
+
+#============================================
+def write_manifest(results, manifest_path: str, wall_seconds: float) -> dict:
+	"""Write a JSON manifest with per-row timings and failures.
+
+	Args:
+		results: Sequence of HaworthJobResult.
+		manifest_path: Output JSON path.
+		wall_seconds: Elapsed time of the whole batch.
+
+	Returns:
+		The manifest dict that was written.
+	"""
+	rows = []
+	for result in results:
+		row = dataclasses.asdict(result)
+		row["outputs"] = list(result.outputs)
+		row["seconds"] = round(result.seconds, 4)
+		rows.append(row)
+	failed = sum(1 for result in results if result.error is not None)
+	manifest = {
+		"total": len(rows),
+		"rendered": len(rows) - failed,
+		"failed": failed,
+		"wall_seconds": round(wall_seconds, 3),
+		"worker_seconds": round(sum(result.seconds for result in results), 3),
+		"rows": rows,
+	}
+	with open(manifest_path, "w", encoding="utf-8") as handle:
+		json.dump(manifest, handle, indent=2)
+		handle.write("\n")
+	return manifest
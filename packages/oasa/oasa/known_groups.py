@@ -64,3 +64,24 @@ name_to_smiles = {'Me': 'C',
                   'TBDPS': 'Si(C(C)(C)C)(c1ccccc1)c2ccccc2',
 
                   }
+
+
+
+# group SMILES parsed once; group_fragment() hands out copies of these
+_fragment_templates = {}
+
+
+def group_fragment( smiles_text):
+  """Return a new molecule for a group SMILES, parsing each text only once.
+
+  The first call parses smiles_text (without coordinates) and keeps the
+  result as a template; every call returns a deep copy of the template,
+  so callers are free to modify and insert the fragment.
+  """
+  template = _fragment_templates.get( smiles_text)
+  if template is None:
+    # imported here so the group tables load without RDKit
+    from oasa import smiles_lib
+    template = smiles_lib.text_to_mol( smiles_text, calc_coords=0)
+    _fragment_templates[ smiles_text] = template
+  return template.deep_copy()
@@ -22,10 +22,10 @@
 import re
 
 from oasa import oasa_utils as misc
-from oasa import smiles_lib as smiles
 from oasa import coords_generator
 from oasa.oasa_config import Config
 from oasa.known_groups import name_to_smiles
+from oasa.known_groups import group_fragment
 from oasa.oasa_exceptions import oasa_invalid_atom_symbol
 
 
@@ -132,7 +132,7 @@ class linear_formula( object):
           for j in range( count):
             if chunk[0] == "!":
               # the form should be a smiles
-              m = smiles.text_to_mol( chunk[1:], calc_coords=0)
+              m = group_fragment( chunk[1:])
               m.add_missing_hydrogens()
               hs = [v for v in m.vertices[0].neighbors if v.symbol == 'H']
               m.disconnect( hs[0], m.vertices[0])
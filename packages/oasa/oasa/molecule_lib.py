@@ -29,7 +29,7 @@ from oasa import transform3d_lib as transform3d
 from oasa import periodic_table as PT
 from oasa.atom_lib import Atom as atom
 from oasa.bond_lib import Bond as bond
-from oasa.query_atom import QueryAtom as query_atom
+from oasa import substructure_match
 
 
 
@@ -614,189 +614,19 @@ class Molecule(base_graph):
     explicit hydrogens that match implicit hydrogens on self the length of the
     returned fragment might be shorter of the matched implicit hydrogens;
 
-    IF YOU DON'T LET THE GENERATOR RUN TO THE END OR SET THE auto_cleanup TO FALSE, YOU HAVE TO
-    RUN clean_after_search MANUALLY NOT TO CLUTTER THE STRUCTURE"""
-
-    # at first decide if we need to add implicit hydrogens to self
-    add_implicit = False
-    for v in other.vertices:
-      if (isinstance( v, atom) and v.symbol == 'H') or \
-         (isinstance( v, atom) and v.explicit_hydrogens > 0) or \
-         (isinstance( v, query_atom) and ('H' in v.symbols or 'R' in v.symbols)):
-        add_implicit = True
-        break
-    if add_implicit:
-      added_hs = self.add_missing_hydrogens()
-      for h in added_hs:
-        h.properties_['implicit_hydrogen'] = True
-    # here we add explicit hydrogens to other, we call them implicit_hydrogen to make it
-    # work the same way as implicit_hydrogen
-    for v in other.vertices:
-      for i in range( v.explicit_hydrogens):
-        h = other.create_vertex()
-        other.add_vertex( h)
-        h.symbol = 'H'
-        e = other.create_edge()
-        e.order = 1
-        other.add_edge( v, h, e=e)
-        h.properties_['implicit_hydrogen'] = True
-      v.explicit_hydrogens = 0  # make it 0 and after search put it back
-    # for implicit_freesites we add the free_sites here
-    if implicit_freesites:
-      for v in other.vertices:
-        v.properties_['old_free_sites'] = v.free_sites
-        v.free_sites = v.free_valency
-
-    # then we create the dicts for storing threads in each of the atoms
-    i = 0
-    for a in other.vertices:
-      a.properties_['subsearch'] = {}
-    for e in other.edges | self.edges:
-      e.properties_['subsearch'] = {}
-    # here we select the vertex to start from
-    vs = [v for v in other.vertices if isinstance( v, atom)]
-    sym = common.least_common_item( [v.symbol for v in vs])
-    v = [v for v in vs if v.symbol == sym][0]
-    for a in self.vertices:
-      a.properties_['subsearch'] = {}
-      if v.matches( a):
-        i += 1
-        a.properties_['subsearch'][i] = v
-        v.properties_['subsearch'][i] = a
-
-    # now we can proceed with the search
-    yielded = set()
-    for thread in self._mark_matching_threads( v, other):
-      vs = [v.properties_['subsearch'][thread] for v in other.vertices]
-      # for symetrical fragments we have to get rid of copies (O1=N=O2 and O2=N=O1)
-      vsset = frozenset( vs)
-      if vsset not in yielded:
-        if self._freesites_match( other, thread):
-          yield [v for v in vs if not 'implicit_hydrogen' in list(v.properties_.keys())]
-      yielded.add( vsset)
-
-    if auto_cleanup:
-      self.clean_after_search( other)
+    neither molecule is modified, so searches may run side by side on the same
+    molecules (see oasa.substructure_match); auto_cleanup is kept for
+    compatibility and has no effect"""
+    return substructure_match.iter_matches( self, other, implicit_freesites=implicit_freesites)
 
 
   def clean_after_search( self, other):
-    # for implicit_freesites we restore original free_sites here
-    for v in other.vertices:
-      if "old_free_sites" in v.properties_:
-        v.free_sites = v.properties_['old_free_sites']
-        del v.properties_['old_free_sites']
-    # finally we remove the added implicit hydrogens
-    hs = [v for v in self.vertices if 'implicit_hydrogen' in list(v.properties_.keys())]
-    for v in hs:
-      del v.properties_['implicit_hydrogen']
-      self.remove_vertex( v)
-    # we also remove implicit_hydrogen (that represent atom.explicit_hydrogens) on other
-    # and also set the explicit_hydrogens count back to the original atoms
-    for v in other.vertices:
-      if 'implicit_hydrogen' not in v.properties_:
-        v.explicit_hydrogens = len( [h for h in v.neighbors if 'implicit_hydrogen' in h.properties_])
-    hs = [v for v in other.vertices if 'implicit_hydrogen' in list(v.properties_.keys())]
-    for v in hs:
-      del v.properties_['implicit_hydrogen']
-      other.remove_vertex( v)
-    for v in self.vertices + other.vertices:
-      del v.properties_['subsearch']
-    for e in self.edges | other.edges:
-      del e.properties_['subsearch']
-
-
-  def _mark_matching_threads( self, v, other):
-    """v is other vertex, other is the other molecule"""
-    thread = 0
-    threads = list(v.properties_['subsearch'].keys())
-    while threads:
-      thread = min( threads)
-      threads.remove( thread)
-
-      mirror = v.properties_['subsearch'][thread]
-      for e, n in v.get_neighbor_edge_pairs():
-        if thread not in n.properties_['subsearch']:
-          candidates = set()
-          for me, mn in mirror.get_neighbor_edge_pairs():
-            if thread not in mn.properties_['subsearch'] and mn.matches( n) and me.matches( e) and thread not in e.properties_['subsearch']:
-              candidates.add( (mn, me, e))
-
-          if candidates:
-            if len( candidates) > 1:
-              new_threads = self._spawn_thread( other, thread, len( candidates)-1)
-              ths = [thread] + new_threads
-            else:
-              ths = [thread]
-            for c, me, e in candidates:
-              th = ths.pop()
-              n.properties_['subsearch'][th] = c
-              c.properties_['subsearch'][th] = n
-              e.properties_['subsearch'][th] = me
-              me.properties_['subsearch'][th] = e
-            [x for x in self._mark_matching_threads( n, other)] # just make the generator run
-            if thread not in v.properties_['subsearch']:
-              # the thread already died
-              break
-            else:
-              pass
-          else:
-            self._delete_thread( other, thread)
-            break
-        # for proper handling of rings we have to check also the ones that are in this thread already
-        elif thread not in e.properties_['subsearch']:
-          me = self.get_edge_between( mirror, n.properties_['subsearch'][thread])
-          if me and e.matches( me):
-            e.properties_['subsearch'][thread] = me
-            me.properties_['subsearch'][thread] = e
-          else:
-            self._delete_thread( other, thread)
-            break
-        else:
-          pass
-
-      threads = [i for i in list(v.properties_['subsearch'].keys()) if i >= thread]
-      if thread in threads:
-        threads.remove( thread)
-        yield thread
-
-
-  def _spawn_thread( self, other, thread, number):
-    my_vs = [v for v in self.vertices if thread in v.properties_['subsearch']]
-    my_es = [e for e in self.edges if thread in e.properties_['subsearch']]
-    other_vs = [v for v in other.vertices if thread in v.properties_['subsearch']]
-    other_es = [e for e in other.edges if thread in e.properties_['subsearch']]
-    max_thread = max( [max( v.properties_['subsearch'].keys()) for v in other.vertices if v.properties_['subsearch']])
-    for i in range( max_thread +1, max_thread +number +1, 1):
-      for v in my_vs + my_es + other_vs + other_es:
-        v.properties_['subsearch'][ i] = v.properties_['subsearch'][thread]
-    return list(range(max_thread + 1, max_thread + number + 1, 1))
-
-
-  def _delete_thread( self, other, thread):
-    for v in self.vertices + other.vertices:
-      try:
-        del v.properties_['subsearch'][thread]
-      except KeyError:
-        pass
-
-
-  def _freesites_match( self, other, thread):
-    for v in other.vertices:
-      mirror = v.properties_['subsearch'][thread]
-      unmatched_ns = [n for n in mirror.neighbors if thread not in n.properties_['subsearch']] # and not n.symbol == 'H']
-      # if there is more unmatched neighbors then free-site it does not match (Hs don't count)
-      if not len( unmatched_ns)+mirror.explicit_hydrogens <= v.free_sites:
-        return False
-    return True
+    """kept for compatibility, the search does not leave anything to clean"""
+    pass
 
 
   def contains_substructure( self, other, implicit_freesites=True):
-    found = False
-    for i in self.select_matching_substructures( other, implicit_freesites=implicit_freesites, auto_cleanup=False):
-      found = True
-      break
-    self.clean_after_search( other)
-    return found
+    return substructure_match.has_match( self, other, implicit_freesites=implicit_freesites)
 
 
   # // --- end of the fragment matching routines ---
@@ -982,6 +812,18 @@ def equals( mol1, mol2, level=0):
   return True
 
 
+def as_molecule( mol):
+  """returns mol as a Molecule, thawing array-backed molecules (such as
+     oasa.frozen_molecule.FrozenMolecule) through their to_molecule() method;
+     duck-typed so that plain Molecule users never import frozen_molecule"""
+  if isinstance( mol, Molecule):
+    return mol
+  to_molecule = getattr( mol, 'to_molecule', None)
+  if to_molecule is not None:
+    return to_molecule()
+  return mol
+
+
 
 #import psyco
 #psyco.profile()
@@ -81,7 +81,8 @@ class QueryAtom( chem_vertex):
       self.symbols = set( [symbol])
     else:
       self.symbols = self.parse_query_definition( symbol)
-
+    # the highest valency any of the symbols allows, so free_valency works
+    self.valency = max( max( PT.periodic_table[ sym]['valency']) for sym in self.symbols)
     self._symbol = symbol
 
 
@@ -0,0 +1,225 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Content-addressed LRU cache for render-ops lists.
+
+Keys are SHA-256 digests of a molecule's atoms, bonds, coordinates and
+drawing properties plus the render style, so the same structure rendered
+with the same style reuses one ops list regardless of the Python objects
+involved. A hit may list bond ops in another order than a fresh render,
+since bond order follows set iteration; the drawing is the same.
+
+Only plain values (strings, numbers, booleans, None and containers of
+them) go into a key. A molecule or style carrying any other object in its
+properties has no stable key and is rendered without the cache.
+
+The cache is opt-in: render_out uses one only when a RenderOpsCache is
+passed as the ops_cache option. The in-memory tier is bounded by an
+approximate byte budget. An optional directory tier stores ops as
+ops_to_json_dict(keep_rgba=True) JSON files, with numbers rounded to
+DISK_ROUND_DIGITS and color tuples kept with their alpha.
+"""
+
+# Standard Library
+import collections
+import hashlib
+import json
+import os
+import sys
+import threading
+
+# local repo modules
+from oasa import render_ops
+from oasa.molecule_lib import as_molecule
+
+
+# bump when the renderer output or the key layout changes
+CACHE_FORMAT_VERSION = 2
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# digits kept when writing ops to disk (screen output needs far fewer)
+DISK_ROUND_DIGITS = 6
+
+_ATOM_KEY_ATTRS = (
+	"symbol", "charge", "isotope", "multiplicity", "valency",
+	"explicit_hydrogens", "free_valency", "x", "y", "z",
+)
+_BOND_KEY_ATTRS = (
+	"order", "type", "aromatic", "center", "line_color", "wavy_style",
+	"bond_length_override", "bond_length_exception_tag",
+)
+
+
+#============================================
+class _UnstableValue(Exception):
+	"""Raised when a value has no repr that is stable across processes."""
+
+
+#============================================
+def _stable(value):
+	"""Return a canonical, hashable form of a plain value.
+
+	Raises:
+		_UnstableValue: For objects whose repr may contain memory addresses.
+	"""
+	if value is None or isinstance(value, (str, bool, int, float)):
+		return value
+	if isinstance(value, (tuple, list)):
+		return tuple(_stable(item) for item in value)
+	if isinstance(value, dict):
+		return tuple(sorted((str(k), _stable(v)) for k, v in value.items()))
+	raise _UnstableValue(type(value).__name__)
+
+
+#============================================
+def _properties_key(obj) -> tuple:
+	properties = getattr(obj, "properties_", None) or {}
+	return _stable(properties)
+
+
+#============================================
+def render_key(mol, style=None, **extra):
+	"""Return the cache key for rendering mol with style.
+
+	Args:
+		mol: Molecule or FrozenMolecule.
+		style: Style dict passed to molecule_to_ops().
+		**extra: Further values that change the ops (e.g. margin, scaling).
+
+	Returns:
+		Hex SHA-256 digest, or None when an atom, bond or style value is
+		not a plain value and so cannot be keyed reliably.
+	"""
+	mol = as_molecule(mol)
+	index = {atom: i for i, atom in enumerate(mol.vertices)}
+	try:
+		atoms = tuple(
+			_stable(tuple(getattr(atom, name, None) for name in _ATOM_KEY_ATTRS))
+			+ (_properties_key(atom),)
+			for atom in mol.vertices
+		)
+		# mol.edges is a set, so bonds are sorted to make the key canonical
+		bonds = tuple(sorted(
+			repr((index[bond.vertices[0]], index[bond.vertices[1]])
+				+ _stable(tuple(getattr(bond, name, None) for name in _BOND_KEY_ATTRS))
+				+ (_properties_key(bond),))
+			for bond in mol.edges
+		))
+		payload = (
+			CACHE_FORMAT_VERSION,
+			atoms,
+			bonds,
+			_stable(style or {}),
+			_stable(extra),
+		)
+	except _UnstableValue:
+		return None
+	return hashlib.sha256(repr(payload).encode("utf-8")).hexdigest()
+
+
+#============================================
+def _ops_nbytes(ops) -> int:
+	"""Approximate memory held by one ops list (shallow per field)."""
+	total = sys.getsizeof(ops)
+	for op in ops:
+		total += sys.getsizeof(op)
+		for value in vars(op).values():
+			total += sys.getsizeof(value)
+	return total
+
+
+#============================================
+class RenderOpsCache:
+	"""LRU cache of ops lists bounded by an approximate memory budget.
+
+	Attributes:
+		max_bytes: Memory budget for the in-memory tier.
+		cache_dir: Directory for persisted entries, or None.
+		hits: Lookups served from memory or disk.
+		misses: Lookups that found nothing.
+	"""
+
+	#============================================
+	def __init__(self, max_bytes=DEFAULT_MAX_BYTES, cache_dir=None):
+		self.max_bytes = int(max_bytes)
+		self.cache_dir = cache_dir
+		self.hits = 0
+		self.misses = 0
+		self._entries = collections.OrderedDict()
+		self._nbytes = 0
+		self._lock = threading.Lock()
+		if cache_dir:
+			os.makedirs(cache_dir, exist_ok=True)
+
+	#============================================
+	def __len__(self):
+		return len(self._entries)
+
+	#============================================
+	@property
+	def nbytes(self) -> int:
+		"""Approximate bytes held by the in-memory tier."""
+		return self._nbytes
+
+	#============================================
+	def _disk_path(self, key: str) -> str:
+		return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+	#============================================
+	def _remember(self, key: str, ops: tuple) -> None:
+		size = _ops_nbytes(ops)
+		if size > self.max_bytes:
+			return
+		with self._lock:
+			if key in self._entries:
+				self._nbytes -= self._entries.pop(key)[1]
+			self._entries[key] = (ops, size)
+			self._nbytes += size
+			while self._nbytes > self.max_bytes:
+				_key, (_ops, old_size) = self._entries.popitem(last=False)
+				self._nbytes -= old_size
+
+	#============================================
+	def get(self, key: str):
+		"""Return a new list of the cached ops for key, or None."""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is not None:
+				self._entries.move_to_end(key)
+				self.hits += 1
+				return list(entry[0])
+		if self.cache_dir:
+			path = self._disk_path(key)
+			if os.path.isfile(path):
+				try:
+					with open(path, "r", encoding="utf-8") as handle:
+						ops = tuple(render_ops.ops_from_json_dict(json.load(handle)))
+				except (OSError, ValueError, KeyError, TypeError):
+					ops = None
+				if ops is not None:
+					self._remember(key, ops)
+					self.hits += 1
+					return list(ops)
+		self.misses += 1
+		return None
+
+	#============================================
+	def put(self, key: str, ops) -> None:
+		"""Store ops under key in memory and, if configured, on disk."""
+		ops = tuple(ops)
+		self._remember(key, ops)
+		if not self.cache_dir:
+			return
+		path = self._disk_path(key)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+		with open(temp_path, "w", encoding="utf-8") as handle:
+			json.dump(render_ops.ops_to_json_dict(ops, round_digits=DISK_ROUND_DIGITS, keep_rgba=True), handle)
+		os.replace(temp_path, path)
+
+	#============================================
+	def clear(self) -> None:
+		"""Drop the in-memory tier; persisted files are kept."""
+		with self._lock:
+			self._entries.clear()
+			self._nbytes = 0
@@ -28,10 +28,12 @@ from oasa import oasa_utils as misc
 from oasa import render_ops
 from oasa import wedge_geometry
 from oasa.render_lib.data_types import AttachConstraints
+from oasa.render_lib.data_types import BATCH_GEOMETRY_MIN_TARGETS
 from oasa.render_lib.data_types import _coerce_attach_target
 from oasa.render_lib.bond_length_policy import _bond_style_for_edge
 from oasa.render_lib.bond_length_policy import resolve_bond_length
 from oasa.render_lib.low_level_geometry import _capsule_intersects_target
+from oasa.render_lib.low_level_geometry import _capsule_intersects_targets_batch
 from oasa.render_lib.attach_resolution import _correct_endpoint_for_alignment
 from oasa.render_lib.attach_resolution import _retreat_to_target_gap
 from oasa.render_lib.attach_resolution import resolve_attach_endpoint
@@ -387,21 +389,47 @@ def _apply_bond_length_policy(edge, start, end):
 
 
 #============================================
-def _avoid_cross_label_overlaps(start, end, half_width, own_vertices, label_targets, epsilon=0.5):
+def _avoid_cross_label_overlaps(start, end, half_width, own_vertices, label_targets, epsilon=0.5,
+		target_arrays=None, target_index=None):
 	"""Retreat bond endpoints away from non-own-vertex label targets.
 
 	For each label target that is NOT owned by one of the bond's own vertices,
 	check whether the stroked bond segment (capsule) penetrates the target.  If
 	so, retreat the nearer endpoint via ``retreat_endpoint_until_legal``.
 
+	When ``target_index`` (AttachTargetGrid over ``label_targets``) is given,
+	only targets near the segment are visited. When ``target_arrays``
+	(AttachTargetArrays packed from ``label_targets``) is given, one batched
+	call finds the targets the original capsule hits and only those are
+	visited; with both, the batched call runs on the grid candidates when
+	there are many of them. Retreating only shortens the segment, so targets
+	missed by the original capsule are missed by every shortened one too.
+
 	Returns the (possibly shortened) ``(start, end)`` pair.
 	"""
 	if not label_targets:
 		return start, end
-	cross_targets = [
-		t for v, t in label_targets.items()
-		if v not in own_vertices
-	]
+	if target_index is not None:
+		indices = target_index.query(start, end, margin=half_width)
+		if target_arrays is not None and len(indices) >= BATCH_GEOMETRY_MIN_TARGETS:
+			hits = _capsule_intersects_targets_batch(
+				start, end, half_width, target_arrays, epsilon, candidates=indices)
+			indices = hits.nonzero()[0]
+		cross_targets = [
+			target_index.targets[i] for i in indices
+			if target_index.keys[i] not in own_vertices
+		]
+	elif target_arrays is not None:
+		hits = _capsule_intersects_targets_batch(start, end, half_width, target_arrays, epsilon)
+		cross_targets = [
+			target_arrays.targets[i] for i in hits.nonzero()[0]
+			if target_arrays.keys[i] not in own_vertices
+		]
+	else:
+		cross_targets = [
+			t for v, t in label_targets.items()
+			if v not in own_vertices
+		]
 	if not cross_targets:
 		return start, end
 	min_length = max(half_width * 4.0, 1.0)
@@ -454,6 +482,8 @@ def build_bond_ops(edge, start, end, context):
 			half_width=edge_line_width / 2.0,
 			own_vertices={v1, v2},
 			label_targets=context.label_targets,
+			target_arrays=context.label_target_arrays,
+			target_index=context.label_target_index,
 		)
 	has_shown_vertex = False
 	if context.shown_vertices:
@@ -510,6 +540,8 @@ def build_bond_ops(edge, start, end, context):
 				(x1, y1), (x2, y2) = _avoid_cross_label_overlaps(
 					(x1, y1), (x2, y2), half_width=edge_line_width / 2.0,
 					own_vertices={v1, v2}, label_targets=context.label_targets,
+					target_arrays=context.label_target_arrays,
+					target_index=context.label_target_index,
 				)
 			ops.extend(_line_ops((x1, y1), (x2, y2), edge_line_width,
 					color1, color2, gradient, cap="butt"))
@@ -522,6 +554,8 @@ def build_bond_ops(edge, start, end, context):
 				(x1, y1), (x2, y2) = _avoid_cross_label_overlaps(
 					(x1, y1), (x2, y2), half_width=edge_line_width / 2.0,
 					own_vertices={v1, v2}, label_targets=context.label_targets,
+					target_arrays=context.label_target_arrays,
+					target_index=context.label_target_index,
 				)
 			ops.extend(_line_ops((x1, y1), (x2, y2), edge_line_width,
 					color1, color2, gradient, cap="round"))
@@ -537,6 +571,8 @@ def build_bond_ops(edge, start, end, context):
 				(x1, y1), (x2, y2) = _avoid_cross_label_overlaps(
 					(x1, y1), (x2, y2), half_width=edge_line_width / 2.0,
 					own_vertices={v1, v2}, label_targets=context.label_targets,
+					target_arrays=context.label_target_arrays,
+					target_index=context.label_target_index,
 				)
 			ops.extend(_line_ops((x1, y1), (x2, y2), edge_line_width,
 					color1, color2, gradient, cap="butt"))
@@ -58,6 +58,13 @@ ATTACH_GAP_TARGET = 1.5
 ATTACH_GAP_MIN = 1.3
 ATTACH_GAP_MAX = 1.7
 ATTACH_PERP_TOLERANCE = 0.07
+
+# Label-target count from which bond clipping packs the targets into NumPy
+# arrays and tests each bond against all of them in one call.
+BATCH_GEOMETRY_MIN_TARGETS = 48
+# Label-target count from which bond clipping indexes the targets in a
+# uniform grid and only tests the labels near each bond.
+SPATIAL_INDEX_MIN_TARGETS = 8
 # fraction of font_size used as the target gap between bond endpoint and glyph body
 ATTACH_GAP_FONT_FRACTION = 0.058
 
@@ -155,6 +162,10 @@ class BondRenderContext:
 	label_targets: dict | None = None
 	attach_targets: dict | None = None
 	attach_constraints: 'AttachConstraints | None' = None
+	# AttachTargetArrays packed from label_targets, for batched overlap tests
+	label_target_arrays: object | None = None
+	# AttachTargetGrid over label_targets, for nearby-label queries
+	label_target_index: object | None = None
 
 
 #============================================
@@ -0,0 +1,211 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Process-wide cache of Cairo text extents for label geometry.
+
+Label layout needs the advance and ink extents of short strings (single
+characters, character pairs for kerning, element symbols) at a handful of
+fonts and sizes. FontMetricsStore measures each (font, size, text) once
+with one Cairo context per thread and keeps the result for the life of the
+process. A precomputed JSON table can seed the store, so headless servers
+without pycairo still get real metrics; pass its path to load_table().
+"""
+
+# Standard Library
+import json
+import threading
+
+# pycairo is imported by the first measurement; None means unavailable
+_NOT_LOADED = object()
+_cairo = _NOT_LOADED
+
+
+TABLE_FORMAT_VERSION = 1
+
+
+#============================================
+def _key(font_name, font_size, text) -> tuple:
+	return (font_name or "sans-serif", round(float(font_size), 6), text)
+
+
+#============================================
+def _cairo_module():
+	"""Return the cairo module, importing it on first use; None if missing."""
+	global _cairo
+	if _cairo is _NOT_LOADED:
+		try:
+			import cairo
+		except ImportError:
+			cairo = None
+		_cairo = cairo
+	return _cairo
+
+
+#============================================
+class FontMetricsStore:
+	"""Thread-safe map of (font, size, text) -> (x_bearing, width, x_advance).
+
+	Attributes:
+		measured: Number of Cairo measurements taken (cache misses).
+	"""
+
+	#============================================
+	def __init__(self):
+		self._extents = {}
+		self._lock = threading.Lock()
+		self._local = threading.local()
+		self.measured = 0
+
+	#============================================
+	def __len__(self):
+		return len(self._extents)
+
+	#============================================
+	def _context(self, font_name, font_size):
+		"""Return this thread's measuring context set to font and size."""
+		local = self._local
+		context = getattr(local, "context", None)
+		if context is None:
+			surface = _cairo.ImageSurface(_cairo.FORMAT_A8, 1, 1)
+			context = _cairo.Context(surface)
+			local.surface = surface
+			local.context = context
+			local.font = None
+		if local.font != (font_name, font_size):
+			context.select_font_face(font_name, 0, 0)
+			context.set_font_size(font_size)
+			local.font = (font_name, font_size)
+		return context
+
+	#============================================
+	def text_extents(self, font_name, font_size, text):
+		"""Return (x_bearing, width, x_advance) of text, or None if unmeasurable.
+
+		None means neither the table nor Cairo could provide metrics; callers
+		keep their own fallback in that case.
+		"""
+		key = _key(font_name, font_size, text)
+		extents = self._extents.get(key)
+		if extents is not None:
+			return extents
+		if _cairo_module() is None:
+			return None
+		try:
+			measured = self._context(key[0], key[1]).text_extents(text)
+		except Exception:
+			return None
+		extents = (float(measured.x_bearing), float(measured.width), float(measured.x_advance))
+		with self._lock:
+			self._extents[key] = extents
+			self.measured += 1
+		return extents
+
+	#============================================
+	def clear(self) -> None:
+		"""Forget every cached entry, including loaded table entries."""
+		with self._lock:
+			self._extents.clear()
+
+	#============================================
+	def load_table(self, path: str) -> int:
+		"""Merge a table written by save_table(); returns the entry count."""
+		with open(path, "r", encoding="utf-8") as handle:
+			data = json.load(handle)
+		if data.get("version") != TABLE_FORMAT_VERSION:
+			raise ValueError(f"Unsupported font metrics table version in {path}: {data.get('version')!r}")
+		entries = {}
+		for font_name, font_size, text, x_bearing, width, x_advance in data["entries"]:
+			entries[_key(font_name, font_size, text)] = (float(x_bearing), float(width), float(x_advance))
+		with self._lock:
+			self._extents.update(entries)
+		return len(entries)
+
+	#============================================
+	def save_table(self, path: str) -> int:
+		"""Write every cached entry to a JSON table; returns the entry count."""
+		with self._lock:
+			items = sorted(self._extents.items())
+		entries = [[font, size, text, *extents] for (font, size, text), extents in items]
+		with open(path, "w", encoding="utf-8") as handle:
+			json.dump({"version": TABLE_FORMAT_VERSION, "entries": entries}, handle)
+		return len(entries)
+
+	#============================================
+	def precompute(self, font_names, font_sizes, characters) -> int:
+		"""Measure every character and character pair for the given fonts.
+
+		Args:
+			font_names: Font family names.
+			font_sizes: Font sizes (include script sizes if needed).
+			characters: String of characters to measure singly and in pairs.
+
+		Returns:
+			Number of entries now cached.
+		"""
+		for font_name in font_names:
+			for font_size in font_sizes:
+				for first in characters:
+					self.text_extents(font_name, font_size, first)
+					for second in characters:
+						self.text_extents(font_name, font_size, first + second)
+		return len(self)
+
+
+#============================================
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+#============================================
+def get_store() -> FontMetricsStore:
+	"""Return the process-wide store, creating it on first use."""
+	global _STORE
+	if _STORE is None:
+		with _STORE_LOCK:
+			if _STORE is None:
+				_STORE = FontMetricsStore()
+	return _STORE
+
+
+#============================================
+def load_table(path: str) -> int:
+	"""Seed the process-wide store from a JSON table written by save_table().
+
+	Args:
+		path: Path of the table, e.g. one built by
+			tools/build_font_metrics_table.py.
+
+	Returns:
+		Number of entries read from the table.
+	"""
+	return get_store().load_table(path)
+
+
+#============================================
+def char_advances(chunk, font_name, font_size):
+	"""Return per-character x advances for one run of text, or None.
+
+	The advance of each character after the first is the pair advance
+	minus the advance of the previous character, which keeps pair kerning
+	while measuring each character and pair only once.
+	"""
+	store = get_store()
+	advances = []
+	previous = None
+	previous_advance = 0.0
+	for char in chunk:
+		single = store.text_extents(font_name, font_size, char)
+		if single is None:
+			return None
+		if previous is None:
+			advance = single[2]
+		else:
+			pair = store.text_extents(font_name, font_size, previous + char)
+			if pair is None:
+				return None
+			advance = pair[2] - previous_advance
+		advances.append(max(0.0, advance))
+		previous = char
+		previous_advance = single[2]
+	return advances
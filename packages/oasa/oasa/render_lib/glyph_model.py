@@ -19,21 +19,14 @@
 
 """Glyph attach primitives and Cairo font metrics for element symbols."""
 
-# Standard Library
-import functools
-
 # local repo modules
+from oasa.render_lib import font_metrics
 from oasa.render_lib.data_types import GlyphAttachPrimitive
 from oasa.render_lib.data_types import _OVAL_GLYPH_ELEMENTS
 from oasa.render_lib.data_types import _RECT_GLYPH_ELEMENTS
 from oasa.render_lib.data_types import _SPECIAL_GLYPH_ELEMENTS
 from oasa.render_lib.data_types import _normalize_element_symbol
 
-try:
-	import cairo as _cairo
-except ImportError:
-	_cairo = None
-
 
 #============================================
 def _glyph_class_for_symbol(symbol: str) -> str:
@@ -49,21 +42,14 @@ def _glyph_class_for_symbol(symbol: str) -> str:
 
 
 #============================================
-@functools.lru_cache(maxsize=512)
 def _glyph_center_factor(symbol: str, font_name: str, font_size: float) -> float:
 	"""Return normalized center factor within glyph x-advance."""
-	if _cairo is None:
-		return 0.5
-	try:
-		surface = _cairo.ImageSurface(_cairo.FORMAT_A8, 1, 1)
-		context = _cairo.Context(surface)
-		context.select_font_face(font_name or "sans-serif", 0, 0)
-		context.set_font_size(float(font_size))
-		extents = context.text_extents(symbol)
-	except Exception:
+	extents = font_metrics.get_store().text_extents(font_name or "sans-serif", float(font_size), symbol)
+	if extents is None:
 		return 0.5
-	advance = max(1e-6, float(extents.x_advance))
-	center = float(extents.x_bearing) + (float(extents.width) * 0.5)
+	x_bearing, width, x_advance = extents
+	advance = max(1e-6, x_advance)
+	center = x_bearing + (width * 0.5)
 	factor = center / advance
 	return min(1.0, max(0.0, factor))
 
@@ -34,6 +34,7 @@ from oasa.render_lib.data_types import _normalize_element_symbol
 from oasa.render_lib.data_types import make_box_target
 from oasa.render_lib.data_types import make_circle_target
 from oasa.render_lib.data_types import make_composite_target
+from oasa.render_lib import font_metrics
 from oasa.render_lib.glyph_model import glyph_attach_primitive
 from oasa.render_lib.attach_resolution import _correct_endpoint_for_alignment
 from oasa.render_lib.attach_resolution import _min_distance_point_to_target_boundary
@@ -41,12 +42,6 @@ from oasa.render_lib.attach_resolution import _retreat_to_target_gap
 from oasa.render_lib.attach_resolution import resolve_attach_endpoint
 from oasa.render_lib.attach_resolution import retreat_endpoint_until_legal
 
-try:
-	import cairo as _cairo
-except ImportError:
-	_cairo = None
-
-
 #============================================
 def vertex_is_shown(vertex):
 	if vertex.properties_.get("label"):
@@ -113,27 +108,15 @@ def _text_char_advances(text, font_size, font_name):
 	if not visible:
 		return []
 	fallback = [font_size * 0.60] * len(visible)
-	if _cairo is None:
-		return fallback
-	try:
-		surface = _cairo.ImageSurface(_cairo.FORMAT_A8, 1, 1)
-		context = _cairo.Context(surface)
-		context.select_font_face(font_name or "sans-serif", 0, 0)
-	except Exception:
-		return fallback
 	segments = render_ops._text_segments(str(text or ""))
 	advances = []
 	for chunk, tags in segments:
 		segment_state = render_ops._segment_baseline_state(tags)
 		segment_size = render_ops._segment_font_size(font_size, segment_state)
-		context.set_font_size(segment_size)
-		previous_advance = 0.0
-		for index in range(len(chunk)):
-			prefix = chunk[: index + 1]
-			extents = context.text_extents(prefix)
-			char_advance = max(0.0, float(extents.x_advance) - previous_advance)
-			advances.append(char_advance)
-			previous_advance = float(extents.x_advance)
+		chunk_advances = font_metrics.char_advances(chunk, font_name or "sans-serif", segment_size)
+		if chunk_advances is None:
+			return fallback
+		advances.extend(chunk_advances)
 	if len(advances) != len(visible):
 		return fallback
 	return advances
@@ -150,14 +133,8 @@ def _text_ink_bearing_correction(text, font_size, font_name):
 	visible = _visible_label_text(text)
 	if not visible:
 		return (0.0, 0.0)
-	if _cairo is None:
-		return (0.0, 0.0)
-	try:
-		surface = _cairo.ImageSurface(_cairo.FORMAT_A8, 1, 1)
-		context = _cairo.Context(surface)
-		context.select_font_face(font_name or "sans-serif", 0, 0)
-	except Exception:
-		return (0.0, 0.0)
+	store = font_metrics.get_store()
+	font_name = font_name or "sans-serif"
 	segments = render_ops._text_segments(str(text or ""))
 	# Get left bearing of first segment's first character
 	left_bearing = 0.0
@@ -166,10 +143,10 @@ def _text_ink_bearing_correction(text, font_size, font_name):
 			continue
 		segment_state = render_ops._segment_baseline_state(tags)
 		segment_size = render_ops._segment_font_size(font_size, segment_state)
-		context.set_font_size(segment_size)
-		first_char = chunk[0]
-		extents = context.text_extents(first_char)
-		left_bearing = max(0.0, float(extents.x_bearing))
+		extents = store.text_extents(font_name, segment_size, chunk[0])
+		if extents is None:
+			return (0.0, 0.0)
+		left_bearing = max(0.0, extents[0])
 		break
 	# Get right bearing of last segment's last character
 	right_bearing = 0.0
@@ -178,12 +155,12 @@ def _text_ink_bearing_correction(text, font_size, font_name):
 			continue
 		segment_state = render_ops._segment_baseline_state(tags)
 		segment_size = render_ops._segment_font_size(font_size, segment_state)
-		context.set_font_size(segment_size)
-		last_char = chunk[-1]
-		extents = context.text_extents(last_char)
+		extents = store.text_extents(font_name, segment_size, chunk[-1])
+		if extents is None:
+			return (0.0, 0.0)
+		x_bearing, width, x_advance = extents
 		# right_bearing = advance - left_bearing - ink_width
-		char_right = float(extents.x_advance) - float(extents.x_bearing) - float(extents.width)
-		right_bearing = max(0.0, char_right)
+		right_bearing = max(0.0, x_advance - x_bearing - width)
 		break
 	return (left_bearing, right_bearing)
 
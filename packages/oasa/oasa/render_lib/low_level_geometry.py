@@ -27,6 +27,23 @@ from oasa import geometry
 from oasa import oasa_utils as misc
 from oasa.render_lib.data_types import _coerce_attach_target
 
+# NumPy is optional: the batched kernels use it, the scalar code does not
+_NOT_LOADED = object()
+_numpy = _NOT_LOADED
+
+
+#============================================
+def _numpy_module():
+	"""Return the numpy module, importing it on first use; None if missing."""
+	global _numpy
+	if _numpy is _NOT_LOADED:
+		try:
+			import numpy
+		except ImportError:
+			numpy = None
+		_numpy = numpy
+	return _numpy
+
 
 #============================================
 def _closest_point_on_segment(point, p1, p2):
@@ -182,6 +199,226 @@ def _capsule_intersects_target(seg_start, seg_end, half_width, target, epsilon):
 	raise ValueError(f"Unsupported attach target kind: {resolved.kind!r}")
 
 
+# ------------------------------------------------------------------
+# NumPy-batched kernels
+#
+# Each *_batch function mirrors the scalar function of the same name with
+# the same formulas and tolerances, so results match element for element.
+# Points are arrays of shape (..., 2) and boxes (..., 4); inputs broadcast,
+# so one segment against N targets and M segments (shape (M, 1, 2))
+# against N targets (shape (N, ...)) are both a single call.
+# ------------------------------------------------------------------
+
+#============================================
+def _orientation_batch(p1, p2, p3):
+	"""Batched _orientation(): 0 collinear, 1 clockwise, 2 counterclockwise."""
+	numpy = _numpy_module()
+	value = ((p2[..., 1] - p1[..., 1]) * (p3[..., 0] - p2[..., 0])) - (
+		(p2[..., 0] - p1[..., 0]) * (p3[..., 1] - p2[..., 1]))
+	return numpy.where(numpy.abs(value) <= 1e-12, 0, numpy.where(value > 0.0, 1, 2))
+
+
+#============================================
+def _on_segment_batch(p1, p2, q):
+	"""Batched _on_segment()."""
+	numpy = _numpy_module()
+	in_x = (numpy.minimum(p1[..., 0], p2[..., 0]) - 1e-12 <= q[..., 0]) & (
+		q[..., 0] <= numpy.maximum(p1[..., 0], p2[..., 0]) + 1e-12)
+	in_y = (numpy.minimum(p1[..., 1], p2[..., 1]) - 1e-12 <= q[..., 1]) & (
+		q[..., 1] <= numpy.maximum(p1[..., 1], p2[..., 1]) + 1e-12)
+	return in_x & in_y
+
+
+#============================================
+def _segments_intersect_batch(p1, p2, q1, q2):
+	"""Batched _segments_intersect(); returns a boolean array."""
+	numpy = _numpy_module()
+	p1, p2, q1, q2 = (numpy.asarray(p, dtype=float) for p in (p1, p2, q1, q2))
+	o1 = _orientation_batch(p1, p2, q1)
+	o2 = _orientation_batch(p1, p2, q2)
+	o3 = _orientation_batch(q1, q2, p1)
+	o4 = _orientation_batch(q1, q2, p2)
+	result = (o1 != o2) & (o3 != o4)
+	result |= (o1 == 0) & _on_segment_batch(p1, p2, q1)
+	result |= (o2 == 0) & _on_segment_batch(p1, p2, q2)
+	result |= (o3 == 0) & _on_segment_batch(q1, q2, p1)
+	result |= (o4 == 0) & _on_segment_batch(q1, q2, p2)
+	return result
+
+
+#============================================
+def _point_to_segment_distance_sq_batch(point, seg_start, seg_end):
+	"""Batched _point_to_segment_distance_sq()."""
+	numpy = _numpy_module()
+	point, seg_start, seg_end = (numpy.asarray(p, dtype=float) for p in (point, seg_start, seg_end))
+	px, py = point[..., 0], point[..., 1]
+	x1, y1 = seg_start[..., 0], seg_start[..., 1]
+	dx = seg_end[..., 0] - x1
+	dy = seg_end[..., 1] - y1
+	denominator = (dx * dx) + (dy * dy)
+	degenerate = denominator <= 1e-12
+	safe = numpy.where(degenerate, 1.0, denominator)
+	t_value = numpy.clip(((px - x1) * dx + (py - y1) * dy) / safe, 0.0, 1.0)
+	t_value = numpy.where(degenerate, 0.0, t_value)
+	closest_x = x1 + (dx * t_value)
+	closest_y = y1 + (dy * t_value)
+	return ((px - closest_x) * (px - closest_x)) + ((py - closest_y) * (py - closest_y))
+
+
+#============================================
+def _distance_sq_segment_to_segment_batch(p1, p2, q1, q2):
+	"""Batched _distance_sq_segment_to_segment()."""
+	numpy = _numpy_module()
+	distances = numpy.minimum(
+		numpy.minimum(
+			_point_to_segment_distance_sq_batch(p1, q1, q2),
+			_point_to_segment_distance_sq_batch(p2, q1, q2),
+		),
+		numpy.minimum(
+			_point_to_segment_distance_sq_batch(q1, p1, p2),
+			_point_to_segment_distance_sq_batch(q2, p1, p2),
+		),
+	)
+	return numpy.where(_segments_intersect_batch(p1, p2, q1, q2), 0.0, distances)
+
+
+#============================================
+def _segment_distance_to_box_sq_batch(seg_start, seg_end, boxes):
+	"""Batched _segment_distance_to_box_sq() against boxes of shape (..., 4)."""
+	numpy = _numpy_module()
+	seg_start = numpy.asarray(seg_start, dtype=float)
+	seg_end = numpy.asarray(seg_end, dtype=float)
+	boxes = numpy.asarray(boxes, dtype=float)
+	x1 = numpy.minimum(boxes[..., 0], boxes[..., 2])
+	x2 = numpy.maximum(boxes[..., 0], boxes[..., 2])
+	y1 = numpy.minimum(boxes[..., 1], boxes[..., 3])
+	y2 = numpy.maximum(boxes[..., 1], boxes[..., 3])
+	corners = (
+		numpy.stack((x1, y1), axis=-1),
+		numpy.stack((x2, y1), axis=-1),
+		numpy.stack((x2, y2), axis=-1),
+		numpy.stack((x1, y2), axis=-1),
+	)
+	start_inside = (x1 <= seg_start[..., 0]) & (seg_start[..., 0] <= x2) & (
+		y1 <= seg_start[..., 1]) & (seg_start[..., 1] <= y2)
+	end_inside = (x1 <= seg_end[..., 0]) & (seg_end[..., 0] <= x2) & (
+		y1 <= seg_end[..., 1]) & (seg_end[..., 1] <= y2)
+	# an edge crossing gives distance 0 from the segment-segment kernel
+	distance = None
+	for index in range(4):
+		edge_distance = _distance_sq_segment_to_segment_batch(
+			seg_start, seg_end, corners[index], corners[(index + 1) % 4])
+		distance = edge_distance if distance is None else numpy.minimum(distance, edge_distance)
+	return numpy.where(start_inside | end_inside, 0.0, distance)
+
+
+#============================================
+class AttachTargetArrays:
+	"""Attach targets flattened into primitive arrays for batched tests.
+
+	Composite targets are expanded into their box and circle children;
+	box_owner and circle_owner map each primitive back to its position in
+	targets. Segment targets never block a capsule and are dropped.
+
+	Attributes:
+		keys: Keys of the packed mapping (e.g. vertices), in order.
+		targets: AttachTarget objects in the same order.
+		boxes: (B, 4) normalized boxes.
+		box_owner: (B,) target index of each box.
+		circle_centers: (C, 2) circle centers.
+		circle_radii: (C,) circle radii.
+		circle_owner: (C,) target index of each circle.
+	"""
+
+	#============================================
+	def __init__(self, keys, targets):
+		numpy = _numpy_module()
+		self.keys = list(keys)
+		self.targets = [_coerce_attach_target(t) for t in targets]
+		boxes, box_owner, centers, radii, circle_owner = [], [], [], [], []
+		for index, target in enumerate(self.targets):
+			pending = [target]
+			while pending:
+				primitive = pending.pop()
+				if primitive.kind == "box":
+					boxes.append(misc.normalize_coords(primitive.box))
+					box_owner.append(index)
+				elif primitive.kind == "circle":
+					centers.append(primitive.center)
+					radii.append(float(primitive.radius))
+					circle_owner.append(index)
+				elif primitive.kind == "composite":
+					pending.extend(primitive.targets or ())
+				elif primitive.kind != "segment":
+					raise ValueError(f"Unsupported attach target kind: {primitive.kind!r}")
+		self.boxes = numpy.array(boxes, dtype=float).reshape(-1, 4)
+		self.box_owner = numpy.array(box_owner, dtype=numpy.intp)
+		self.circle_centers = numpy.array(centers, dtype=float).reshape(-1, 2)
+		self.circle_radii = numpy.array(radii, dtype=float)
+		self.circle_owner = numpy.array(circle_owner, dtype=numpy.intp)
+
+	#============================================
+	def __len__(self):
+		return len(self.targets)
+
+
+#============================================
+def pack_attach_targets(target_map):
+	"""Pack a {key: AttachTarget} mapping into AttachTargetArrays.
+
+	Returns None when NumPy is not installed; callers then use the scalar
+	_capsule_intersects_target() path.
+	"""
+	if _numpy_module() is None:
+		return None
+	return AttachTargetArrays(target_map.keys(), target_map.values())
+
+
+#============================================
+def _capsule_intersects_targets_batch(seg_start, seg_end, half_width, packed, epsilon,
+		candidates=None):
+	"""Batched _capsule_intersects_target() for one segment vs packed targets.
+
+	Args:
+		seg_start: (x, y) segment start.
+		seg_end: (x, y) segment end.
+		half_width: Capsule radius (half the stroke width).
+		packed: AttachTargetArrays.
+		epsilon: Inward tolerance, as in the scalar function.
+		candidates: Optional sequence of target indices to test (e.g. from
+			a spatial index query); other targets report False.
+
+	Returns:
+		Boolean array with one entry per packed target.
+	"""
+	numpy = _numpy_module()
+	hits = numpy.zeros(len(packed), dtype=bool)
+	seg_start = numpy.asarray(seg_start, dtype=float)
+	seg_end = numpy.asarray(seg_end, dtype=float)
+	boxes, box_owner = packed.boxes, packed.box_owner
+	centers, radii, circle_owner = packed.circle_centers, packed.circle_radii, packed.circle_owner
+	if candidates is not None:
+		selected = numpy.zeros(len(packed), dtype=bool)
+		selected[numpy.asarray(candidates, dtype=numpy.intp)] = True
+		box_keep = selected[box_owner]
+		boxes, box_owner = boxes[box_keep], box_owner[box_keep]
+		circle_keep = selected[circle_owner]
+		centers, radii, circle_owner = centers[circle_keep], radii[circle_keep], circle_owner[circle_keep]
+	if len(boxes):
+		inner = boxes + numpy.array((epsilon, epsilon, -epsilon, -epsilon))
+		valid = (inner[:, 0] < inner[:, 2]) & (inner[:, 1] < inner[:, 3])
+		distance_sq = _segment_distance_to_box_sq_batch(seg_start, seg_end, inner)
+		box_hits = valid & (distance_sq < (half_width * half_width))
+		hits[box_owner[box_hits]] = True
+	if len(radii):
+		effective = numpy.maximum(0.0, radii - epsilon)
+		distance_sq = _point_to_segment_distance_sq_batch(centers, seg_start, seg_end)
+		limit = half_width + effective
+		circle_hits = (effective > 0.0) & (distance_sq < (limit * limit))
+		hits[circle_owner[circle_hits]] = True
+	return hits
+
+
 #============================================
 def _point_in_attach_target(point, target, epsilon=0.0):
 	"""Return True when point is in strict interior of one target primitive."""
@@ -23,10 +23,13 @@
 from oasa import geometry
 from oasa import oasa_utils as misc
 from oasa import render_ops
+from oasa.molecule_lib import as_molecule
 from oasa.render_lib.data_types import ATTACH_GAP_TARGET
 from oasa.render_lib.data_types import ATTACH_PERP_TOLERANCE
+from oasa.render_lib.data_types import BATCH_GEOMETRY_MIN_TARGETS
 from oasa.render_lib.data_types import BondRenderContext
 from oasa.render_lib.data_types import HASHED_BOND_WEDGE_RATIO
+from oasa.render_lib.data_types import SPATIAL_INDEX_MIN_TARGETS
 from oasa.render_lib.data_types import _coerce_attach_target
 from oasa.render_lib.data_types import make_attach_constraints
 from oasa.render_lib.data_types import make_box_target
@@ -40,6 +43,8 @@ from oasa.render_lib.label_geometry import label_attach_target
 from oasa.render_lib.label_geometry import label_target
 from oasa.render_lib.label_geometry import vertex_is_shown
 from oasa.render_lib.label_geometry import vertex_label_text
+from oasa.render_lib.low_level_geometry import pack_attach_targets
+from oasa.render_lib.spatial_index import build_attach_target_grid
 from oasa.render_lib.bond_ops import build_bond_ops
 
 
@@ -382,11 +387,36 @@ def _edge_points(mol, transform_xy):
 	return points
 
 
+#============================================
+def label_target_accelerators(label_targets):
+	"""Build the optional lookup structures for bond-vs-label overlap tests.
+
+	Args:
+		label_targets: Dict of vertex -> label attach target.
+
+	Returns:
+		Tuple (packed_arrays, grid_index) for BondRenderContext's
+		label_target_arrays and label_target_index. Each entry is None when
+		there are too few labels for it to pay off.
+	"""
+	packed_arrays = None
+	if len(label_targets) >= BATCH_GEOMETRY_MIN_TARGETS:
+		packed_arrays = pack_attach_targets(label_targets)
+	grid_index = None
+	if len(label_targets) >= SPATIAL_INDEX_MIN_TARGETS:
+		grid_index = build_attach_target_grid(label_targets)
+	return packed_arrays, grid_index
+
+
 #============================================
 def molecule_to_ops(mol, style=None, transform_xy=None):
-	"""Convert one molecule into a render-ops list for SVG/Cairo painters."""
+	"""Convert one molecule into a render-ops list for SVG/Cairo painters.
+
+	Accepts an OASA Molecule or a FrozenMolecule.
+	"""
 	if mol is None:
 		return []
+	mol = as_molecule(mol)
 	used_style = _resolve_style(style)
 	bond_coords = _edge_points(mol, transform_xy=transform_xy)
 	# compute shown vertices, label targets, and attach targets via helper
@@ -403,6 +433,7 @@ def molecule_to_ops(mol, style=None, transform_xy=None):
 		alignment_tolerance=float(used_style["attach_perp_tolerance"]),
 		line_width=float(used_style["line_width"]),
 	)
+	label_target_arrays, label_target_index = label_target_accelerators(label_targets)
 	context = BondRenderContext(
 		molecule=mol,
 		line_width=float(used_style["line_width"]),
@@ -419,6 +450,8 @@ def molecule_to_ops(mol, style=None, transform_xy=None):
 		label_targets=label_targets,
 		attach_targets=attach_targets,
 		attach_constraints=attach_constraints,
+		label_target_arrays=label_target_arrays,
+		label_target_index=label_target_index,
 	)
 	ops = []
 	for edge in _render_edges_in_order(mol):
@@ -0,0 +1,130 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Uniform grid spatial index over attach targets."""
+
+# Standard Library
+import math
+
+# local repo modules
+from oasa import oasa_utils as misc
+from oasa.render_lib.data_types import _coerce_attach_target
+
+
+#============================================
+def _target_bounds(target):
+	"""Return the (x1, y1, x2, y2) bounding box of one attach target."""
+	resolved = _coerce_attach_target(target)
+	if resolved.kind == "box":
+		return misc.normalize_coords(resolved.box)
+	if resolved.kind == "circle":
+		cx, cy = resolved.center
+		radius = max(0.0, float(resolved.radius))
+		return (cx - radius, cy - radius, cx + radius, cy + radius)
+	if resolved.kind == "segment":
+		return misc.normalize_coords((resolved.p1[0], resolved.p1[1], resolved.p2[0], resolved.p2[1]))
+	if resolved.kind == "composite":
+		children = [_target_bounds(child) for child in (resolved.targets or ())]
+		if not children:
+			return None
+		return (
+			min(b[0] for b in children),
+			min(b[1] for b in children),
+			max(b[2] for b in children),
+			max(b[3] for b in children),
+		)
+	raise ValueError(f"Unsupported attach target kind: {resolved.kind!r}")
+
+
+#============================================
+class AttachTargetGrid:
+	"""Uniform grid bucketing attach targets by their bounding boxes.
+
+	Built once per render pass; query() returns the targets whose bounding
+	box comes within a margin of a segment's bounding box, which is a
+	superset of the targets a stroked segment of that half width can touch.
+
+	Attributes:
+		keys: Keys of the indexed mapping (e.g. vertices), in order.
+		targets: AttachTarget objects in the same order.
+		bounds: Bounding box per target (None for empty composites).
+		cell_size: Edge length of one square grid cell.
+	"""
+
+	#============================================
+	def __init__(self, keys, targets, cell_size=None):
+		self.keys = list(keys)
+		self.targets = [_coerce_attach_target(t) for t in targets]
+		self.bounds = [_target_bounds(t) for t in self.targets]
+		if cell_size is None:
+			cell_size = self._default_cell_size()
+		self.cell_size = float(cell_size)
+		self._cells = {}
+		for index, bounds in enumerate(self.bounds):
+			if bounds is None:
+				continue
+			for cell in self._cells_for(bounds):
+				self._cells.setdefault(cell, []).append(index)
+
+	#============================================
+	def _default_cell_size(self) -> float:
+		"""Twice the median target extent, so most targets span few cells."""
+		extents = sorted(
+			max(b[2] - b[0], b[3] - b[1]) for b in self.bounds if b is not None
+		)
+		if not extents:
+			return 1.0
+		return max(2.0 * extents[len(extents) // 2], 1e-6)
+
+	#============================================
+	def _cells_for(self, bounds):
+		"""Yield the (ix, iy) cells overlapped by one bounding box."""
+		size = self.cell_size
+		ix1 = math.floor(bounds[0] / size)
+		iy1 = math.floor(bounds[1] / size)
+		ix2 = math.floor(bounds[2] / size)
+		iy2 = math.floor(bounds[3] / size)
+		for ix in range(ix1, ix2 + 1):
+			for iy in range(iy1, iy2 + 1):
+				yield (ix, iy)
+
+	#============================================
+	def __len__(self):
+		return len(self.targets)
+
+	#============================================
+	def query(self, seg_start, seg_end, margin=0.0) -> list:
+		"""Return ascending indices of targets near one segment.
+
+		Args:
+			seg_start: (x, y) segment start.
+			seg_end: (x, y) segment end.
+			margin: Distance added around the segment bounding box, e.g.
+				the stroke half width.
+
+		Returns:
+			Sorted list of target indices whose bounding boxes overlap the
+			segment bounding box expanded by margin.
+		"""
+		x1, y1, x2, y2 = misc.normalize_coords((seg_start[0], seg_start[1], seg_end[0], seg_end[1]))
+		x1 -= margin
+		y1 -= margin
+		x2 += margin
+		y2 += margin
+		found = set()
+		for cell in self._cells_for((x1, y1, x2, y2)):
+			found.update(self._cells.get(cell, ()))
+		hits = []
+		for index in found:
+			bx1, by1, bx2, by2 = self.bounds[index]
+			if bx1 <= x2 and x1 <= bx2 and by1 <= y2 and y1 <= by2:
+				hits.append(index)
+		hits.sort()
+		return hits
+
+
+#============================================
+def build_attach_target_grid(target_map, cell_size=None):
+	"""Index a {key: AttachTarget} mapping in an AttachTargetGrid."""
+	return AttachTargetGrid(target_map.keys(), target_map.values(), cell_size=cell_size)
@@ -265,7 +265,28 @@ def _serialize_list(value, digits):
 
 
 #============================================
-def ops_to_json_dict(ops, round_digits=3):
+def _serialize_color(color, digits, keep_rgba):
+	if keep_rgba and isinstance(color, (tuple, list)):
+		return _serialize_list(color, digits)
+	return color_to_hex(color)
+
+
+#============================================
+def ops_to_json_dict(ops, round_digits=3, keep_rgba=False):
+	"""Serialize render ops to JSON-ready dicts in z order.
+
+	Args:
+		ops: Iterable of render ops.
+		round_digits: Digits kept for float values.
+		keep_rgba: Write tuple colors as [r, g, b(, a)] lists instead of hex
+			strings, so alpha survives a round trip through ops_from_json_dict().
+
+	Raises:
+		ValueError: For an object that is not one of the render op types.
+	"""
+	def _color(color):
+		return _serialize_color(color, round_digits, keep_rgba)
+
 	serialized = []
 	for op in sort_ops(ops):
 		if isinstance(op, LineOp):
@@ -276,15 +297,15 @@ def ops_to_json_dict(ops, round_digits=3):
 				"width": _serialize_number(op.width, round_digits),
 				"cap": op.cap,
 				"join": op.join,
-				"color": color_to_hex(op.color),
+				"color": _color(op.color),
 				"z": op.z,
 			}
 		elif isinstance(op, PolygonOp):
 			entry = {
 				"kind": "polygon",
 				"points": [ _serialize_list(point, round_digits) for point in op.points ],
-				"fill": color_to_hex(op.fill),
-				"stroke": color_to_hex(op.stroke),
+				"fill": _color(op.fill),
+				"stroke": _color(op.stroke),
 				"stroke_width": _serialize_number(op.stroke_width, round_digits),
 				"z": op.z,
 			}
@@ -293,8 +314,8 @@ def ops_to_json_dict(ops, round_digits=3):
 				"kind": "circle",
 				"center": _serialize_list(op.center, round_digits),
 				"radius": _serialize_number(op.radius, round_digits),
-				"fill": color_to_hex(op.fill),
-				"stroke": color_to_hex(op.stroke),
+				"fill": _color(op.fill),
+				"stroke": _color(op.stroke),
 				"stroke_width": _serialize_number(op.stroke_width, round_digits),
 				"z": op.z,
 			}
@@ -308,8 +329,8 @@ def ops_to_json_dict(ops, round_digits=3):
 			entry = {
 				"kind": "path",
 				"commands": commands,
-				"fill": color_to_hex(op.fill),
-				"stroke": color_to_hex(op.stroke),
+				"fill": _color(op.fill),
+				"stroke": _color(op.stroke),
 				"stroke_width": _serialize_number(op.stroke_width, round_digits),
 				"cap": op.cap,
 				"join": op.join,
@@ -325,11 +346,11 @@ def ops_to_json_dict(ops, round_digits=3):
 				"font_name": op.font_name,
 				"anchor": op.anchor,
 				"weight": op.weight,
-				"color": color_to_hex(op.color),
+				"color": _color(op.color),
 				"z": op.z,
 			}
 		else:
-			continue
+			raise ValueError(f"Unsupported render op: {type(op).__name__}")
 		if op.op_id:
 			entry["id"] = op.op_id
 		serialized.append(entry)
@@ -341,6 +362,94 @@ def ops_to_json_text(ops, round_digits=3):
 	return json.dumps(ops_to_json_dict(ops, round_digits=round_digits), indent=2, sort_keys=True)
 
 
+#============================================
+def _point(value):
+	return tuple(value)
+
+
+#============================================
+def _json_color(value):
+	if isinstance(value, list):
+		return tuple(value)
+	return value
+
+
+#============================================
+def ops_from_json_dict(entries):
+	"""Rebuild render ops from ops_to_json_dict() output.
+
+	Colors come back as hex strings, or as tuples when serialized with
+	keep_rgba=True. Numbers keep the rounding applied when serializing; the
+	ops are returned in serialized (sorted) order.
+	"""
+	ops = []
+	for entry in entries:
+		kind = entry.get("kind")
+		op_id = entry.get("id")
+		if kind == "line":
+			op = LineOp(
+				p1=_point(entry["p1"]),
+				p2=_point(entry["p2"]),
+				width=entry["width"],
+				cap=entry.get("cap", "butt"),
+				join=entry.get("join", ""),
+				color=_json_color(entry.get("color")),
+				z=entry.get("z", 0),
+				op_id=op_id,
+			)
+		elif kind == "polygon":
+			op = PolygonOp(
+				points=tuple(_point(point) for point in entry["points"]),
+				fill=_json_color(entry.get("fill")),
+				stroke=_json_color(entry.get("stroke")),
+				stroke_width=entry.get("stroke_width", 0.0),
+				z=entry.get("z", 0),
+				op_id=op_id,
+			)
+		elif kind == "circle":
+			op = CircleOp(
+				center=_point(entry["center"]),
+				radius=entry["radius"],
+				fill=_json_color(entry.get("fill")),
+				stroke=_json_color(entry.get("stroke")),
+				stroke_width=entry.get("stroke_width", 0.0),
+				z=entry.get("z", 0),
+				op_id=op_id,
+			)
+		elif kind == "path":
+			commands = tuple(
+				(cmd, None if payload is None else tuple(payload))
+				for cmd, payload in entry["commands"]
+			)
+			op = PathOp(
+				commands=commands,
+				fill=_json_color(entry.get("fill")),
+				stroke=_json_color(entry.get("stroke")),
+				stroke_width=entry.get("stroke_width", 0.0),
+				cap=entry.get("cap", ""),
+				join=entry.get("join", ""),
+				z=entry.get("z", 0),
+				op_id=op_id,
+			)
+		elif kind == "text":
+			op = TextOp(
+				x=entry["x"],
+				y=entry["y"],
+				text=entry["text"],
+				font_size=entry.get("font_size", 12.0),
+				font_name=entry.get("font_name", "sans-serif"),
+				anchor=entry.get("anchor", "start"),
+				weight=entry.get("weight", "normal"),
+				color=_json_color(entry.get("color")),
+				z=entry.get("z", 0),
+				op_id=op_id,
+			)
+		else:
+			raise ValueError(f"Unsupported render op kind: {kind!r}")
+		ops.append(op)
+	return ops
+
+
 #============================================
 def supports_text_ops():
 	return True
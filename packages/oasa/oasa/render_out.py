@@ -12,6 +12,7 @@ import xml.dom.minidom as dom
 # local repo modules
 from oasa import dom_extensions
 from oasa import molecule_utils
+from oasa import render_cache
 from oasa import render_ops
 from oasa.render_lib.molecule_ops import molecule_to_ops
 from oasa import svg_out
@@ -84,7 +85,18 @@ def _render_ops_for_mol(mol, *, margin, scaling, options):
 		return ((x - x1 + margin) * scaling, (y - y1 + margin) * scaling)
 
 	style = _extract_style(options, scaling)
-	ops = molecule_to_ops(mol, style=style, transform_xy=_transform_xy)
+	# caching is opt-in through an explicit ops_cache=RenderOpsCache(...)
+	cache = options.get("ops_cache")
+	key = None
+	ops = None
+	if cache is not None:
+		key = render_cache.render_key(mol, style, margin=margin, scaling=scaling)
+	if key is not None:
+		ops = cache.get(key)
+	if ops is None:
+		ops = molecule_to_ops(mol, style=style, transform_xy=_transform_xy)
+		if key is not None:
+			cache.put(key, ops)
 	width = int(round(((_molecule_bounds(mol)[2] - x1) + 2 * margin) * scaling))
 	height = int(round(((_molecule_bounds(mol)[3] - y1) + 2 * margin) * scaling))
 	return ops, max(1, width), max(1, height)
@@ -153,15 +165,7 @@ def _render_cairo(ops, output_target, fmt, width, height, options):
 
 
 #============================================
-def render_to_svg(mol, output_target, **options):
-	margin = float(options.get("margin", 15))
-	scaling = float(options.get("scaling", 1.0))
-	ops, width, height = _render_ops_for_mol(
-		mol,
-		margin=margin,
-		scaling=scaling,
-		options=options,
-	)
+def _write_svg(ops, output_target, width, height):
 	document = _ops_to_svg_document(ops, width, height)
 	text = svg_out.pretty_print_svg(document.toxml("utf-8"))
 	if hasattr(output_target, "write"):
@@ -172,6 +176,19 @@ def render_to_svg(mol, output_target, **options):
 	else:
 		with open(output_target, "w", encoding="utf-8") as handle:
 			handle.write(text)
+
+
+#============================================
+def render_to_svg(mol, output_target, **options):
+	margin = float(options.get("margin", 15))
+	scaling = float(options.get("scaling", 1.0))
+	ops, width, height = _render_ops_for_mol(
+		mol,
+		margin=margin,
+		scaling=scaling,
+		options=options,
+	)
+	_write_svg(ops, output_target, width, height)
 	return output_target
 
 
@@ -241,3 +258,59 @@ def mols_to_output(mols, output_target, fmt=None, **options):
 	if mol is None:
 		raise ValueError("No molecules supplied for rendering.")
 	return mol_to_output(mol, output_target, fmt=fmt or legacy_format, **options)
+
+
+#============================================
+def _default_scaling(fmt):
+	"""Return the scaling render_to_<fmt>() uses when none is given."""
+	if fmt == "png":
+		return 2.0
+	return 1.0
+
+
+#============================================
+def mol_to_outputs(mol, output_targets, **options):
+	"""Render one molecule to several formats, sharing ops where possible.
+
+	Label layout, attach resolution and bond ops run once per scaling, and
+	every target at that scaling is painted from the same ops. Each format
+	uses the scaling its render_to_*() function would use (``scaling``, or
+	2.0 for PNG and 1.0 otherwise), so every file matches the single-format
+	output. Without an explicit ``scaling``, PNG gets its own ops pass.
+
+	Args:
+		mol: Molecule or FrozenMolecule.
+		output_targets: Mapping of format -> path or file object, or an
+			iterable of paths whose extensions give the formats.
+		**options: Render options as for render_to_svg().
+
+	Returns:
+		Dict mapping format -> output target, in the order written.
+	"""
+	if hasattr(output_targets, "items"):
+		targets = [(fmt.lower(), target) for fmt, target in output_targets.items()]
+	else:
+		targets = [(_resolve_format(target, None), target) for target in output_targets]
+	for fmt, _target in targets:
+		if fmt not in ("svg", "png", "pdf", "ps"):
+			raise ValueError(f"Unsupported output format: {fmt}")
+	margin = float(options.get("margin", 15))
+	# scaling -> (ops, width, height)
+	rendered = {}
+	written = {}
+	for fmt, target in targets:
+		scaling = float(options.get("scaling", _default_scaling(fmt)))
+		if scaling not in rendered:
+			rendered[scaling] = _render_ops_for_mol(
+				mol,
+				margin=margin,
+				scaling=scaling,
+				options=options,
+			)
+		ops, width, height = rendered[scaling]
+		if fmt == "svg":
+			_write_svg(ops, target, width, height)
+		else:
+			_render_cairo(ops, target, fmt, width, height, options)
+		written[fmt] = target
+	return written
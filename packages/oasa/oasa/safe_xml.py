@@ -34,3 +34,12 @@ def parse_dom_from_file(path):
 def parse_dom_from_string(text):
 	"""Parse XML from a string into a minidom Document."""
 	return minidom.parseString(_to_bytes(text))
+
+
+#============================================
+def iterparse_xml(source, events=("end",)):
+	"""Incrementally parse XML from a path or binary file object.
+
+	Returns the defused ElementTree iterparse iterator of (event, element).
+	"""
+	return elementtree.iterparse(source, events=events)
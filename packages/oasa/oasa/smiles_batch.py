@@ -0,0 +1,226 @@
+"""Streaming batch SMILES-to-molecule pipeline with a process pool.
+
+Each record goes through smiles_lib.text_to_mol (RDKit parse, bridge
+conversion and RDKit 2D layout) inside a worker process. Workers send
+molecules back as compact tuples of plain values instead of pickled OASA
+object graphs, and the parent rebuilds Molecule objects. Results come back
+in input order, one BatchResult per record, with failures reported as
+BatchError values instead of raised exceptions.
+"""
+
+# Standard Library
+import os
+import time
+import collections
+import dataclasses
+import concurrent.futures
+
+# local repo modules
+from oasa import smiles_lib
+from oasa.atom_lib import Atom
+from oasa.bond_lib import Bond
+from oasa.molecule_lib import Molecule
+
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class BatchError:
+	"""Failure of one record, returned in place of a molecule."""
+	error_type: str
+	message: str
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class BatchResult:
+	"""Outcome of one input record.
+
+	Attributes:
+		index: Zero-based record number in the input stream.
+		smiles: The SMILES text of the record.
+		name: Optional record name (text after the SMILES on the line).
+		mol: The OASA Molecule, or None when the record failed.
+		error: A BatchError when the record failed, otherwise None.
+		seconds: Worker time spent on this record.
+	"""
+	index: int
+	smiles: str
+	name: str
+	mol: object
+	error: BatchError
+	seconds: float
+
+
+#============================================
+def pack_mol(mol) -> tuple:
+	"""Flatten a molecule into a tuple of plain values for pickling.
+
+	Args:
+		mol: OASA Molecule.
+
+	Returns:
+		Tuple (atoms, bonds) where atoms holds (symbol, charge, isotope,
+		multiplicity, x, y, z) per atom and bonds holds (atom_index1,
+		atom_index2, order, type, aromatic) per bond.
+	"""
+	index = {}
+	atoms = []
+	for i, a in enumerate(mol.vertices):
+		index[a] = i
+		atoms.append((a.symbol, a.charge, a.isotope, a.multiplicity, a.x, a.y, a.z))
+	bonds = []
+	for b in mol.edges:
+		v1, v2 = b.vertices
+		bonds.append((index[v1], index[v2], b.order, b.type, b.aromatic))
+	packed = (tuple(atoms), tuple(bonds))
+	return packed
+
+
+#============================================
+def unpack_mol(packed: tuple):
+	"""Rebuild an OASA Molecule from the output of pack_mol().
+
+	Args:
+		packed: Tuple produced by pack_mol().
+
+	Returns:
+		New OASA Molecule.
+	"""
+	atoms, bonds = packed
+	mol = Molecule()
+	vertices = []
+	for symbol, charge, isotope, multiplicity, x, y, z in atoms:
+		a = Atom(symbol=symbol, charge=charge)
+		a.isotope = isotope
+		a.multiplicity = multiplicity
+		a.x = x
+		a.y = y
+		a.z = z
+		mol.add_vertex(a)
+		vertices.append(a)
+	for i1, i2, order, bond_type, aromatic in bonds:
+		b = Bond(order=order, type=bond_type)
+		b.aromatic = aromatic
+		mol.add_edge(vertices[i1], vertices[i2], b)
+	return mol
+
+
+#============================================
+def split_record(line: str) -> tuple:
+	"""Split a SMILES file line into (smiles, name).
+
+	Args:
+		line: One input line; text after the first whitespace is the name.
+
+	Returns:
+		Tuple of (smiles, name), both stripped; name may be empty.
+	"""
+	parts = line.strip().split(None, 1)
+	if not parts:
+		return ("", "")
+	smiles = parts[0]
+	name = parts[1] if len(parts) > 1 else ""
+	return (smiles, name)
+
+
+#============================================
+def _convert_one(smiles: str, calc_coords, localize_aromatic_bonds: bool) -> tuple:
+	"""Convert one SMILES to a packed molecule or an error tuple."""
+	start = time.perf_counter()
+	packed = None
+	error = None
+	try:
+		packed = pack_mol(smiles_lib.text_to_mol(
+			smiles, calc_coords=calc_coords, localize_aromatic_bonds=localize_aromatic_bonds))
+	except Exception as exc:
+		error = (type(exc).__name__, str(exc))
+	seconds = time.perf_counter() - start
+	return (packed, error, seconds)
+
+
+#============================================
+def _convert_chunk(chunk: list, calc_coords, localize_aromatic_bonds: bool) -> list:
+	"""Worker entry point: convert a chunk of (index, smiles, name) records."""
+	out = []
+	for index, smiles, name in chunk:
+		packed, error, seconds = _convert_one(smiles, calc_coords, localize_aromatic_bonds)
+		out.append((index, smiles, name, packed, error, seconds))
+	return out
+
+
+#============================================
+def _to_result(row: tuple) -> BatchResult:
+	"""Turn a worker output row into a BatchResult with a real Molecule."""
+	index, smiles, name, packed, error, seconds = row
+	mol = None
+	batch_error = None
+	if error is not None:
+		batch_error = BatchError(error_type=error[0], message=error[1])
+	else:
+		mol = unpack_mol(packed)
+	result = BatchResult(index=index, smiles=smiles, name=name, mol=mol,
+		error=batch_error, seconds=seconds)
+	return result
+
+
+#============================================
+def _iter_chunks(lines, chunk_size: int):
+	"""Yield lists of (index, smiles, name), skipping blank and # lines."""
+	chunk = []
+	index = 0
+	for line in lines:
+		smiles, name = split_record(line)
+		if not smiles or smiles.startswith("#"):
+			continue
+		chunk.append((index, smiles, name))
+		index += 1
+		if len(chunk) >= chunk_size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+
+#============================================
+def iter_text_to_mols(lines, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+	calc_coords=1, localize_aromatic_bonds: bool = True):
+	"""Parse and lay out SMILES records in a process pool, streaming results.
+
+	Input is consumed lazily and at most a few chunks per worker are in
+	flight, so memory stays flat for arbitrarily long inputs.
+
+	Args:
+		lines: Iterable of lines, each 'SMILES [name]'. Blank lines and
+			lines starting with '#' are skipped.
+		workers: Number of worker processes; None uses os.cpu_count(),
+			0 or 1 converts in the calling process.
+		chunk_size: Records sent to a worker per task.
+		calc_coords: Passed to smiles_lib.text_to_mol.
+		localize_aromatic_bonds: Passed to smiles_lib.text_to_mol.
+
+	Yields:
+		BatchResult objects in input order.
+	"""
+	if workers is None:
+		workers = os.cpu_count() or 1
+	chunks = _iter_chunks(lines, max(1, chunk_size))
+	if workers <= 1:
+		for chunk in chunks:
+			for row in _convert_chunk(chunk, calc_coords, localize_aromatic_bonds):
+				yield _to_result(row)
+		return
+	max_pending = workers * 2
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+		pending = collections.deque()
+		for chunk in chunks:
+			pending.append(pool.submit(_convert_chunk, chunk, calc_coords, localize_aromatic_bonds))
+			# keep the window bounded and drain strictly in submission order
+			while len(pending) >= max_pending:
+				for row in pending.popleft().result():
+					yield _to_result(row)
+		while pending:
+			for row in pending.popleft().result():
+				yield _to_result(row)
@@ -774,8 +774,12 @@ converter = smiles_converter
 ## MODULE INTERFACE - oldstyle -- delegates to RDKit via rdkit_formats
 
 from oasa import coords_generator
+from oasa import smiles_batch
 from oasa.codecs import rdkit_formats
 
+# a bracket atom of element H ([H], [2H], [H+]), not [He], [Hg] or [NH4+]
+_EXPLICIT_HYDROGEN = re.compile(r"\[\d*H(?![a-z])")
+
 reads_text = True
 writes_text = True
 reads_files = True
@@ -816,8 +820,9 @@ def cxsmiles_to_mol(cxsmiles_text, localize_aromatic_bonds=True):
     raise ValueError("no CXSMILES coordinate block found")
   smiles = cxsmiles_text[:sep_idx]
   coord_block = cxsmiles_text[sep_idx + len(sep):]
+  # drop anything after the closing '|' (e.g. a record name), then
   # strip closing delimiters: '))|' or ')|' and leading '('
-  coord_block = coord_block.rstrip("|").strip("()")
+  coord_block = coord_block.split("|", 1)[0].strip("()")
 
   # parse coordinates from the block: "x1,y1,;x2,y2,;..."
   coords = []
@@ -850,6 +855,59 @@ def cxsmiles_to_mol(cxsmiles_text, localize_aromatic_bonds=True):
   return mol
 
 
+#============================================
+def mol_to_cxsmiles(smiles_text, mol):
+  """Append the 2D coordinates of mol to smiles_text as a CXSMILES block.
+
+  Inverse of cxsmiles_to_mol(): mol must have been parsed from
+  smiles_text with text_to_mol(), so that vertex order matches SMILES
+  string atom order. text_to_mol() drops explicit [H] atoms; such input is
+  written as the SMILES RDKit gives for the molecule without them, so
+  every atom of the written SMILES gets its own coordinates.
+
+  Args:
+    smiles_text: the SMILES string mol was parsed from.
+    mol: Molecule with x, y coordinates set on each vertex.
+
+  Returns:
+    CXSMILES string 'SMILES |(x1,y1,;x2,y2,;...)|'.
+  """
+  vertices = mol.vertices
+  if _EXPLICIT_HYDROGEN.search(smiles_text):
+    smiles_text, order = rdkit_formats.smiles_text_as_read(smiles_text)
+    vertices = [mol.vertices[i] for i in order]
+  if len(vertices) != len(mol.vertices):
+    raise ValueError(
+      f"atom count {len(mol.vertices)} != SMILES atom count {len(vertices)}"
+    )
+  pairs = ";".join(f"{v.x:.4f},{v.y:.4f}," for v in vertices)
+  return f"{smiles_text} |({pairs})|"
+
+
+#============================================
+def iter_text_to_mols(lines, workers=None, chunk_size=None, calc_coords=1,
+  localize_aromatic_bonds=True):
+  """Convert many SMILES lines in a process pool, yielding ordered results.
+
+  See oasa.smiles_batch.iter_text_to_mols() for details.
+
+  Args:
+    lines: iterable of 'SMILES [name]' lines.
+    workers: number of worker processes (None = all CPUs).
+    chunk_size: records per worker task (None = module default).
+    calc_coords: passed to text_to_mol().
+    localize_aromatic_bonds: passed to text_to_mol().
+
+  Returns:
+    Generator of smiles_batch.BatchResult objects in input order.
+  """
+  if chunk_size is None:
+    chunk_size = smiles_batch.DEFAULT_CHUNK_SIZE
+  return smiles_batch.iter_text_to_mols(lines, workers=workers,
+    chunk_size=chunk_size, calc_coords=calc_coords,
+    localize_aromatic_bonds=localize_aromatic_bonds)
+
+
 def mol_to_file( mol, f):
   text = mol_to_text( mol)
   import io
@@ -2,19 +2,38 @@
 
 Two-tier approach:
   Tier 1 (exact match): Pre-built lookup table from all sugar codes in
-  sugar_codes.yaml, indexed by SMILES string. High confidence.
-  Tier 2 (structural inference): Parse the SMILES into a molecule and
-  analyze ring structure, substituents, and stereochemistry. Best effort.
+  sugar_codes.yaml, indexed by canonical isomeric SMILES (RDKit), so any
+  spelling of a known sugar is found with one hash lookup. High
+  confidence.
+  Tier 2 (structural inference): Parse the SMILES into a molecule, find
+  its sugar rings and look up each ring type with the molecule's element,
+  bond order and stereocenter counts. Best effort.
+
+Both tables are built once per process from the generated SMILES of
+every sugar code, and can be saved to and loaded from a JSON file with
+save_index() and load_index().
 """
 
 # Standard Library
+import os
+import json
+import hashlib
+import threading
 import dataclasses
 
+# PIP3 modules
+import rdkit
+
 # local repo modules
 from oasa import sugar_code
 from oasa import sugar_code_smiles
 from oasa import sugar_code_names
 from oasa import smiles_lib as smiles_module
+from oasa.codecs import rdkit_formats
+
+
+# bump when the stored table layout or the key definitions change
+INDEX_FORMAT_VERSION = 1
 
 
 #============================================
@@ -34,21 +53,63 @@ class SugarCodeError(ValueError):
 	pass
 
 
-# Module-level lookup table, built lazily on first use
+# Module-level lookup tables, built lazily on first use
 _LOOKUP_TABLE = None
+_INFERENCE_TABLE = None
+
+
+#============================================
+def _canonical_key(smiles_text: str):
+	"""Return the canonical isomeric SMILES of smiles_text, or None."""
+	try:
+		return rdkit_formats.smiles_canonical_text(smiles_text)
+	except ValueError:
+		return None
+
+
+#============================================
+def _structure_signature(mol) -> str:
+	"""Return the element, bond order and stereocenter counts of mol as a key."""
+	atoms = {}
+	for a in mol.atoms:
+		atoms[a.symbol] = atoms.get(a.symbol, 0) + 1
+	bonds = {}
+	for b in mol.bonds:
+		bonds[b.order] = bonds.get(b.order, 0) + 1
+	stereo = len(getattr(mol, 'stereochemistry', []))
+	atom_text = ",".join(f"{symbol}{count}" for symbol, count in sorted(atoms.items()))
+	bond_text = ",".join(f"{order}:{count}" for order, count in sorted(bonds.items(), key=str))
+	return f"{atom_text}|{bond_text}|{stereo}"
+
+
+#============================================
+def _inference_key(ring_type: str, mol) -> str:
+	return f"{ring_type}|{_structure_signature(mol)}"
 
 
 #============================================
-def _build_lookup_table() -> dict:
-	"""Build the SMILES -> SugarCodeResult lookup from all sugar codes.
+def _build_lookup_tables() -> tuple:
+	"""Build the exact and inference tables from all sugar codes.
 
 	Iterates over all entries in sugar_codes.yaml and generates SMILES for
 	each valid (code, ring_type, anomeric) combination using Phase 6.
+	Each generated SMILES is parsed once here, never per query.
+
+	Returns:
+		Tuple (exact, inferred). exact maps canonical SMILES, and the
+		generated spelling as an alias, to an "exact_match" result.
+		inferred maps _inference_key() to the first "inferred" result in
+		code, then alpha/beta, order.
 	"""
-	table = {}
+	exact = {}
+	inferred = {}
 	names = sugar_code_names.all_sugar_names()
 	for code_str in sorted(names.keys()):
 		display_name = names[code_str]
+		try:
+			num_positions = len(sugar_code.parse(code_str).positions)
+		except ValueError:
+			num_positions = None
 		for ring in ("pyranose", "furanose"):
 			for anom in ("alpha", "beta"):
 				try:
@@ -63,20 +124,120 @@ def _build_lookup_table() -> dict:
 					name=display_name,
 					confidence="exact_match",
 				)
-				# Store both the raw SMILES and the OASA-parsed canonical form
-				table[smi] = result
-	return table
+				exact[smi] = result
+				key = _canonical_key(smi)
+				if key is not None:
+					exact[key] = result
+				if num_positions is None:
+					continue
+				try:
+					candidate_mol = smiles_module.text_to_mol(smi, calc_coords=0)
+				except Exception:
+					continue
+				# inference only offers codes whose carbons are all backbone
+				carbons = sum(1 for a in candidate_mol.atoms if a.symbol == "C")
+				if carbons != num_positions:
+					continue
+				inferred.setdefault(_inference_key(ring, candidate_mol),
+					dataclasses.replace(result, confidence="inferred"))
+	return (exact, inferred)
 
 
 #============================================
-def _get_lookup_table() -> dict:
-	"""Return the cached lookup table, building it on first access."""
-	global _LOOKUP_TABLE
+def _source_fingerprint() -> str:
+	"""Hash of everything the tables are built from."""
+	digest = hashlib.sha256()
+	digest.update(f"{INDEX_FORMAT_VERSION}|{rdkit.__version__}".encode("ascii"))
+	for path in (sugar_code_names.DATA_PATH, sugar_code_smiles.__file__):
+		with open(path, "rb") as handle:
+			digest.update(handle.read())
+	return digest.hexdigest()
+
+
+#============================================
+def _ensure_tables() -> None:
+	global _LOOKUP_TABLE, _INFERENCE_TABLE
 	if _LOOKUP_TABLE is None:
-		_LOOKUP_TABLE = _build_lookup_table()
+		_LOOKUP_TABLE, _INFERENCE_TABLE = _build_lookup_tables()
+
+
+#============================================
+def _get_lookup_table() -> dict:
+	"""Return the cached canonical-key table, building it on first access."""
+	_ensure_tables()
 	return _LOOKUP_TABLE
 
 
+#============================================
+def _get_inference_table() -> dict:
+	"""Return the cached inference table, building it on first access."""
+	_ensure_tables()
+	return _INFERENCE_TABLE
+
+
+#============================================
+def save_index(path: str) -> None:
+	"""Write both lookup tables to a JSON file.
+
+	Args:
+		path: Output file path; written atomically.
+	"""
+	def rows(table):
+		return {key: [r.sugar_code, r.ring_type, r.anomeric, r.name] for key, r in table.items()}
+
+	data = {
+		"format": INDEX_FORMAT_VERSION,
+		"source": _source_fingerprint(),
+		"exact": rows(_get_lookup_table()),
+		"inferred": rows(_get_inference_table()),
+	}
+	temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+	try:
+		with open(temp_path, "w", encoding="utf-8") as handle:
+			json.dump(data, handle, separators=(",", ":"), sort_keys=True)
+		os.replace(temp_path, path)
+	finally:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+
+
+#============================================
+def load_index(path: str) -> bool:
+	"""Use the tables saved by save_index() instead of building them.
+
+	The file is ignored when it is missing, unreadable, or was built from
+	a different sugar_codes.yaml, SMILES generator or RDKit version.
+
+	Args:
+		path: File written by save_index().
+
+	Returns:
+		True when the saved tables are now in use.
+	"""
+	global _LOOKUP_TABLE, _INFERENCE_TABLE
+	try:
+		with open(path, "r", encoding="utf-8") as handle:
+			data = json.load(handle)
+	except (OSError, ValueError):
+		return False
+	if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT_VERSION:
+		return False
+	if data.get("source") != _source_fingerprint():
+		return False
+
+	def results(rows, confidence):
+		return {key: SugarCodeResult(*row, confidence=confidence) for key, row in rows.items()}
+
+	try:
+		exact = results(data["exact"], "exact_match")
+		inferred = results(data["inferred"], "inferred")
+	except (KeyError, TypeError, AttributeError):
+		return False
+	_LOOKUP_TABLE = exact
+	_INFERENCE_TABLE = inferred
+	return True
+
+
 #============================================
 def smiles_to_sugar_code(smiles_text: str) -> SugarCodeResult:
 	"""Convert a SMILES string to a sugar code.
@@ -99,17 +260,20 @@ def smiles_to_sugar_code(smiles_text: str) -> SugarCodeResult:
 	table = _get_lookup_table()
 	if clean in table:
 		return table[clean]
+	key = _canonical_key(clean)
+	if key in table:
+		return table[key]
 
 	# Tier 2: Structural inference from the molecule
-	return _infer_from_molecule(clean, table)
+	return _infer_from_molecule(clean, _get_inference_table())
 
 
 #============================================
 def _infer_from_molecule(smiles_text: str, table: dict) -> SugarCodeResult:
 	"""Tier 2: Analyze molecule structure to determine sugar code.
 
-	Parses the SMILES, identifies the sugar ring, and maps substituent
-	stereochemistry back to Fischer projection R/L codes.
+	Parses the SMILES, identifies the sugar rings, and looks up each ring
+	type with the molecule's structure signature.
 	"""
 	# Parse the SMILES into a molecule
 	mol = _safe_parse(smiles_text)
@@ -156,87 +320,12 @@ def _find_sugar_rings(mol) -> list:
 
 #============================================
 def _try_ring(mol, ring_atoms: list, table: dict) -> SugarCodeResult:
-	"""Try to match a ring to a sugar code by regenerating SMILES and looking up."""
-	# Identify ring type from ring size
-	ring_size = len(ring_atoms)
-	if ring_size == 5:
+	"""Look up a ring by ring type and the molecule's structure signature."""
+	if len(ring_atoms) == 5:
 		ring_type = "furanose"
 	else:
 		ring_type = "pyranose"
-
-	# Count total carbons in the molecule to estimate sugar size
-	all_carbons = [a for a in mol.atoms if a.symbol == "C"]
-	num_carbons = len(all_carbons)
-
-	# Try generating SMILES for plausible sugar codes and compare
-	# This uses Phase 6 to regenerate SMILES for candidate sugar codes
-	# and checks if they produce the same molecular structure
-	names = sugar_code_names.all_sugar_names()
-	for code_str in sorted(names.keys()):
-		# Quick filter: carbon count should match
-		try:
-			parsed = sugar_code.parse(code_str)
-		except ValueError:
-			continue
-		if len(parsed.positions) != num_carbons:
-			continue
-		for anom in ("alpha", "beta"):
-			try:
-				candidate_smi = sugar_code_smiles.sugar_code_to_smiles(
-					code_str, ring_type, anom,
-				)
-			except ValueError:
-				continue
-			# Compare molecules by checking atom counts and connectivity
-			if _molecules_match(mol, candidate_smi):
-				return SugarCodeResult(
-					sugar_code=code_str,
-					ring_type=ring_type,
-					anomeric=anom,
-					name=names[code_str],
-					confidence="inferred",
-				)
-	return None
-
-
-#============================================
-def _molecules_match(mol, candidate_smiles: str) -> bool:
-	"""Check if two molecules represent the same structure.
-
-	Compares atom counts and bond connectivity as a heuristic.
-	"""
-	try:
-		candidate_mol = smiles_module.text_to_mol(candidate_smiles, calc_coords=0)
-	except Exception:
-		return False
-
-	# Compare atom counts by element
-	def atom_counts(m):
-		counts = {}
-		for a in m.atoms:
-			counts[a.symbol] = counts.get(a.symbol, 0) + 1
-		return counts
-
-	if atom_counts(mol) != atom_counts(candidate_mol):
-		return False
-
-	# Compare bond counts by order
-	def bond_counts(m):
-		counts = {}
-		for b in m.bonds:
-			counts[b.order] = counts.get(b.order, 0) + 1
-		return counts
-
-	if bond_counts(mol) != bond_counts(candidate_mol):
-		return False
-
-	# Compare stereochemistry count
-	mol_stereo = len(getattr(mol, 'stereochemistry', []))
-	cand_stereo = len(getattr(candidate_mol, 'stereochemistry', []))
-	if mol_stereo != cand_stereo:
-		return False
-
-	return True
+	return table.get(_inference_key(ring_type, mol))
 
 
 #============================================
@@ -0,0 +1,550 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Headless, indexed substructure search over a directory of drawings.
+
+A SubstructureIndex keeps one entry per CDML or CD-SVG file (plain or
+gzipped) with the molecules it contains, stored compactly together with
+their heavy-atom element counts and a path fingerprint. Entries are
+validated by file size and modification time, so re-opening an index
+only parses files that changed. The index persists as one JSON file.
+
+Searching screens every indexed molecule against the query's element
+counts and fingerprint, which never rejects a true match, and runs the
+real matcher (Molecule.contains_substructure) on what is left, in a
+process pool. Programs with a GUI should use the "spawn" start method
+(mp_context) so the workers are not forked from the GUI process.
+"""
+
+# Standard Library
+import os
+import gzip
+import json
+import time
+import zlib
+import threading
+import collections
+import dataclasses
+import multiprocessing
+import concurrent.futures
+
+# local repo modules
+from oasa import cdml
+from oasa.atom_lib import Atom
+from oasa.bond_lib import Bond
+from oasa.molecule_lib import Molecule
+from oasa.query_atom import QueryAtom
+
+
+# bump when the stored molecule, count or fingerprint layout changes
+INDEX_FORMAT_VERSION = 1
+DEFAULT_INDEX_NAME = ".oasa_substructure_index.json"
+FILE_EXTENSIONS = (".cdml", ".svg", ".cdml.gz", ".svgz")
+FINGERPRINT_BITS = 1024
+# longest linear path, in bonds, hashed into the fingerprint
+MAX_PATH_BONDS = 3
+DEFAULT_CHUNK_SIZE = 50
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class IndexedMolecule:
+	"""One molecule of an indexed file.
+
+	Attributes:
+		packed: Compact molecule from pack_mol().
+		counts: Heavy-atom element counts, symbol -> count.
+		fingerprint: Path fingerprint as an int bit set.
+	"""
+	packed: tuple
+	counts: dict
+	fingerprint: int
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class IndexEntry:
+	"""Index record of one file.
+
+	Attributes:
+		path: File path relative to the indexed directory.
+		mtime_ns: Modification time the entry was built from.
+		size: File size the entry was built from.
+		molecules: Tuple of IndexedMolecule.
+		error: Reason the file could not be read, otherwise None.
+	"""
+	path: str
+	mtime_ns: int
+	size: int
+	molecules: tuple
+	error: str = None
+
+
+#============================================
+@dataclasses.dataclass(frozen=True)
+class SearchHit:
+	"""A file molecule containing the query.
+
+	Attributes:
+		path: Absolute file path.
+		molecule_index: Position of the molecule among the file molecules.
+	"""
+	path: str
+	molecule_index: int
+
+
+#============================================
+@dataclasses.dataclass
+class SearchStats:
+	"""Counters of the last search."""
+	files: int = 0
+	molecules: int = 0
+	candidates: int = 0
+	matches: int = 0
+	seconds: float = 0.0
+
+
+#============================================
+def _is_plain_heavy_atom(v) -> bool:
+	return isinstance(v, Atom) and v.symbol != "H"
+
+
+#============================================
+def pack_mol(mol) -> tuple:
+	"""Flatten a molecule to the values substructure matching reads.
+
+	Args:
+		mol: OASA Molecule; vertices may be Atom or QueryAtom.
+
+	Returns:
+		Tuple (atoms, bonds). Atoms hold (symbol, charge, multiplicity,
+		valency, explicit_hydrogens, free_sites, is_query) and bonds hold
+		(atom_index1, atom_index2, order).
+	"""
+	index = {}
+	atoms = []
+	for i, v in enumerate(mol.vertices):
+		index[v] = i
+		is_query = isinstance(v, QueryAtom)
+		atoms.append((
+			v.symbol, v.charge, v.multiplicity, v.valency,
+			getattr(v, "explicit_hydrogens", 0), v.free_sites, is_query,
+		))
+	bonds = []
+	for e in mol.edges:
+		v1, v2 = e.vertices
+		bonds.append((index[v1], index[v2], e.order))
+	packed = (tuple(atoms), tuple(bonds))
+	return packed
+
+
+#============================================
+def unpack_mol(packed) -> Molecule:
+	"""Rebuild a Molecule from the output of pack_mol() (tuples or lists)."""
+	atoms, bonds = packed
+	mol = Molecule()
+	vertices = []
+	for symbol, charge, multiplicity, valency, explicit_hydrogens, free_sites, is_query in atoms:
+		if is_query:
+			v = QueryAtom()
+			v.symbol = symbol
+		else:
+			v = Atom(symbol=symbol)
+			v.explicit_hydrogens = explicit_hydrogens
+		v.charge = charge
+		v.multiplicity = multiplicity
+		v.valency = valency
+		v.free_sites = free_sites
+		mol.add_vertex(v)
+		vertices.append(v)
+	for i1, i2, order in bonds:
+		mol.add_edge(vertices[i1], vertices[i2], Bond(order=order))
+	return mol
+
+
+#============================================
+def element_counts(mol) -> dict:
+	"""Return heavy-atom counts of the plain (non-query) atoms of mol."""
+	counts = collections.Counter(v.symbol for v in mol.vertices if _is_plain_heavy_atom(v))
+	return dict(counts)
+
+
+#============================================
+def _feature_bit(text: str) -> int:
+	# crc32 is stable across processes, unlike hash() of a str
+	return 1 << (zlib.crc32(text.encode("ascii", "replace")) % FINGERPRINT_BITS)
+
+
+#============================================
+def fingerprint(mol, max_bonds: int = MAX_PATH_BONDS) -> int:
+	"""Return the linear-path fingerprint of mol as an int bit set.
+
+	Every simple path of up to max_bonds bonds through plain heavy atoms
+	sets one bit for its symbols and bond orders. A path in a query maps
+	onto a path with the same symbols and orders in any molecule the
+	query matches, so a match needs query_fp & mol_fp == query_fp.
+
+	Args:
+		mol: OASA Molecule.
+		max_bonds: Longest path length in bonds.
+
+	Returns:
+		Fingerprint with FINGERPRINT_BITS possible bits.
+	"""
+	heavy = [v for v in mol.vertices if _is_plain_heavy_atom(v)]
+	heavy_set = set(heavy)
+	neighbors = {}
+	for v in heavy:
+		neighbors[v] = [(e.order, n) for e, n in v.get_neighbor_edge_pairs() if n in heavy_set]
+	bits = 0
+	seen = set()
+
+	def walk(v, labels, visited):
+		nonlocal bits
+		forward = "".join(labels)
+		backward = "".join(reversed(labels))
+		key = min(forward, backward)
+		if key not in seen:
+			seen.add(key)
+			bits |= _feature_bit(key)
+		if len(visited) > max_bonds:
+			return
+		for order, n in neighbors[v]:
+			if n in visited:
+				continue
+			visited.add(n)
+			labels.append(str(order))
+			labels.append(n.symbol)
+			walk(n, labels, visited)
+			labels.pop()
+			labels.pop()
+			visited.discard(n)
+
+	for v in heavy:
+		walk(v, [v.symbol], {v})
+	return bits
+
+
+#============================================
+def describe_mol(mol) -> IndexedMolecule:
+	"""Pack mol and compute its prefilter data."""
+	return IndexedMolecule(packed=pack_mol(mol), counts=element_counts(mol), fingerprint=fingerprint(mol))
+
+
+#============================================
+def may_contain(candidate: IndexedMolecule, query: IndexedMolecule) -> bool:
+	"""Cheap screen: False only when candidate cannot contain query."""
+	fp = query.fingerprint
+	if candidate.fingerprint & fp != fp:
+		return False
+	counts = candidate.counts
+	for symbol, count in query.counts.items():
+		if counts.get(symbol, 0) < count:
+			return False
+	return True
+
+
+#============================================
+def read_drawing_molecules(path: str) -> list:
+	"""Read the molecules of a CDML or CD-SVG file, gzipped or not.
+
+	Args:
+		path: File path.
+
+	Returns:
+		List of connected OASA Molecules in document order.
+	"""
+	with open(path, "rb") as handle:
+		gzipped = handle.read(2) == b"\x1f\x8b"
+	opener = gzip.open if gzipped else open
+	with opener(path, "rb") as handle:
+		mols = list(cdml.read_cdml_file(handle))
+	return mols
+
+
+#============================================
+def _index_file(directory: str, rel_path: str) -> IndexEntry:
+	"""Build the entry of one file; read errors are kept in the entry."""
+	path = os.path.join(directory, rel_path)
+	try:
+		stat = os.stat(path)
+	except OSError as exc:
+		# gone since the scan; the next update() looks at it again
+		return IndexEntry(path=rel_path, mtime_ns=-1, size=-1, molecules=(),
+			error=f"{type(exc).__name__}: {exc}")
+	molecules = ()
+	error = None
+	try:
+		molecules = tuple(describe_mol(mol) for mol in read_drawing_molecules(path))
+	except Exception as exc:
+		error = f"{type(exc).__name__}: {exc}"
+	entry = IndexEntry(path=rel_path, mtime_ns=stat.st_mtime_ns, size=stat.st_size,
+		molecules=molecules, error=error)
+	return entry
+
+
+#============================================
+def _index_chunk(directory: str, rel_paths: list) -> list:
+	"""Worker entry point: index a chunk of files."""
+	return [_index_file(directory, rel_path) for rel_path in rel_paths]
+
+
+#============================================
+def _search_chunk(packed_query: tuple, implicit_freesites: bool, candidates: list) -> list:
+	"""Worker entry point: match the query against (key, packed) candidates."""
+	query = unpack_mol(packed_query)
+	found = []
+	for key, packed in candidates:
+		mol = unpack_mol(packed)
+		if mol.contains_substructure(query, implicit_freesites=implicit_freesites):
+			found.append(key)
+	return found
+
+
+#============================================
+def _chunks(items, size: int):
+	chunk = []
+	for item in items:
+		chunk.append(item)
+		if len(chunk) >= size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+
+#============================================
+def _map_chunks(func, chunks, workers: int, mp_context, *args):
+	"""Yield func(*args, chunk) results in order, in a pool when workers > 1."""
+	if workers <= 1:
+		for chunk in chunks:
+			yield func(*args, chunk)
+		return
+	if isinstance(mp_context, str):
+		mp_context = multiprocessing.get_context(mp_context)
+	max_pending = workers * 2
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+		pending = collections.deque()
+		for chunk in chunks:
+			pending.append(pool.submit(func, *args, chunk))
+			# keep the window bounded and drain strictly in submission order
+			while len(pending) >= max_pending:
+				yield pending.popleft().result()
+		while pending:
+			yield pending.popleft().result()
+
+
+#============================================
+def _entry_to_json(entry: IndexEntry) -> dict:
+	data = {
+		"mtime_ns": entry.mtime_ns,
+		"size": entry.size,
+		"molecules": [
+			{"packed": m.packed, "counts": m.counts, "fingerprint": format(m.fingerprint, "x")}
+			for m in entry.molecules
+		],
+	}
+	if entry.error:
+		data["error"] = entry.error
+	return data
+
+
+#============================================
+def _entry_from_json(rel_path: str, data: dict) -> IndexEntry:
+	molecules = tuple(
+		IndexedMolecule(packed=m["packed"], counts=m["counts"], fingerprint=int(m["fingerprint"], 16))
+		for m in data["molecules"]
+	)
+	entry = IndexEntry(path=rel_path, mtime_ns=data["mtime_ns"], size=data["size"],
+		molecules=molecules, error=data.get("error"))
+	return entry
+
+
+#============================================
+class SubstructureIndex:
+	"""Persistent search index of the drawings in one directory.
+
+	Args:
+		directory: Directory holding CDML/CD-SVG files.
+		index_path: JSON file for the index; None uses DEFAULT_INDEX_NAME
+			inside directory, False keeps the index in memory only.
+		recursive: Also index subdirectories.
+		workers: Worker processes; None uses os.cpu_count(), 0 or 1 work
+			in the calling process.
+		chunk_size: Files or molecules sent to a worker per task.
+		mp_context: multiprocessing context or start method name ("spawn")
+			for the worker pool; None uses the platform default.
+	"""
+
+	#============================================
+	def __init__(self, directory: str, index_path=None, recursive: bool = False,
+		workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE, mp_context=None) -> None:
+		self.directory = os.path.abspath(directory)
+		if index_path is None:
+			index_path = os.path.join(self.directory, DEFAULT_INDEX_NAME)
+		self.index_path = index_path
+		self.recursive = recursive
+		if workers is None:
+			workers = os.cpu_count() or 1
+		self.workers = workers
+		self.chunk_size = max(1, chunk_size)
+		self.mp_context = mp_context
+		self.entries = {}
+		self.last_search = SearchStats()
+		self._dirty = False
+		self.load()
+
+	#============================================
+	def load(self) -> None:
+		"""Read the index file; a missing or outdated file gives an empty index."""
+		self.entries = {}
+		if not self.index_path or not os.path.isfile(self.index_path):
+			return
+		try:
+			with open(self.index_path, "r", encoding="utf-8") as handle:
+				data = json.load(handle)
+		except (OSError, ValueError):
+			return
+		if data.get("format") != INDEX_FORMAT_VERSION or data.get("fingerprint_bits") != FINGERPRINT_BITS:
+			return
+		for rel_path, entry_data in data.get("files", {}).items():
+			self.entries[rel_path] = _entry_from_json(rel_path, entry_data)
+
+	#============================================
+	def save(self) -> bool:
+		"""Write the index file atomically, if it changed since load().
+
+		The index is a cache, so an unwritable location is not an error:
+		the index then lives in memory only and False is returned.
+		"""
+		if not self.index_path or not self._dirty:
+			return True
+		data = {
+			"format": INDEX_FORMAT_VERSION,
+			"fingerprint_bits": FINGERPRINT_BITS,
+			"files": {rel_path: _entry_to_json(e) for rel_path, e in sorted(self.entries.items())},
+		}
+		temp_path = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+		try:
+			with open(temp_path, "w", encoding="utf-8") as handle:
+				json.dump(data, handle, separators=(",", ":"))
+			os.replace(temp_path, self.index_path)
+		except OSError:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			return False
+		self._dirty = False
+		return True
+
+	#============================================
+	def scan(self) -> dict:
+		"""Return {relative path: (mtime_ns, size)} of the searchable files."""
+		found = {}
+		index_name = os.path.basename(self.index_path) if self.index_path else None
+		for root, dirs, files in os.walk(self.directory):
+			if not self.recursive:
+				dirs[:] = []
+			dirs.sort()
+			for name in sorted(files):
+				if name == index_name or not name.lower().endswith(FILE_EXTENSIONS):
+					continue
+				path = os.path.join(root, name)
+				try:
+					stat = os.stat(path)
+				except OSError:
+					continue
+				found[os.path.relpath(path, self.directory)] = (stat.st_mtime_ns, stat.st_size)
+		return found
+
+	#============================================
+	def update(self, progress=None) -> int:
+		"""Bring the index in line with the directory and save it.
+
+		Files whose size and modification time match their entry are not
+		read again; new and changed files are indexed in the pool.
+
+		Args:
+			progress: Called as progress("index", done, total) after each
+				chunk of (re)indexed files.
+
+		Returns:
+			Number of files (re)indexed or dropped.
+		"""
+		found = self.scan()
+		changed = 0
+		for rel_path in list(self.entries):
+			if rel_path not in found:
+				del self.entries[rel_path]
+				changed += 1
+		stale = []
+		for rel_path, (mtime_ns, size) in found.items():
+			entry = self.entries.get(rel_path)
+			if entry is None or entry.mtime_ns != mtime_ns or entry.size != size:
+				stale.append(rel_path)
+		done = 0
+		for entries in _map_chunks(_index_chunk, _chunks(stale, self.chunk_size),
+				self.workers, self.mp_context, self.directory):
+			for entry in entries:
+				self.entries[entry.path] = entry
+				changed += 1
+			done += len(entries)
+			if progress:
+				progress("index", done, len(stale))
+		if changed:
+			self._dirty = True
+		self.save()
+		return changed
+
+	#============================================
+	def search(self, query, implicit_freesites: bool = True, refresh: bool = True,
+		progress=None) -> list:
+		"""Return SearchHit for each indexed molecule containing query.
+
+		Args:
+			query: OASA Molecule used as the fragment (may hold QueryAtoms).
+			implicit_freesites: Passed to Molecule.contains_substructure().
+			refresh: Call update() first.
+			progress: Called as progress(stage, done, total) after each
+				chunk; stage is "index" while files are (re)indexed and
+				"match" while candidate molecules are matched.
+
+		Returns:
+			List of SearchHit sorted by path and molecule index.
+		"""
+		start = time.perf_counter()
+		if refresh:
+			self.update(progress=progress)
+		query_info = describe_mol(query)
+		stats = SearchStats(files=len(self.entries))
+		candidates = []
+		for rel_path, entry in sorted(self.entries.items()):
+			for i, indexed in enumerate(entry.molecules):
+				stats.molecules += 1
+				if may_contain(indexed, query_info):
+					candidates.append(((rel_path, i), indexed.packed))
+		stats.candidates = len(candidates)
+		hits = []
+		done = 0
+		chunks = list(_chunks(candidates, self.chunk_size))
+		results = _map_chunks(_search_chunk, chunks, self.workers, self.mp_context,
+			query_info.packed, implicit_freesites)
+		for chunk, keys in zip(chunks, results):
+			for rel_path, i in keys:
+				hits.append(SearchHit(path=os.path.join(self.directory, rel_path), molecule_index=i))
+			done += len(chunk)
+			if progress:
+				progress("match", done, len(candidates))
+		stats.matches = len(hits)
+		stats.seconds = time.perf_counter() - start
+		self.last_search = stats
+		return hits
+
+	#============================================
+	def matching_files(self, query, implicit_freesites: bool = True, refresh: bool = True,
+		progress=None) -> list:
+		"""Return sorted absolute paths of files with a molecule containing query."""
+		hits = self.search(query, implicit_freesites=implicit_freesites, refresh=refresh,
+			progress=progress)
+		paths = sorted(set(hit.path for hit in hits))
+		return paths
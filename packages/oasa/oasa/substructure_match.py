@@ -0,0 +1,427 @@
+#--------------------------------------------------------------------------
+#     This file is part of OASA - a free chemical python library
+#--------------------------------------------------------------------------
+
+"""Re-entrant substructure matching for OASA molecules.
+
+A VF2-style matcher: query atoms are mapped one at a time in a fixed
+order in which every atom (after the first of each fragment) is bonded
+to an already mapped one, and an explicit stack of candidate lists
+replaces the recursion. Candidates are screened up front by atom
+matches(), degree and ring membership.
+
+Both molecules are only read. Hydrogens that the search needs but that
+are not drawn as atoms (free valency and explicit_hydrogens of the
+target, explicit_hydrogens of the query) become virtual nodes of the
+search graphs, and all search state lives in the generator, so any
+number of searches may run at the same time on the same molecules.
+
+Matching rules, kept from the original thread-based matcher:
+	- a plain query atom matches a target atom when
+	  target.matches(query) is true, so charge is compared only when the
+	  query atom is charged; a QueryAtom decides with query.matches(target);
+	- the start atom, the first plain query atom of the least common
+	  symbol, is checked with query.matches(target) instead, so for it
+	  charge is compared only when the target atom is charged;
+	- bonds match when target_bond.matches(query_bond) is true;
+	- target hydrogens are only considered when the query has hydrogens,
+	  explicit_hydrogens or a QueryAtom allowing H or R;
+	- every target atom may have at most as many unmatched neighbors
+	  (hydrogens included) as its query atom has free_sites, or
+	  free_valency with implicit_freesites.
+"""
+
+# local repo modules
+from oasa.atom_lib import Atom
+from oasa.bond_lib import Bond
+from oasa.query_atom import QueryAtom
+
+
+# shared stand-ins for virtual hydrogens and their bonds, never modified
+_HYDROGEN = None
+_HYDROGEN_BOND = None
+
+
+#============================================
+def _virtual_hydrogen() -> tuple:
+	"""Return the (atom, bond) used to match virtual hydrogens."""
+	global _HYDROGEN, _HYDROGEN_BOND
+	if _HYDROGEN is None:
+		_HYDROGEN_BOND = Bond(order=1)
+		_HYDROGEN = Atom(symbol='H')
+	return (_HYDROGEN, _HYDROGEN_BOND)
+
+
+#============================================
+def atoms_match(query_vertex, target_vertex, start: bool = False) -> bool:
+	"""Return True when target_vertex can be the image of query_vertex.
+
+	Args:
+		query_vertex: Atom or QueryAtom of the query.
+		target_vertex: Atom of the target.
+		start: query_vertex is the start atom, see start_node().
+	"""
+	if start or isinstance(query_vertex, QueryAtom):
+		return query_vertex.matches(target_vertex)
+	return target_vertex.matches(query_vertex)
+
+
+#============================================
+def start_node(objects) -> int:
+	"""Return the node the original matcher started from, or -1.
+
+	That is the first plain Atom of the least common symbol, counting
+	virtual hydrogens; ties go to the symbol seen first.
+	"""
+	counts = {}
+	for v in objects:
+		if isinstance(v, Atom):
+			counts[v.symbol] = counts.get(v.symbol, 0) + 1
+	if not counts:
+		return -1
+	symbol = min(counts, key=counts.get)
+	for node, v in enumerate(objects):
+		if isinstance(v, Atom) and v.symbol == symbol:
+			return node
+	return -1
+
+
+#============================================
+def needs_hydrogens(query) -> bool:
+	"""Return True when the query can map atoms onto target hydrogens."""
+	for v in query.vertices:
+		if isinstance(v, Atom) and (v.symbol == 'H' or v.explicit_hydrogens > 0):
+			return True
+		if isinstance(v, QueryAtom) and ('H' in v.symbols or 'R' in v.symbols):
+			return True
+	return False
+
+
+#============================================
+def _ring_vertices(mol) -> set:
+	"""Return the vertices of mol that lie on a ring."""
+	ring_vertices = set()
+	for ring in mol.get_smallest_independent_cycles():
+		ring_vertices.update(ring)
+	return ring_vertices
+
+
+#============================================
+def _match_key(v) -> tuple:
+	"""Key under which atoms always give the same matches() answers."""
+	if isinstance(v, Atom):
+		return ('atom', v.symbol, v.valency, v.multiplicity, v.charge)
+	return ('vertex', id(v))
+
+
+#============================================
+class SearchGraph:
+	"""Read-only index view of a molecule, with virtual hydrogen nodes.
+
+	Node i < len(mol.vertices) is mol.vertices[i]; higher nodes are
+	virtual hydrogens. The molecule itself is never modified. A target
+	view may be shared by any number of searches with queries of the same
+	needs_hydrogens() value, as long as the molecule is not edited.
+
+	Attributes:
+		objects: Atom of each node; virtual hydrogens share one stand-in.
+		parent: Atom node a virtual hydrogen hangs on, -1 for real atoms.
+		adjacency: Per node, dict of neighbor node -> bond.
+		in_ring: Per node, whether it lies on a ring.
+		real_count: Number of real atoms.
+		extra: Per real node, hydrogens counted as unmatched neighbors
+			without being nodes.
+		buckets: Real nodes grouped by _match_key(), so matches() is
+			asked once per group.
+		bucket_matches: atoms_match() results per (plain query Atom key,
+			bucket key, start flag), shared by every search that reuses this view.
+		hydrogens: Whether free valencies became virtual hydrogens.
+	"""
+
+	#============================================
+	def __init__(self, mol, virtual_counts, extra=None, hydrogens: bool = False) -> None:
+		vertices = list(mol.vertices)
+		index = {v: i for i, v in enumerate(vertices)}
+		ring_vertices = _ring_vertices(mol)
+		self.objects = list(vertices)
+		self.parent = [-1] * len(vertices)
+		self.adjacency = [{} for v in vertices]
+		self.in_ring = [v in ring_vertices for v in vertices]
+		self.real_count = len(vertices)
+		self.extra = list(extra) if extra is not None else [0] * len(vertices)
+		self.hydrogens = hydrogens
+		self.buckets = {}
+		self.bucket_matches = {}
+		for i, v in enumerate(vertices):
+			self.buckets.setdefault(_match_key(v), []).append(i)
+			for e, n in v.get_neighbor_edge_pairs():
+				self.adjacency[i][index[n]] = e
+		hydrogen, hydrogen_bond = _virtual_hydrogen()
+		for i, count in enumerate(virtual_counts):
+			for _ in range(count):
+				node = len(self.objects)
+				self.objects.append(hydrogen)
+				self.parent.append(i)
+				self.adjacency.append({i: hydrogen_bond})
+				self.in_ring.append(False)
+				self.adjacency[i][node] = hydrogen_bond
+
+	#============================================
+	@classmethod
+	def for_target(cls, mol, hydrogens: bool) -> 'SearchGraph':
+		"""Build the view searched in.
+
+		Args:
+			mol: Target molecule.
+			hydrogens: Add each atom's free valency and explicit_hydrogens
+				as virtual hydrogens; see needs_hydrogens().
+		"""
+		virtual_counts = []
+		extra = []
+		for v in mol.vertices:
+			explicit = getattr(v, 'explicit_hydrogens', 0)
+			if hydrogens:
+				virtual_counts.append(max(0, v.free_valency) + explicit)
+				extra.append(0)
+			else:
+				virtual_counts.append(0)
+				extra.append(explicit)
+		return cls(mol, virtual_counts, extra=extra, hydrogens=hydrogens)
+
+	#============================================
+	@classmethod
+	def for_query(cls, mol) -> 'SearchGraph':
+		"""Build the view searched for; explicit_hydrogens become nodes."""
+		return cls(mol, [getattr(v, 'explicit_hydrogens', 0) for v in mol.vertices])
+
+	#============================================
+	def is_virtual(self, node: int) -> bool:
+		"""Return True for a virtual hydrogen node."""
+		return node >= self.real_count
+
+
+#============================================
+class SubstructureMatcher:
+	"""All matches of one query molecule in one target molecule.
+
+	The constructor only builds index views of both molecules; the
+	search runs lazily in matches(). Neither molecule may be edited while
+	a search over them is in progress.
+
+	Args:
+		target: Molecule searched in.
+		query: Molecule searched for; it may contain QueryAtom vertices.
+		implicit_freesites: Use each query atom's free_valency instead of
+			its free_sites as the number of unmatched neighbors allowed.
+		target_graph: Prebuilt SearchGraph.for_target() view to reuse; it
+			is rebuilt when its hydrogens flag does not fit the query.
+		query_graph: Prebuilt SearchGraph.for_query() view to reuse.
+	"""
+
+	#============================================
+	def __init__(self, target, query, implicit_freesites: bool = False,
+		target_graph: SearchGraph = None, query_graph: SearchGraph = None) -> None:
+		hydrogens = needs_hydrogens(query)
+		if target_graph is None or target_graph.hydrogens != hydrogens:
+			target_graph = SearchGraph.for_target(target, hydrogens)
+		if query_graph is None:
+			query_graph = SearchGraph.for_query(query)
+		self.target = target_graph
+		self.query = query_graph
+		self.free_limit = []
+		for node, v in enumerate(self.query.objects):
+			if self.query.is_virtual(node):
+				self.free_limit.append(0)
+			elif implicit_freesites:
+				self.free_limit.append(v.free_valency)
+			else:
+				self.free_limit.append(v.free_sites)
+		self.start = start_node(self.query.objects)
+		self.candidates = [self._screen(node) for node in range(len(self.query.objects))]
+		self.order, self.anchor = self._match_order()
+
+	#============================================
+	def _screen(self, query_node: int) -> tuple:
+		"""Return (real target candidates, virtual hydrogens allowed)."""
+		target = self.target
+		query_object = self.query.objects[query_node]
+		degree = len(self.query.adjacency[query_node])
+		ring = self.query.in_ring[query_node]
+		query_key = _match_key(query_object)
+		start = query_node == self.start
+		# id() based keys of other vertices could be reused after they are freed
+		cacheable = isinstance(query_object, Atom)
+		real = []
+		for key, nodes in target.buckets.items():
+			cache_key = (query_key, key, start)
+			matched = target.bucket_matches.get(cache_key) if cacheable else None
+			if matched is None:
+				matched = atoms_match(query_object, target.objects[nodes[0]], start)
+				if cacheable:
+					target.bucket_matches[cache_key] = matched
+			if not matched:
+				continue
+			for node in nodes:
+				if len(target.adjacency[node]) < degree or (ring and not target.in_ring[node]):
+					continue
+				real.append(node)
+		hydrogen_ok = (
+			target.real_count < len(target.objects)
+			and degree <= 1 and not ring
+			and atoms_match(query_object, target.objects[-1], start)
+		)
+		return (frozenset(real), hydrogen_ok)
+
+	#============================================
+	def _selectivity(self, query_node: int) -> int:
+		"""Number of target nodes that could be the image of query_node."""
+		real, hydrogen_ok = self.candidates[query_node]
+		count = len(real)
+		if hydrogen_ok:
+			count += len(self.target.objects) - self.target.real_count
+		return count
+
+	#============================================
+	def _match_order(self) -> tuple:
+		"""Return (query nodes in match order, anchor node of each or -1).
+
+		The most selective atom starts; then the next atom is always a
+		neighbor of the mapped ones, preferring atoms with more mapped
+		neighbors and fewer candidates. Each disconnected query fragment
+		starts again from its most selective atom.
+		"""
+		adjacency = self.query.adjacency
+		remaining = set(range(len(adjacency)))
+		order = []
+		anchor = []
+		placed = {}
+		while remaining:
+			frontier = [n for n in remaining if any(m in placed for m in adjacency[n])]
+			if frontier:
+				node = min(frontier, key=lambda n: (
+					-sum(1 for m in adjacency[n] if m in placed), self._selectivity(n), n))
+				anchor.append(min((m for m in adjacency[node] if m in placed), key=placed.get))
+			else:
+				node = min(remaining, key=lambda n: (self._selectivity(n), n))
+				anchor.append(-1)
+			placed[node] = len(order)
+			order.append(node)
+			remaining.discard(node)
+		return (order, anchor)
+
+	#============================================
+	def _step_candidates(self, step: int, image: list, used: set) -> list:
+		"""Return target nodes to try for the query atom at step.
+
+		Virtual hydrogens of one atom are interchangeable, so only the
+		first unused one of each atom is offered.
+		"""
+		target = self.target
+		real, hydrogen_ok = self.candidates[self.order[step]]
+		anchor = self.anchor[step]
+		if anchor >= 0:
+			pool = target.adjacency[image[anchor]]
+		else:
+			pool = range(len(target.objects))
+		found = []
+		hydrogen_parents = set()
+		for node in pool:
+			if node in used:
+				continue
+			if target.is_virtual(node):
+				parent = target.parent[node]
+				if hydrogen_ok and parent not in hydrogen_parents:
+					hydrogen_parents.add(parent)
+					found.append(node)
+			elif node in real:
+				found.append(node)
+		# candidates are popped from the end, so they are tried in order
+		found.reverse()
+		return found
+
+	#============================================
+	def _bonds_match(self, query_node: int, target_node: int, image: list) -> bool:
+		"""Check the bonds from query_node to already mapped query atoms."""
+		target_bonds = self.target.adjacency[target_node]
+		for neighbor, query_bond in self.query.adjacency[query_node].items():
+			mapped = image[neighbor]
+			if mapped is None:
+				continue
+			target_bond = target_bonds.get(mapped)
+			if target_bond is None or not target_bond.matches(query_bond):
+				return False
+		return True
+
+	#============================================
+	def _free_sites_match(self, image: list, used: set) -> bool:
+		"""Check that no target atom has more unmatched neighbors than allowed."""
+		target = self.target
+		for query_node, target_node in enumerate(image):
+			unmatched = sum(1 for n in target.adjacency[target_node] if n not in used)
+			if not target.is_virtual(target_node):
+				unmatched += target.extra[target_node]
+			if unmatched > self.free_limit[query_node]:
+				return False
+		return True
+
+	#============================================
+	def mappings(self):
+		"""Yield each complete mapping as a list of target nodes per query node."""
+		size = len(self.order)
+		if not size:
+			return
+		image = [None] * size
+		used = set()
+		stack = [self._step_candidates(0, image, used)]
+		while stack:
+			step = len(stack) - 1
+			query_node = self.order[step]
+			if image[query_node] is not None:
+				used.discard(image[query_node])
+				image[query_node] = None
+			candidates = stack[-1]
+			while candidates:
+				target_node = candidates.pop()
+				if self._bonds_match(query_node, target_node, image):
+					break
+			else:
+				stack.pop()
+				continue
+			image[query_node] = target_node
+			used.add(target_node)
+			if step + 1 < size:
+				stack.append(self._step_candidates(step + 1, image, used))
+			elif self._free_sites_match(image, used):
+				yield list(image)
+
+	#============================================
+	def matches(self):
+		"""Yield matched target atoms, in query atom order, once per atom set.
+
+		Target hydrogens that are not drawn as atoms are left out, so a
+		match may be shorter than the query.
+		"""
+		target = self.target
+		seen = set()
+		for image in self.mappings():
+			atoms = [target.objects[node] for node in image if not target.is_virtual(node)]
+			key = frozenset(atoms)
+			if key in seen:
+				continue
+			seen.add(key)
+			yield atoms
+
+
+#============================================
+def iter_matches(target, query, implicit_freesites: bool = False):
+	"""Yield the atoms of target matching query; see SubstructureMatcher."""
+	matcher = SubstructureMatcher(target, query, implicit_freesites=implicit_freesites)
+	return matcher.matches()
+
+
+#============================================
+def has_match(target, query, implicit_freesites: bool = True) -> bool:
+	"""Return True when query occurs in target."""
+	for _atoms in iter_matches(target, query, implicit_freesites=implicit_freesites):
+		return True
+	return False
@@ -28,6 +28,7 @@ from oasa.render_lib.data_types import BondRenderContext
 from oasa.render_lib.data_types import make_attach_constraints
 from oasa.render_lib.label_geometry import label_target
 from oasa.render_lib.bond_ops import build_bond_ops
+from oasa.render_lib.molecule_ops import label_target_accelerators
 from oasa.render_lib.molecule_ops import _resolved_vertex_label_layout
 from oasa.render_lib.molecule_ops import build_vertex_ops
 from oasa import transform_lib as transform
@@ -106,6 +107,7 @@ class svg_out(object):
       )
       label_targets[v] = target
     constraints = make_attach_constraints(line_width=self.line_width)
+    label_target_arrays, label_target_index = label_target_accelerators( label_targets)
     self._bond_context = BondRenderContext(
       molecule=self.molecule,
       line_width=self.line_width,
@@ -122,6 +124,8 @@ class svg_out(object):
       label_targets=label_targets,
       attach_targets=label_targets,
       attach_constraints=constraints,
+      label_target_arrays=label_target_arrays,
+      label_target_index=label_target_index,
     )
 
     if before:
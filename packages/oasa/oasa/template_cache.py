@@ -0,0 +1,186 @@
+"""Persistent cache of laid-out molecules for SMILES-defined templates.
+
+Template tools in BKChem and BKChem-Qt turn a SMILES string into a
+molecule with 2D coordinates on first use, which costs an RDKit parse
+and layout per template and per session. TemplateCache keeps the
+result in a JSON file in the user config directory: the copyable
+attributes of every atom and bond, keyed by SMILES. A later session,
+in either application, rebuilds the molecule from those attributes
+without calling RDKit.
+
+The file header records the OASA version, the CDML version, the RDKit
+version and a hash of the parsing and layout modules; a file written
+under any other header is ignored and rewritten.
+"""
+
+# Standard Library
+import os
+import json
+import hashlib
+import importlib.metadata
+
+# PIP3 modules
+import rdkit
+
+# local repo modules
+from oasa import cdml_writer
+from oasa import coords_generator
+from oasa import rdkit_bridge
+from oasa import smiles_lib
+from oasa.atom_lib import Atom as atom
+from oasa.bond_lib import Bond as bond
+from oasa.codecs import rdkit_formats
+from oasa.molecule_lib import Molecule as molecule
+
+
+CACHE_FORMAT_VERSION = 1
+
+# shared TemplateCache instances keyed by file path
+_CACHES = {}
+
+
+#============================================
+def _oasa_version() -> str:
+	"""Installed OASA version, or 'source' when run from the repo tree."""
+	try:
+		return importlib.metadata.version("oasa")
+	except importlib.metadata.PackageNotFoundError:
+		return "source"
+
+
+#============================================
+def _source_fingerprint() -> str:
+	"""Hash of the modules that turn SMILES into laid-out molecules."""
+	digest = hashlib.sha256()
+	for module in (rdkit_formats, rdkit_bridge, coords_generator):
+		with open(module.__file__, "rb") as handle:
+			digest.update(handle.read())
+	return digest.hexdigest()
+
+
+#============================================
+def _cache_header() -> dict:
+	return {
+		"format": CACHE_FORMAT_VERSION,
+		"oasa": _oasa_version(),
+		"cdml": cdml_writer.DEFAULT_CDML_VERSION,
+		"rdkit": rdkit.__version__,
+		"source": _source_fingerprint(),
+	}
+
+
+#============================================
+def pack_layout(mol):
+	"""Return the copyable attributes of mol as JSON data, or None.
+
+	Atoms and bonds are recorded through their attrs_to_copy, the same
+	attributes Graph.deep_copy() carries over. None is returned when a
+	value would not survive a JSON round trip.
+	"""
+	index = {v: i for i, v in enumerate(mol.vertices)}
+	atoms = [[getattr(v, name) for name in atom.attrs_to_copy] for v in mol.vertices]
+	bonds = []
+	for e in mol.edges:
+		v1, v2 = e.vertices
+		bonds.append([index[v1], index[v2]] + [getattr(e, name) for name in bond.attrs_to_copy])
+	data = {"atoms": atoms, "bonds": bonds}
+	try:
+		if json.loads(json.dumps(data)) != data:
+			return None
+	except (TypeError, ValueError):
+		return None
+	return data
+
+
+#============================================
+def unpack_layout(data):
+	"""Rebuild a molecule from pack_layout() data."""
+	mol = molecule()
+	vertices = []
+	for values in data["atoms"]:
+		v = atom()
+		for name, value in zip(atom.attrs_to_copy, values):
+			setattr(v, name, value)
+		mol.add_vertex(v)
+		vertices.append(v)
+	for values in data["bonds"]:
+		e = bond()
+		for name, value in zip(bond.attrs_to_copy, values[2:]):
+			setattr(e, name, value)
+		mol.add_edge(vertices[values[0]], vertices[values[1]], e)
+	return mol
+
+
+#============================================
+class TemplateCache:
+	"""Laid-out template molecules stored in one JSON file.
+
+	Entries are read on first use and written back, merged with entries
+	other processes saved meanwhile, each time a new layout is added.
+
+	Args:
+		path: Cache file path; the directory is created when needed.
+	"""
+
+	#============================================
+	def __init__(self, path: str):
+		self.path = path
+		self.header = _cache_header()
+		self._layouts = None
+
+	#============================================
+	def _read_file(self) -> dict:
+		"""Return the layouts stored on disk, {} if missing or stale."""
+		try:
+			with open(self.path, "r", encoding="utf-8") as handle:
+				data = json.load(handle)
+		except (OSError, ValueError):
+			return {}
+		if not isinstance(data, dict) or data.get("header") != self.header:
+			return {}
+		return data.get("layouts", {})
+
+	#============================================
+	def _write_file(self) -> bool:
+		"""Merge with the file on disk and replace it; False on failure."""
+		merged = self._read_file()
+		merged.update(self._layouts)
+		self._layouts = merged
+		tmp_path = f"{self.path}.{os.getpid()}.tmp"
+		try:
+			os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+			with open(tmp_path, "w", encoding="utf-8") as handle:
+				json.dump({"header": self.header, "layouts": merged}, handle)
+			os.replace(tmp_path, self.path)
+		except OSError:
+			return False
+		return True
+
+	#============================================
+	def layout(self, smiles_text: str):
+		"""Return smiles_lib.text_to_mol(smiles_text, calc_coords=1).
+
+		The first request for a SMILES runs RDKit and stores the result;
+		later ones, in this or a later session, rebuild it from the file.
+		"""
+		if self._layouts is None:
+			self._layouts = self._read_file()
+		data = self._layouts.get(smiles_text)
+		if data is not None:
+			return unpack_layout(data)
+		mol = smiles_lib.text_to_mol(smiles_text, calc_coords=1)
+		data = pack_layout(mol)
+		if data is not None:
+			self._layouts[smiles_text] = data
+			self._write_file()
+		return mol
+
+
+#============================================
+def get_cache(path: str) -> TemplateCache:
+	"""Return the shared TemplateCache for path."""
+	cache = _CACHES.get(path)
+	if cache is None:
+		cache = TemplateCache(path)
+		_CACHES[path] = cache
+	return cache
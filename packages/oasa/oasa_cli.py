@@ -6,6 +6,7 @@ import argparse
 import importlib.util
 import os
 import sys
+import time
 
 
 #============================================
@@ -15,15 +16,48 @@ if OASA_DIR not in sys.path:
 
 
 # local repo modules
+from oasa.haworth import batch as haworth_batch
 from oasa.haworth import layout as haworth_layout
 from oasa import render_out
+from oasa import smiles_batch
 from oasa import smiles_lib as smiles
+from oasa import substructure_index
 
 
 #============================================
 DEFAULT_BOND_LENGTH = 30
 
 
+#============================================
+RENDER_FORMATS = ("svg", "png", "pdf", "ps")
+
+
+#============================================
+def _parse_formats(text):
+	"""Parse a comma-separated --formats value.
+
+	Args:
+		text (str): Value such as "svg,png,pdf".
+
+	Returns:
+		list[str]: Unique lower-case formats in the given order.
+	"""
+	formats = []
+	for item in text.split(","):
+		fmt = item.strip().lower()
+		if not fmt:
+			continue
+		if fmt not in RENDER_FORMATS:
+			raise argparse.ArgumentTypeError(
+				f"unsupported format {fmt!r}; choose from {', '.join(RENDER_FORMATS)}"
+			)
+		if fmt not in formats:
+			formats.append(fmt)
+	if not formats:
+		raise argparse.ArgumentTypeError("no formats given")
+	return formats
+
+
 #============================================
 def parse_args(argv=None):
 	"""Parse command-line arguments.
@@ -83,6 +117,154 @@ def parse_args(argv=None):
 		default=None,
 		help="Anomeric stereo for substituent placement (default: none)"
 	)
+	haworth_parser.add_argument(
+		"-F", "--formats",
+		dest="formats",
+		type=_parse_formats,
+		default=None,
+		help="Comma-separated formats written from one render pass, e.g. svg,png,pdf;"
+			" each output replaces the extension of --output (default: single format)"
+	)
+
+	haworth_batch_parser = subparsers.add_parser(
+		"haworth-batch",
+		help="Render Haworth projections for a TSV/CSV table of SMILES or sugar codes"
+	)
+	haworth_batch_parser.add_argument(
+		"-i", "--input",
+		dest="input",
+		required=True,
+		help="Job table with a header row; columns: input (required), name, mode,"
+			" stereo, series, formats"
+	)
+	haworth_batch_parser.add_argument(
+		"-o", "--output-dir",
+		dest="output_dir",
+		required=True,
+		help="Directory for rendered files and the manifest"
+	)
+	haworth_batch_parser.add_argument(
+		"-M", "--manifest",
+		dest="manifest",
+		default=None,
+		help="Manifest JSON path (default: OUTPUT_DIR/manifest.json)"
+	)
+	haworth_batch_parser.add_argument(
+		"-m", "--mode",
+		dest="mode",
+		choices=("pyranose", "furanose"),
+		default="pyranose",
+		help="Default ring mode for rows without one (default: pyranose)"
+	)
+	haworth_batch_parser.add_argument(
+		"-t", "--stereo",
+		dest="stereo",
+		choices=("alpha", "beta"),
+		default=None,
+		help="Default anomeric stereo for rows without one (default: none)"
+	)
+	haworth_batch_parser.add_argument(
+		"-d", "--series",
+		dest="series",
+		choices=("D", "L"),
+		default=None,
+		help="Default sugar series for rows without one (default: from sugar code)"
+	)
+	haworth_batch_parser.add_argument(
+		"-F", "--formats",
+		dest="formats",
+		type=_parse_formats,
+		default=["svg"],
+		help="Default comma-separated output formats (default: svg)"
+	)
+	haworth_batch_parser.add_argument(
+		"-w", "--workers",
+		dest="workers",
+		type=int,
+		default=None,
+		help="Worker processes (default: CPU count; 1 disables the pool)"
+	)
+	haworth_batch_parser.add_argument(
+		"-c", "--chunk-size",
+		dest="chunk_size",
+		type=int,
+		default=haworth_batch.DEFAULT_CHUNK_SIZE,
+		help=f"Rows per worker task (default: {haworth_batch.DEFAULT_CHUNK_SIZE})"
+	)
+
+	batch_parser = subparsers.add_parser(
+		"smiles-batch",
+		help="Convert a SMILES file to 2D CXSMILES with a worker pool"
+	)
+	batch_parser.add_argument(
+		"-i", "--input",
+		dest="input",
+		required=True,
+		help="Input file with one 'SMILES [name]' record per line"
+	)
+	batch_parser.add_argument(
+		"-o", "--output",
+		dest="output",
+		required=True,
+		help="Output CXSMILES file ('SMILES |(coords)| name' per line)"
+	)
+	batch_parser.add_argument(
+		"-w", "--workers",
+		dest="workers",
+		type=int,
+		default=None,
+		help="Worker processes (default: CPU count; 1 disables the pool)"
+	)
+	batch_parser.add_argument(
+		"-c", "--chunk-size",
+		dest="chunk_size",
+		type=int,
+		default=smiles_batch.DEFAULT_CHUNK_SIZE,
+		help=f"Records per worker task (default: {smiles_batch.DEFAULT_CHUNK_SIZE})"
+	)
+
+	search_parser = subparsers.add_parser(
+		"substructure-search",
+		help="List CDML/CD-SVG files in a directory that contain a fragment"
+	)
+	search_parser.add_argument(
+		"-d", "--directory",
+		dest="directory",
+		required=True,
+		help="Directory with .cdml/.svg drawings (gzipped files are read too)"
+	)
+	search_parser.add_argument(
+		"-q", "--query",
+		dest="query",
+		required=True,
+		help="Fragment as SMILES"
+	)
+	search_parser.add_argument(
+		"--index",
+		dest="index",
+		default=None,
+		help=f"Index file (default: {substructure_index.DEFAULT_INDEX_NAME} in the directory)"
+	)
+	search_parser.add_argument(
+		"-r", "--recursive",
+		dest="recursive",
+		action="store_true",
+		help="Search subdirectories too"
+	)
+	search_parser.add_argument(
+		"-w", "--workers",
+		dest="workers",
+		type=int,
+		default=None,
+		help="Worker processes (default: CPU count; 1 disables the pool)"
+	)
+	search_parser.add_argument(
+		"-c", "--chunk-size",
+		dest="chunk_size",
+		type=int,
+		default=substructure_index.DEFAULT_CHUNK_SIZE,
+		help=f"Files or molecules per worker task (default: {substructure_index.DEFAULT_CHUNK_SIZE})"
+	)
 	args = parser.parse_args(argv)
 	return args
 
@@ -129,12 +311,17 @@ def _render_haworth(args):
 		args (argparse.Namespace): Parsed arguments.
 
 	Returns:
-		str: Output path that was written.
+		list[str]: Output paths that were written.
 	"""
-	output_format = _resolve_format(args.output, args.format)
-	if output_format == "png":
+	if args.formats:
+		stem = os.path.splitext(args.output)[0]
+		output_paths = {fmt: f"{stem}.{fmt}" for fmt in args.formats}
+	else:
+		output_format = _resolve_format(args.output, args.format)
+		output_paths = {output_format: args.output}
+	if any(fmt != "svg" for fmt in output_paths):
 		if importlib.util.find_spec("cairo") is None:
-			raise RuntimeError("PNG output requires pycairo.")
+			raise RuntimeError("PNG, PDF and PS output require pycairo.")
 
 	# Parse SMILES and generate initial coordinates
 	mol = smiles.text_to_mol(args.smiles, calc_coords=DEFAULT_BOND_LENGTH)
@@ -151,18 +338,145 @@ def _render_haworth(args):
 	# Ensure the output directory exists
 	_ensure_parent_dir(args.output)
 
-	render_out.mol_to_output(mol, args.output, format=output_format)
+	if len(output_paths) == 1:
+		(output_format, output_path), = output_paths.items()
+		render_out.mol_to_output(mol, output_path, format=output_format)
+	else:
+		render_out.mol_to_outputs(mol, output_paths)
+	return list(output_paths.values())
+
+
+#============================================
+def _render_haworth_batch(args):
+	"""Render every row of a Haworth job table and write a manifest.
+
+	Failed rows are reported on stderr and recorded in the manifest.
+
+	Args:
+		args (argparse.Namespace): Parsed arguments.
+
+	Returns:
+		str: Manifest path that was written.
+	"""
+	start = time.perf_counter()
+	with open(args.input, "r", encoding="utf-8", newline="") as handle:
+		jobs = haworth_batch.read_jobs(
+			handle,
+			mode=args.mode,
+			stereo=args.stereo,
+			series=args.series,
+			formats=args.formats,
+		)
+	results = []
+	for result in haworth_batch.iter_render_jobs(
+			jobs,
+			args.output_dir,
+			workers=args.workers,
+			chunk_size=args.chunk_size,
+			bond_length=DEFAULT_BOND_LENGTH):
+		if result.error is not None:
+			print(
+				f"row {result.index + 1} ({result.input}): "
+				f"{result.error.error_type}: {result.error.message}",
+				file=sys.stderr,
+			)
+		results.append(result)
+	manifest_path = args.manifest or os.path.join(args.output_dir, "manifest.json")
+	_ensure_parent_dir(manifest_path)
+	manifest = haworth_batch.write_manifest(results, manifest_path, time.perf_counter() - start)
+	print(
+		f"Rendered {manifest['rendered']} of {manifest['total']} rows"
+		f" ({manifest['failed']} failed) in {manifest['wall_seconds']:.2f} s"
+	)
+	return manifest_path
+
+
+#============================================
+def _convert_smiles_batch(args):
+	"""Convert a SMILES file to CXSMILES lines using a process pool.
+
+	Failed records are reported on stderr and left out of the output.
+
+	Args:
+		args (argparse.Namespace): Parsed arguments.
+
+	Returns:
+		str: Output path that was written.
+	"""
+	_ensure_parent_dir(args.output)
+	converted = 0
+	failed = 0
+	with open(args.input, "r", encoding="utf-8") as in_handle, \
+		open(args.output, "w", encoding="utf-8") as out_handle:
+		results = smiles_batch.iter_text_to_mols(
+			in_handle,
+			workers=args.workers,
+			chunk_size=args.chunk_size,
+			calc_coords=1,
+		)
+		for result in results:
+			if result.error is not None:
+				failed += 1
+				print(
+					f"record {result.index + 1} ({result.smiles}): "
+					f"{result.error.error_type}: {result.error.message}",
+					file=sys.stderr,
+				)
+				continue
+			line = smiles.mol_to_cxsmiles(result.smiles, result.mol)
+			if result.name:
+				line = f"{line} {result.name}"
+			out_handle.write(line + "\n")
+			converted += 1
+	print(f"Converted {converted} records ({failed} failed)")
 	return args.output
 
 
+#============================================
+def _substructure_search(args):
+	"""Print the files of a directory that contain the query fragment.
+
+	Matching paths go to stdout, one per line, and a summary to stderr.
+	The directory index is created or refreshed on the way.
+
+	Args:
+		args (argparse.Namespace): Parsed arguments.
+	"""
+	query = smiles.text_to_mol(args.query, calc_coords=0)
+	index = substructure_index.SubstructureIndex(
+		args.directory,
+		index_path=args.index,
+		recursive=args.recursive,
+		workers=args.workers,
+		chunk_size=args.chunk_size,
+	)
+	for path in index.matching_files(query):
+		print(path)
+	stats = index.last_search
+	print(
+		f"Matched {stats.matches} of {stats.molecules} molecules in {stats.files} files"
+		f" ({stats.candidates} passed the prefilter) in {stats.seconds:.2f} s",
+		file=sys.stderr,
+	)
+
+
 #============================================
 def main(argv=None):
 	"""Run the CLI entry point."""
 	args = parse_args(argv)
-	if args.command != "haworth":
-		raise ValueError("Only the haworth command is supported.")
-	output_path = _render_haworth(args)
-	print(f"Wrote {output_path}")
+	if args.command == "haworth":
+		output_paths = _render_haworth(args)
+	elif args.command == "haworth-batch":
+		output_paths = [_render_haworth_batch(args)]
+	elif args.command == "smiles-batch":
+		output_paths = [_convert_smiles_batch(args)]
+	elif args.command == "substructure-search":
+		_substructure_search(args)
+		output_paths = []
+	else:
+		raise ValueError(f"Unsupported command: {args.command}")
+	for output_path in output_paths:
+		print(f"Wrote {output_path}")
 
 
 if __name__ == "__main__":
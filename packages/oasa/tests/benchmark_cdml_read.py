@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark CDML parse throughput and peak memory.
+
+Compares the minidom reader (whole-document DOM plus simpleXPathSearch)
+with the streaming ElementTree reader on the BKChem template fixtures
+and on a generated multi-megabyte archive built from them. Runs from
+the repo root.
+"""
+
+# Standard Library
+import io
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+from oasa import cdml
+from oasa import cdml_writer
+from oasa import dom_extensions as dom_ext
+from oasa import safe_xml
+
+
+TEMPLATE_DIR = "packages/bkchem-app/bkchem_data/templates"
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time minidom and streaming CDML readers"
+	)
+	parser.add_argument(
+		'-c', '--copies', dest='copies',
+		type=int, default=200,
+		help="Template molecule copies in the generated archive (default: 200)",
+	)
+	parser.add_argument(
+		'-r', '--repeat', dest='repeat',
+		type=int, default=3,
+		help="Runs per measurement, best time kept (default: 3)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def dom_read(data: bytes) -> int:
+	"""Read with minidom and simpleXPathSearch; return molecules read."""
+	doc = safe_xml.parse_dom_from_string(data)
+	count = 0
+	for mol_el in dom_ext.simpleXPathSearch(doc, "//molecule"):
+		if cdml_writer.read_cdml_molecule_element(mol_el) is not None:
+			count += 1
+	return count
+
+
+#============================================
+def stream_read(data: bytes) -> int:
+	"""Read with the streaming reader; return molecules read."""
+	count = 0
+	for mol_el in cdml.iter_molecule_elements(io.BytesIO(data)):
+		if cdml_writer.read_cdml_molecule_element(mol_el) is not None:
+			count += 1
+	return count
+
+
+#============================================
+def load_fixtures() -> dict:
+	"""Return {name: bytes} of the template CDML files."""
+	fixtures = {}
+	for name in sorted(os.listdir(TEMPLATE_DIR)):
+		if name.endswith(".cdml"):
+			with open(os.path.join(TEMPLATE_DIR, name), "rb") as handle:
+				fixtures[name] = handle.read()
+	return fixtures
+
+
+#============================================
+def build_archive(fixtures: dict, copies: int) -> bytes:
+	"""Concatenate the <molecule> elements of all fixtures copies times."""
+	parts = []
+	for data in fixtures.values():
+		doc = safe_xml.parse_dom_from_string(data)
+		for mol_el in dom_ext.simpleXPathSearch(doc, "//molecule"):
+			parts.append(mol_el.toxml())
+	body = "\n".join(parts)
+	text = ('<cdml version="26.02" xmlns="http://www.freesoftware.fsf.org/bkchem/cdml">\n'
+		+ "\n".join(body for _ in range(copies)) + "\n</cdml>\n")
+	return text.encode("utf-8")
+
+
+#============================================
+def measure(func, data: bytes, repeat: int) -> tuple:
+	"""Return (molecules, best seconds, peak traced bytes)."""
+	best = None
+	for _ in range(repeat):
+		start = time.perf_counter()
+		count = func(data)
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min(best, elapsed)
+	tracemalloc.start()
+	func(data)
+	_current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return (count, best, peak)
+
+
+#============================================
+def main() -> None:
+	"""Print throughput and peak memory per input and reader."""
+	args = parse_args()
+	inputs = load_fixtures()
+	inputs[f"archive x{args.copies}"] = build_archive(inputs, args.copies)
+	print(f"{'input':<22s} {'reader':<8s} {'MB':>7s} {'mols':>6s} {'MB/s':>8s} {'peak MB':>8s}")
+	print("-" * 64)
+	for name, data in inputs.items():
+		megabytes = len(data) / 1e6
+		for label, func in (("minidom", dom_read), ("stream", stream_read)):
+			count, seconds, peak = measure(func, data, args.repeat)
+			print(f"{name:<22s} {label:<8s} {megabytes:>7.2f} {count:>6d}"
+				f" {megabytes / seconds:>8.2f} {peak / 1e6:>8.2f}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark memory use of Molecule objects vs array-backed MoleculeTable.
+
+Builds the same dataset twice, once as a list of OASA Molecule objects and
+once as a MoleculeTable, and reports traced allocations for each. The
+dataset cycles through a set of drug-like SMILES so large counts stay
+cheap to generate.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+import tracemalloc
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+from oasa.frozen_molecule import MoleculeTable
+
+
+# ============================================
+# Dataset
+# ============================================
+
+DATASET_SMILES = (
+	"CC(=O)Oc1ccccc1C(=O)O",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"CC(C)Cc1ccc(cc1)C(C)C(=O)O",
+	"C(CCCCCCCC)C(CC)C(CCC(C(CC1)CC(O)C1)C)C=C(CC2)C2(C)CC3C=4CCC3C4C",
+	"OCC1OC(O)C(O)C(O)C1O",
+	"c1ccc2c(c1)ccc1ccccc12",
+	"CN(C)CCCN1c2ccccc2CCc2ccccc21",
+	"O=C(O)CC(O)(CC(=O)O)C(=O)O",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Compare memory of Molecule lists and MoleculeTable"
+	)
+	parser.add_argument(
+		'-n', '--count', dest='count',
+		type=int, default=5000,
+		help="Number of molecules in the dataset (default: 5000)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_molecules(count: int) -> list:
+	"""Parse count molecules, cycling through DATASET_SMILES."""
+	templates = [oasa.smiles_lib.text_to_mol(s) for s in DATASET_SMILES]
+	mols = [templates[i % len(templates)].deep_copy() for i in range(count)]
+	return mols
+
+
+#============================================
+def traced(builder) -> tuple:
+	"""Run builder under tracemalloc; return (result, bytes, seconds)."""
+	tracemalloc.start()
+	start = time.perf_counter()
+	result = builder()
+	seconds = time.perf_counter() - start
+	size, _peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return (result, size, seconds)
+
+
+#============================================
+def main() -> None:
+	"""Build the dataset in both representations and print a table."""
+	args = parse_args()
+	mols, mol_bytes, mol_seconds = traced(lambda: build_molecules(args.count))
+	table, table_bytes, table_seconds = traced(lambda: MoleculeTable.from_molecules(mols))
+	atoms = sum(len(m.vertices) for m in mols)
+	print(f"{args.count} molecules, {atoms} heavy atoms")
+	print(f"{'representation':<22s} {'MiB':>10s} {'bytes/atom':>12s} {'build s':>10s}")
+	print("-" * 58)
+	for label, size, seconds in (
+		("list[Molecule]", mol_bytes, mol_seconds),
+		("MoleculeTable", table_bytes, table_seconds),
+	):
+		print(f"{label:<22s} {size / 2**20:>10.2f} {size / atoms:>12.1f} {seconds:>10.2f}")
+	print(f"ratio: {mol_bytes / max(table_bytes, 1):.1f}x smaller"
+		f" (array payload {table.nbytes / 2**20:.2f} MiB)")
+
+
+if __name__ == '__main__':
+	main()
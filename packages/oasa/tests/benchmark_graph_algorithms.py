@@ -3,7 +3,9 @@
 
 Runs timing comparisons on real molecule graphs parsed from SMILES strings.
 Verifies result parity between the two implementations and prints speedup
-ratios in a summary table.
+ratios in a summary table. A second section times edit-then-query loops,
+comparing the incrementally patched rustworkx mirror against a forced
+full rebuild after every edit.
 """
 
 # Standard Library
@@ -34,6 +36,13 @@ MOLECULES = {
 	),
 }
 
+# editing-session sized structures for the edit-then-query loops
+EDIT_MOLECULES = {
+	"cholesterol": MOLECULES["cholesterol"],
+	# 60 linked phenylene rings, 360 heavy atoms
+	"polyphenylene_60": "c1ccc(cc1)" + "c1ccc(cc1)" * 58 + "c1ccccc1",
+}
+
 
 #============================================
 def parse_args() -> argparse.Namespace:
@@ -452,6 +461,93 @@ def benchmark_molecule(
 	return results
 
 
+#============================================
+def _edit_then_query(mol, anchor, force_rebuild: bool) -> None:
+	"""Add a methyl to anchor, query rings, then remove it and query again.
+
+	Args:
+		mol: An oasa.molecule instance.
+		anchor: Vertex of mol that receives the temporary substituent.
+		force_rebuild: When True, drop the mirror after each edit so the
+			next query pays for a full rebuild (the pre-incremental cost).
+	"""
+	v = mol.create_vertex()
+	mol.add_vertex(v)
+	mol.add_edge(anchor, v)
+	if force_rebuild:
+		mol._flush_cache()
+	mol.get_smallest_independent_cycles()
+	mol.remove_vertex(v)
+	if force_rebuild:
+		mol._flush_cache()
+	mol.get_connected_components()
+
+
+#============================================
+def benchmark_edit_then_query(name: str, smiles: str, num_iterations: int) -> dict:
+	"""Time edit-then-query loops with incremental and rebuilt mirrors.
+
+	Args:
+		name: Human-readable molecule name.
+		smiles: SMILES string.
+		num_iterations: Number of timing iterations.
+
+	Returns:
+		Dict with keys: molecule, atoms, incremental_us, rebuild_us, speedup.
+	"""
+	mol = smiles_to_oasa_mol(smiles)
+	anchor = mol.vertices[len(mol.vertices) // 2]
+	# sync the mirror once so both loops start from the same state
+	mol.get_connected_components()
+	incremental_us = time_function(
+		lambda: _edit_then_query(mol, anchor, False),
+		num_iterations,
+	)
+	rebuild_us = time_function(
+		lambda: _edit_then_query(mol, anchor, True),
+		num_iterations,
+	)
+	speedup = rebuild_us / incremental_us if incremental_us > 0 else float("inf")
+	result = {
+		"molecule": name,
+		"atoms": len(mol.vertices),
+		"incremental_us": incremental_us,
+		"rebuild_us": rebuild_us,
+		"speedup": speedup,
+	}
+	return result
+
+
+#============================================
+def print_edit_table(edit_results: list) -> None:
+	"""Print the edit-then-query timing table.
+
+	Args:
+		edit_results: List of result dicts from benchmark_edit_then_query.
+	"""
+	print(f"\n{'='*65}")
+	print("EDIT-THEN-QUERY: add/remove one atom, query rings and components")
+	print(f"{'='*65}")
+	header = (
+		f"{'Molecule':<20s} "
+		f"{'Atoms':>6s} "
+		f"{'Incr (us)':>11s} "
+		f"{'Rebuild (us)':>13s} "
+		f"{'Speedup':>9s}"
+	)
+	print(f"\n{header}")
+	print("-" * len(header))
+	for row in edit_results:
+		line = (
+			f"{row['molecule']:<20s} "
+			f"{row['atoms']:>6d} "
+			f"{row['incremental_us']:>11.1f} "
+			f"{row['rebuild_us']:>13.1f} "
+			f"{row['speedup']:>8.1f}x"
+		)
+		print(line)
+
+
 #============================================
 def print_molecule_table(results: list, verbose: bool) -> None:
 	"""Print a formatted comparison table for one molecule.
@@ -564,6 +660,14 @@ def main() -> None:
 	# final summary
 	print_summary(all_results)
 
+	# incremental mirror vs full rebuild after every edit
+	edit_results = []
+	for mol_name, smiles in EDIT_MOLECULES.items():
+		edit_results.append(
+			benchmark_edit_then_query(mol_name, smiles, args.num_iterations)
+		)
+	print_edit_table(edit_results)
+
 
 #============================================
 if __name__ == '__main__':
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the compiled functional-group classifier.
+
+Times classifying a generated set of molecules with the subsearch_data
+patterns the naive way (parse every pattern again for each molecule and
+match it on its own) and with a compiled GroupClassifier, in the calling
+process and in a worker pool. Runs from the repo root.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+from oasa import group_classifier
+
+
+DATASET_SMILES = (
+	"CC(=O)Oc1ccccc1C(=O)O",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"CC(C)Cc1ccc(cc1)C(C)C(=O)O",
+	"OCC1OC(O)C(O)C(O)C1O",
+	"CN(C)CCCN1c2ccccc2CCc2ccccc21",
+	"O=C(O)CC(O)(CC(=O)O)C(=O)O",
+	"CC(C)CCCC(C)C1CCC2C3CC=C4CC(O)CCC4(C)C3CCC12C",
+	"NCCc1ccc(O)c(O)c1",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time naive and compiled functional-group classification"
+	)
+	parser.add_argument(
+		'-n', '--molecules', dest='molecules',
+		type=int, default=400,
+		help="Number of molecules to classify (default: 400)",
+	)
+	parser.add_argument(
+		'-w', '--workers', dest='workers',
+		type=int, default=None,
+		help="Worker processes for the pooled run (default: CPU count)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def naive(mols, tables) -> list:
+	"""Parse and match every pattern separately for every molecule."""
+	structures, rings = tables
+	rows = [(name, smiles, substituents) for name, _category, smiles, substituents in structures]
+	rows.extend((name, smiles, ()) for name, smiles in rings)
+	results = []
+	for mol in mols:
+		found = set()
+		for name, smiles, substituents in rows:
+			query, _labelled = group_classifier.parse_pattern(smiles, substituents)
+			if mol.contains_substructure(query):
+				found.add(name)
+		results.append(frozenset(found))
+	return results
+
+
+#============================================
+def timed(func) -> tuple:
+	"""Run func; return (result, seconds)."""
+	start = time.perf_counter()
+	result = func()
+	return (result, time.perf_counter() - start)
+
+
+#============================================
+def main() -> None:
+	"""Build the dataset and print one line per strategy."""
+	args = parse_args()
+	base = [oasa.smiles_lib.text_to_mol(smiles, calc_coords=0) for smiles in DATASET_SMILES]
+	mols = [base[i % len(base)] for i in range(args.molecules)]
+	classifier, compile_s = timed(group_classifier.GroupClassifier)
+	expected, naive_s = timed(lambda: naive(mols, classifier.tables))
+	serial, serial_s = timed(lambda: list(classifier.classify_many(mols)))
+	pooled, pooled_s = timed(lambda: list(classifier.classify_many(mols, workers=args.workers)))
+	labels, label_s = timed(lambda: [classifier.label_atoms(mol) for mol in mols])
+	print(f"{args.molecules} molecules, {len(classifier.patterns)} patterns,"
+		f" results equal: {expected == serial == pooled}")
+	print(f"{'step':<26s} {'seconds':>10s}")
+	print("-" * 37)
+	for label, seconds in (
+		("compile patterns", compile_s),
+		("naive per-pattern search", naive_s),
+		("classify_many (serial)", serial_s),
+		("classify_many (pool)", pooled_s),
+		("label_atoms", label_s),
+	):
+		print(f"{label:<26s} {seconds:>10.3f}")
+	print(f"labelled atoms: {sum(len(found) for found in labels)}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark group-abbreviation expansion while reading CDML.
+
+Builds a polymer-like CDML chain whose backbone carbons carry Ph, Me,
+COOH and OMe group atoms, then reads it with the cached group fragments
+(known_groups.group_fragment) and with a SMILES parse per group atom,
+which is what read_cdml_molecule_element() did before. Runs from the
+repo root.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+from oasa import cdml
+from oasa import cdml_writer
+from oasa import known_groups
+from oasa import smiles_lib
+
+
+GROUP_NAMES = ("Ph", "Me", "COOH", "OMe")
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time CDML reading of a group-heavy drawing"
+	)
+	parser.add_argument(
+		'-g', '--groups', dest='groups',
+		type=int, default=500,
+		help="Group atoms in the generated chain (default: 500)",
+	)
+	parser.add_argument(
+		'-r', '--repeat', dest='repeat',
+		type=int, default=3,
+		help="Runs per measurement, best time kept (default: 3)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def build_cdml(groups: int) -> str:
+	"""Return CDML text for a carbon chain with one group per backbone atom."""
+	atoms = []
+	bonds = []
+	for i in range(groups):
+		name = GROUP_NAMES[i % len(GROUP_NAMES)]
+		atoms.append(f'<atom id="c{i}" name="C"><point x="{i}cm" y="0cm"/></atom>')
+		atoms.append(f'<atom id="g{i}" name="{name}"><point x="{i}cm" y="1cm"/></atom>')
+		bonds.append(f'<bond type="n1" start="c{i}" end="g{i}"/>')
+		if i:
+			bonds.append(f'<bond type="n1" start="c{i - 1}" end="c{i}"/>')
+	return ('<cdml version="26.02" xmlns="http://www.freesoftware.fsf.org/bkchem/cdml">'
+		'<molecule id="m1">' + "".join(atoms) + "".join(bonds) + '</molecule></cdml>')
+
+
+#============================================
+def parse_every_time(smiles_text: str):
+	"""Group expansion without the fragment cache."""
+	return smiles_lib.text_to_mol(smiles_text, calc_coords=0)
+
+
+#============================================
+def best_time(text: str, repeat: int) -> tuple:
+	"""Return (atoms read, best seconds) for cdml.text_to_mol()."""
+	best = None
+	for _ in range(repeat):
+		start = time.perf_counter()
+		mol = cdml.text_to_mol(text)
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min(best, elapsed)
+	return (len(mol.vertices), best)
+
+
+#============================================
+def main() -> None:
+	"""Print read times with and without the group fragment cache."""
+	args = parse_args()
+	text = build_cdml(args.groups)
+	cached_atoms, cached = best_time(text, args.repeat)
+	cdml_writer.group_fragment = parse_every_time
+	try:
+		plain_atoms, plain = best_time(text, args.repeat)
+	finally:
+		cdml_writer.group_fragment = known_groups.group_fragment
+	assert cached_atoms == plain_atoms
+	print(f"{args.groups} group atoms, {cached_atoms} atoms after expansion")
+	print(f"parse per group: {plain * 1000:8.1f} ms")
+	print(f"cached fragment: {cached * 1000:8.1f} ms  ({plain / cached:.1f}x)")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark molecule_to_ops on peptides with and without batched geometry.
+
+Large molecules pack their label targets into NumPy arrays so each bond is
+tested against all labels in one call (see BATCH_GEOMETRY_MIN_TARGETS).
+This script times molecule_to_ops for growing peptides with batching
+enabled and with the threshold raised out of reach, and checks that both
+paths produce identical ops.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.peptide_utils
+import oasa.smiles_lib
+from oasa.render_lib import molecule_ops
+
+
+# repeating unit without proline (unsupported by sequence_to_smiles)
+PEPTIDE_UNIT = "DESKTWYNQG"
+# drawing-scale bond length, as used by the oasa_cli renderers
+BOND_LENGTH = 30
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time molecule_to_ops with and without batched geometry"
+	)
+	parser.add_argument(
+		'-r', '--repeats', dest='repeats',
+		type=int, default=3,
+		help="Timing repeats per size, best time is reported (default: 3)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def best_time(func, repeats: int) -> tuple:
+	"""Return (result, best seconds) over repeats calls of func."""
+	best = None
+	result = None
+	for _ in range(repeats):
+		start = time.perf_counter()
+		result = func()
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min(best, elapsed)
+	return (result, best)
+
+
+#============================================
+def main() -> None:
+	"""Time growing peptides and print a comparison table."""
+	args = parse_args()
+	threshold = molecule_ops.BATCH_GEOMETRY_MIN_TARGETS
+	print(f"{'residues':>8s} {'atoms':>6s} {'scalar s':>10s} {'batched s':>10s} {'speedup':>8s}")
+	print("-" * 48)
+	for units in (1, 2, 4, 8):
+		sequence = PEPTIDE_UNIT * units
+		mol = oasa.smiles_lib.text_to_mol(
+			oasa.peptide_utils.sequence_to_smiles(sequence), calc_coords=BOND_LENGTH)
+		molecule_ops.BATCH_GEOMETRY_MIN_TARGETS = 10**9
+		plain, plain_s = best_time(lambda: molecule_ops.molecule_to_ops(mol), args.repeats)
+		molecule_ops.BATCH_GEOMETRY_MIN_TARGETS = threshold
+		batched, batched_s = best_time(lambda: molecule_ops.molecule_to_ops(mol), args.repeats)
+		if plain != batched:
+			raise RuntimeError(f"ops differ for {len(sequence)} residues")
+		print(f"{len(sequence):>8d} {len(mol.vertices):>6d} {plain_s:>10.3f} {batched_s:>10.3f}"
+			f" {plain_s / batched_s:>7.1f}x")
+
+
+if __name__ == '__main__':
+	main()
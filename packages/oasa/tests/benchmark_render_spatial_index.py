@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark molecule_to_ops label clipping with the attach-target grid.
+
+Each bond used to be tested against every label target, which grows with
+atoms x labels. Large molecules now index their label targets in a uniform
+grid (see SPATIAL_INDEX_MIN_TARGETS) so each bond only visits nearby
+labels. This script times molecule_to_ops for peptides up to protein size
+with the scalar loop, with NumPy batching only, and with the grid, and
+checks that all three produce identical ops.
+"""
+
+# Standard Library
+import sys
+import time
+import argparse
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.peptide_utils
+import oasa.smiles_lib
+from oasa.render_lib import molecule_ops
+
+
+# repeating unit without proline (unsupported by sequence_to_smiles)
+PEPTIDE_UNIT = "DESKTWYNQG"
+# drawing-scale bond length, as used by the oasa_cli renderers
+BOND_LENGTH = 30
+OUT_OF_REACH = 10**9
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time molecule_to_ops with and without the label-target grid"
+	)
+	parser.add_argument(
+		'-r', '--repeats', dest='repeats',
+		type=int, default=1,
+		help="Timing repeats per size, best time is reported (default: 1)",
+	)
+	parser.add_argument(
+		'-u', '--units', dest='units',
+		type=int, nargs='+', default=[2, 4, 8, 16, 32],
+		help="Peptide sizes in 10-residue units (default: 2 4 8 16 32)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def best_time(func, repeats: int) -> tuple:
+	"""Return (result, best seconds) over repeats calls of func."""
+	best = None
+	result = None
+	for _ in range(repeats):
+		start = time.perf_counter()
+		result = func()
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min(best, elapsed)
+	return (result, best)
+
+
+#============================================
+def time_mode(mol, repeats: int, batch_threshold: int, index_threshold: int) -> tuple:
+	"""Time molecule_to_ops with the given fast-path thresholds."""
+	saved = (molecule_ops.BATCH_GEOMETRY_MIN_TARGETS, molecule_ops.SPATIAL_INDEX_MIN_TARGETS)
+	molecule_ops.BATCH_GEOMETRY_MIN_TARGETS = batch_threshold
+	molecule_ops.SPATIAL_INDEX_MIN_TARGETS = index_threshold
+	try:
+		return best_time(lambda: molecule_ops.molecule_to_ops(mol), repeats)
+	finally:
+		molecule_ops.BATCH_GEOMETRY_MIN_TARGETS, molecule_ops.SPATIAL_INDEX_MIN_TARGETS = saved
+
+
+#============================================
+def main() -> None:
+	"""Time growing peptides and print a comparison table."""
+	args = parse_args()
+	batch = molecule_ops.BATCH_GEOMETRY_MIN_TARGETS
+	index = molecule_ops.SPATIAL_INDEX_MIN_TARGETS
+	print(f"{'residues':>8s} {'atoms':>6s} {'scalar s':>10s} {'batched s':>10s}"
+		f" {'grid s':>10s} {'speedup':>8s}")
+	print("-" * 58)
+	for units in args.units:
+		sequence = PEPTIDE_UNIT * units
+		mol = oasa.smiles_lib.text_to_mol(
+			oasa.peptide_utils.sequence_to_smiles(sequence), calc_coords=BOND_LENGTH)
+		plain, plain_s = time_mode(mol, args.repeats, OUT_OF_REACH, OUT_OF_REACH)
+		batched, batched_s = time_mode(mol, args.repeats, batch, OUT_OF_REACH)
+		gridded, grid_s = time_mode(mol, args.repeats, batch, index)
+		if not (plain == batched == gridded):
+			raise RuntimeError(f"ops differ for {len(sequence)} residues")
+		print(f"{len(sequence):>8d} {len(mol.vertices):>6d} {plain_s:>10.3f} {batched_s:>10.3f}"
+			f" {grid_s:>10.3f} {plain_s / grid_s:>7.1f}x")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark indexed substructure search over a directory of drawings.
+
+Writes a temporary directory of CDML files, then times a brute-force
+search (parse every file, match every molecule), building the index,
+re-validating a warm index and searching through the index. Runs from
+the repo root.
+"""
+
+# Standard Library
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# ensure OASA package is importable from the repo tree
+sys.path.insert(0, "packages/oasa")
+
+# local repo modules
+import oasa.smiles_lib
+from oasa import cdml_writer
+from oasa import substructure_index
+
+
+DATASET_SMILES = (
+	"CC(=O)Oc1ccccc1C(=O)O",
+	"CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+	"CC(C)Cc1ccc(cc1)C(C)C(=O)O",
+	"OCC1OC(O)C(O)C(O)C1O",
+	"c1ccc2c(c1)ccc1ccccc12",
+	"CN(C)CCCN1c2ccccc2CCc2ccccc21",
+	"O=C(O)CC(O)(CC(=O)O)C(=O)O",
+	"CCCCCCCCCCCCCCCC(=O)O",
+)
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Time brute-force and indexed substructure search"
+	)
+	parser.add_argument(
+		'-n', '--files', dest='files',
+		type=int, default=400,
+		help="Number of drawings to generate (default: 400)",
+	)
+	parser.add_argument(
+		'-q', '--query', dest='query',
+		default="c1ccccc1C(=O)O",
+		help="Query fragment as SMILES (default: c1ccccc1C(=O)O)",
+	)
+	parser.add_argument(
+		'-w', '--workers', dest='workers',
+		type=int, default=None,
+		help="Worker processes for the index (default: CPU count)",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def write_dataset(directory: str, count: int) -> None:
+	"""Write count CDML drawings, cycling through DATASET_SMILES."""
+	texts = []
+	for smiles in DATASET_SMILES:
+		mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=1)
+		texts.append(cdml_writer.mol_to_text(mol))
+	for i in range(count):
+		path = os.path.join(directory, f"drawing_{i:05d}.cdml")
+		with open(path, "w", encoding="utf-8") as handle:
+			handle.write(texts[i % len(texts)])
+
+
+#============================================
+def brute_force(directory: str, query) -> int:
+	"""Parse every file and match every molecule; return matching files."""
+	found = 0
+	for name in sorted(os.listdir(directory)):
+		if not name.endswith(".cdml"):
+			continue
+		path = os.path.join(directory, name)
+		for mol in substructure_index.read_drawing_molecules(path):
+			if mol.contains_substructure(query):
+				found += 1
+				break
+	return found
+
+
+#============================================
+def timed(func) -> tuple:
+	"""Run func; return (result, seconds)."""
+	start = time.perf_counter()
+	result = func()
+	return (result, time.perf_counter() - start)
+
+
+#============================================
+def main() -> None:
+	"""Generate the dataset and print one line per search strategy."""
+	args = parse_args()
+	query = oasa.smiles_lib.text_to_mol(args.query, calc_coords=0)
+	with tempfile.TemporaryDirectory() as directory:
+		write_dataset(directory, args.files)
+		brute, brute_s = timed(lambda: brute_force(directory, query))
+		index = substructure_index.SubstructureIndex(directory, workers=args.workers)
+		_built, cold_s = timed(index.update)
+		warm = substructure_index.SubstructureIndex(directory, workers=args.workers)
+		_changed, warm_s = timed(warm.update)
+		hits, search_s = timed(lambda: warm.matching_files(query, refresh=False))
+		stats = warm.last_search
+	print(f"{args.files} files, query {args.query}, {len(hits)} matching"
+		f" (brute force {brute})")
+	print(f"{'step':<26s} {'seconds':>10s}")
+	print("-" * 37)
+	for label, seconds in (
+		("brute-force search", brute_s),
+		("build index (cold)", cold_s),
+		("reopen index (warm)", warm_s),
+		("indexed search", search_s),
+	):
+		print(f"{label:<26s} {seconds:>10.3f}")
+	print(f"prefilter kept {stats.candidates} of {stats.molecules} molecules")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,126 @@
+"""Tests for the streaming ElementTree CDML reader."""
+
+# Standard Library
+import io
+import os
+import gzip
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+from oasa import cdml
+from oasa import cdml_writer
+from oasa import dom_extensions as dom_ext
+from oasa import safe_xml
+from oasa import substructure_index
+
+
+TEMPLATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+	"..", "..", "bkchem-app", "bkchem_data", "templates"))
+
+CD_SVG = """\
+<svg xmlns="http://www.w3.org/2000/svg">
+  <g><path d="M 0 0 L 1 1"/></g>
+  <cdml version="26.02" xmlns="http://www.freesoftware.fsf.org/bkchem/cdml">
+    <molecule id="m1">
+      <atom id="a1" name="C"><point x="1.0cm" y="2.0cm"/></atom>
+      <atom id="a2" name="Ph"><point x="2.0cm" y="2.0cm"/></atom>
+      <bond type="n2" start="a1" end="a2" color="#ff0000" line_width="2.0"/>
+    </molecule>
+    <molecule id="m2">
+      <atom id="b1" name="N" charge="1"><point x="1" y="1"/></atom>
+      <atom id="b2" name="O"><point x="3" y="3"/></atom>
+    </molecule>
+  </cdml>
+</svg>
+"""
+
+# prefixed elements are not 'molecule' elements; nested ones follow their parent
+ODD_CDML = """\
+<cdml xmlns:c="urn:example" xmlns:b="urn:other">
+  <c:molecule><c:atom id="x" name="C"><c:point x="0" y="0"/></c:atom></c:molecule>
+  <molecule id="outer">
+    <atom id="a1" name="C" b:note="1"><point x="0" y="0"/></atom>
+    <molecule id="inner">
+      <atom id="a2" name="O"><point x="1" y="0"/></atom>
+      <bond type="n1" start="a1" end="a2" b:extra="y"/>
+    </molecule>
+  </molecule>
+  <molecule><atom id="z" name="Xx"><point x="0" y="0"/></atom></molecule>
+  <molecule><atom id="q" name="S"/></molecule>
+</cdml>
+"""
+
+
+#============================================
+def _describe(mol) -> tuple:
+	index = {v: i for i, v in enumerate(mol.vertices)}
+	atoms = [(v.symbol, v.charge, v.x, v.y, v.z) for v in mol.vertices]
+	bonds = sorted((index[e.vertices[0]], index[e.vertices[1]], e.order, e.type,
+		sorted(e.properties_.items())) for e in mol.edges)
+	return (atoms, bonds)
+
+
+#============================================
+def _dom_read(text) -> list:
+	"""The minidom reader that iter_molecule_elements() replaces."""
+	doc = safe_xml.parse_dom_from_string(text)
+	mols = []
+	for mol_el in dom_ext.simpleXPathSearch(doc, "//molecule"):
+		mol = cdml_writer.read_cdml_molecule_element(mol_el)
+		if mol is None:
+			continue
+		if mol.is_connected():
+			mols.append(mol)
+		else:
+			mols.extend(mol.get_disconnected_subgraphs())
+	return [_describe(mol) for mol in mols]
+
+
+#============================================
+def _fixture_texts() -> list:
+	texts = [CD_SVG, ODD_CDML]
+	for name in sorted(os.listdir(TEMPLATE_DIR)):
+		if name.endswith(".cdml"):
+			with open(os.path.join(TEMPLATE_DIR, name), encoding="utf-8") as handle:
+				texts.append(handle.read())
+	return texts
+
+
+#============================================
+@pytest.mark.parametrize("text", _fixture_texts())
+def test_stream_reader_matches_dom_reader(text):
+	assert [_describe(mol) for mol in cdml.read_cdml(text)] == _dom_read(text)
+
+
+#============================================
+def test_molecule_element_order_and_names():
+	ids = [el.get("id", "") for el in cdml.iter_molecule_elements(io.BytesIO(ODD_CDML.encode("utf-8")))]
+	assert ids == ["outer", "inner", "", ""]
+
+
+#============================================
+def test_consumed_elements_are_released():
+	"""Molecule elements are cleared once the next one is requested."""
+	seen = []
+	for mol_el in cdml.iter_molecule_elements(io.BytesIO(CD_SVG.encode("utf-8"))):
+		assert len(mol_el) > 0
+		seen.append(mol_el)
+	assert all(len(mol_el) == 0 for mol_el in seen)
+
+
+#============================================
+def test_file_to_mol_streams_binary_and_text():
+	data = CD_SVG.encode("utf-8")
+	from_bytes = cdml.file_to_mol(io.BytesIO(data))
+	from_text = cdml.file_to_mol(io.StringIO(CD_SVG))
+	assert _describe(from_bytes) == _describe(from_text)
+
+
+#============================================
+def test_drawing_reader_streams_gzip(tmp_path):
+	path = tmp_path / "drawing.svgz"
+	path.write_bytes(gzip.compress(CD_SVG.encode("utf-8")))
+	mols = substructure_index.read_drawing_molecules(str(path))
+	assert [_describe(mol) for mol in mols] == _dom_read(CD_SVG)
@@ -0,0 +1,107 @@
+"""Tests for the shared font-metrics store used by label geometry."""
+
+# Standard Library
+import json
+
+# Third Party
+import pytest
+
+# local repo modules
+from oasa.render_lib import font_metrics
+from oasa.render_lib import glyph_model
+from oasa.render_lib import label_geometry
+
+
+#============================================
+def _write_table(path, entries):
+	with open(path, "w", encoding="utf-8") as handle:
+		json.dump({"version": font_metrics.TABLE_FORMAT_VERSION, "entries": entries}, handle)
+
+
+#============================================
+@pytest.fixture
+def table_store(monkeypatch, tmp_path):
+	"""Process store seeded only from a table, with Cairo disabled."""
+	store = font_metrics.FontMetricsStore()
+	table = tmp_path / "metrics.json"
+	_write_table(table, [
+		["Arial", 10.0, "O", 0.5, 7.0, 8.0],
+		["Arial", 10.0, "H", 1.0, 6.0, 7.5],
+		# pair advance 8.0 + 7.5 - 0.5 kerning
+		["Arial", 10.0, "OH", 0.5, 14.0, 15.0],
+		["Arial", 6.5, "2", 0.25, 3.0, 4.0],
+		["Arial", 10.0, "H2", 1.0, 9.0, 11.0],
+	])
+	assert store.load_table(str(table)) == 5
+	monkeypatch.setattr(font_metrics, "_cairo", None)
+	monkeypatch.setattr(font_metrics, "_STORE", store)
+	return store
+
+
+#============================================
+def test_char_advances_use_pair_kerning(table_store):
+	assert font_metrics.char_advances("OH", "Arial", 10.0) == [8.0, 7.0]
+	assert font_metrics.char_advances("OHX", "Arial", 10.0) is None
+
+
+#============================================
+def test_label_geometry_reads_shared_store(table_store):
+	assert label_geometry._text_char_advances("OH", 10.0, "Arial") == [8.0, 7.0]
+	# subscript runs are measured at the script font size
+	assert label_geometry._text_char_advances("H<sub>2</sub>", 10.0, "Arial") == [7.5, 4.0]
+	assert label_geometry._text_char_advances("Q", 10.0, "Arial") == [6.0]
+	assert label_geometry._text_ink_bearing_correction("OH", 10.0, "Arial") == (0.5, 0.5)
+	assert glyph_model._glyph_center_factor("O", "Arial", 10.0) == pytest.approx(4.0 / 8.0)
+	assert glyph_model._glyph_center_factor("N", "Arial", 10.0) == 0.5
+
+
+#============================================
+def test_table_roundtrip_and_version_check(tmp_path):
+	store = font_metrics.FontMetricsStore()
+	source = tmp_path / "in.json"
+	_write_table(source, [["Arial", 12, "C", 1, 2, 3]])
+	store.load_table(str(source))
+	copy = tmp_path / "out.json"
+	assert store.save_table(str(copy)) == 1
+	other = font_metrics.FontMetricsStore()
+	other.load_table(str(copy))
+	assert other.text_extents("Arial", 12.0, "C") == (1.0, 2.0, 3.0)
+	_write_table(source, [])
+	data = json.loads(source.read_text(encoding="utf-8"))
+	data["version"] = 99
+	source.write_text(json.dumps(data), encoding="utf-8")
+	with pytest.raises(ValueError):
+		other.load_table(str(source))
+
+
+#============================================
+def test_load_table_seeds_process_store(monkeypatch, tmp_path):
+	monkeypatch.setattr(font_metrics, "_cairo", None)
+	monkeypatch.setattr(font_metrics, "_STORE", None)
+	table = tmp_path / "metrics.json"
+	_write_table(table, [["Arial", 12, "C", 1, 2, 3]])
+	# nothing is loaded until the table is named explicitly
+	assert font_metrics.get_store().text_extents("Arial", 12.0, "C") is None
+	assert font_metrics.load_table(str(table)) == 1
+	assert font_metrics.get_store().text_extents("Arial", 12.0, "C") == (1.0, 2.0, 3.0)
+
+
+#============================================
+def test_cairo_measurements_are_cached_and_match_prefix_advances():
+	cairo = pytest.importorskip("cairo")
+	store = font_metrics.FontMetricsStore()
+	first = store.text_extents("sans-serif", 16.0, "O")
+	assert store.text_extents("sans-serif", 16.0, "O") == first
+	assert store.measured == 1
+	surface = cairo.ImageSurface(cairo.FORMAT_A8, 1, 1)
+	context = cairo.Context(surface)
+	context.select_font_face("sans-serif", 0, 0)
+	context.set_font_size(16.0)
+	text = "COOH"
+	expected = []
+	previous = 0.0
+	for index in range(len(text)):
+		advance = float(context.text_extents(text[: index + 1]).x_advance)
+		expected.append(max(0.0, advance - previous))
+		previous = advance
+	assert font_metrics.char_advances(text, "sans-serif", 16.0) == pytest.approx(expected)
@@ -0,0 +1,102 @@
+"""Tests for the array-backed FrozenMolecule and MoleculeTable."""
+
+# Standard Library
+import os
+import subprocess
+import sys
+
+# Third Party
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+import oasa.molfile_lib
+import oasa.render_lib.molecule_ops
+from oasa.frozen_molecule import FrozenMolecule
+from oasa.frozen_molecule import MoleculeTable
+
+
+#============================================
+def _signature(mol) -> tuple:
+	"""Return a comparable summary of atoms and bonds in vertex order."""
+	index = {a: i for i, a in enumerate(mol.vertices)}
+	atoms = tuple((a.symbol, a.charge, a.isotope, a.multiplicity, a.valency,
+		a.explicit_hydrogens, a.x, a.y, a.z) for a in mol.vertices)
+	bonds = sorted((index[b.vertices[0]], index[b.vertices[1]], b.order, b.aromatic,
+		b.type, b.line_color, b.wavy_style, b.center) for b in mol.edges)
+	return (atoms, tuple(bonds))
+
+
+#============================================
+def _sample():
+	"""Parse a molecule with charge, isotope and varied bond data."""
+	mol = oasa.smiles_lib.text_to_mol("[13CH3]C(=O)[O-].c1ccncc1")
+	bond = sorted(mol.edges, key=lambda b: b.order)[0]
+	bond.type = "w"
+	bond.line_color = "#ff0000"
+	mol.vertices[0].multiplicity = 2
+	return mol
+
+
+#============================================
+def test_roundtrip_is_lossless():
+	mol = _sample()
+	frozen = FrozenMolecule.from_molecule(mol)
+	assert _signature(frozen.to_molecule()) == _signature(mol)
+
+
+#============================================
+def test_unset_coordinates_and_aromatic_order_roundtrip():
+	mol = oasa.smiles_lib.text_to_mol("c1ccccc1", calc_coords=0, localize_aromatic_bonds=False)
+	for b in mol.edges:
+		b.order = 4
+	thawed = FrozenMolecule.from_molecule(mol).to_molecule()
+	assert _signature(thawed) == _signature(mol)
+	assert all(b.order == 4 for b in thawed.edges)
+
+
+#============================================
+def test_csr_adjacency_matches_graph():
+	mol = _sample()
+	frozen = FrozenMolecule.from_molecule(mol)
+	for i, v in enumerate(mol.vertices):
+		expected = sorted(mol.vertices.index(n) for n in v.neighbors)
+		assert sorted(frozen.neighbors(i).tolist()) == expected
+	assert not frozen.indices.flags.writeable
+
+
+#============================================
+def test_table_indexing_roundtrip():
+	mols = [_sample(), oasa.smiles_lib.text_to_mol("CCO"), oasa.smiles_lib.text_to_mol("C1CC1")]
+	table = MoleculeTable.from_molecules(mols)
+	assert len(table) == 3
+	for mol, frozen in zip(mols, table):
+		assert _signature(frozen.to_molecule()) == _signature(mol)
+	assert table[-1].symbols == ["C", "C", "C"]
+	with pytest.raises(IndexError):
+		table[3]
+
+
+#============================================
+def test_writers_and_renderer_accept_frozen():
+	mol = oasa.smiles_lib.text_to_mol("CC(=O)O")
+	frozen = FrozenMolecule.from_molecule(mol)
+	assert oasa.smiles_lib.mol_to_text(frozen) == oasa.smiles_lib.mol_to_text(mol)
+	assert "M  END" in oasa.molfile_lib.mol_to_text(frozen)
+	ops = oasa.render_lib.molecule_ops.molecule_to_ops(frozen)
+	assert len(ops) == len(oasa.render_lib.molecule_ops.molecule_to_ops(mol))
+
+
+#============================================
+def test_plain_molecules_do_not_load_numpy():
+	code = (
+		"import sys\n"
+		"import oasa.molecule_lib\n"
+		"mol = oasa.molecule_lib.Molecule()\n"
+		"assert oasa.molecule_lib.as_molecule(mol) is mol\n"
+		"import oasa.frozen_molecule\n"
+		"print(' '.join(sorted({'numpy'} & set(sys.modules))))\n"
+	)
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+	output = subprocess.check_output([sys.executable, "-c", code], env=env, text=True)
+	assert output.split() == []
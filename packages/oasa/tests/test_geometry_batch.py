@@ -0,0 +1,120 @@
+"""Parity tests for the NumPy-batched kernels in render_lib.low_level_geometry."""
+
+# Standard Library
+import random
+
+# PIP3 modules
+import numpy
+
+# local repo modules
+import oasa.peptide_utils
+import oasa.smiles_lib
+from oasa.render_lib import low_level_geometry as llg
+from oasa.render_lib import molecule_ops
+from oasa.render_lib.bond_ops import _avoid_cross_label_overlaps
+from oasa.render_lib.data_types import make_box_target
+from oasa.render_lib.data_types import make_circle_target
+from oasa.render_lib.data_types import make_composite_target
+from oasa.render_lib.data_types import make_segment_target
+
+
+#============================================
+def _random_point(rng) -> tuple:
+	# a coarse lattice produces collinear and touching cases too
+	return (rng.choice(range(-4, 5)) * 0.5, rng.choice(range(-4, 5)) * 0.5)
+
+
+#============================================
+def _random_targets(rng, count: int) -> list:
+	targets = []
+	for _ in range(count):
+		x, y = _random_point(rng)
+		kind = rng.choice(("box", "circle", "composite", "segment"))
+		box = make_box_target((x, y, x + rng.uniform(0.2, 2.0), y + rng.uniform(0.2, 2.0)))
+		circle = make_circle_target((x, y), rng.uniform(0.1, 1.5))
+		if kind == "box":
+			targets.append(box)
+		elif kind == "circle":
+			targets.append(circle)
+		elif kind == "composite":
+			targets.append(make_composite_target([box, circle]))
+		else:
+			targets.append(make_segment_target((x, y), (x + 1.0, y)))
+	return targets
+
+
+#============================================
+def test_segment_kernels_match_scalar():
+	rng = random.Random(7)
+	segments = [(_random_point(rng), _random_point(rng)) for _ in range(60)]
+	p1 = numpy.array([s[0] for s in segments])[:, None, :]
+	p2 = numpy.array([s[1] for s in segments])[:, None, :]
+	q1 = numpy.array([s[0] for s in segments])[None, :, :]
+	q2 = numpy.array([s[1] for s in segments])[None, :, :]
+	intersect = llg._segments_intersect_batch(p1, p2, q1, q2)
+	distance = llg._distance_sq_segment_to_segment_batch(p1, p2, q1, q2)
+	for i, (a1, a2) in enumerate(segments):
+		for j, (b1, b2) in enumerate(segments):
+			assert intersect[i, j] == llg._segments_intersect(a1, a2, b1, b2)
+			assert distance[i, j] == llg._distance_sq_segment_to_segment(a1, a2, b1, b2)
+
+
+#============================================
+def test_box_distance_matches_scalar():
+	rng = random.Random(11)
+	boxes = [(*_random_point(rng), *_random_point(rng)) for _ in range(40)]
+	for _ in range(40):
+		start, end = _random_point(rng), _random_point(rng)
+		batch = llg._segment_distance_to_box_sq_batch(start, end, numpy.array(boxes))
+		expected = [llg._segment_distance_to_box_sq(start, end, box) for box in boxes]
+		assert batch.tolist() == expected
+
+
+#============================================
+def test_capsule_batch_matches_scalar():
+	rng = random.Random(3)
+	targets = _random_targets(rng, 50)
+	packed = llg.pack_attach_targets(dict(enumerate(targets)))
+	for _ in range(60):
+		start, end = _random_point(rng), _random_point(rng)
+		half_width = rng.uniform(0.0, 0.6)
+		batch = llg._capsule_intersects_targets_batch(start, end, half_width, packed, 0.5)
+		expected = [llg._capsule_intersects_target(start, end, half_width, t, 0.5) for t in targets]
+		assert batch.tolist() == expected
+
+
+#============================================
+def test_avoid_cross_label_overlaps_batched_matches_scalar():
+	rng = random.Random(5)
+	targets = dict(enumerate(_random_targets(rng, 30)))
+	packed = llg.pack_attach_targets(targets)
+	for _ in range(40):
+		start, end = _random_point(rng), _random_point(rng)
+		own = {rng.randrange(30)}
+		plain = _avoid_cross_label_overlaps(start, end, 0.3, own, targets)
+		batched = _avoid_cross_label_overlaps(start, end, 0.3, own, targets, target_arrays=packed)
+		assert batched == plain
+
+
+#============================================
+def test_molecule_to_ops_same_with_and_without_batching(monkeypatch):
+	smiles = oasa.peptide_utils.sequence_to_smiles("DESKTWYNQG" * 2)
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=30)
+	_shown, label_targets, _attach = molecule_ops.build_label_attach_targets(mol.vertices)
+	assert len(label_targets) >= molecule_ops.BATCH_GEOMETRY_MIN_TARGETS
+	batched = molecule_ops.molecule_to_ops(mol)
+	monkeypatch.setattr(molecule_ops, "BATCH_GEOMETRY_MIN_TARGETS", 10**9)
+	plain = molecule_ops.molecule_to_ops(mol)
+	assert batched == plain
+
+
+#============================================
+def test_molecule_to_ops_without_numpy(monkeypatch):
+	smiles = oasa.peptide_utils.sequence_to_smiles("DESKTWYNQG" * 2)
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=30)
+	batched = molecule_ops.molecule_to_ops(mol)
+	# simulate a missing NumPy: packing is skipped and the scalar path runs
+	monkeypatch.setattr(llg, "_numpy", None)
+	_shown, label_targets, _attach = molecule_ops.build_label_attach_targets(mol.vertices)
+	assert llg.pack_attach_targets(label_targets) is None
+	assert molecule_ops.molecule_to_ops(mol) == batched
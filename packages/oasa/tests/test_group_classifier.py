@@ -0,0 +1,90 @@
+"""Tests for the compiled functional-group classifier."""
+
+# local repo modules
+import oasa.smiles_lib
+from oasa import group_classifier
+from oasa import subsearch_data
+
+
+#============================================
+def _mol(smiles):
+	return oasa.smiles_lib.text_to_mol(smiles, calc_coords=0)
+
+
+#============================================
+def _labels_by_index(classifier, mol) -> dict:
+	index = {v: i for i, v in enumerate(mol.vertices)}
+	return {index[atom]: names for atom, names in classifier.label_atoms(mol).items()}
+
+
+#============================================
+def test_every_table_pattern_compiles():
+	patterns = group_classifier.compile_patterns()
+	assert len(patterns) == len(subsearch_data.structures) + len(subsearch_data.rings)
+	keys = [group_classifier._selectivity(p) for p in patterns]
+	assert keys == sorted(keys)
+
+
+#============================================
+def test_get_classifier_compiles_once():
+	assert group_classifier.get_classifier() is group_classifier.get_classifier()
+
+
+#============================================
+def test_legacy_hydrogens_are_kept():
+	"""Bare H atoms and bracket H counts become explicit_hydrogens."""
+	aldehyde, labelled = group_classifier.parse_pattern("HC=O")
+	assert [(v.symbol, v.explicit_hydrogens) for v in aldehyde.vertices] == [("C", 1), ("O", 0)]
+	assert labelled == (0, 1)
+	alcohol, labelled = group_classifier.parse_pattern("C-[OH]", [1])
+	assert [(v.symbol, v.explicit_hydrogens) for v in alcohol.vertices] == [("C", 0), ("O", 1)]
+	assert labelled == (1,)
+
+
+#============================================
+def test_classify_distinguishes_groups():
+	classifier = group_classifier.get_classifier()
+	assert classifier.classify(_mol("CCO")) == {"alcohol"}
+	assert classifier.classify(_mol("COC")) == {"ether"}
+	assert classifier.classify(_mol("CC=O")) == {"aldehyde"}
+	assert classifier.classify(_mol("CC(=O)C")) == {"ketone"}
+	assert classifier.classify(_mol("CCCC")) == frozenset()
+
+
+#============================================
+def test_label_atoms_skips_substituent_positions():
+	classifier = group_classifier.get_classifier()
+	assert _labels_by_index(classifier, _mol("CC(=O)C")) == {1: ("ketone",), 2: ("ketone",)}
+	labels = _labels_by_index(classifier, _mol("Oc1ccccc1"))
+	assert labels[0] == ("alcohol",)
+	assert all(labels[i] == ("benzene",) for i in range(1, 7))
+
+
+#============================================
+def test_matches_separate_pattern_search():
+	"""The compiled classifier finds what matching each pattern alone finds."""
+	classifier = group_classifier.get_classifier()
+	for smiles in ("CC(=O)Oc1ccccc1C(=O)O", "NCCc1ccc(O)c(O)c1", "C1CCNCC1", "CC(=O)[O-]"):
+		mol = _mol(smiles)
+		expected = set()
+		for pattern in classifier.patterns:
+			if mol.contains_substructure(pattern.query):
+				expected.add(pattern.name)
+		assert classifier.classify(mol) == expected
+
+
+#============================================
+def test_classify_many_in_pool_matches_serial():
+	classifier = group_classifier.get_classifier()
+	mols = [_mol(s) for s in ("CCO", "CC(=O)O", "c1ccncc1", "CCN(C)C")] * 3
+	serial = list(classifier.classify_many(mols))
+	assert serial == [classifier.classify(mol) for mol in mols]
+	assert list(classifier.classify_many(mols, workers=2, chunk_size=2)) == serial
+
+
+#============================================
+def test_custom_tables():
+	classifier = group_classifier.GroupClassifier(
+		structures=[("nitrile", "nitrile", "C#N", [])], rings=[])
+	assert classifier.classify(_mol("CC#N")) == {"nitrile"}
+	assert classifier.classify(_mol("CCO")) == frozenset()
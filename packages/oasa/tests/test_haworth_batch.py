@@ -0,0 +1,110 @@
+"""Tests for the batch Haworth renderer and the haworth-batch CLI."""
+
+# Standard Library
+import io
+import json
+
+# Third Party
+import pytest
+
+# local repo modules
+import oasa_cli
+from oasa import render_out
+from oasa import sugar_code_smiles
+from oasa.haworth import batch as haworth_batch
+from oasa.haworth import layout as haworth_layout
+
+
+#============================================
+def test_read_jobs_csv_applies_defaults_and_row_options():
+	table = io.StringIO(
+		"input,name,mode,stereo,formats\n"
+		"ARLRDM,glucose,,beta,\n"
+		"\n"
+		"# skipped,x,,,\n"
+		"C1CCOCC1,,furanose,,svg png\n"
+		"CCO,glucose,,,\n"
+	)
+	jobs = haworth_batch.read_jobs(table, stereo="alpha", formats=("svg",))
+	assert [job.name for job in jobs] == ["glucose", "row_0002", "glucose_0003"]
+	assert jobs[0].stereo == "beta"
+	assert jobs[0].mode == "pyranose"
+	assert jobs[1].stereo == "alpha"
+	assert jobs[1].mode == "furanose"
+	assert jobs[1].formats == ("svg", "png")
+
+
+#============================================
+def test_resolve_smiles_converts_sugar_codes():
+	jobs = haworth_batch.read_jobs(io.StringIO("input\tstereo\nARLRDM\talpha\nC1CCOCC1\t\n"))
+	kind, smiles, series = haworth_batch.resolve_smiles(jobs[0])
+	assert kind == "sugar_code"
+	assert smiles == sugar_code_smiles.sugar_code_to_smiles("ARLRDM", "pyranose", "alpha")
+	assert series == "D"
+	assert haworth_batch.resolve_smiles(jobs[1]) == ("smiles", "C1CCOCC1", None)
+
+
+#============================================
+def test_haworth_batch_cli_writes_outputs_and_manifest(tmp_path):
+	table = tmp_path / "jobs.tsv"
+	table.write_text(
+		"input\tname\tstereo\n"
+		"ARLRDM\tglucose\talpha\n"
+		"ARLRDM\tmissing_stereo\t\n"
+		"C1CCOCC1\toxane\t\n",
+		encoding="utf-8",
+	)
+	out_dir = tmp_path / "out"
+	oasa_cli.main(["haworth-batch", "-i", str(table), "-o", str(out_dir), "-w", "1"])
+	manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+	assert (manifest["total"], manifest["rendered"], manifest["failed"]) == (3, 2, 1)
+	rows = {row["name"]: row for row in manifest["rows"]}
+	assert rows["missing_stereo"]["error"]["error_type"] == "ValueError"
+	assert rows["glucose"]["input_kind"] == "sugar_code"
+	assert rows["glucose"]["seconds"] >= 0.0
+	assert "<svg" in (out_dir / "glucose.svg").read_text(encoding="utf-8")
+	assert (out_dir / "oxane.svg").is_file()
+
+
+#============================================
+def _record_layouts(monkeypatch) -> list:
+	"""Collect every molecule the batch lays out, for re-rendering."""
+	built = []
+	original_build = haworth_layout.build_haworth
+
+	def _recording_build(mol, **kwargs):
+		built.append(mol)
+		return original_build(mol, **kwargs)
+
+	monkeypatch.setattr(haworth_layout, "build_haworth", _recording_build)
+	return built
+
+
+#============================================
+def test_batch_png_matches_single_file_render(monkeypatch, tmp_path):
+	painted = []
+
+	def _capture(ops, output_target, fmt, width, height, options):
+		# bond ops follow set iteration, so compare them as a sorted multiset
+		painted.append((fmt, sorted(repr(op) for op in ops), width, height))
+
+	monkeypatch.setattr(render_out, "_render_cairo", _capture)
+	built = _record_layouts(monkeypatch)
+	job = haworth_batch.read_jobs(io.StringIO("input\tstereo\tformats\nARLRDM\talpha\tsvg png\n"))[0]
+	result = haworth_batch.render_job(job, str(tmp_path))
+	assert result.error is None
+	# the single-file path of oasa_cli.py haworth -o name.png, on the same layout
+	render_out.mol_to_output(built[0], str(tmp_path / "single.png"), format="png")
+	assert [entry[0] for entry in painted] == ["png", "png"]
+	assert painted[0][1:] == painted[1][1:]
+
+
+#============================================
+def test_batch_png_bytes_match_single_file_render(monkeypatch, tmp_path):
+	pytest.importorskip("cairo")
+	built = _record_layouts(monkeypatch)
+	job = haworth_batch.read_jobs(io.StringIO("input\tname\tstereo\tformats\nARLRDM\tglucose\talpha\tsvg png\n"))[0]
+	assert haworth_batch.render_job(job, str(tmp_path)).error is None
+	single = tmp_path / "single.png"
+	render_out.mol_to_output(built[0], str(single), format="png")
+	assert (tmp_path / "glucose.png").read_bytes() == single.read_bytes()
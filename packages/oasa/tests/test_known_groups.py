@@ -0,0 +1,75 @@
+"""Tests for the pre-parsed group fragment cache in known_groups."""
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+import oasa.linear_formula
+from oasa import cdml
+from oasa import known_groups
+from oasa import smiles_lib
+
+
+GROUP_CDML = """\
+<cdml version="26.02" xmlns="http://www.freesoftware.fsf.org/bkchem/cdml">
+  <molecule id="m1">
+    <atom id="a1" name="Ph"><point x="1.0cm" y="1.0cm"/></atom>
+    <atom id="a2" name="C"><point x="2.0cm" y="1.0cm"/></atom>
+    <atom id="a3" name="Ph"><point x="3.0cm" y="1.0cm"/></atom>
+    <bond type="n1" start="a1" end="a2"/>
+    <bond type="n1" start="a2" end="a3"/>
+  </molecule>
+</cdml>
+"""
+
+
+#============================================
+def _describe(mol) -> tuple:
+	index = {v: i for i, v in enumerate(mol.vertices)}
+	atoms = [(v.symbol, v.charge, v.explicit_hydrogens, v.isotope, v.properties_)
+		for v in mol.vertices]
+	bonds = sorted((index[e.vertices[0]], index[e.vertices[1]], e.order, e.aromatic, e.type)
+		for e in mol.edges)
+	return (atoms, bonds)
+
+
+#============================================
+@pytest.mark.parametrize("smiles_text", sorted(set(known_groups.cdml_to_smiles.values())
+	| set(known_groups.name_to_smiles.values())))
+def test_fragment_matches_fresh_parse(smiles_text):
+	"""Copies equal a fresh parse; unparsable entries still raise."""
+	try:
+		expected = _describe(smiles_lib.text_to_mol(smiles_text, calc_coords=0))
+	except ValueError:
+		with pytest.raises(ValueError):
+			known_groups.group_fragment(smiles_text)
+		assert smiles_text not in known_groups._fragment_templates
+		return
+	assert _describe(known_groups.group_fragment(smiles_text)) == expected
+
+
+#============================================
+def test_fragments_are_independent_copies():
+	first = known_groups.group_fragment("C(=O)O")
+	first.vertices[0].symbol = "N"
+	first.add_missing_hydrogens()
+	second = known_groups.group_fragment("C(=O)O")
+	assert [v.symbol for v in second.vertices] == ["C", "O", "O"]
+	assert not set(first.vertices) & set(second.vertices)
+
+
+#============================================
+def test_repeated_groups_share_one_parse(monkeypatch):
+	calls = []
+	parse = smiles_lib.text_to_mol
+
+	def counting_parse(text, **kwargs):
+		calls.append(text)
+		return parse(text, **kwargs)
+
+	monkeypatch.setattr(known_groups, "_fragment_templates", {})
+	monkeypatch.setattr(smiles_lib, "text_to_mol", counting_parse)
+	mol = cdml.text_to_mol(GROUP_CDML)
+	assert len(mol.vertices) == 13
+	assert len(oasa.linear_formula.linear_formula("PhCH2Ph").molecule.vertices) == 13
+	assert calls == ["c1ccccc1"]
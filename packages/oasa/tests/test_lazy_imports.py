@@ -0,0 +1,61 @@
+"""Tests that RDKit, pycairo and NumPy are imported on first use, not on import."""
+
+# Standard Library
+import os
+import sys
+import subprocess
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+from oasa import coords_generator
+from oasa import known_groups
+from oasa.render_lib import font_metrics
+
+
+# modules BKChem-Qt loads before its first paint
+STARTUP_MODULES = (
+	"oasa.cdml",
+	"oasa.cdml_writer",
+	"oasa.known_groups",
+	"oasa.coords_generator",
+	"oasa.render_lib.molecule_ops",
+)
+
+
+#============================================
+def _loaded_after_import(module_name: str) -> set:
+	"""Import module_name in a fresh interpreter; return heavy modules loaded."""
+	code = (
+		f"import sys, {module_name}\n"
+		"print(' '.join(sorted({'rdkit', 'cairo', 'numpy'} & set(sys.modules))))\n"
+	)
+	env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+	output = subprocess.check_output([sys.executable, "-c", code], env=env, text=True)
+	return set(output.split())
+
+
+#============================================
+@pytest.mark.parametrize("module_name", STARTUP_MODULES)
+def test_import_does_not_load_rdkit_cairo_or_numpy(module_name):
+	assert _loaded_after_import(module_name) == set()
+
+
+#============================================
+def test_first_use_still_reaches_rdkit():
+	assert len(known_groups.group_fragment("c1ccccc1").vertices) == 6
+	mol = known_groups.group_fragment("CCO")
+	coords_generator.calculate_coords(mol, bond_length=1.0, force=1)
+	assert all(v.x is not None and v.y is not None for v in mol.vertices)
+
+
+#============================================
+def test_cairo_loaded_on_first_measurement(monkeypatch):
+	monkeypatch.setattr(font_metrics, "_cairo", font_metrics._NOT_LOADED)
+	cairo = font_metrics._cairo_module()
+	assert font_metrics._cairo is cairo
+	assert cairo is sys.modules.get("cairo")
+	# None, as set by tests simulating a missing pycairo, stays None
+	monkeypatch.setattr(font_metrics, "_cairo", None)
+	assert font_metrics._cairo_module() is None
@@ -1,3 +1,6 @@
+# Third Party
+import pytest
+
 # local repo modules
 import oasa_cli
 
@@ -12,3 +15,13 @@ def test_oasa_haworth_cli_svg(tmp_path):
 	with open(output_path, "r", encoding="utf-8") as handle:
 		svg_text = handle.read()
 	assert "<svg" in svg_text
+
+
+#============================================
+def test_oasa_haworth_cli_formats_flag(tmp_path):
+	output_path = tmp_path / "haworth_multi.out"
+	argv = ["haworth", "-s", "C1CCOCC1", "-o", str(output_path), "--formats", "svg"]
+	oasa_cli.main(argv)
+	assert (tmp_path / "haworth_multi.svg").is_file()
+	with pytest.raises(SystemExit):
+		oasa_cli.parse_args(["haworth", "-s", "C", "-o", "x.svg", "--formats", "svg,gif"])
@@ -156,6 +156,50 @@ def test_sdf_empty_raises():
 		rdkit_formats.sdf_text_to_mol("")
 
 
+#============================================
+def test_sdf_stream_roundtrip_keeps_name_and_data_fields():
+	"""Streamed records keep order, title and SD data fields."""
+	mol1 = _make_simple_mol()
+	mol1.name = "methanol-ish"
+	mol1.data_fields = {"ID": "A-1", "MW": "31.03"}
+	mol2 = _make_ethanol()
+	mol2.name = "ethanol"
+	mol2.data_fields = {"ID": "A-2"}
+	out = io.StringIO()
+	count = rdkit_formats.sdf_mols_to_stream(iter([mol1, mol2]), out)
+	assert count == 2
+	out.seek(0)
+	loaded = list(rdkit_formats.sdf_iter_file_to_mols(out))
+	assert [len(m.atoms) for m in loaded] == [2, 3]
+	assert [m.name for m in loaded] == ["methanol-ish", "ethanol"]
+	assert loaded[0].data_fields == {"ID": "A-1", "MW": "31.03"}
+	assert loaded[1].data_fields == {"ID": "A-2"}
+
+
+#============================================
+def test_sdf_stream_reads_binary_and_skips_bad_records():
+	"""Binary handles work and an unparseable record is skipped."""
+	good = rdkit_formats.sdf_mol_to_text(_make_ethanol())
+	bad = "broken\n\n\n  1  0  0  0  0  0  0  0  0  0999 V2000\nM  END\n$$$$\n"
+	data = (good + bad + good).encode("utf-8")
+	loaded = list(rdkit_formats.sdf_iter_file_to_mols(io.BytesIO(data)))
+	assert len(loaded) == 2
+
+
+#============================================
+def test_sdf_codec_stream_capability():
+	"""The sdf codec advertises and uses its stream reader and writer."""
+	codec = oasa.codec_registry.get_codec("sdf")
+	assert codec.reads_stream is True
+	assert codec.writes_stream is True
+	out = io.StringIO()
+	codec.write_stream([_make_simple_mol(), _make_ethanol()], out)
+	out.seek(0)
+	assert len(list(codec.read_stream(out))) == 2
+	out.seek(0)
+	assert len(codec.read_file(out).atoms) == 5
+
+
 # ===================================================================
 # SDF V3000 tests
 # ===================================================================
@@ -307,6 +351,14 @@ def test_smiles_benzene():
 	assert len(text) > 0
 
 
+#============================================
+def test_smiles_canonical_text_ignores_spelling():
+	assert rdkit_formats.smiles_canonical_text("OCC") == rdkit_formats.smiles_canonical_text("C(O)C")
+	assert rdkit_formats.smiles_canonical_text("C[C@H](N)O") != rdkit_formats.smiles_canonical_text("C[C@@H](N)O")
+	with pytest.raises(ValueError):
+		rdkit_formats.smiles_canonical_text("C1CC")
+
+
 # ===================================================================
 # NxN cholesterol super roundtrip test
 # ===================================================================
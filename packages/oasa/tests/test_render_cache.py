@@ -0,0 +1,113 @@
+"""Tests for the content-addressed render-ops cache."""
+
+# Standard Library
+import io
+
+# Third Party
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+from oasa import render_cache
+from oasa import render_ops
+from oasa import render_out
+from oasa.render_lib import molecule_ops
+
+
+#============================================
+def _mol(smiles="CC(=O)N"):
+	return oasa.smiles_lib.text_to_mol(smiles, calc_coords=1)
+
+
+#============================================
+def test_render_key_depends_on_content_not_identity():
+	first = _mol()
+	second = _mol()
+	assert render_cache.render_key(first, {}) == render_cache.render_key(second, {})
+	assert render_cache.render_key(first, {"font_size": 10.0}) != render_cache.render_key(first, {})
+	second.vertices[0].x += 0.5
+	assert render_cache.render_key(first, {}) != render_cache.render_key(second, {})
+	second = _mol()
+	second.vertices[1].charge = 1
+	assert render_cache.render_key(first, {}) != render_cache.render_key(second, {})
+
+
+#============================================
+def test_lru_respects_memory_cap():
+	ops = molecule_ops.molecule_to_ops(_mol())
+	size = render_cache._ops_nbytes(tuple(ops))
+	cache = render_cache.RenderOpsCache(max_bytes=int(size * 2.5))
+	cache.put("a", ops)
+	cache.put("b", ops)
+	assert cache.get("a") == ops
+	cache.put("c", ops)
+	assert len(cache) == 2
+	assert cache.get("b") is None
+	assert cache.get("a") == ops
+	assert cache.nbytes <= cache.max_bytes
+
+
+#============================================
+def test_disk_tier_roundtrips_ops(tmp_path):
+	ops = molecule_ops.molecule_to_ops(_mol("c1ccccc1O"))
+	cache = render_cache.RenderOpsCache(cache_dir=str(tmp_path))
+	cache.put("k" * 64, ops)
+	fresh = render_cache.RenderOpsCache(cache_dir=str(tmp_path))
+	loaded = fresh.get("k" * 64)
+	assert render_ops.ops_to_json_dict(loaded) == render_ops.ops_to_json_dict(ops)
+	assert fresh.hits == 1
+
+
+#============================================
+def test_render_key_covers_z_and_skips_unstable_values():
+	first = _mol()
+	second = _mol()
+	second.vertices[0].z = 1.0
+	assert render_cache.render_key(first, {}) != render_cache.render_key(second, {})
+	# plain property values are keyed by content
+	first.vertices[0].properties_["tag"] = ("a", 1)
+	second = _mol()
+	second.vertices[0].properties_["tag"] = ("a", 1)
+	assert render_cache.render_key(first, {}) == render_cache.render_key(second, {})
+	# an object's repr carries its address, so such molecules get no key
+	first.vertices[0].properties_["owner"] = object()
+	assert render_cache.render_key(first, {}) is None
+
+
+#============================================
+def test_json_keeps_rgba_and_rejects_unknown_ops():
+	op = render_ops.LineOp(p1=(0.0, 0.0), p2=(1.0, 0.0), width=1.0, color=(1.0, 0.0, 0.0, 0.5))
+	entries = render_ops.ops_to_json_dict([op], keep_rgba=True)
+	assert entries[0]["color"] == [1.0, 0.0, 0.0, 0.5]
+	assert render_ops.ops_from_json_dict(entries) == [op]
+	assert render_ops.ops_to_json_dict([op])[0]["color"] == "#ff0000"
+	with pytest.raises(ValueError):
+		render_ops.ops_to_json_dict([op, object()])
+
+
+#============================================
+def test_render_out_cache_is_opt_in(monkeypatch):
+	calls = []
+	original = render_out.molecule_to_ops
+
+	def _counting(*args, **kwargs):
+		calls.append(1)
+		return original(*args, **kwargs)
+
+	def _no_key(*args, **kwargs):
+		raise AssertionError("render_key() called without a cache")
+
+	monkeypatch.setattr(render_out, "molecule_to_ops", _counting)
+	monkeypatch.setattr(render_cache, "render_key", _no_key)
+	render_out.render_to_svg(_mol(), io.StringIO())
+	render_out.render_to_svg(_mol(), io.StringIO())
+	assert len(calls) == 2
+	monkeypatch.undo()
+	monkeypatch.setattr(render_out, "molecule_to_ops", _counting)
+	cache = render_cache.RenderOpsCache()
+	first = io.StringIO()
+	render_out.render_to_svg(_mol(), first, ops_cache=cache)
+	second = io.StringIO()
+	render_out.render_to_svg(_mol(), second, ops_cache=cache)
+	assert len(calls) == 3
+	assert first.getvalue() == second.getvalue()
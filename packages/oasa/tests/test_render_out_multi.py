@@ -0,0 +1,85 @@
+"""Tests for single-pass multi-format export in render_out."""
+
+# Standard Library
+import io
+
+# Third Party
+import pytest
+
+# local repo modules
+import oasa.smiles_lib
+from oasa import render_out
+
+
+#============================================
+def _capture_cairo(monkeypatch) -> list:
+	"""Replace _render_cairo with a stub that records what it would paint."""
+	painted = []
+
+	def _capture(ops, output_target, fmt, width, height, options):
+		painted.append((fmt, list(ops), width, height))
+
+	monkeypatch.setattr(render_out, "_render_cairo", _capture)
+	return painted
+
+
+#============================================
+def test_mol_to_outputs_builds_ops_once_per_scaling(monkeypatch):
+	mol = oasa.smiles_lib.text_to_mol("c1ccccc1O", calc_coords=30)
+	calls = []
+	original = render_out.molecule_to_ops
+
+	def _counting(*args, **kwargs):
+		calls.append(1)
+		return original(*args, **kwargs)
+
+	monkeypatch.setattr(render_out, "molecule_to_ops", _counting)
+	painted = _capture_cairo(monkeypatch)
+	svg_buffer = io.StringIO()
+	written = render_out.mol_to_outputs(
+		mol,
+		{"svg": svg_buffer, "png": io.BytesIO(), "pdf": io.BytesIO()},
+	)
+	assert list(written) == ["svg", "png", "pdf"]
+	# SVG and PDF share the 1.0 pass; PNG gets its own 2.0 pass
+	assert len(calls) == 2
+	assert "<svg" in svg_buffer.getvalue()
+	assert [entry[0] for entry in painted] == ["png", "pdf"]
+	single = io.StringIO()
+	render_out.render_to_svg(mol, single)
+	assert single.getvalue() == svg_buffer.getvalue()
+	calls.clear()
+	render_out.mol_to_outputs(mol, {"svg": io.StringIO(), "png": io.BytesIO()}, scaling=3.0)
+	assert len(calls) == 1
+
+
+#============================================
+def test_mol_to_outputs_png_matches_render_to_png_ops(monkeypatch):
+	mol = oasa.smiles_lib.text_to_mol("CC(=O)Nc1ccc(O)cc1", calc_coords=30)
+	painted = _capture_cairo(monkeypatch)
+	render_out.mol_to_outputs(mol, {"svg": io.StringIO(), "png": io.BytesIO()})
+	render_out.render_to_png(mol, io.BytesIO())
+	assert [entry[0] for entry in painted] == ["png", "png"]
+	assert painted[0][1:] == painted[1][1:]
+
+
+#============================================
+def test_mol_to_outputs_png_pixels_match_render_to_png():
+	pytest.importorskip("cairo")
+	mol = oasa.smiles_lib.text_to_mol("CC(=O)Nc1ccc(O)cc1", calc_coords=30)
+	multi = io.BytesIO()
+	render_out.mol_to_outputs(mol, {"svg": io.StringIO(), "png": multi})
+	single = io.BytesIO()
+	render_out.render_to_png(mol, single)
+	assert multi.getvalue() == single.getvalue()
+
+
+#============================================
+def test_mol_to_outputs_infers_formats_from_paths(tmp_path):
+	mol = oasa.smiles_lib.text_to_mol("CCO", calc_coords=30)
+	path = tmp_path / "ethanol.svg"
+	written = render_out.mol_to_outputs(mol, [str(path)])
+	assert written == {"svg": str(path)}
+	assert path.read_text(encoding="utf-8").startswith("<?xml")
+	with pytest.raises(ValueError):
+		render_out.mol_to_outputs(mol, {"gif": io.BytesIO()})
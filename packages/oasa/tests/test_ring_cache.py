@@ -0,0 +1,157 @@
+"""Tests for the per ring system cache behind Graph ring perception.
+
+Each test edits a parsed molecule and checks that rings of untouched ring
+systems are reused while the result still matches a fresh perception.
+"""
+
+# local repo modules
+import oasa.smiles_lib
+
+
+#============================================
+def _parse(smiles: str):
+	"""Parse SMILES without coordinates and drop zero-order bonds."""
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=0)
+	mol.remove_zero_order_bonds()
+	return mol
+
+
+#============================================
+def _fresh_ring_systems(mol) -> set:
+	"""Return ring system vertex sets from an uncached perception."""
+	mol._flush_cache()
+	systems = {frozenset(s.vertices) for s in _systems(mol)}
+	return systems
+
+
+#============================================
+def _systems(mol) -> list:
+	"""Return the cached RingSystem objects after a refresh."""
+	mol.get_smallest_independent_cycles()
+	return list(mol._ring_cache._systems.values())
+
+
+#============================================
+def _circuit_rank(mol) -> int:
+	"""Number of independent cycles: E - V + components."""
+	rank = len(mol.edges) - len(mol.vertices) + len(mol.get_connected_components())
+	return rank
+
+
+#============================================
+def test_substituent_edit_keeps_all_ring_systems():
+	"""Adding and removing an acyclic substituent reuses every system."""
+	mol = _parse("c1ccccc1CCc1ccc2ccccc2c1")
+	before = {id(s) for s in _systems(mol)}
+	anchor = [v for v in mol.vertices if v.symbol == 'C' and v.degree == 2][0]
+	methyl = mol.create_vertex()
+	mol.add_vertex(methyl)
+	mol.add_edge(anchor, methyl)
+	assert {id(s) for s in _systems(mol)} == before
+	mol.remove_vertex(methyl)
+	assert {id(s) for s in _systems(mol)} == before
+
+
+#============================================
+def test_ring_bond_removal_only_stales_its_system():
+	"""Opening the naphthalene keeps the cached benzene system object."""
+	mol = _parse("c1ccccc1CCc1ccc2ccccc2c1")
+	systems = _systems(mol)
+	benzene = [s for s in systems if len(s.vertices) == 6][0]
+	naphthalene = [s for s in systems if len(s.vertices) == 10][0]
+	# pick a naphthalene edge that is not the fusion bond
+	fusion = [v for v in naphthalene.vertices if v.degree == 3]
+	edge = [e for e in naphthalene.edges if not set(e.vertices) & set(fusion)][0]
+	mol.disconnect_edge(edge)
+	after = _systems(mol)
+	assert benzene in after
+	assert len(mol.get_smallest_independent_cycles()) == _circuit_rank(mol)
+	assert {frozenset(s.vertices) for s in after} == _fresh_ring_systems(mol)
+
+
+#============================================
+def test_ring_closure_is_perceived():
+	"""Connecting the ends of a chain creates a new ring system."""
+	mol = _parse("CCCCCC.c1ccccc1")
+	assert len(mol.get_smallest_independent_cycles()) == 1
+	ends = [v for v in mol.vertices if v.degree == 1]
+	mol.add_edge(ends[0], ends[1])
+	cycles = mol.get_smallest_independent_cycles()
+	assert len(cycles) == 2
+	assert sorted(len(c) for c in cycles) == [6, 6]
+
+
+#============================================
+def test_temporary_disconnect_roundtrip_matches_fresh():
+	"""Stripping and reconnecting edges ends in the same ring systems."""
+	mol = _parse("C1CC2CCC1CC2c1ccccc1")
+	expected = _fresh_ring_systems(mol)
+	mol.get_smallest_independent_cycles()
+	for e in list(mol.edges):
+		if e.aromatic:
+			mol.temporarily_disconnect_edge(e)
+	mol.temporarily_strip_bridge_edges()
+	mol.reconnect_temporarily_disconnected_edges()
+	assert {frozenset(s.vertices) for s in _systems(mol)} == expected
+	assert len(mol.get_smallest_independent_cycles()) == _circuit_rank(mol)
+
+
+#============================================
+def test_all_cycles_match_uncached_perception():
+	"""Per system exhaustive perception equals the whole-graph algorithm."""
+	mol = _parse("C1CC2CCC1CC2c1ccc2ccccc2c1")
+	assert mol.get_all_cycles() == mol._get_all_cycles_uncached()
+
+
+#============================================
+def test_returned_rings_are_independent_copies():
+	"""Callers may mutate the returned list and sets without harm."""
+	mol = _parse("c1ccccc1")
+	rings = mol.get_smallest_independent_cycles()
+	rings[0].clear()
+	rings.clear()
+	assert len(mol.get_smallest_independent_cycles()[0]) == 6
+
+
+#============================================
+def _cached_then_fresh(mol) -> tuple:
+	"""Return the cached cycle basis and the one of a fresh perception."""
+	cached = mol.get_smallest_independent_cycles()
+	mol._flush_cache()
+	fresh = mol.get_smallest_independent_cycles()
+	return (cached, fresh)
+
+
+#============================================
+def test_cycles_after_edits_equal_fresh_perception():
+	"""Rings and their order after edits match a fresh perception.
+
+	Cages get a different basis from a different root, so each block must
+	be rooted the same way whatever the edit history.
+	"""
+	# methyl adamantane, cubane and naphthalene
+	mol = _parse("CC12CC3CC(CC(C3)C1)C2.C12C3C4C1C5C2C3C45.c1ccc2ccccc2c1")
+	mol.get_smallest_independent_cycles()
+	# drop the methyl, the first vertex of the graph
+	mol.remove_vertex(mol.vertices[0])
+	cached, fresh = _cached_then_fresh(mol)
+	assert cached == fresh
+	# open and close a cubane ring bond: the cubane system is perceived again
+	cubane_atom = [v for v in mol.vertices if v.degree == 3 and all(n.degree == 3 for n in v.neighbors)][0]
+	neighbor = cubane_atom.neighbors[0]
+	mol.disconnect(cubane_atom, neighbor)
+	mol.get_smallest_independent_cycles()
+	mol.add_edge(cubane_atom, neighbor)
+	cached, fresh = _cached_then_fresh(mol)
+	assert cached == fresh
+	# join two ring systems with a new chain
+	adamantane_atom = mol.vertices[0]
+	naphthalene_atom = mol.vertices[-1]
+	linker = mol.create_vertex()
+	mol.add_vertex(linker)
+	mol.add_edge(naphthalene_atom, linker)
+	mol.get_smallest_independent_cycles()
+	mol.add_edge(linker, adamantane_atom)
+	cached, fresh = _cached_then_fresh(mol)
+	assert cached == fresh
+	assert len(cached) == _circuit_rank(mol)
@@ -164,6 +164,139 @@ class TestRxBackendLazySync:
 		assert len(backend.rx) == 2
 
 
+#============================================
+class TestRxBackendIncremental:
+	"""Test in-place mirror patching by the Graph edit methods."""
+
+	#============================================
+	def _synced_chain4(self) -> tuple:
+		"""Build a chain of 4 vertices and sync its backend once.
+
+		Returns:
+			Tuple of (graph, vertices_list, edges_list).
+		"""
+		g = Graph()
+		verts = [Vertex() for _ in range(4)]
+		for v in verts:
+			g.add_vertex(v)
+		edges = [g.add_edge(verts[i], verts[i + 1]) for i in range(3)]
+		g._rx_backend.ensure_synced(g)
+		return g, verts, edges
+
+	#============================================
+	def _assert_mirror_matches(self, g):
+		"""Mirror maps and rx graph must match the OASA graph exactly."""
+		backend = g._rx_backend
+		assert set(backend.v_to_i) == set(g.vertices)
+		assert set(backend.e_to_i) == set(g.edges)
+		assert len(backend.rx) == len(g.vertices)
+		assert len(backend.rx.edge_list()) == len(g.edges)
+		for e, ei in backend.e_to_i.items():
+			v1, v2 = e.get_vertices()
+			pair = set(backend.rx.get_edge_endpoints_by_index(ei))
+			assert pair == {backend.v_to_i[v1], backend.v_to_i[v2]}
+
+	#============================================
+	def test_add_edge_patches_without_rebuild(self):
+		"""Adding an edge to a synced graph must not mark it dirty."""
+		g, verts, edges = self._synced_chain4()
+		g.add_edge(verts[3], verts[0])
+		assert g._rx_backend._dirty is False
+		self._assert_mirror_matches(g)
+		assert len(g.get_smallest_independent_cycles()) == 1
+
+	#============================================
+	def test_disconnect_edge_patches_without_rebuild(self):
+		"""Removing an edge splits the mirrored graph in place."""
+		g, verts, edges = self._synced_chain4()
+		g.disconnect_edge(edges[1])
+		assert g._rx_backend._dirty is False
+		self._assert_mirror_matches(g)
+		assert len(g.get_connected_components()) == 2
+
+	#============================================
+	def test_remove_vertex_and_recycle_index(self):
+		"""A new vertex may reuse a freed index and still map correctly."""
+		g, verts, edges = self._synced_chain4()
+		g.remove_vertex(verts[0])
+		v_new = Vertex()
+		g.add_vertex(v_new)
+		g.add_edge(v_new, verts[3])
+		assert g._rx_backend._dirty is False
+		self._assert_mirror_matches(g)
+		# components keep graph.vertices order despite the recycled index
+		g.add_vertex(Vertex())
+		components = g.get_connected_components()
+		assert v_new in components[0]
+		assert verts[1] in components[0]
+
+	#============================================
+	def test_temporary_disconnect_roundtrip(self):
+		"""Temporary disconnect and reconnect keep the mirror in sync."""
+		g, verts, edges = self._synced_chain4()
+		g.temporarily_disconnect_edge(edges[0])
+		self._assert_mirror_matches(g)
+		assert g.is_connected() is False
+		g.reconnect_temporarily_disconnected_edges()
+		assert g._rx_backend._dirty is False
+		self._assert_mirror_matches(g)
+		assert g.is_connected() is True
+
+	#============================================
+	def _rewire(self, g, e, old, new, assign):
+		"""Move one end of e from old to new without the Graph methods."""
+		v1, v2 = e.get_vertices()
+		other = v2 if v1 is old else v1
+		assign(e, (other, new))
+		old.remove_edge_and_neighbor(e)
+		other.add_neighbor(new, e)
+		new.add_neighbor(other, e)
+
+	#============================================
+	def test_rewired_edge_resyncs_mirror(self):
+		"""set_vertices() outside the Graph methods rebuilds the mirror."""
+		g, verts, edges = self._synced_chain4()
+		assert g.is_connected() is True
+		# chain 0-1-2-3 becomes triangle 0-1-2 and a lone vertex 3
+		self._rewire(g, edges[2], verts[3], verts[0], lambda e, vs: e.set_vertices(vs))
+		assert g._rx_backend._dirty is True
+		assert len(g.get_connected_components()) == 2
+		self._assert_mirror_matches(g)
+		assert [len(ring) for ring in g.get_smallest_independent_cycles()] == [3]
+
+	#============================================
+	def test_rewired_bond_vertices_resync_mirror(self):
+		"""Assigning bond.vertices keeps the molecule caches in sync."""
+		mol = graph_test_fixtures.make_hexane()["oasa_mol"]
+		assert mol.get_smallest_independent_cycles() == []
+		first = mol.vertices[0]
+		last = mol.vertices[-1]
+		bond = first.neighbor_edges[0]
+		# C1-C2 becomes C6-C2, closing a five-ring and leaving C1 alone
+		self._rewire(mol, bond, first, last, lambda e, vs: setattr(e, 'vertices', vs))
+		assert [len(ring) for ring in mol.get_smallest_independent_cycles()] == [5]
+		assert len(mol.get_connected_components()) == 2
+		self._assert_mirror_matches(mol)
+
+	#============================================
+	def test_reversed_edge_keeps_mirror(self):
+		"""Swapping the ends of an edge is not a rewiring."""
+		g, verts, edges = self._synced_chain4()
+		v1, v2 = edges[1].get_vertices()
+		edges[1].set_vertices((v2, v1))
+		assert g._rx_backend._dirty is False
+		self._assert_mirror_matches(g)
+
+	#============================================
+	def test_flush_cache_still_forces_rebuild(self):
+		"""Plain _flush_cache() keeps the full rebuild fallback."""
+		g, verts, edges = self._synced_chain4()
+		g._flush_cache()
+		assert g._rx_backend._dirty is True
+		assert g.is_connected() is True
+		self._assert_mirror_matches(g)
+
+
 #============================================
 class TestRxBackendAlgorithms:
 	"""Test algorithm delegates using molecule fixtures."""
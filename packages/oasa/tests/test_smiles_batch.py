@@ -0,0 +1,78 @@
+"""Tests for the batch SMILES pipeline and the smiles-batch CLI command."""
+
+# local repo modules
+import oasa_cli
+import oasa.smiles_lib
+from oasa import smiles_batch
+
+
+#============================================
+def _signature(mol) -> tuple:
+	"""Return a comparable summary of atoms, bonds and coordinates."""
+	atoms = tuple((a.symbol, a.charge, a.isotope, round(a.x, 6), round(a.y, 6))
+		for a in mol.vertices)
+	index = {a: i for i, a in enumerate(mol.vertices)}
+	bonds = tuple(sorted((index[b.vertices[0]], index[b.vertices[1]], b.order)
+		for b in mol.edges))
+	return (atoms, bonds)
+
+
+#============================================
+def test_pack_unpack_roundtrip():
+	"""A packed molecule rebuilds with the same atoms, bonds and coords."""
+	mol = oasa.smiles_lib.text_to_mol("[13CH3]C(=O)[O-].c1ccncc1")
+	rebuilt = smiles_batch.unpack_mol(smiles_batch.pack_mol(mol))
+	assert _signature(rebuilt) == _signature(mol)
+
+
+#============================================
+def test_results_ordered_with_error_records():
+	"""Results follow input order and bad records carry a BatchError."""
+	lines = ["CCO ethanol", "", "# comment", "C1CC", "c1ccccc1 benzene", "N"]
+	results = list(smiles_batch.iter_text_to_mols(lines, workers=1, chunk_size=2))
+	assert [r.index for r in results] == [0, 1, 2, 3]
+	assert [r.name for r in results] == ["ethanol", "", "benzene", ""]
+	assert results[1].mol is None
+	assert results[1].error is not None
+	assert results[0].error is None
+	assert len(results[2].mol.vertices) == 6
+
+
+#============================================
+def test_process_pool_matches_serial():
+	"""A two-worker pool returns the same molecules as serial conversion."""
+	lines = ["CCO", "CC(=O)O", "c1ccccc1O", "C1CCCCC1N", "OCC(O)CO"] * 3
+	serial = list(smiles_batch.iter_text_to_mols(lines, workers=1))
+	pooled = list(smiles_batch.iter_text_to_mols(lines, workers=2, chunk_size=2))
+	assert [r.smiles for r in pooled] == lines
+	assert [_signature(r.mol) for r in pooled] == [_signature(r.mol) for r in serial]
+
+
+#============================================
+def test_smiles_batch_cli_roundtrip(tmp_path):
+	"""The CLI writes CXSMILES lines that read back with the same coords."""
+	input_path = tmp_path / "input.smi"
+	input_path.write_text("CCO ethanol\nnot_smiles\nc1ccccc1\n", encoding="utf-8")
+	output_path = tmp_path / "out.cxsmi"
+	oasa_cli.main(["smiles-batch", "-i", str(input_path), "-o", str(output_path), "-w", "1"])
+	lines = output_path.read_text(encoding="utf-8").splitlines()
+	assert len(lines) == 2
+	assert lines[0].endswith(" ethanol")
+	mol = oasa.smiles_lib.cxsmiles_to_mol(lines[0])
+	assert [a.symbol for a in mol.vertices] == ["C", "C", "O"]
+
+
+#============================================
+def test_cxsmiles_with_explicit_hydrogens():
+	"""Dropped [H] atoms get no coordinates; every written atom gets its own."""
+	for text in ("[H]OC", "C([H])([H])(C(=O)[O-])[NH3+]", "[2H]C([2H])([2H])O"):
+		mol = oasa.smiles_lib.text_to_mol(text)
+		line = oasa.smiles_lib.mol_to_cxsmiles(text, mol)
+		smiles, block = line.split(" |(")
+		assert len(block.rstrip(")|").split(";")) == len(mol.vertices)
+		back = oasa.smiles_lib.cxsmiles_to_mol(line)
+		written = sorted((a.symbol, round(a.x, 4), round(a.y, 4)) for a in back.vertices)
+		assert written == sorted((a.symbol, round(a.x, 4), round(a.y, 4)) for a in mol.vertices)
+	assert oasa.smiles_lib.mol_to_cxsmiles("[H]OC", oasa.smiles_lib.text_to_mol("[H]OC")).startswith("OC |")
+	# without bracket hydrogens the input spelling is kept
+	assert oasa.smiles_lib.mol_to_cxsmiles("OCC", oasa.smiles_lib.text_to_mol("OCC")).startswith("OCC |")
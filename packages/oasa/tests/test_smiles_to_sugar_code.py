@@ -0,0 +1,98 @@
+"""Tests for the SMILES-to-sugar-code lookup tables."""
+
+# Standard Library
+import json
+
+# PIP3 modules
+import pytest
+import rdkit.Chem
+
+# local repo modules
+from oasa import smiles_to_sugar_code
+from oasa import sugar_code_smiles
+
+
+GLUCOSE_ALPHA = sugar_code_smiles.sugar_code_to_smiles("ARLRDM", "pyranose", "alpha")
+
+
+#============================================
+def _other_spelling(smiles: str) -> str:
+	"""Return a different SMILES spelling of the same structure."""
+	rmol = rdkit.Chem.MolFromSmiles(smiles)
+	for root in range(rmol.GetNumAtoms()):
+		text = rdkit.Chem.MolToSmiles(rmol, rootedAtAtom=root)
+		if text != smiles:
+			return text
+	raise AssertionError("no alternative spelling found")
+
+
+#============================================
+@pytest.fixture
+def fresh_tables(monkeypatch):
+	"""Drop the cached tables for one test."""
+	monkeypatch.setattr(smiles_to_sugar_code, "_LOOKUP_TABLE", None)
+	monkeypatch.setattr(smiles_to_sugar_code, "_INFERENCE_TABLE", None)
+
+
+#============================================
+def test_generated_smiles_is_exact_match():
+	result = smiles_to_sugar_code.smiles_to_sugar_code(GLUCOSE_ALPHA)
+	assert (result.sugar_code, result.ring_type, result.anomeric) == ("ARLRDM", "pyranose", "alpha")
+	assert result.confidence == "exact_match"
+
+
+#============================================
+def test_other_spelling_is_exact_match():
+	"""A re-ordered SMILES of the same sugar is found through the canonical key."""
+	spelled = _other_spelling(GLUCOSE_ALPHA)
+	assert smiles_to_sugar_code.smiles_to_sugar_code(spelled) == \
+		smiles_to_sugar_code.smiles_to_sugar_code(GLUCOSE_ALPHA)
+
+
+#============================================
+def test_anomers_are_told_apart():
+	beta = sugar_code_smiles.sugar_code_to_smiles("ARLRDM", "pyranose", "beta")
+	result = smiles_to_sugar_code.smiles_to_sugar_code(_other_spelling(beta))
+	assert result.anomeric == "beta"
+
+
+#============================================
+def test_stereo_free_smiles_is_inferred():
+	flat = rdkit.Chem.MolToSmiles(rdkit.Chem.MolFromSmiles(GLUCOSE_ALPHA), isomericSmiles=False)
+	result = smiles_to_sugar_code.smiles_to_sugar_code(flat)
+	assert result.confidence == "inferred"
+	assert result.ring_type == "pyranose"
+
+
+#============================================
+def test_non_sugar_raises():
+	with pytest.raises(smiles_to_sugar_code.SugarCodeError):
+		smiles_to_sugar_code.smiles_to_sugar_code("CCO")
+	with pytest.raises(smiles_to_sugar_code.SugarCodeError):
+		smiles_to_sugar_code.smiles_to_sugar_code("C1CCOC1")
+
+
+#============================================
+def test_saved_index_round_trip(tmp_path, fresh_tables):
+	path = str(tmp_path / "sugar_index.json")
+	smiles_to_sugar_code.save_index(path)
+	exact = smiles_to_sugar_code._get_lookup_table()
+	inferred = smiles_to_sugar_code._get_inference_table()
+	smiles_to_sugar_code._LOOKUP_TABLE = None
+	smiles_to_sugar_code._INFERENCE_TABLE = None
+	assert smiles_to_sugar_code.load_index(path)
+	assert smiles_to_sugar_code._LOOKUP_TABLE == exact
+	assert smiles_to_sugar_code._INFERENCE_TABLE == inferred
+
+
+#============================================
+def test_stale_or_missing_index_is_ignored(tmp_path, fresh_tables):
+	path = tmp_path / "sugar_index.json"
+	assert not smiles_to_sugar_code.load_index(str(path))
+	smiles_to_sugar_code.save_index(str(path))
+	data = json.loads(path.read_text())
+	data["source"] = "other"
+	path.write_text(json.dumps(data))
+	smiles_to_sugar_code._LOOKUP_TABLE = None
+	assert not smiles_to_sugar_code.load_index(str(path))
+	assert smiles_to_sugar_code._LOOKUP_TABLE is None
@@ -0,0 +1,86 @@
+"""Tests for the attach-target grid in render_lib.spatial_index."""
+
+# Standard Library
+import random
+
+# local repo modules
+import oasa.peptide_utils
+import oasa.smiles_lib
+from oasa.render_lib import low_level_geometry as llg
+from oasa.render_lib import molecule_ops
+from oasa.render_lib.bond_ops import _avoid_cross_label_overlaps
+from oasa.render_lib.data_types import make_box_target
+from oasa.render_lib.data_types import make_circle_target
+from oasa.render_lib.data_types import make_composite_target
+from oasa.render_lib.spatial_index import build_attach_target_grid
+
+
+#============================================
+def _random_targets(rng, count: int) -> dict:
+	targets = {}
+	for i in range(count):
+		x, y = rng.uniform(-20, 20), rng.uniform(-20, 20)
+		box = make_box_target((x, y, x + rng.uniform(0.5, 4.0), y + rng.uniform(0.5, 4.0)))
+		circle = make_circle_target((x, y), rng.uniform(0.5, 2.0))
+		targets[i] = rng.choice((box, circle, make_composite_target([box, circle])))
+	return targets
+
+
+#============================================
+def _random_segment(rng) -> tuple:
+	x, y = rng.uniform(-20, 20), rng.uniform(-20, 20)
+	return ((x, y), (x + rng.uniform(-6, 6), y + rng.uniform(-6, 6)))
+
+
+#============================================
+def test_query_is_superset_of_capsule_hits():
+	rng = random.Random(13)
+	targets = _random_targets(rng, 120)
+	grid = build_attach_target_grid(targets)
+	assert len(grid) == 120
+	for _ in range(200):
+		start, end = _random_segment(rng)
+		half_width = rng.uniform(0.0, 1.0)
+		near = set(grid.query(start, end, margin=half_width))
+		for key, target in targets.items():
+			if llg._capsule_intersects_target(start, end, half_width, target, 0.0):
+				assert key in near
+
+
+#============================================
+def test_query_small_cells_match_large_cells():
+	rng = random.Random(17)
+	targets = _random_targets(rng, 60)
+	fine = build_attach_target_grid(targets, cell_size=0.7)
+	coarse = build_attach_target_grid(targets, cell_size=100.0)
+	for _ in range(50):
+		start, end = _random_segment(rng)
+		assert fine.query(start, end, 0.4) == coarse.query(start, end, 0.4)
+
+
+#============================================
+def test_avoid_cross_label_overlaps_indexed_matches_scalar():
+	rng = random.Random(19)
+	targets = _random_targets(rng, 80)
+	grid = build_attach_target_grid(targets)
+	packed = llg.pack_attach_targets(targets)
+	for _ in range(80):
+		start, end = _random_segment(rng)
+		own = {rng.randrange(80)}
+		plain = _avoid_cross_label_overlaps(start, end, 0.5, own, targets)
+		indexed = _avoid_cross_label_overlaps(start, end, 0.5, own, targets, target_index=grid)
+		both = _avoid_cross_label_overlaps(
+			start, end, 0.5, own, targets, target_arrays=packed, target_index=grid)
+		assert indexed == plain
+		assert both == plain
+
+
+#============================================
+def test_molecule_to_ops_same_with_and_without_index(monkeypatch):
+	smiles = oasa.peptide_utils.sequence_to_smiles("DESKTWYNQG" * 2)
+	mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=30)
+	indexed = molecule_ops.molecule_to_ops(mol)
+	monkeypatch.setattr(molecule_ops, "SPATIAL_INDEX_MIN_TARGETS", 10**9)
+	monkeypatch.setattr(molecule_ops, "BATCH_GEOMETRY_MIN_TARGETS", 10**9)
+	plain = molecule_ops.molecule_to_ops(mol)
+	assert indexed == plain
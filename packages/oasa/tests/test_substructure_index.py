@@ -0,0 +1,150 @@
+"""Tests for the indexed substructure search over drawing directories."""
+
+# Standard Library
+import os
+import gzip
+
+# local repo modules
+import oasa_cli
+import oasa.smiles_lib
+from oasa import cdml_writer
+from oasa import substructure_index
+
+
+DRAWINGS = {
+	"ethanol.cdml": "CCO",
+	"benzene.cdml": "c1ccccc1",
+	"phenol.cdml": "Oc1ccccc1",
+	"acetic.cdml": "CC(=O)O",
+	"mixture.cdml": "CCN.c1ccncc1",
+}
+
+
+#============================================
+def _write_drawings(directory, drawings=DRAWINGS):
+	"""Write one CDML file per SMILES into directory."""
+	for name, smiles in drawings.items():
+		mol = oasa.smiles_lib.text_to_mol(smiles, calc_coords=1)
+		with open(os.path.join(directory, name), "w", encoding="utf-8") as handle:
+			handle.write(cdml_writer.mol_to_text(mol))
+
+
+#============================================
+def _brute_force(directory, query):
+	"""Return files with a molecule containing query, without the index."""
+	found = []
+	for name in sorted(os.listdir(directory)):
+		if not name.endswith(substructure_index.FILE_EXTENSIONS):
+			continue
+		path = os.path.join(directory, name)
+		for mol in substructure_index.read_drawing_molecules(path):
+			if mol.contains_substructure(query, implicit_freesites=True):
+				found.append(path)
+				break
+	return found
+
+
+#============================================
+def test_search_matches_brute_force(tmp_path):
+	"""Index results equal a plain contains_substructure loop."""
+	_write_drawings(str(tmp_path))
+	index = substructure_index.SubstructureIndex(str(tmp_path), workers=1)
+	for smiles in ("CO", "c1ccccc1", "C=O", "N", "CC", "Cl"):
+		query = oasa.smiles_lib.text_to_mol(smiles, calc_coords=0)
+		expected = _brute_force(str(tmp_path), query)
+		assert index.matching_files(query) == expected
+	assert index.last_search.files == len(DRAWINGS)
+
+
+#============================================
+def test_prefilter_never_rejects_a_match():
+	"""Counts and fingerprint of a match are a superset of the query's."""
+	mol = oasa.smiles_lib.text_to_mol("CC(=O)Oc1ccccc1C(=O)O", calc_coords=0)
+	candidate = substructure_index.describe_mol(mol)
+	for smiles in ("CC(=O)O", "c1ccccc1", "OC=O", "CO"):
+		query = oasa.smiles_lib.text_to_mol(smiles, calc_coords=0)
+		assert mol.contains_substructure(query)
+		assert substructure_index.may_contain(candidate, substructure_index.describe_mol(query))
+	query = oasa.smiles_lib.text_to_mol("CN", calc_coords=0)
+	assert not substructure_index.may_contain(candidate, substructure_index.describe_mol(query))
+
+
+#============================================
+def test_index_persists_and_revalidates(tmp_path):
+	"""A saved index is reused and only changed files are read again."""
+	_write_drawings(str(tmp_path))
+	index = substructure_index.SubstructureIndex(str(tmp_path), workers=1)
+	assert index.update() == len(DRAWINGS)
+	assert os.path.isfile(os.path.join(str(tmp_path), substructure_index.DEFAULT_INDEX_NAME))
+	reopened = substructure_index.SubstructureIndex(str(tmp_path), workers=1)
+	assert set(reopened.entries) == set(DRAWINGS)
+	assert reopened.update() == 0
+	# rewrite one drawing with a different molecule
+	_write_drawings(str(tmp_path), {"ethanol.cdml": "CCCl"})
+	path = os.path.join(str(tmp_path), "ethanol.cdml")
+	stat = os.stat(path)
+	os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+	assert reopened.update() == 1
+	query = oasa.smiles_lib.text_to_mol("CCl", calc_coords=0)
+	assert reopened.matching_files(query) == [path]
+
+
+#============================================
+def test_gzip_and_worker_pool(tmp_path):
+	"""Gzipped drawings are indexed and a pool gives the same hits."""
+	_write_drawings(str(tmp_path))
+	mol = oasa.smiles_lib.text_to_mol("CCOc1ccccc1", calc_coords=1)
+	with gzip.open(os.path.join(str(tmp_path), "ether.cdml.gz"), "wt", encoding="utf-8") as handle:
+		handle.write(cdml_writer.mol_to_text(mol))
+	query = oasa.smiles_lib.text_to_mol("COc1ccccc1", calc_coords=0)
+	serial = substructure_index.SubstructureIndex(str(tmp_path), index_path=False, workers=1)
+	pooled = substructure_index.SubstructureIndex(str(tmp_path), index_path=False,
+		workers=2, chunk_size=1)
+	# spawned workers, as a GUI uses them, start without a copy of the caller
+	spawned = substructure_index.SubstructureIndex(str(tmp_path), index_path=False,
+		workers=2, chunk_size=3, mp_context="spawn")
+	expected = [os.path.join(str(tmp_path), "ether.cdml.gz")]
+	assert serial.matching_files(query) == expected
+	assert pooled.matching_files(query) == expected
+	assert spawned.matching_files(query) == expected
+
+
+#============================================
+def test_search_reports_progress(tmp_path):
+	"""Indexing and matching report per-chunk progress up to their totals."""
+	_write_drawings(str(tmp_path))
+	index = substructure_index.SubstructureIndex(str(tmp_path), index_path=False,
+		workers=1, chunk_size=2)
+	calls = []
+	query = oasa.smiles_lib.text_to_mol("CC", calc_coords=0)
+	index.matching_files(query, progress=lambda *args: calls.append(args))
+	assert [c for c in calls if c[0] == "index"] == [
+		("index", 2, 5), ("index", 4, 5), ("index", 5, 5)]
+	matching = [c for c in calls if c[0] == "match"]
+	assert matching[-1] == ("match", index.last_search.candidates, index.last_search.candidates)
+	calls.clear()
+	index.matching_files(query, progress=lambda *args: calls.append(args))
+	# nothing to re-index the second time
+	assert all(c[0] == "match" for c in calls)
+
+
+#============================================
+def test_unreadable_file_is_recorded(tmp_path):
+	"""A broken drawing gets an error entry and no molecules."""
+	with open(os.path.join(str(tmp_path), "broken.cdml"), "w", encoding="utf-8") as handle:
+		handle.write("<cdml")
+	index = substructure_index.SubstructureIndex(str(tmp_path), index_path=False, workers=1)
+	index.update()
+	entry = index.entries["broken.cdml"]
+	assert entry.molecules == ()
+	assert entry.error
+
+
+#============================================
+def test_cli_prints_matching_paths(tmp_path, capsys):
+	"""The substructure-search command prints matching files."""
+	_write_drawings(str(tmp_path))
+	oasa_cli.main(["substructure-search", "-d", str(tmp_path), "-q", "c1ccccc1", "-w", "1"])
+	out = capsys.readouterr().out.split()
+	assert out == [os.path.join(str(tmp_path), "benzene.cdml"),
+		os.path.join(str(tmp_path), "phenol.cdml")]
@@ -0,0 +1,121 @@
+"""Tests for the re-entrant substructure matcher."""
+
+# local repo modules
+import oasa.smiles_lib
+from oasa import substructure_match
+from oasa.atom_lib import Atom
+from oasa.query_atom import QueryAtom
+from oasa.molecule_lib import Molecule
+
+
+CHOLESTEROL = "CC(C)CCCC(C)C1CCC2C3CC=C4CC(O)CCC4(C)C3CCC12C"
+
+
+#============================================
+def _mol(smiles):
+	return oasa.smiles_lib.text_to_mol(smiles, calc_coords=0)
+
+
+#============================================
+def _snapshot(mol) -> tuple:
+	"""Return everything a search must leave untouched."""
+	atoms = tuple((id(v), v.symbol, v.explicit_hydrogens, v.free_sites, dict(v.properties_))
+		for v in mol.vertices)
+	bonds = tuple(sorted((id(e), e.order, str(e.properties_)) for e in mol.edges))
+	return (atoms, bonds)
+
+
+#============================================
+def _index_sets(mol, matches) -> list:
+	index = {v: i for i, v in enumerate(mol.vertices)}
+	return sorted(tuple(sorted(index[a] for a in atoms)) for atoms in matches)
+
+
+#============================================
+def test_fused_rings_all_found():
+	"""Both saturated six-membered rings of cholesterol are reported."""
+	target = _mol(CHOLESTEROL)
+	found = list(target.select_matching_substructures(_mol("C1CCCCC1"), implicit_freesites=True))
+	assert len(found) == 2
+	assert all(len(atoms) == 6 for atoms in found)
+
+
+#============================================
+def test_hydrogens_and_free_sites():
+	"""Implicit target hydrogens match query hydrogens, free sites limit matches."""
+	query = _mol("C-O")
+	query.vertices[1].explicit_hydrogens = 1
+	assert _mol("CCO").contains_substructure(query)
+	assert not _mol("COC").contains_substructure(query)
+	# the hydrogen image is not part of the match
+	assert [len(atoms) for atoms in _mol("CCO").select_matching_substructures(query, True)] == [2]
+	# without implicit free sites the match must be exact
+	assert _mol("CC").contains_substructure(_mol("CC"), implicit_freesites=False)
+	assert not _mol("CCC").contains_substructure(_mol("CC"), implicit_freesites=False)
+
+
+#============================================
+def test_charge_compared_only_when_query_is_charged():
+	"""The start atom compares charge the other way round, as the old search did."""
+	carboxylate = _mol("CC(=O)[O-]")
+	# single-atom queries are their own start atom: charge counts when the target has it
+	assert _index_sets(carboxylate, carboxylate.select_matching_substructures(_mol("[O-]"), True)) == [(2,), (3,)]
+	assert _index_sets(carboxylate, carboxylate.select_matching_substructures(_mol("O"), True)) == [(2,)]
+	assert _mol("CCO").contains_substructure(_mol("[O-]"), implicit_freesites=True)
+	assert not _mol("[NH4+]").contains_substructure(_mol("N"))
+	# other atoms compare charge only when the query atom is charged
+	assert not _mol("CC(=O)O").contains_substructure(_mol("C[O-]"), implicit_freesites=True)
+	assert carboxylate.contains_substructure(_mol("C[O-]"), implicit_freesites=True)
+	assert _mol("C[O-]").contains_substructure(_mol("CO"), implicit_freesites=True)
+
+
+#============================================
+def test_query_atom_uses_its_matches():
+	"""A QueryAtom decides itself which target atoms it stands for."""
+	query = Molecule()
+	carbon = Atom(symbol='C')
+	halogen = QueryAtom()
+	halogen.symbol = "X"
+	query.add_vertex(carbon)
+	query.add_vertex(halogen)
+	query.add_edge(carbon, halogen)
+	target = _mol("ClCCBr")
+	found = _index_sets(target, target.select_matching_substructures(query, implicit_freesites=True))
+	assert found == [(0, 1), (2, 3)]
+	assert not _mol("CCO").contains_substructure(query)
+
+
+#============================================
+def test_search_leaves_molecules_untouched():
+	"""Finished and abandoned searches do not modify either molecule."""
+	target = _mol("OCC(=O)O")
+	query = _mol("C=O")
+	query.vertices[0].explicit_hydrogens = 0
+	hydroxy = _mol("CO")
+	hydroxy.vertices[1].explicit_hydrogens = 1
+	before = (_snapshot(target), _snapshot(query), _snapshot(hydroxy))
+	list(target.select_matching_substructures(query, implicit_freesites=True))
+	abandoned = target.select_matching_substructures(hydroxy, implicit_freesites=True)
+	next(abandoned)
+	assert (_snapshot(target), _snapshot(query), _snapshot(hydroxy)) == before
+
+
+#============================================
+def test_interleaved_searches_on_one_target():
+	"""Searches on one target can be advanced in turns without interference."""
+	target = _mol(CHOLESTEROL)
+	queries = [_mol(s) for s in ("CCCC", "C1CCCCC1", "CC(C)C", "C=C")]
+	expected = [_index_sets(target, substructure_match.iter_matches(target, q, True)) for q in queries]
+	running = [substructure_match.iter_matches(target, q, True) for q in queries]
+	collected = [[] for q in queries]
+	while running:
+		for i, gen in enumerate(running):
+			if gen is None:
+				continue
+			try:
+				collected[i].append(next(gen))
+			except StopIteration:
+				running[i] = None
+		if all(gen is None for gen in running):
+			break
+	assert [_index_sets(target, atoms) for atoms in collected] == expected
@@ -0,0 +1,107 @@
+"""Tests for the persistent template layout cache."""
+
+# Standard Library
+import json
+
+# PIP3 modules
+import pytest
+
+# local repo modules
+from oasa import smiles_lib
+from oasa import template_cache
+from oasa.atom_lib import Atom
+from oasa.bond_lib import Bond
+
+
+SMILES = (
+	"NC(CC1=CC=CC=C1)C(O)=O",
+	"OC[C@H]1O[C@@H](O)[C@H](O)[C@@H](O)[C@@H]1O",
+	"C[N+](C)(C)CC([O-])=O",
+	"[13CH3]C#N",
+)
+
+
+#============================================
+def _value(obj, name):
+	"""Attribute value; RDKit layouts differ in the last bits between calls."""
+	value = getattr(obj, name)
+	if isinstance(value, float):
+		return round(value, 9)
+	return value
+
+
+#============================================
+def _describe(mol) -> tuple:
+	index = {v: i for i, v in enumerate(mol.vertices)}
+	atoms = [tuple(_value(v, name) for name in Atom.attrs_to_copy) + (v.free_valency,)
+		for v in mol.vertices]
+	bonds = sorted((index[e.vertices[0]], index[e.vertices[1]])
+		+ tuple(_value(e, name) for name in Bond.attrs_to_copy) for e in mol.edges)
+	return (atoms, bonds)
+
+
+#============================================
+def _no_rdkit(text, **kwargs):
+	raise AssertionError(f"RDKit layout requested for {text}")
+
+
+#============================================
+@pytest.mark.parametrize("smiles_text", SMILES)
+def test_cached_layout_matches_fresh_layout(tmp_path, monkeypatch, smiles_text):
+	path = str(tmp_path / "cache.json")
+	fresh = _describe(template_cache.TemplateCache(path).layout(smiles_text))
+	assert fresh == _describe(smiles_lib.text_to_mol(smiles_text, calc_coords=1))
+	monkeypatch.setattr(smiles_lib, "text_to_mol", _no_rdkit)
+	assert _describe(template_cache.TemplateCache(path).layout(smiles_text)) == fresh
+
+
+#============================================
+def test_layouts_are_independent_copies(tmp_path):
+	cache = template_cache.TemplateCache(str(tmp_path / "cache.json"))
+	first = cache.layout("CCO")
+	first.vertices[0].x += 5.0
+	assert cache.layout("CCO").vertices[0].x != first.vertices[0].x
+
+
+#============================================
+def test_stale_header_is_ignored(tmp_path, monkeypatch):
+	path = tmp_path / "cache.json"
+	template_cache.TemplateCache(str(path)).layout("CCO")
+	data = json.loads(path.read_text())
+	data["header"]["oasa"] = "0.0"
+	path.write_text(json.dumps(data))
+	calls = []
+	layout = smiles_lib.text_to_mol
+
+	def counting_layout(text, **kwargs):
+		calls.append(text)
+		return layout(text, **kwargs)
+
+	monkeypatch.setattr(smiles_lib, "text_to_mol", counting_layout)
+	template_cache.TemplateCache(str(path)).layout("CCO")
+	assert calls == ["CCO"]
+	assert json.loads(path.read_text())["header"] == template_cache._cache_header()
+
+
+#============================================
+def test_writers_merge_entries(tmp_path):
+	"""Two sessions sharing one file keep each other's layouts."""
+	path = str(tmp_path / "cache.json")
+	first = template_cache.TemplateCache(path)
+	second = template_cache.TemplateCache(path)
+	first.layout("CCO")
+	second.layout("CCN")
+	assert set(json.loads(open(path).read())["layouts"]) == {"CCO", "CCN"}
+
+
+#============================================
+def test_unwritable_path_still_lays_out(tmp_path):
+	blocker = tmp_path / "file"
+	blocker.write_text("")
+	cache = template_cache.TemplateCache(str(blocker / "cache.json"))
+	assert len(cache.layout("CCO").vertices) == 3
+
+
+#============================================
+def test_get_cache_is_shared():
+	assert template_cache.get_cache("x.json") is template_cache.get_cache("x.json")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Build a precomputed font-metrics table for headless label layout.
+
+Run on a machine with pycairo and the target fonts installed. The table
+holds text extents for every character and character pair of the label
+alphabet at the requested fonts and sizes (plus their sub/superscript
+sizes). Servers that render without pycairo pass the written file to
+oasa.render_lib.font_metrics.load_table() before rendering.
+"""
+
+# Standard Library
+import os
+import sys
+import string
+import argparse
+import subprocess
+
+# Ensure packages are importable
+_REPO_ROOT = subprocess.run(
+	["git", "rev-parse", "--show-toplevel"],
+	capture_output=True, text=True, check=True,
+).stdout.strip()
+_OASA_DIR = os.path.join(_REPO_ROOT, "packages", "oasa")
+if _OASA_DIR not in sys.path:
+	sys.path.insert(0, _OASA_DIR)
+
+# local repo modules
+from oasa import render_ops
+from oasa.render_lib import font_metrics
+
+
+# element symbols, digits, charges and label punctuation
+DEFAULT_CHARACTERS = string.ascii_letters + string.digits + "+-()[]=#*'"
+
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""Parse command-line arguments."""
+	parser = argparse.ArgumentParser(
+		description="Write a font-metrics table for font_metrics.load_table()"
+	)
+	parser.add_argument(
+		'-o', '--output', dest='output', required=True,
+		help="Output JSON table path",
+	)
+	parser.add_argument(
+		'-f', '--fonts', dest='fonts', nargs='+', default=["sans-serif", "Arial"],
+		help="Font family names (default: sans-serif Arial)",
+	)
+	parser.add_argument(
+		'-s', '--sizes', dest='sizes', type=float, nargs='+', default=[12.0, 16.0],
+		help="Base font sizes (default: 12 16)",
+	)
+	parser.add_argument(
+		'-c', '--characters', dest='characters', default=DEFAULT_CHARACTERS,
+		help="Characters to measure singly and in pairs",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+def main() -> None:
+	"""Measure the label alphabet and write the table."""
+	args = parse_args()
+	if font_metrics._cairo is None:
+		raise RuntimeError("Building a font-metrics table requires pycairo.")
+	sizes = set()
+	for size in args.sizes:
+		sizes.add(size)
+		sizes.add(render_ops._segment_font_size(size, "sub"))
+	store = font_metrics.FontMetricsStore()
+	store.precompute(args.fonts, sorted(sizes), args.characters)
+	count = store.save_table(args.output)
+	print(f"Wrote {count} entries to {args.output}")
+
+
+#============================================
+if __name__ == "__main__":
+	main()